@@ -17,14 +17,14 @@ Currently this only provides API versioning information
 """
 from __future__ import annotations
 
-from typing import Optional
+from typing import Dict, Optional
 
 import pycountry
 from flask import current_app
 
 from colin_api.exceptions import AddressNotFoundException
 from colin_api.resources.db import DB
-from colin_api.utils import stringify_list
+from colin_api.utils import fetch_by_ids, stringify_list
 
 
 class Address:  # pylint: disable=too-many-instance-attributes; need all these fields
@@ -39,6 +39,16 @@ class Address:  # pylint: disable=too-many-instance-attributes; need all these f
     delivery_instructions = None
     address_id = None
 
+    ADDRESS_QUERY = """
+        SELECT province, city, postal_cd, addr_line_1, addr_line_2, addr_line_3,
+          unit_type, unit_no, civic_no, civic_no_suffix, street_name, street_type,
+          street_direction, address_format_type, route_service_type, lock_box_no,
+          route_service_no, installation_type, installation_name, addr_id, ct.full_desc, delivery_instructions
+        FROM ADDRESS a
+          LEFT JOIN COUNTRY_TYPE ct on a.country_typ_cd = ct.country_typ_cd
+        WHERE {where}
+        """
+
     def __init__(self):
         """Initialize with all values None."""
 
@@ -112,15 +122,7 @@ class Address:  # pylint: disable=too-many-instance-attributes; need all these f
         try:
             if not cursor:
                 cursor = DB.connection.cursor()
-            cursor.execute("""
-                SELECT province, city, postal_cd, addr_line_1, addr_line_2, addr_line_3,
-                  unit_type, unit_no, civic_no, civic_no_suffix, street_name, street_type,
-                  street_direction, address_format_type, route_service_type, lock_box_no,
-                  route_service_no, installation_type, installation_name, addr_id, ct.full_desc, delivery_instructions
-                FROM ADDRESS a
-                  LEFT JOIN COUNTRY_TYPE ct on a.country_typ_cd = ct.country_typ_cd
-                WHERE addr_id=:address_id
-                """, address_id=address_id)
+            cursor.execute(cls.ADDRESS_QUERY.format(where='addr_id=:address_id'), address_id=address_id)
 
             address = cursor.fetchone()
             address = dict(zip([x[0].lower() for x in cursor.description], address))
@@ -130,6 +132,17 @@ class Address:  # pylint: disable=too-many-instance-attributes; need all these f
             current_app.logger.error(err.with_traceback(None))
             raise AddressNotFoundException(address_id=address_id)  # pylint: disable=raise-missing-from
 
+    @classmethod
+    def get_by_address_ids(cls, cursor, address_ids: list) -> Dict[int, Address]:
+        """Return the addresses associated with the given addr_ids, keyed by addr_id."""
+        try:
+            rows = fetch_by_ids(cursor, cls.ADDRESS_QUERY.format(where='addr_id in ({ids})'), address_ids)
+        except Exception as err:
+            current_app.logger.error(err.with_traceback(None))
+            raise err
+
+        return {row['addr_id']: cls._build_address_obj(row) for row in rows}
+
     @classmethod
     def create_new_address(cls, cursor, address_info: dict = None, corp_num: str = None):
         """Get new address id and insert address into address table."""
@@ -26,7 +26,7 @@ from flask import current_app
 from colin_api.exceptions import PartiesNotFoundException
 from colin_api.models import Address, Business  # pylint: disable=cyclic-import
 from colin_api.resources.db import DB
-from colin_api.utils import convert_to_json_date, delete_from_table_by_event_ids, stringify_list
+from colin_api.utils import convert_to_json_date, delete_from_table_by_event_ids, fetch_by_ids, stringify_list
 
 
 class Party:  # pylint: disable=too-many-instance-attributes; need all these fields
@@ -82,8 +82,10 @@ class Party:  # pylint: disable=too-many-instance-attributes; need all these fie
             'id': self.corp_party_id
         }
 
-    def get_start_event_date(self, cursor):
-        """Get the start event date of the party."""
+    def get_start_event_date(self, cursor, start_event_dates: Dict = None):
+        """Get the start event date of the party, from the start_event_dates when already loaded."""
+        if start_event_dates is not None and self.start_event_id in start_event_dates:
+            return start_event_dates[self.start_event_id]
         query = """
                 SELECT event_typ_cd, event_timestmp, effective_dt
                 FROM event e
@@ -93,6 +95,24 @@ class Party:  # pylint: disable=too-many-instance-attributes; need all these fie
         dates = cursor.execute(query, event_id=self.start_event_id).fetchone()
         description = cursor.description
         dates = dict(zip([x[0].lower() for x in description], dates))
+        return Party._parse_start_event_date(dates)
+
+    @classmethod
+    def get_start_event_dates(cls, cursor, event_ids: List) -> Dict:
+        """Get the start event dates of the given events, keyed by event id."""
+        query = """
+                SELECT e.event_id, event_typ_cd, event_timestmp, effective_dt
+                FROM event e
+                  LEFT JOIN filing f on f.event_id = e.event_id
+                WHERE e.event_id in ({ids})
+                """
+        start_event_dates = {}
+        for dates in fetch_by_ids(cursor, query, event_ids):
+            start_event_dates.setdefault(dates['event_id'], cls._parse_start_event_date(dates))
+        return start_event_dates
+
+    @staticmethod
+    def _parse_start_event_date(dates: dict) -> Optional[str]:
         if dates['event_typ_cd'] in ['CONVICORP', 'CONVAMAL', 'CONVCIN']:
             return None
         return convert_to_json_date(dates['effective_dt'] or dates['event_timestmp'])
@@ -125,14 +145,34 @@ class Party:  # pylint: disable=too-many-instance-attributes; need all these fie
         return [row[0] for row in offices]
 
     @classmethod
-    def _parse_party(cls, cursor, row: dict) -> Party:
-        """Parse the party row."""
+    def _get_offices_held_by_party_ids(cls, cursor, corp_party_ids: List) -> Dict[int, List]:
+        """Get the offices held by the parties, keyed by corp_party_id."""
+        query = """
+                SELECT corp_party_id, officer_typ_cd
+                FROM offices_held
+                WHERE corp_party_id in ({ids})
+                """
+        offices_held = {}
+        for row in fetch_by_ids(cursor, query, corp_party_ids):
+            offices_held.setdefault(row['corp_party_id'], []).append(row['officer_typ_cd'])
+        return offices_held
+
+    @staticmethod
+    def _get_address(cursor, address_id, addresses: Dict = None) -> Address:
+        """Return the address from the loaded addresses, or query it if it was not loaded."""
+        if addresses and address_id in addresses:
+            return addresses[address_id]
+        return Address.get_by_address_id(cursor, address_id)
+
+    @classmethod
+    def _parse_party(cls, cursor, row: dict, addresses: Dict = None, offices_held: Dict = None) -> Party:
+        """Parse the party row, using the addresses and offices held already loaded for the party set if given."""
         party = Party()
         party.title = ''
         party.officer = Party._parse_officer(row)
         if row['delivery_addr_id']:
-            party.delivery_address = Address.get_by_address_id(cursor, row['delivery_addr_id']).as_dict()
-        party.mailing_address = Address.get_by_address_id(cursor, row['mailing_addr_id']).as_dict() \
+            party.delivery_address = cls._get_address(cursor, row['delivery_addr_id'], addresses).as_dict()
+        party.mailing_address = cls._get_address(cursor, row['mailing_addr_id'], addresses).as_dict() \
             if row['mailing_addr_id'] else party.delivery_address
         party.appointment_date =\
             convert_to_json_date(row.get('appointment_dt', None))
@@ -146,9 +186,25 @@ class Party:  # pylint: disable=too-many-instance-attributes; need all these fie
         party.corp_num = row.get('corp_num', None)
 
         if party.role_type == cls.role_types['Officer']:
-            party.offices_held = cls._get_offices_held(cursor, party.corp_party_id)
+            if offices_held is not None:
+                party.offices_held = offices_held.get(party.corp_party_id, [])
+            else:
+                party.offices_held = cls._get_offices_held(cursor, party.corp_party_id)
         return party
 
+    @classmethod
+    def _parse_parties(cls, cursor, rows: List[dict]) -> List[Party]:
+        """Parse the party rows, loading the addresses and offices held of all the parties at once."""
+        addresses = Address.get_by_address_ids(
+            cursor,
+            [row[key] for row in rows for key in ('delivery_addr_id', 'mailing_addr_id')]
+        )
+        offices_held = cls._get_offices_held_by_party_ids(
+            cursor,
+            [row['corp_party_id'] for row in rows if row.get('party_typ_cd') == cls.role_types['Officer']]
+        )
+        return [cls._parse_party(cursor, row, addresses, offices_held) for row in rows]
+
     @classmethod
     def _build_parties_list(cls, cursor, corp_num: str, event_id: int = None) -> Optional[List[Party]]:
         """Return the party list from the query."""
@@ -159,13 +215,14 @@ class Party:  # pylint: disable=too-many-instance-attributes; need all these fie
 
         completing_parties = {}
         party_list = []
+        founding_date = None
         description = cursor.description
-        for row in parties:
-            row = dict(zip([x[0].lower() for x in description], row))
-            party = Party._parse_party(cursor, row)
-
+        rows = [dict(zip([x[0].lower() for x in description], row)) for row in parties]
+        for party in cls._parse_parties(cursor, rows):
             if not party.appointment_date:
-                party.appointment_date = Business.get_founding_date(cursor=cursor, corp_num=corp_num)
+                if founding_date is None:
+                    founding_date = Business.get_founding_date(cursor=cursor, corp_num=corp_num)
+                party.appointment_date = founding_date
 
             if party.role_type == cls.role_types['Director'] and not party.delivery_address:
                 current_app.logger.error('Bad director data for party id: %s, corp num: %s',
@@ -242,11 +299,16 @@ class Party:  # pylint: disable=too-many-instance-attributes; need all these fie
 
             party_id_map: Dict[str, Party] = {}
             child_party_ids: List[str] = []
+            rows = [dict(zip([x[0].lower() for x in description], party_row)) for party_row in parties]
+            parsed_parties = Party._parse_parties(cursor, rows)
+            start_event_dates = Party.get_start_event_dates(
+                cursor,
+                [party.start_event_id for party in parsed_parties
+                 if not party.appointment_date and party.start_event_id]
+            )
             # NB: list is already ordered by start_event_id so we can assume the
             #     1st record is the oldest child and the last one is the newest parent
-            for party_row in parties:
-                party_row = dict(zip([x[0].lower() for x in description], party_row))
-                party = Party._parse_party(cursor, party_row)
+            for party in parsed_parties:
                 party_id_map[party.corp_party_id] = party
                 if party.prev_party_id:
                     # only need previous party information for appointment date when applicable
@@ -254,13 +316,13 @@ class Party:  # pylint: disable=too-many-instance-attributes; need all these fie
                         # set the appointment date from previous party record
                         child_party = party_id_map[party.prev_party_id]
                         party.appointment_date = child_party.appointment_date or \
-                            child_party.get_start_event_date(cursor) or 'unknown'
+                            child_party.get_start_event_date(cursor, start_event_dates) or 'unknown'
                     # mark the prev_party_id as a child so its not returned
                     # (not removed in case another party record references it)
                     child_party_ids.append(party.prev_party_id)
                 if not party.appointment_date:
                     # wasn't set by a previous record so set it by its event or filing date
-                    party.appointment_date = party.get_start_event_date(cursor)
+                    party.appointment_date = party.get_start_event_date(cursor, start_event_dates)
 
             # only return the top level parent records
             for party_id in party_id_map:  # pylint: disable=consider-using-dict-items
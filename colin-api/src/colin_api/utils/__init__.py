@@ -79,6 +79,25 @@ def stringify_list(list_orig: list) -> str:
     return list_str
 
 
+ORACLE_IN_LIST_LIMIT = 1000
+
+
+def fetch_by_ids(cursor, query: str, ids: list) -> list:
+    """Return the rows (as dicts with lower case keys) of the query for the given ids.
+
+    The query has an {ids} placeholder which is replaced with bind variables, the ids are queried in chunks as an
+    Oracle in list is limited to 1000 expressions.
+    """
+    ids = list(dict.fromkeys(value for value in ids if value is not None))
+    rows = []
+    for start in range(0, len(ids), ORACLE_IN_LIST_LIMIT):
+        binds = {f'id{i}': value for i, value in enumerate(ids[start:start + ORACLE_IN_LIST_LIMIT])}
+        cursor.execute(query.format(ids=', '.join(f':{name}' for name in binds)), binds)
+        columns = [x[0].lower() for x in cursor.description]
+        rows.extend(dict(zip(columns, row)) for row in cursor.fetchall())
+    return rows
+
+
 def delete_from_table_by_event_ids(cursor, event_ids: list, table: str, column: str = 'start_event_id'):
     """Delete rows with given event ids from given table."""
     try:
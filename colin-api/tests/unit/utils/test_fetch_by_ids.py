@@ -0,0 +1,67 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the fetch_by_ids utility.
+
+Test-Suite to ensure that the ids are queried in chunks within the Oracle in list limit.
+"""
+from unittest.mock import MagicMock
+
+import pytest
+
+from colin_api.utils import ORACLE_IN_LIST_LIMIT, fetch_by_ids
+
+
+QUERY = 'select id, name from corp_party where id in ({ids})'
+
+
+def _cursor():
+    """Return a cursor mock returning a row per bound id of each query."""
+    cursor = MagicMock()
+    cursor.description = [('ID',), ('NAME',)]
+    cursor.execute.side_effect = lambda query, binds: setattr(
+        cursor, 'rows', [(value, f'name {value}') for value in binds.values()]
+    )
+    cursor.fetchall.side_effect = lambda: cursor.rows
+    return cursor
+
+
+@pytest.mark.parametrize('id_count, expected_chunks', [
+    (0, []),
+    (1000, [1000]),
+    (1001, [1000, 1]),
+])
+def test_fetch_by_ids(id_count, expected_chunks):
+    """Assert that the ids are fetched in chunks of at most ORACLE_IN_LIST_LIMIT bind variables."""
+    assert ORACLE_IN_LIST_LIMIT == 1000
+    cursor = _cursor()
+    ids = list(range(1, id_count + 1))
+
+    rows = fetch_by_ids(cursor, QUERY, ids)
+
+    assert [len(call.args[1]) for call in cursor.execute.call_args_list] == expected_chunks
+    for call in cursor.execute.call_args_list:
+        query, binds = call.args
+        assert query == QUERY.format(ids=', '.join(f':{name}' for name in binds))
+    assert rows == [{'id': value, 'name': f'name {value}'} for value in ids]
+
+
+def test_fetch_by_ids_skips_duplicates_and_none():
+    """Assert that duplicate and None ids are not bound."""
+    cursor = _cursor()
+
+    rows = fetch_by_ids(cursor, QUERY, [1, None, 2, 1])
+
+    cursor.execute.assert_called_once_with(QUERY.format(ids=':id0, :id1'), {'id0': 1, 'id1': 2})
+    assert rows == [{'id': 1, 'name': 'name 1'}, {'id': 2, 'name': 'name 2'}]
@@ -1,6 +1,26 @@
+from itertools import groupby
+
 import pandas as pd
 
 def convert_result_set_to_dict(rs):
     df = pd.DataFrame(rs, columns=rs.keys())
     result_dict = df.to_dict('records')
     return result_dict
+
+
+def convert_result_set_to_dicts_by_key(rs, key_column: str, exclude_columns: tuple = ()) -> dict:
+    """Partition the result set, ordered by the key column, into the records of each key.
+
+    The records of each key are converted as convert_result_set_to_dict does for a result set of that key only, and
+    without the key and excluded columns.
+    """
+    keys = list(rs.keys())
+    key_index = keys.index(key_column)
+    indexes = [i for i, k in enumerate(keys) if k != key_column and k not in exclude_columns]
+    columns = [keys[i] for i in indexes]
+
+    result = {}
+    for key, rows in groupby(rs, key=lambda row: row[key_index]):
+        df = pd.DataFrame([tuple(row[i] for i in indexes) for row in rows], columns=columns)
+        result[key] = df.to_dict('records')
+    return result
@@ -150,6 +150,16 @@ class _Config():  # pylint: disable=too-few-public-methods
     TOMBSTONE_BATCHES = int(TOMBSTONE_BATCHES) if TOMBSTONE_BATCHES.isnumeric() else 0
     TOMBSTONE_BATCH_SIZE = os.getenv('TOMBSTONE_BATCH_SIZE')
     TOMBSTONE_BATCH_SIZE = int(TOMBSTONE_BATCH_SIZE) if TOMBSTONE_BATCH_SIZE.isnumeric() else 0
+    # run each extract query once per batch of corps, instead of once per corp
+    TOMBSTONE_BATCH_EXTRACT = os.getenv('TOMBSTONE_BATCH_EXTRACT', 'false').lower() == 'true'
+    TOMBSTONE_EXTRACT_FETCH_SIZE = os.getenv('TOMBSTONE_EXTRACT_FETCH_SIZE', '10000')
+    TOMBSTONE_EXTRACT_FETCH_SIZE = int(TOMBSTONE_EXTRACT_FETCH_SIZE) if TOMBSTONE_EXTRACT_FETCH_SIZE.isnumeric() \
+        else 10000
+    # write the rows of a batch of corps per table at once, instead of one row at a time
+    TOMBSTONE_BULK_LOAD = os.getenv('TOMBSTONE_BULK_LOAD', 'false').lower() == 'true'
+    TOMBSTONE_BULK_LOAD_PAGE_SIZE = os.getenv('TOMBSTONE_BULK_LOAD_PAGE_SIZE', '1000')
+    TOMBSTONE_BULK_LOAD_PAGE_SIZE = int(TOMBSTONE_BULK_LOAD_PAGE_SIZE) \
+        if TOMBSTONE_BULK_LOAD_PAGE_SIZE.isnumeric() else 1000
 
     # verify flow
     VERIFY_BATCH_SIZE = os.getenv('VERIFY_BATCH_SIZE')
@@ -9,7 +9,8 @@ from common.auth_service import AuthService
 from common.extract_tracking_service import \
     ExtractTrackingService as CorpProcessingService, ProcessingStatuses
 from common.init_utils import colin_extract_init, get_config, lear_init
-from common.query_utils import convert_result_set_to_dict
+from common.query_utils import (convert_result_set_to_dict,
+                                convert_result_set_to_dicts_by_key)
 from prefect import flow, serve, task
 from prefect.cache_policies import NO_CACHE
 from prefect.context import get_run_context
@@ -19,15 +20,16 @@ from prefect.task_runners import ConcurrentTaskRunner
 from prefect_dask import DaskTaskRunner
 from sqlalchemy import Connection, text
 from sqlalchemy.engine import Engine
-from tombstone.tombstone_queries import (get_corp_snapshot_filings_queries,
+from tombstone.tombstone_queries import (get_corp_snapshot_filings_batch_queries,
+                                         get_corp_snapshot_filings_queries,
                                          get_corp_users_query,
                                          get_total_unprocessed_count_query,
                                          get_unprocessed_corps_query)
 from tombstone.tombstone_utils import (all_unsupported_types,
                                        build_epoch_filing, format_users_data,
                                        formatted_data_cleanup,
-                                       get_data_formatters, load_data,
-                                       update_data, update_versioning)
+                                       get_data_formatters, load_data)
+from tombstone.tombstone_loaders import BulkLoader, RowLoader
 
 
 @task(cache_policy=NO_CACHE)
@@ -124,6 +126,32 @@ def get_snapshot_filings_data(config, colin_engine: Engine, corp_num: str) -> di
         return raw_data
 
 
+@task(name='2.1-Batch-Snapshot-Placeholder-Filings-Collect-Task', cache_policy=NO_CACHE)
+def get_batch_snapshot_filings_data(config, colin_engine: Engine, corp_nums: list) -> dict:
+    """Get corp snapshot and placeholder filings data for a batch of corps.
+
+    Each query runs once for the batch and its rows are streamed and partitioned by corp, so the raw data of each
+    corp is the same as get_snapshot_filings_data returns for it.
+    """
+    raw_data = {corp_num: {} for corp_num in corp_nums}
+    queries = get_corp_snapshot_filings_batch_queries(config)
+
+    try:
+        with colin_engine.connect() as conn:
+            conn = conn.execution_options(stream_results=True, yield_per=config.TOMBSTONE_EXTRACT_FETCH_SIZE)
+            for k, q in queries.items():
+                rs = conn.execute(text(q), {'corp_nums': corp_nums})
+                raw_dicts = convert_result_set_to_dicts_by_key(rs, 'batch_corp_num', ('batch_row_num',))
+                for corp_num in corp_nums:
+                    raw_data[corp_num][k] = raw_dicts.get(corp_num, [])
+    except Exception as e:
+        # fall back to collecting the corps one at a time
+        print(f'❌ Error collecting batch snapshot and filings data, collecting corps one at a time: {repr(e)}')
+        return {}
+
+    return raw_data
+
+
 @task(name='2.2-Corp-Snapshot-Placeholder-Filings-Cleanup-Task', cache_policy=NO_CACHE)
 def clean_snapshot_filings_data(data: dict) -> dict:
     """Clean corp snapshot and placeholder filings data."""
@@ -139,23 +167,23 @@ def clean_snapshot_filings_data(data: dict) -> dict:
 
 
 @task(name='3.1-Corp-Snapshot-Migrate-Task', cache_policy=NO_CACHE)
-def load_corp_snapshot(conn: Connection, tombstone_data: dict, users_mapper: dict, versioning_mapper: dict) -> int:
+def load_corp_snapshot(loader: RowLoader, tombstone_data: dict, users_mapper: dict, versioning_mapper: dict) -> int:
     """Migrate corp snapshot."""
     # Note: The business info is partially loaded for businesses table now. And it will be fully
     # updated by the following placeholder historical filings migration. But it depends on the
     # implementation of next step.
-    business_id = load_data(conn, 'businesses', tombstone_data['businesses'], 'identifier', conflict_error=True)
+    business_id = loader.load_data('businesses', tombstone_data['businesses'], 'identifier', conflict_error=True)
     versioning_mapper['businesses_version'].append(business_id)
 
     for office in tombstone_data['offices']:
         office['offices']['business_id'] = business_id
-        office_id = load_data(conn, 'offices', office['offices'])
+        office_id = loader.load_data('offices', office['offices'])
         versioning_mapper['offices_version'].append(office_id)
 
         for address in office['addresses']:
             address['business_id'] = business_id
             address['office_id'] = office_id
-            address_id = load_data(conn, 'addresses', address)
+            address_id = loader.load_data('addresses', address)
             versioning_mapper['addresses_version'].append(address_id)
 
     party_roles_map = {}
@@ -163,7 +191,7 @@ def load_corp_snapshot(conn: Connection, tombstone_data: dict, users_mapper: dic
         mailing_address_id = None
         delivery_address_id = None
         for address in party['addresses']:
-            address_id = load_data(conn, 'addresses', address)
+            address_id = loader.load_data('addresses', address)
             versioning_mapper['addresses_version'].append(address_id)
             if address['address_type'] == 'mailing':
                 mailing_address_id = address_id
@@ -175,13 +203,13 @@ def load_corp_snapshot(conn: Connection, tombstone_data: dict, users_mapper: dic
 
         source_full_name = party['parties']['cp_full_name']
         del party['parties']['cp_full_name']
-        party_id = load_data(conn, 'parties', party['parties'])
+        party_id = loader.load_data('parties', party['parties'])
         versioning_mapper['parties_version'].append(party_id)
 
         for party_role in party['party_roles']:
             party_role['business_id'] = business_id
             party_role['party_id'] = party_id
-            party_role_id = load_data(conn, 'party_roles', party_role, expecting_id=True)
+            party_role_id = loader.load_data('party_roles', party_role, expecting_id=True)
             versioning_mapper['party_roles_version'].append(party_role_id)
 
             # Create a unique key for mapping
@@ -194,27 +222,27 @@ def load_corp_snapshot(conn: Connection, tombstone_data: dict, users_mapper: dic
         party_role_id = party_roles_map.get(key)
         office_held['party_role_id'] = party_role_id
         del office_held['cp_full_name']
-        office_held_id = load_data(conn, 'offices_held', office_held)
+        office_held_id = loader.load_data('offices_held', office_held)
         versioning_mapper['offices_held_version'].append(office_held_id)
 
     for share_class in tombstone_data['share_classes']:
         share_class['share_classes']['business_id'] = business_id
-        share_class_id = load_data(conn, 'share_classes', share_class['share_classes'])
+        share_class_id = loader.load_data('share_classes', share_class['share_classes'])
         versioning_mapper['share_classes_version'].append(share_class_id)
 
         for share_series in share_class['share_series']:
             share_series['share_class_id'] = share_class_id
-            share_series_id = load_data(conn, 'share_series', share_series)
+            share_series_id = loader.load_data('share_series', share_series)
             versioning_mapper['share_series_version'].append(share_series_id)
 
     for alias in tombstone_data['aliases']:
         alias['business_id'] = business_id
-        alias_id = load_data(conn, 'aliases', alias)
+        alias_id = loader.load_data('aliases', alias)
         versioning_mapper['aliases_version'].append(alias_id)
 
     for resolution in tombstone_data['resolutions']:
         resolution['business_id'] = business_id
-        resolution_id = load_data(conn, 'resolutions', resolution)
+        resolution_id = loader.load_data('resolutions', resolution)
         versioning_mapper['resolutions_version'].append(resolution_id)
 
     for comment in tombstone_data['comments']:
@@ -222,27 +250,27 @@ def load_corp_snapshot(conn: Connection, tombstone_data: dict, users_mapper: dic
         username = comment['staff_id']
         staff_id = users_mapper.get(username)
         comment['staff_id'] = staff_id
-        load_data(conn, 'comments', comment, versioned=False)
+        loader.load_data('comments', comment, versioned=False)
 
     if in_dissolution := tombstone_data['in_dissolution']:
         batch = in_dissolution['batches']
-        batch_id = load_data(conn, 'batches', batch, versioned=False)
+        batch_id = loader.load_data('batches', batch, versioned=False)
         batch_processing = in_dissolution['batch_processing']
 
         batch_processing['batch_id'] = batch_id
         batch_processing['business_id'] = business_id
-        load_data(conn, 'batch_processing', batch_processing, versioned=False)
+        loader.load_data('batch_processing', batch_processing, versioned=False)
 
         furnishing = in_dissolution['furnishings']
         furnishing['batch_id'] = batch_id
         furnishing['business_id'] = business_id
-        load_data(conn, 'furnishings', furnishing, versioned=False)
+        loader.load_data('furnishings', furnishing, versioned=False)
 
     return business_id
 
 
 @task(name='3.2.1-Placeholder-Historical-Filings-Migrate-Task', cache_policy=NO_CACHE)
-def load_placeholder_filings(conn: Connection, tombstone_data: dict, business_id: int, users_mapper: dict, versioning_mapper: dict):
+def load_placeholder_filings(loader: RowLoader, tombstone_data: dict, business_id: int, users_mapper: dict, versioning_mapper: dict):
     """Migrate placeholder historical filings."""
     filings_data = tombstone_data['filings']
     update_info = tombstone_data['updates']
@@ -253,7 +281,7 @@ def load_placeholder_filings(conn: Connection, tombstone_data: dict, business_id
     # load placeholder filings
     for i, data in enumerate(filings_data):
         f = data['filings']
-        transaction_id = load_data(conn, 'transaction', {'issued_at': datetime.utcnow().isoformat()}, versioned=False)
+        transaction_id = loader.load_data('transaction', {'issued_at': datetime.utcnow().isoformat()}, versioned=False)
         username = f['submitter_id']
         user_id = users_mapper.get(username)
         f['submitter_id'] = user_id
@@ -262,13 +290,13 @@ def load_placeholder_filings(conn: Connection, tombstone_data: dict, business_id
         if (withdrawn_idx := f['withdrawn_filing_id']) is not None:
             f['withdrawn_filing_id'] = filing_ids_mapper[withdrawn_idx]
 
-        filing_id = load_data(conn, 'filings', f, versioned=False)
+        filing_id = loader.load_data('filings', f, versioned=False)
         filing_ids_mapper[i] = filing_id
         # Track the last historical filing ID (before lear_tombstone)
         last_historical_filing_id = filing_id
 
         data['colin_event_ids']['filing_id'] = filing_id
-        load_data(conn, 'colin_event_ids', data['colin_event_ids'], expecting_id=False, versioned=False)
+        loader.load_data('colin_event_ids', data['colin_event_ids'], expecting_id=False, versioned=False)
 
         if i == state_filing_index:
             update_info['businesses']['state_filing_id'] = filing_id
@@ -276,12 +304,12 @@ def load_placeholder_filings(conn: Connection, tombstone_data: dict, business_id
         if jurisdiction := data['jurisdiction']:
             jurisdiction['business_id'] = business_id
             jurisdiction['filing_id'] = filing_id
-            jurisdiction_id = load_data(conn, 'jurisdictions', jurisdiction)
+            jurisdiction_id = loader.load_data('jurisdictions', jurisdiction)
             versioning_mapper['jurisdictions_version'].append(jurisdiction_id)
 
         # load amalgamation snapshot linked to the current filing
         if amalgamation_data := data['amalgamations']:
-            load_amalgamation_snapshot(conn, amalgamation_data, business_id, filing_id, versioning_mapper)
+            load_amalgamation_snapshot(loader, amalgamation_data, business_id, filing_id, versioning_mapper)
 
         if comments_data := data['comments']:
             for comment in comments_data:
@@ -290,36 +318,36 @@ def load_placeholder_filings(conn: Connection, tombstone_data: dict, business_id
                 username = comment['staff_id']
                 staff_id = users_mapper.get(username)
                 comment['staff_id'] = staff_id
-                load_data(conn, 'comments', comment, versioned=False)
+                loader.load_data('comments', comment, versioned=False)
 
         if cco_data := data['consent_continuation_out']:
             cco_data['business_id'] = business_id
             cco_data['filing_id'] = filing_id
-            load_data(conn, 'consent_continuation_outs', cco_data, versioned=False)
+            loader.load_data('consent_continuation_outs', cco_data, versioned=False)
 
     # load epoch filing
     epoch_filing_data = build_epoch_filing(business_id)
-    transaction_id = load_data(conn, 'transaction', {'issued_at': datetime.utcnow().isoformat()}, versioned=False)
+    transaction_id = loader.load_data('transaction', {'issued_at': datetime.utcnow().isoformat()}, versioned=False)
     epoch_filing_data['transaction_id'] = transaction_id
-    load_data(conn, 'filings', epoch_filing_data, versioned=False)
+    loader.load_data('filings', epoch_filing_data, versioned=False)
 
     # load updates for business
     if update_business_data:
         # Set backfill_cutoff_filing_id to the last historical filing (before lear_tombstone)
         if last_historical_filing_id:
             update_business_data['backfill_cutoff_filing_id'] = last_historical_filing_id
-        update_data(conn, 'businesses', update_business_data, 'id', business_id)
+        loader.update_data('businesses', update_business_data, 'id', business_id)
 
     return transaction_id
 
 
 @task(name='3.2.2-Amalgamation-Snapshot-Migrate-Task', cache_policy=NO_CACHE)
-def load_amalgamation_snapshot(conn: Connection, amalgamation_data: dict, business_id: int, filing_id: int, versioning_mapper: dict):
+def load_amalgamation_snapshot(loader: RowLoader, amalgamation_data: dict, business_id: int, filing_id: int, versioning_mapper: dict):
     """Migrate amalgamation snapshot."""
     amalgamation = amalgamation_data['amalgamations']
     amalgamation['business_id'] = business_id
     amalgamation['filing_id'] = filing_id
-    amalgamation_id = load_data(conn, 'amalgamations', amalgamation)
+    amalgamation_id = loader.load_data('amalgamations', amalgamation)
     versioning_mapper['amalgamations_version'].append(amalgamation_id)
 
     for ting in amalgamation_data['amalgamating_businesses']:
@@ -332,12 +360,12 @@ def load_amalgamation_snapshot(conn: Connection, amalgamation_data: dict, busine
                 'state_filing_id': filing_id,
                 'dissolution_date': amalgamation['amalgamation_date']
             }
-            ting_business_id = update_data(conn, 'businesses', temp_ting, 'identifier', ting_identifier)
+            ting_business_id = loader.update_data('businesses', temp_ting, 'identifier', ting_identifier)
             if not ting_business_id:
                 raise Exception(f'TING {ting_identifier} does not exist, cannot migrate TED before TING')
             ting['business_id'] = ting_business_id
         ting['amalgamation_id'] = amalgamation_id
-        amalgamating_business_id = load_data(conn, 'amalgamating_businesses', ting)
+        amalgamating_business_id = loader.load_data('amalgamating_businesses', ting)
         versioning_mapper['amalgamating_businesses_version'].append(amalgamating_business_id)
 
 
@@ -428,11 +456,15 @@ def migrate_corp_users(colin_engine: Engine, lear_engine: Engine, corp_nums: lis
 
 
 @task(name='2-Get-Corp-Tombstone-Data-Task-Async', cache_policy=NO_CACHE)
-def get_tombstone_data(config, colin_engine: Engine, corp_num: str) -> tuple[str, dict]:
-    """Get tombstone data - corp snapshot and placeholder filings."""
+def get_tombstone_data(config, colin_engine: Engine, corp_num: str, raw_data: dict | None = None) -> tuple[str, dict]:
+    """Get tombstone data - corp snapshot and placeholder filings.
+
+    The raw data is collected for the corp, unless it was collected with the batch.
+    """
     try:
         print(f'👷 Start collecting corp snapshot and filings data for {corp_num}...')
-        raw_data = get_snapshot_filings_data(config, colin_engine, corp_num)
+        if raw_data is None:
+            raw_data = get_snapshot_filings_data(config, colin_engine, corp_num)
         # print(f'raw data: {raw_data}')
         clean_data = clean_snapshot_filings_data(raw_data)
         # print(f'clean data: {clean_data}')
@@ -443,6 +475,20 @@ def get_tombstone_data(config, colin_engine: Engine, corp_num: str) -> tuple[str
         return corp_num, e
 
 
+def load_corp(loader: RowLoader, clean_data: dict, users_mapper: dict):
+    """Load tombstone data of a corp - corp snapshot and placeholder filings."""
+    versioning_mapper = defaultdict(list)
+    business_id = load_corp_snapshot(
+        loader, clean_data, users_mapper, versioning_mapper)
+    tombstone_transaction_id = load_placeholder_filings(
+        loader,
+        clean_data,
+        business_id,
+        users_mapper,
+        versioning_mapper)
+    loader.update_versioning(tombstone_transaction_id, versioning_mapper)
+
+
 @task(name='3-Corp-Tombstone-Migrate-Task-Async', cache_policy=NO_CACHE)
 def migrate_tombstone(config, lear_engine: Engine, corp_num: str, clean_data: dict, users_mapper: dict,
                       account_ids: str | None = None) -> str:
@@ -453,17 +499,7 @@ def migrate_tombstone(config, lear_engine: Engine, corp_num: str, clean_data: di
     with lear_engine.connect() as lear_conn:
         transaction = lear_conn.begin()
         try:
-            versioning_mapper = defaultdict(list)
-            business_id = load_corp_snapshot(
-                lear_conn, clean_data, users_mapper, versioning_mapper)
-            tombstone_transaction_id = load_placeholder_filings(
-                lear_conn,
-                clean_data,
-                business_id,
-                users_mapper,
-                versioning_mapper)
-            update_versioning(
-                lear_conn, tombstone_transaction_id, versioning_mapper)
+            load_corp(RowLoader(lear_conn), clean_data, users_mapper)
             update_auth(lear_conn, config, corp_num, clean_data, account_ids)
             transaction.commit()
         except Exception as e:
@@ -476,6 +512,39 @@ def migrate_tombstone(config, lear_engine: Engine, corp_num: str, clean_data: di
     return corp_num, additional_info
 
 
+@task(name='3-Batch-Tombstone-Migrate-Task', cache_policy=NO_CACHE)
+def migrate_tombstone_batch(config, lear_engine: Engine, corps_data: list, users_mapper: dict) -> list:
+    """Migrate tombstone data of a batch of corps, writing the rows of all the corps at once.
+
+    A corp failing while its rows are buffered, or while its auth entity is created, is skipped: its buffered rows
+    are discarded so it can be retried as with migrate_tombstone. If writing the rows fails, all the corps fail.
+    """
+    print(f'👷 Start migrating {len(corps_data)} corps in bulk...')
+    results = []
+    with lear_engine.connect() as lear_conn:
+        transaction = lear_conn.begin()
+        try:
+            loader = BulkLoader(lear_conn, page_size=config.TOMBSTONE_BULK_LOAD_PAGE_SIZE)
+            for corp_num, clean_data, account_ids in corps_data:
+                try:
+                    with loader.corp():
+                        load_corp(loader, clean_data, users_mapper)
+                        update_auth(lear_conn, config, corp_num, clean_data, account_ids)
+                    results.append((corp_num, clean_data['unsupported_types']))
+                except Exception as e:
+                    print(f'❌ Error migrating corp snapshot and filings data for {corp_num}: {repr(e)}')
+                    results.append((corp_num, e))
+            loader.flush()
+            transaction.commit()
+        except Exception as e:
+            transaction.rollback()
+            print(f'❌ Error migrating {len(corps_data)} corps in bulk: {repr(e)}')
+            return [(corp_num, e) for corp_num, _, _ in corps_data]
+    print(f'✅ Complete migrating {len(corps_data)} corps in bulk!')
+
+    return results
+
+
 @flow(
     name='Corps-Tombstone-Migrate-Flow',
     log_prints=True,
@@ -556,21 +625,30 @@ def tombstone_flow():
                 is_user_failed = True
                 continue
 
+            batch_raw_data = {}
+            if config.TOMBSTONE_BATCH_EXTRACT:
+                batch_raw_data = get_batch_snapshot_filings_data(config, colin_engine, corp_nums)
+
             data_futures = []
             for corp_num in corp_nums:
                 data_futures.append(
-                    get_tombstone_data.submit(config, colin_engine, corp_num)
+                    get_tombstone_data.submit(config, colin_engine, corp_num, batch_raw_data.get(corp_num))
                 )
 
             corp_futures = []
+            corps_data = []
             failed = 0
             for f in data_futures:
                 corp_num, clean_data = f.result()
                 if clean_data and not isinstance(clean_data, Exception):
                     account_ids = corp_accounts.get(corp_num)
-                    corp_futures.append(
-                        migrate_tombstone.submit(config, lear_engine, corp_num, clean_data, users_mapper, account_ids)
-                    )
+                    if config.TOMBSTONE_BULK_LOAD:
+                        corps_data.append((corp_num, clean_data, account_ids))
+                    else:
+                        corp_futures.append(
+                            migrate_tombstone.submit(config, lear_engine, corp_num, clean_data, users_mapper,
+                                                     account_ids)
+                        )
                 else:
                     failed += 1
                     processing_service.update_corp_status(
@@ -582,10 +660,13 @@ def tombstone_flow():
                     print(f'❗ Skip migrating {corp_num} due to data collection error.')
 
             wait(corp_futures)
+            corp_results = [f.result() for f in corp_futures]
+            if corps_data:
+                corp_results += migrate_tombstone_batch(config, lear_engine, corps_data, users_mapper)
+
             complete = 0
             partial = 0
-            for f in corp_futures:
-                corp_num, e = f.result()
+            for corp_num, e in corp_results:
                 if not e:
                     complete += 1
                     processing_service.update_corp_status(
@@ -0,0 +1,185 @@
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Optional
+
+from psycopg2.extensions import AsIs
+from psycopg2.extras import execute_values
+from sqlalchemy import Connection, text
+from tombstone.tombstone_utils import (format_params, format_value, load_data,
+                                       update_data, update_versioning)
+
+# The tables are written parents first, a table missing from the list is written after the listed ones.
+# The business references its filings (state_filing_id, backfill_cutoff_filing_id) through updates, which are
+# applied after all the tables are written.
+BULK_LOAD_TABLE_ORDER = [
+    'transaction',
+    'businesses',
+    'offices',
+    'addresses',
+    'parties',
+    'party_roles',
+    'offices_held',
+    'share_classes',
+    'share_series',
+    'aliases',
+    'resolutions',
+    'batches',
+    'batch_processing',
+    'furnishings',
+    'filings',
+    'colin_event_ids',
+    'jurisdictions',
+    'amalgamations',
+    'amalgamating_businesses',
+    'comments',
+    'consent_continuation_outs',
+]
+
+DEFAULT = AsIs('DEFAULT')
+
+
+class RowLoader:
+    """Load each row as it is added, with load_data and update_data."""
+
+    def __init__(self, conn: Connection):
+        self.conn = conn
+
+    def load_data(self, table_name: str, data: dict, conflict_column: str = None, conflict_error: bool = False,
+                  expecting_id: bool = True, versioned: bool = True) -> Optional[int]:
+        return load_data(self.conn, table_name, data, conflict_column, conflict_error, expecting_id, versioned)
+
+    def update_data(self, table_name: str, data: dict, column: str, value: any, versioned: bool = True) -> int:
+        return update_data(self.conn, table_name, data, column, value, versioned)
+
+    def update_versioning(self, transaction_id: int, versioning_mapper: dict):
+        update_versioning(self.conn, transaction_id, versioning_mapper)
+
+
+class BulkLoader(RowLoader):
+    """Buffer the rows of a batch of corps per table and write each table at once on flush.
+
+    The ids are allocated from the table sequences in blocks when the rows are added, so the callers get the ids
+    for their foreign keys as with load_data. On flush, the base tables and then the version tables are written with
+    execute_values, parents first (BULK_LOAD_TABLE_ORDER), followed by the updates.
+    """
+
+    def __init__(self, conn: Connection, page_size: int = 1000, max_id_block_size: int = 10000):
+        super().__init__(conn)
+        self.page_size = page_size
+        self.max_id_block_size = max_id_block_size
+        self.rows = defaultdict(list)
+        self.version_rows = defaultdict(list)
+        self.updates = []
+        self.ids = defaultdict(list)
+        self.id_block_sizes = defaultdict(lambda: 100)
+        self.loaded_ids = defaultdict(set)
+        self.conflict_ids = defaultdict(dict)
+
+    def load_data(self, table_name: str, data: dict, conflict_column: str = None, conflict_error: bool = False,
+                  expecting_id: bool = True, versioned: bool = True) -> Optional[int]:
+        if conflict_column:
+            conflict_value = format_value(data[conflict_column])
+            check_result = self._find_id(table_name, conflict_column, conflict_value)
+            if check_result:
+                if not conflict_error:
+                    return check_result
+                else:
+                    raise Exception('Trying to reload corp existing in db, run delete script first')
+
+        id = None
+        if expecting_id:
+            id = self._next_id(table_name)
+            data['id'] = id
+            self.loaded_ids[table_name].add(id)
+            if conflict_column:
+                self.conflict_ids[table_name][(conflict_column, conflict_value)] = id
+        self.rows[table_name].append(format_params(data))
+
+        if versioned and expecting_id:
+            data['transaction_id'] = -1  # placeholder value, set by update_versioning
+            data['operation_type'] = 0
+            self.version_rows[f'{table_name}_version'].append(format_params(data))
+
+        return id
+
+    def update_data(self, table_name: str, data: dict, column: str, value: any, versioned: bool = True) -> int:
+        """Queue the update, it is applied once the buffered rows are written."""
+        if column == 'id' and value in self.loaded_ids[table_name]:
+            id = value
+        else:
+            id = self._find_id(table_name, column, format_value(value))
+        if id:
+            self.updates.append((table_name, dict(data), column, value, versioned))
+        return id
+
+    def update_versioning(self, transaction_id: int, versioning_mapper: dict):
+        for version_table, ids in versioning_mapper.items():
+            ids = set(ids)
+            for row in self.version_rows[version_table]:
+                if row['id'] in ids:
+                    row['transaction_id'] = transaction_id
+
+    @contextmanager
+    def corp(self):
+        """Discard the rows and updates added for the corp if it fails."""
+        row_counts = {k: len(v) for k, v in self.rows.items()}
+        version_row_counts = {k: len(v) for k, v in self.version_rows.items()}
+        update_count = len(self.updates)
+        conflict_ids = {k: dict(v) for k, v in self.conflict_ids.items()}
+        try:
+            yield self
+        except Exception:
+            for k, v in self.rows.items():
+                del v[row_counts.get(k, 0):]
+            for k, v in self.version_rows.items():
+                del v[version_row_counts.get(k, 0):]
+            del self.updates[update_count:]
+            self.conflict_ids = defaultdict(dict, conflict_ids)
+            raise
+
+    def flush(self):
+        """Write the buffered rows and apply the updates, in the current transaction of the connection."""
+        with self.conn.connection.cursor() as cursor:
+            for table_name in self._ordered(self.rows):
+                self._write(cursor, table_name, self.rows[table_name])
+            for table_name in self._ordered(self.version_rows, '_version'):
+                self._write(cursor, table_name, self.version_rows[table_name])
+
+        for table_name, data, column, value, versioned in self.updates:
+            update_data(self.conn, table_name, data, column, value, versioned)
+
+        self.rows.clear()
+        self.version_rows.clear()
+        self.updates.clear()
+        self.loaded_ids.clear()
+        self.conflict_ids.clear()
+
+    def _find_id(self, table_name: str, column: str, value: any) -> Optional[int]:
+        """Return the id of the row with the value, from the rows of the batch first as they are not in the db yet."""
+        if id := self.conflict_ids[table_name].get((column, value)):
+            return id
+        check_query = f"select id from {table_name} where {column} = :value"
+        return self.conn.execute(text(check_query), {'value': value}).scalar()
+
+    def _next_id(self, table_name: str) -> int:
+        if not self.ids[table_name]:
+            block_size = self.id_block_sizes[table_name]
+            # grow the blocks of the tables with many rows per batch, the ids left at the end are not reused
+            self.id_block_sizes[table_name] = min(block_size * 2, self.max_id_block_size)
+            query = f"""select nextval(pg_get_serial_sequence('{table_name}', 'id')) from generate_series(1, :count)"""
+            self.ids[table_name] = list(reversed(self.conn.execute(text(query), {'count': block_size}).scalars().all()))
+        return self.ids[table_name].pop()
+
+    def _write(self, cursor, table_name: str, rows: list[dict]):
+        if not rows:
+            return
+        # the rows of a table may not have the same keys, the missing ones get the column default
+        columns = list(dict.fromkeys(k for row in rows for k in row))
+        values = [tuple(row.get(k, DEFAULT) for k in columns) for row in rows]
+        query = f"""insert into {table_name} ({', '.join(columns)}) values %s"""
+        execute_values(cursor, query, values, page_size=self.page_size)
+
+    @staticmethod
+    def _ordered(rows: dict, suffix: str = '') -> list:
+        order = {f'{table_name}{suffix}': i for i, table_name in enumerate(BULK_LOAD_TABLE_ORDER)}
+        return sorted(rows, key=lambda table_name: order.get(table_name, len(order)))
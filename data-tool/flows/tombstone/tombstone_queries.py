@@ -902,3 +902,31 @@ def get_corp_snapshot_filings_queries(config, corp_num):
     }
 
     return queries
+
+
+BATCH_CORP_NUM = '__batch_corp_num__'
+
+
+def get_corp_snapshot_filings_batch_queries(config):
+    """Get the snapshot queries for a batch of corps, bound to the :corp_nums list.
+
+    Each query runs once for the batch, laterally joined to the corp nums, so the queries (some of which match the
+    corp num in scalar subqueries) keep the rows and row order of the query for a single corp. The rows are tagged
+    with batch_corp_num and ordered by corp, to be partitioned by corp.
+    """
+    queries = {}
+    for k, q in get_corp_snapshot_filings_queries(config, BATCH_CORP_NUM).items():
+        q = q.strip().rstrip(';').replace(f"'{BATCH_CORP_NUM}'", 'b.corp_num')
+        queries[k] = f"""
+    select b.corp_num as batch_corp_num, q.*
+    from unnest(cast(:corp_nums as varchar[])) with ordinality as b(corp_num, corp_order)
+    cross join lateral (
+        select sub.*, row_number() over () as batch_row_num
+        from (
+            {q}
+        ) sub
+    ) q
+    order by b.corp_order, q.batch_row_num
+    """
+
+    return queries
@@ -91,6 +91,8 @@ class _Config:
     REPORT_API_GOTENBERG_AUDIENCE = os.getenv("REPORT_API_GOTENBERG_AUDIENCE", "")
     REPORT_API_GOTENBERG_URL = os.getenv("REPORT_API_GOTENBERG_URL", "https://")
     REPORT_TEMPLATE_PATH = os.getenv("REPORT_PATH", "report-templates")
+    # number of letters rendered by Gotenberg at the same time
+    FURNISHING_RENDER_MAX_WORKERS = int(os.getenv("FURNISHING_RENDER_MAX_WORKERS", "4"))
     # Letter - MRAS
     MRAS_SVC_URL = os.getenv("MRAS_SVC_URL")
     MRAS_SVC_API_KEY = os.getenv("MRAS_SVC_API_KEY")
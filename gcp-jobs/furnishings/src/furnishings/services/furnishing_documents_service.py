@@ -16,7 +16,11 @@
 NOTE: This is copied from legal-api.
 It was decided not to turn this into a common service as it is only used in 2 places."""
 import io
-from typing import Final
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import BinaryIO, Final
 
 import PyPDF2
 from flask import current_app
@@ -40,30 +44,86 @@ class FurnishingDocumentsService:
         self._report.set_report_data(business=furnishing.business, furnishing=furnishing)
         return self._report.get_pdf()
 
-    def get_merged_furnishing_document(self, furnishings: list) -> bytes:
-        """Return a merged batch furnishing document with cover."""
-        pdfs = self._get_batch_furnishing_documents(furnishings)
-        cover = self._get_batch_cover(pdfs)
-        files = {
-            "cover": cover,
-            "contents": pdfs
-        }
-        return self._merge_documents(files)
+    def get_merged_furnishing_document(self, furnishings: list, output: BinaryIO | None = None) -> bytes | BinaryIO:
+        """Return a merged batch furnishing document with cover.
+
+        The merged document is written to the output file when given (and the output is returned), otherwise the
+        merged document bytes are returned. None is returned if the documents could not be merged.
+        """
+        with ExitStack() as stack:
+            pdfs = self._get_batch_furnishing_documents(furnishings, stack)
+            cover = self._get_batch_cover(pdfs)
+            files = {
+                "cover": cover,
+                "contents": pdfs
+            }
+            if output is not None:
+                return output if self._merge_documents(files, output) else None
+            writer_buffer = io.BytesIO()
+            return writer_buffer.getvalue() if self._merge_documents(files, writer_buffer) else None
 
-    def _get_batch_furnishing_documents(self, furnishings: list) -> list:
+    def _get_batch_furnishing_documents(self, furnishings: list, stack: ExitStack) -> list:
+        """Render the furnishing documents in order, posting up to FURNISHING_RENDER_MAX_WORKERS at a time.
+
+        The template data is loaded in this thread (it uses the db session), only the Gotenberg requests are posted
+        by the workers. Each rendered pdf is spooled to a temp file which is closed when the stack is closed.
+        """
         self._report._document_key = ReportTypes.DISSOLUTION  # pylint: disable=protected-access
+        max_workers = max(current_app.config.get("FURNISHING_RENDER_MAX_WORKERS", 1), 1)
         pdfs = []
-        for f in furnishings:
-            self._report.set_report_data(business=f.business, furnishing=f)
-            pdf = self._report.get_pdf()
-            if not pdf:
-                current_app.logger.error(
-                    f"Error generating PDF for furnishing {f.id}, business {f.business.id}, skip."
-                )
-                continue
-            pdfs.append(pdf)
+        pending: deque[tuple[Furnishing, Future]] = deque()
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="furnishing-render") as executor:
+            try:
+                for f in furnishings:
+                    self._report.set_report_data(business=f.business, furnishing=f)
+                    pending.append((f, executor.submit(self._render_document, self._report.get_pdf_request())))
+                    # bound the requests held in memory while waiting on the workers
+                    if len(pending) >= max_workers * 2:
+                        self._collect_document(*pending.popleft(), pdfs, stack)
+                while pending:
+                    self._collect_document(*pending.popleft(), pdfs, stack)
+            except BaseException:
+                self._discard_pending(executor, pending)
+                raise
         return pdfs
 
+    @staticmethod
+    def _discard_pending(executor: ThreadPoolExecutor, pending: deque):
+        """Cancel the renders not started yet and close the temp files of the ones already rendered."""
+        executor.shutdown(wait=True, cancel_futures=True)
+        for _, future in pending:
+            if future.cancelled() or future.exception() is not None:
+                continue
+            if pdf_file := future.result():
+                pdf_file.close()
+
+    @staticmethod
+    def _render_document(pdf_request: dict) -> BinaryIO | None:
+        pdf = ReportV2.post_pdf(pdf_request)
+        if not pdf:
+            return None
+        with ExitStack() as stack:
+            pdf_file = stack.enter_context(tempfile.TemporaryFile())
+            pdf_file.write(pdf)
+            pdf_file.seek(0)
+            # closed by the caller once it is merged
+            stack.pop_all()
+            return pdf_file
+
+    @staticmethod
+    def _collect_document(furnishing: Furnishing, future: Future, pdfs: list, stack: ExitStack):
+        try:
+            pdf_file = future.result()
+        except Exception as e:
+            current_app.logger.error(f"Error rendering PDF for furnishing {furnishing.id}: {e}")
+            pdf_file = None
+        if not pdf_file:
+            current_app.logger.error(
+                f"Error generating PDF for furnishing {furnishing.id}, business {furnishing.business.id}, skip."
+            )
+            return
+        pdfs.append(stack.enter_context(pdf_file))
+
     def _get_batch_cover(self, files: list) -> bytes:
         self._report._document_key = ReportTypes.DISSOLUTION_COVER
         self._report._report_data = {
@@ -81,21 +141,20 @@ class FurnishingDocumentsService:
         return cover
 
     @staticmethod
-    def _merge_documents(files: dict) -> bytes:
+    def _merge_documents(files: dict, output: BinaryIO) -> bool:
+        """Merge the cover and the rendered pdf files into the output, return whether it was successful."""
         try:
             merger = PyPDF2.PdfMerger()
             if files["cover"]:
                 merger.append(io.BytesIO(files["cover"]))
-            contents = files["contents"]
-            for _, pdf in enumerate(contents):
-                merger.append(io.BytesIO(pdf))
-            writer_buffer = io.BytesIO()
-            merger.write(writer_buffer)
+            for pdf_file in files["contents"]:
+                merger.append(pdf_file)
+            merger.write(output)
             merger.close()
-            return writer_buffer.getvalue()
+            return True
         except Exception as e:
             current_app.logger.error(f"Error merging PDF:{e}")
-            return None
+            return False
 
     @staticmethod
     def _get_batch_custom_identifier() -> int:
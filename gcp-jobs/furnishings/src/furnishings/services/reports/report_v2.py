@@ -67,6 +67,13 @@ class ReportV2:
 
     def get_pdf(self):
         """Render the furnishing document pdf response."""
+        return ReportV2.post_pdf(self.get_pdf_request())
+
+    def get_pdf_request(self) -> dict:
+        """Return the Gotenberg request of the furnishing document pdf.
+
+        The template data is loaded here, so the request can be posted outside of the app context and db session.
+        """
         headers = {}
         token = ReportV2.get_report_api_token()
         if token:
@@ -78,7 +85,12 @@ class ReportV2:
             "templateVars": self._get_template_data()
         }
         files = self._get_report_files(data)
-        response = requests.post(url=url, headers=headers, data=REPORT_META_DATA, files=files, timeout=1800.0)
+        return {"url": url, "headers": headers, "data": REPORT_META_DATA, "files": files}
+
+    @staticmethod
+    def post_pdf(pdf_request: dict) -> bytes | None:
+        """Post the request to Gotenberg and return the pdf, or None if it was not rendered."""
+        response = requests.post(**pdf_request, timeout=1800.0)
 
         if response.status_code != HTTPStatus.OK:
             return None
@@ -13,7 +13,9 @@
 # limitations under the License.
 """Furnishings job processing rules for stage one of involuntary dissolution."""
 import base64
+import tempfile
 import uuid
+from contextlib import ExitStack
 from datetime import UTC, datetime
 from http import HTTPStatus
 from io import BytesIO
@@ -92,6 +94,8 @@ class StageOneProcessor:
 
         except (OSError, Exception) as err:
             current_app.logger.error(err)
+        finally:
+            self.close_paper_letters()
 
     def process_batch(self, batch_processing: BatchProcessing):
         """Process batch_processing entry."""
@@ -134,30 +138,52 @@ class StageOneProcessor:
             document_service = FurnishingDocumentsService(ReportTypes.DISSOLUTION, "greyscale")
             if self._bc_mail_furnishings:
                 self._app.logger.debug("Start generating BC batch letter.")
-                self._bc_letters = document_service.get_merged_furnishing_document(self._bc_mail_furnishings)
+                self._bc_letters = self._generate_batch_letter(document_service, self._bc_mail_furnishings)
                 self._app.logger.debug("Finish generating BC batch letter.")
             if self._xpro_mail_furnishings:
                 self._app.logger.debug("Start generating XPRO batch letter.")
-                self._xpro_letters = document_service.get_merged_furnishing_document(self._xpro_mail_furnishings)
+                self._xpro_letters = self._generate_batch_letter(document_service, self._xpro_mail_furnishings)
                 self._app.logger.debug("Finish generating XPRO batch letter.")
         except Exception as e:
             self._app.logger.error(f"Error generating batch letters: {e}")
         self._app.logger.debug("Finish generating batch letters.")
 
+    @staticmethod
+    def _generate_batch_letter(document_service: FurnishingDocumentsService, furnishings: list):
+        """Merge the batch letter into a temp file, so it is not held in memory until it is uploaded."""
+        with ExitStack() as stack:
+            letters = stack.enter_context(tempfile.TemporaryFile())
+            merged = document_service.get_merged_furnishing_document(furnishings, letters)
+            if merged is letters:
+                # kept open for the upload, it is closed by close_paper_letters
+                stack.pop_all()
+            return merged
+
+    def close_paper_letters(self):
+        """Close the temp files of the generated batch letters."""
+        for letters in (self._bc_letters, self._xpro_letters):
+            if hasattr(letters, "close"):
+                letters.close()
+        self._bc_letters = None
+        self._xpro_letters = None
+
     def upload_to_sftp(self, client, data, filename):
-        """SFTP data to targeted destination."""
+        """SFTP data (bytes or a file) to targeted destination."""
+        fl = data if hasattr(data, "read") else BytesIO(data)
+        fl.seek(0)
         return client.putfo(
-            fl=BytesIO(data),
+            fl=fl,
             remotepath=f'{self._app.config.get("BCMAIL_SFTP_STORAGE_DIRECTORY")}/{filename}'
         )
 
     def update_notes_and_status(self, furnishings_list, funishing_status, furnishing_notes=None):
         """Update the notes and status of furnishing entries in a list."""
-        for furnishing in furnishings_list:
-            furnishing.notes = furnishing_notes
-            furnishing.status = funishing_status
-            furnishing.processed_date = datetime.now(UTC)
-            furnishing.save()
+        Furnishing.bulk_update_status(
+            [furnishing.id for furnishing in furnishings_list],
+            funishing_status,
+            furnishing_notes,
+            datetime.now(UTC)
+        )
 
     def process_paper_letters(self):
         """Process the generated paper letts of BC and XPRO businesses (SFTP)."""
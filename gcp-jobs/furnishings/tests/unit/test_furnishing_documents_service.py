@@ -0,0 +1,109 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the furnishing documents service."""
+import io
+import tempfile
+from http import HTTPStatus
+from unittest.mock import patch
+
+import PyPDF2
+import pytest
+
+from business_model.models import Address, Business, Furnishing
+from furnishings.services.furnishing_documents_service import FurnishingDocumentsService
+from furnishings.services.reports.report_v2 import ReportTypes
+
+from . import (
+    GOTENBURG_RESPONSE,
+    factory_address,
+    factory_batch,
+    factory_business,
+    factory_furnishing,
+)
+
+
+def test_get_merged_furnishing_document(requests_mock, app, session):
+    """Assert that the letters are rendered concurrently and merged in order into the output file."""
+    batch = factory_batch()
+    furnishings = []
+    for i in range(3):
+        business = factory_business(identifier=f"A000000{i}", entity_type=Business.LegalTypes.EXTRA_PRO_A.value)
+        furnishing = factory_furnishing(
+            batch_id=batch.id,
+            business_id=business.id,
+            identifier=business.identifier,
+            furnishing_type=Furnishing.FurnishingType.MAIL
+        )
+        factory_address(address_type=Address.MAILING, furnishings_id=furnishing.id)
+        furnishings.append(furnishing)
+
+    gotenburg_url = f"{app.config['REPORT_API_GOTENBERG_URL']}/forms/chromium/convert/html"
+    # the second letter fails to render and is skipped, the last response is the cover
+    report_gotenburg_mock = requests_mock.post(gotenburg_url, [
+        {"content": GOTENBURG_RESPONSE},
+        {"status_code": HTTPStatus.INTERNAL_SERVER_ERROR},
+        {"content": GOTENBURG_RESPONSE},
+        {"content": GOTENBURG_RESPONSE},
+    ])
+    page_count = len(PyPDF2.PdfReader(io.BytesIO(GOTENBURG_RESPONSE)).pages)
+
+    with patch.dict(app.config, {"FURNISHING_RENDER_MAX_WORKERS": 2}), tempfile.TemporaryFile() as output:
+        document_service = FurnishingDocumentsService(ReportTypes.DISSOLUTION, "greyscale")
+        assert document_service.get_merged_furnishing_document(furnishings, output) is output
+
+        output.seek(0)
+        assert len(PyPDF2.PdfReader(output).pages) == page_count * 3
+        assert report_gotenburg_mock.call_count == 4
+
+
+def test_get_merged_furnishing_document_error(requests_mock, app, session):
+    """Assert that the rendered letters are closed when the batch fails part way."""
+    batch = factory_batch()
+    furnishings = []
+    for i in range(3):
+        business = factory_business(identifier=f"A000000{i}", entity_type=Business.LegalTypes.EXTRA_PRO_A.value)
+        furnishing = factory_furnishing(
+            batch_id=batch.id,
+            business_id=business.id,
+            identifier=business.identifier,
+            furnishing_type=Furnishing.FurnishingType.MAIL
+        )
+        factory_address(address_type=Address.MAILING, furnishings_id=furnishing.id)
+        furnishings.append(furnishing)
+
+    gotenburg_url = f"{app.config['REPORT_API_GOTENBERG_URL']}/forms/chromium/convert/html"
+    requests_mock.post(gotenburg_url, content=GOTENBURG_RESPONSE)
+
+    pdf_files = []
+
+    def temporary_file():
+        pdf_files.append(tempfile.TemporaryFile())
+        return pdf_files[-1]
+
+    document_service = FurnishingDocumentsService(ReportTypes.DISSOLUTION, "greyscale")
+    set_report_data = document_service._report.set_report_data
+
+    def fail_on_last_furnishing(business, furnishing):
+        if furnishing is furnishings[-1]:
+            raise ValueError("report data")
+        set_report_data(business=business, furnishing=furnishing)
+
+    with patch.dict(app.config, {"FURNISHING_RENDER_MAX_WORKERS": 2}), \
+            patch("furnishings.services.furnishing_documents_service.tempfile.TemporaryFile", temporary_file), \
+            patch.object(document_service._report, "set_report_data", side_effect=fail_on_last_furnishing), \
+            pytest.raises(ValueError):
+        document_service.get_merged_furnishing_document(furnishings)
+
+    assert pdf_files
+    assert all(pdf_file.closed for pdf_file in pdf_files)
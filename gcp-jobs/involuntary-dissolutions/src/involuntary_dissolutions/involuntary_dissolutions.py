@@ -197,6 +197,7 @@ def stage_1_process(app: Flask):  # pylint: disable=redefined-outer-name,too-man
         app.logger.debug(f"New batch has been created with ID: {batch.id}")
 
         # create batch processing entries for each business being dissolved
+        batch_processings = []
         for business_elgible in businesses_eligible:
             business, ar_overdue, transition_overdue = business_elgible
             batch_processing = BatchProcessing(business_identifier=business.identifier,
@@ -212,8 +213,9 @@ def stage_1_process(app: Flask):  # pylint: disable=redefined-outer-name,too-man
                 "overdueTransition": transition_overdue,
                 "stage_1_date": datetime.now(UTC).isoformat()
             }
-            batch_processing.save()
-            app.logger.debug(f"New batch processing has been created with ID: {batch_processing.id}")
+            batch_processings.append(batch_processing)
+        BatchProcessing.bulk_save(batch_processings)
+        app.logger.debug(f"{len(batch_processings)} new batch processings have been created for batch ID: {batch.id}")
 
 
     except Exception as err:  # pylint: disable=redefined-outer-name; noqa: B902
@@ -270,41 +272,52 @@ def stage_2_process(app: Flask):
 
     stage_2_delay = timedelta(days=app.config.get("STAGE_2_DELAY"))
 
-    for batch_processing in batch_processings:
-        furnishings = Furnishing.find_by(
-            batch_id=batch_processing.batch_id,
-            business_id=batch_processing.business_id
-        )
+    updates = []
+    try:
+        for batch_processing in batch_processings:
+            furnishings = Furnishing.find_by(
+                batch_id=batch_processing.batch_id,
+                business_id=batch_processing.business_id
+            )
 
-        furnishing_entry_completed = _check_stage_1_furnishing_entries(furnishings)
+            furnishing_entry_completed = _check_stage_1_furnishing_entries(furnishings)
+
+            if not furnishing_entry_completed:
+                updates.append({
+                    "id": batch_processing.id,
+                    "status": BatchProcessing.BatchProcessingStatus.ERROR,
+                    "notes": "stage 1 email or letter has not been sent"
+                })
+                app.logger.debug(
+                    f"Changed Batch Processing with id: {batch_processing.id} status to Error. "
+                    "Stage 1 email or letter has not been sent"
+                )
+                continue
 
-        if not furnishing_entry_completed:
-            batch_processing.status = BatchProcessing.BatchProcessingStatus.ERROR
-            batch_processing.notes = "stage 1 email or letter has not been sent"
-            batch_processing.save()
-            app.logger.debug(
-                f"Changed Batch Processing with id: {batch_processing.id} status to Error. "
-                "Stage 1 email or letter has not been sent"
+            eligible, _ = InvoluntaryDissolutionService.check_business_eligibility(
+                batch_processing.business_identifier,
+                InvoluntaryDissolutionService.EligibilityFilters(exclude_in_dissolution=False)
             )
-            continue
-
-        eligible, _ = InvoluntaryDissolutionService.check_business_eligibility(
-            batch_processing.business_identifier,
-            InvoluntaryDissolutionService.EligibilityFilters(exclude_in_dissolution=False)
-        )
-        if eligible:
-            batch_processing.step = BatchProcessing.BatchProcessingStep.WARNING_LEVEL_2
-            batch_processing.trigger_date = datetime.now(UTC) + stage_2_delay
-            app.logger.debug(f"Changed Batch Processing with id: {batch_processing.id} step to level 2.")
-            if batch_processing.meta_data is None:
-                batch_processing.meta_data = {}
-            batch_processing.meta_data = {**batch_processing.meta_data, "stage_2_date": datetime.now(UTC).isoformat()}
-        else:
-            batch_processing.status = BatchProcessing.BatchProcessingStatus.WITHDRAWN
-            batch_processing.notes = "Moved back into good standing"
-            app.logger.debug(f"Changed Batch Processing with id: {batch_processing.id} status to Withdrawn.")
-        batch_processing.last_modified = datetime.now(UTC)
-        batch_processing.save()
+            if eligible:
+                updates.append({
+                    "id": batch_processing.id,
+                    "step": BatchProcessing.BatchProcessingStep.WARNING_LEVEL_2,
+                    "trigger_date": datetime.now(UTC) + stage_2_delay,
+                    "meta_data": {**(batch_processing.meta_data or {}), "stage_2_date": datetime.now(UTC).isoformat()},
+                    "last_modified": datetime.now(UTC)
+                })
+                app.logger.debug(f"Changed Batch Processing with id: {batch_processing.id} step to level 2.")
+            else:
+                updates.append({
+                    "id": batch_processing.id,
+                    "status": BatchProcessing.BatchProcessingStatus.WITHDRAWN,
+                    "notes": "Moved back into good standing",
+                    "last_modified": datetime.now(UTC)
+                })
+                app.logger.debug(f"Changed Batch Processing with id: {batch_processing.id} status to Withdrawn.")
+    finally:
+        # applied even when a business fails, so the entries processed before it keep their updates
+        BatchProcessing.bulk_update(updates)
 
 
 def stage_3_process(app: Flask):
@@ -328,53 +341,66 @@ def stage_3_process(app: Flask):
 
     # TODO: add check if warnings have been sent out & set batch_processing.status to error if not
 
-    for batch_processing in batch_processings:
-        # Check if gazette furnishing entry has been completed. If not, do not transition to stage 3.
-        furnishings = Furnishing.find_by(
-            batch_id=batch_processing.batch_id,
-            business_id=batch_processing.business_id
-        )
-        furnishing_entry_completed = any(
-            (furnishing.furnishing_type == Furnishing.FurnishingType.GAZETTE)
-            and furnishing.status == Furnishing.FurnishingStatus.PROCESSED
-            for furnishing in furnishings
-        )
-        if not furnishing_entry_completed:
-            batch_processing.status = BatchProcessing.BatchProcessingStatus.ERROR
-            batch_processing.notes = "stage 2 intent to dissolve data has not been sent"
-            batch_processing.save()
-            app.logger.debug(
-                f"Changed Batch Processing with id: {batch_processing.id} status to Error. "
-                "Stage 2 intent to dissolve data has not been sent"
+    updates = []
+    try:
+        for batch_processing in batch_processings:
+            # Check if gazette furnishing entry has been completed. If not, do not transition to stage 3.
+            furnishings = Furnishing.find_by(
+                batch_id=batch_processing.batch_id,
+                business_id=batch_processing.business_id
             )
-            continue
-
-        eligible, _ = InvoluntaryDissolutionService.check_business_eligibility(
-            batch_processing.business_identifier,
-            InvoluntaryDissolutionService.EligibilityFilters(exclude_in_dissolution=False)
-        )
-        batch_processing.last_modified = datetime.now(UTC)
-        if eligible:
-            filing = create_invountary_dissolution_filing(batch_processing.business_id)
-            app.logger.debug(f"Created Involuntary Dissolution Filing with ID: {filing.id}")
-            batch_processing.filing_id = filing.id
-            batch_processing.step = BatchProcessing.BatchProcessingStep.DISSOLUTION
-            batch_processing.status = BatchProcessing.BatchProcessingStatus.QUEUED
-            if batch_processing.meta_data is None:
-                batch_processing.meta_data = {}
-            batch_processing.meta_data = {**batch_processing.meta_data, "stage_3_date": datetime.now(UTC).isoformat()}
-            batch_processing.save()
-
-            put_filing_on_queue(filing.id, app)
-
-            app.logger.debug(
-                f"Batch Processing with identifier: {batch_processing.business_identifier} has been marked as queued."
+            furnishing_entry_completed = any(
+                (furnishing.furnishing_type == Furnishing.FurnishingType.GAZETTE)
+                and furnishing.status == Furnishing.FurnishingStatus.PROCESSED
+                for furnishing in furnishings
             )
-        else:
-            batch_processing.status = BatchProcessing.BatchProcessingStatus.WITHDRAWN
-            batch_processing.notes = "Moved back into good standing"
-            batch_processing.save()
+            if not furnishing_entry_completed:
+                updates.append({
+                    "id": batch_processing.id,
+                    "status": BatchProcessing.BatchProcessingStatus.ERROR,
+                    "notes": "stage 2 intent to dissolve data has not been sent"
+                })
+                app.logger.debug(
+                    f"Changed Batch Processing with id: {batch_processing.id} status to Error. "
+                    "Stage 2 intent to dissolve data has not been sent"
+                )
+                continue
 
+            eligible, _ = InvoluntaryDissolutionService.check_business_eligibility(
+                batch_processing.business_identifier,
+                InvoluntaryDissolutionService.EligibilityFilters(exclude_in_dissolution=False)
+            )
+            if eligible:
+                # saved before the filing is queued, as the filer completes the batch processing of the filing
+                batch_processing.last_modified = datetime.now(UTC)
+                filing = create_invountary_dissolution_filing(batch_processing.business_id)
+                app.logger.debug(f"Created Involuntary Dissolution Filing with ID: {filing.id}")
+                batch_processing.filing_id = filing.id
+                batch_processing.step = BatchProcessing.BatchProcessingStep.DISSOLUTION
+                batch_processing.status = BatchProcessing.BatchProcessingStatus.QUEUED
+                if batch_processing.meta_data is None:
+                    batch_processing.meta_data = {}
+                batch_processing.meta_data = {
+                    **batch_processing.meta_data, "stage_3_date": datetime.now(UTC).isoformat()
+                }
+                batch_processing.save()
+
+                put_filing_on_queue(filing.id, app)
+
+                app.logger.debug(
+                    f"Batch Processing with identifier: {batch_processing.business_identifier} "
+                    "has been marked as queued."
+                )
+            else:
+                updates.append({
+                    "id": batch_processing.id,
+                    "status": BatchProcessing.BatchProcessingStatus.WITHDRAWN,
+                    "notes": "Moved back into good standing",
+                    "last_modified": datetime.now(UTC)
+                })
+    finally:
+        # applied even when a business fails, so the entries processed before it keep their updates
+        BatchProcessing.bulk_update(updates)
     mark_eligible_batches_completed()
     app.logger.debug("Marked batches complete when all of their associated batch_processings are completed.")
 
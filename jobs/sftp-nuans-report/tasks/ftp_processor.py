@@ -14,6 +14,7 @@
 import os
 import logging
 from typing import List
+from business_common.utils.fixed_width_export import upload
 from services.sftp import SFTPService
 
 
@@ -29,7 +30,7 @@ class FtpProcessor:  # pylint:disable=too-few-public-methods
                 for file in file_list:
                     if not file.startswith("sftp_priv_key_file"):
                         file_full_name = data_dir + file
-                        sftp_client.put(file_full_name)
+                        upload(sftp_client, file_full_name)
                         logging.info('SFTP to NUANS completed for file: %s', file_full_name)
 
             except Exception as e:  # NOQA # pylint: disable=broad-except
@@ -0,0 +1,48 @@
+"""outbox events
+
+Revision ID: c3d5e7f9a1b2
+Revises: 4df1fdafb9ea
+Create Date: 2026-10-18 11:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3d5e7f9a1b2'
+down_revision = '4df1fdafb9ea'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('outbox_events',
+                    sa.Column('id', sa.Integer(), nullable=False),
+                    sa.Column('idempotency_key', sa.String(length=100), nullable=False),
+                    sa.Column('event_type', sa.String(length=50), nullable=False),
+                    sa.Column('status', sa.Enum('PENDING', 'COMPLETED', 'FAILED', name='outbox_event_status'),
+                              nullable=False),
+                    sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+                    sa.Column('attempts', sa.Integer(), nullable=False),
+                    sa.Column('last_error', sa.String(length=1000), nullable=True),
+                    sa.Column('created_date', sa.DateTime(timezone=True), nullable=True),
+                    sa.Column('next_attempt_date', sa.DateTime(timezone=True), nullable=True),
+                    sa.Column('processed_date', sa.DateTime(timezone=True), nullable=True),
+                    sa.Column('filing_id', sa.Integer(), nullable=False),
+                    sa.Column('business_id', sa.Integer(), nullable=True),
+                    sa.ForeignKeyConstraint(['business_id'], ['businesses.id'], ),
+                    sa.ForeignKeyConstraint(['filing_id'], ['filings.id'], ),
+                    sa.PrimaryKeyConstraint('id'),
+                    sa.UniqueConstraint('idempotency_key'))
+    op.create_index(op.f('ix_outbox_events_filing_id'), 'outbox_events', ['filing_id'], unique=False)
+    op.create_index('ix_outbox_events_status_next_attempt_date', 'outbox_events', ['status', 'next_attempt_date'],
+                    unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_outbox_events_status_next_attempt_date', table_name='outbox_events')
+    op.drop_index(op.f('ix_outbox_events_filing_id'), table_name='outbox_events')
+    op.drop_table('outbox_events')
+    sa.Enum(name='outbox_event_status').drop(op.get_bind(), checkfirst=True)
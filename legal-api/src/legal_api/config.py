@@ -97,6 +97,8 @@ class _Config:  # pylint: disable=too-few-public-methods
     NAICS_API_URL = f'{BUSINESS_API_URL + BUSINESS_API_VERSION_2}/naics'
 
     REPORT_TEMPLATE_PATH = os.getenv('REPORT_PATH', 'report-templates')
+    # rebuild cached report templates when a template file changes on disk
+    REPORT_TEMPLATE_CACHE_CHECK_MTIME = os.getenv('REPORT_TEMPLATE_CACHE_CHECK_MTIME', 'false').lower() == 'true'
     FONTS_PATH = os.getenv('FONTS_PATH', 'fonts')
 
     GO_LIVE_DATE = os.getenv('GO_LIVE_DATE')
@@ -189,6 +191,31 @@ class _Config:  # pylint: disable=too-few-public-methods
     except (TypeError, ValueError):
         CACHE_DEFAULT_TIMEOUT = 300
 
+    # Authorization decision cache, a TTL of 0 disables it
+    try:
+        AUTHZ_CACHE_TTL = int(os.getenv('AUTHZ_CACHE_TTL', '30'))
+        AUTHZ_CACHE_MAX_SIZE = int(os.getenv('AUTHZ_CACHE_MAX_SIZE', '2048'))
+    except (TypeError, ValueError):
+        AUTHZ_CACHE_TTL = 30
+        AUTHZ_CACHE_MAX_SIZE = 2048
+    AUTHZ_CACHE_USE_SHARED_CACHE = os.getenv('AUTHZ_CACHE_USE_SHARED_CACHE', 'false').lower() == 'true'
+
+    # Snapshots of the business revisions as of completed filings, a max size of 0 disables it
+    try:
+        REVISION_SNAPSHOT_CACHE_MAX_SIZE = int(os.getenv('REVISION_SNAPSHOT_CACHE_MAX_SIZE', '1024'))
+    except (TypeError, ValueError):
+        REVISION_SNAPSHOT_CACHE_MAX_SIZE = 1024
+    REVISION_SNAPSHOT_CACHE_USE_SHARED_CACHE = \
+        os.getenv('REVISION_SNAPSHOT_CACHE_USE_SHARED_CACHE', 'false').lower() == 'true'
+
+    # Results of the uploaded PDF validations per (file key, etag), a timeout of 0 disables it
+    try:
+        PDF_VALIDATION_CACHE_TIMEOUT = int(os.getenv('PDF_VALIDATION_CACHE_TIMEOUT', '3600'))
+        PDF_VALIDATION_SPOOL_MAX_SIZE = int(os.getenv('PDF_VALIDATION_SPOOL_MAX_SIZE', str(1024 * 1024)))
+    except (TypeError, ValueError):
+        PDF_VALIDATION_CACHE_TIMEOUT = 3600
+        PDF_VALIDATION_SPOOL_MAX_SIZE = 1024 * 1024
+
     # MRAS
     MRAS_SVC_URL = os.getenv('MRAS_SVC_URL')
     MRAS_SVC_API_KEY = os.getenv('MRAS_SVC_API_KEY')
@@ -235,6 +262,7 @@ class DevConfig(_Config):  # pylint: disable=too-few-public-methods
 
     TESTING = False
     DEBUG = True
+    REPORT_TEMPLATE_CACHE_CHECK_MTIME = True
 
 
 class TestConfig(_Config):  # pylint: disable=too-few-public-methods
@@ -245,6 +273,10 @@ class TestConfig(_Config):  # pylint: disable=too-few-public-methods
 
     DEBUG = True
     TESTING = True
+    REPORT_TEMPLATE_CACHE_CHECK_MTIME = True
+    AUTHZ_CACHE_TTL = 0
+    REVISION_SNAPSHOT_CACHE_MAX_SIZE = 0
+    PDF_VALIDATION_CACHE_TIMEOUT = 0
     # POSTGRESQL
     DB_USER = os.getenv('DATABASE_TEST_USERNAME', '')
     DB_PASSWORD = os.getenv('DATABASE_TEST_PASSWORD', '')
@@ -16,17 +16,21 @@
 from __future__ import annotations
 
 # from dataclasses import dataclass, field
+import base64
+import binascii
 import copy
+import json
 from contextlib import suppress
 from enum import Enum
 from typing import Dict, Final, List, Optional
 
 from flask import current_app, url_for
 from flask_jwt_oidc import JwtManager
-from sqlalchemy import desc
+from sqlalchemy import and_, desc, func, or_
+from sqlalchemy.orm import joinedload
 
 from legal_api.core.meta import FilingMeta
-from legal_api.models import Business, Document, DocumentType
+from legal_api.models import Business, Comment, Document, DocumentType, db
 from legal_api.models import Filing as FilingStorage  # noqa: I001
 from legal_api.models import UserRoles
 from legal_api.services import VersionedBusinessDetailsService  # noqa: I005
@@ -381,32 +385,60 @@ class Filing:  # pylint: disable=too-many-public-methods
                start: int = None,
                size: int = None,
                effective_date=None,
+               cursor: dict = None,
                **kwargs) \
             -> list:
         """Return the ledger list by directly querying the storage objects.
 
+        The filings are ordered newest first by (filing_date desc, id), which is stable across pages.
+        The cursor is the position of the last filing of the previous page, see decode_ledger_cursor.
+
         Note: Sort of breaks the "core" style, but searches are always interesting ducks.
         """
         base_url = current_app.config.get('LEGAL_API_BASE_URL')
 
         business = Business.find_by_internal_id(business_id)
 
-        query = FilingStorage.query.filter(FilingStorage.business_id == business_id)
+        # the comment counts are aggregated once for the business instead of counted per filing
+        comments_count_query = db.session.query(Comment.filing_id,
+                                                func.count(Comment.id).label('comments_count')) \
+            .join(FilingStorage, FilingStorage.id == Comment.filing_id) \
+            .filter(FilingStorage.business_id == business_id) \
+            .group_by(Comment.filing_id) \
+            .subquery()
+
+        query = db.session.query(FilingStorage, func.coalesce(comments_count_query.c.comments_count, 0)) \
+            .outerjoin(comments_count_query, comments_count_query.c.filing_id == FilingStorage.id) \
+            .options(joinedload(FilingStorage.filing_submitter),
+                     joinedload(FilingStorage.parent_filing)) \
+            .filter(FilingStorage.business_id == business_id)
 
         if effective_date:
             query = query.filter(FilingStorage.effective_date <= effective_date)
         if statuses and isinstance(statuses, List):
             query = query.filter(FilingStorage._status.in_(statuses))  # pylint: disable=protected-access;required by SA
 
+        filing_date = FilingStorage._filing_date  # pylint: disable=protected-access;required by SA
+        if cursor:
+            query = query.filter(or_(filing_date < cursor['filingDate'],
+                                     and_(filing_date == cursor['filingDate'],
+                                          FilingStorage.id > cursor['filingId'])))
+
+        # matches the (business_id, filing_date desc, id) index, the order must be set before the offset/limit
+        query = query.order_by(desc(filing_date), FilingStorage.id)
+
         if start:
             query = query.offset(start)
         if size:
             query = query.limit(size)
 
-        query = query.order_by(desc(FilingStorage.filing_date))
+        rows = query.all()
+        # the business versions the display names depend on are loaded in one range query
+        business_revisions = VersionedBusinessDetailsService.get_business_revisions_for_transactions(
+            business_id, [filing.transaction_id for filing, _ in rows])
 
         ledger = []
-        for filing in query.all():
+        for filing, comments_count in rows:
 
             submitter_displayname = REDACTED_STAFF_SUBMITTER
             if (submitter := filing.filing_submitter) \
@@ -417,7 +449,8 @@ class Filing:  # pylint: disable=too-many-public-methods
             ledger_filing = {
                 'availableOnPaperOnly': filing.paper_only,
                 'businessIdentifier': business.identifier,
-                'displayName': FilingMeta.display_name(business, filing=filing),
+                'displayName': FilingMeta.display_name(business, filing=filing,
+                                                       business_revisions=business_revisions),
                 'effectiveDate': filing.effective_date,
                 'filingId': filing.id,
                 'name': filing.filing_type,
@@ -427,7 +460,7 @@ class Filing:  # pylint: disable=too-many-public-methods
                 'submittedDate': filing._filing_date,  # pylint: disable=protected-access
                 'paymentDate': filing.payment_completion_date,
 
-                **Filing.common_ledger_items(business.identifier, filing),
+                **Filing.common_ledger_items(business.identifier, filing, comments_count),
             }
             if filing.filing_sub_type:
                 ledger_filing['filingSubType'] = filing.filing_sub_type
@@ -451,7 +484,25 @@ class Filing:  # pylint: disable=too-many-public-methods
         return ledger
 
     @staticmethod
-    def common_ledger_items(business_identifier: str, filing_storage: FilingStorage) -> dict:
+    def encode_ledger_cursor(ledger_filing: dict) -> str:
+        """Return an opaque cursor for the position of a ledger filing."""
+        cursor = {'filingDate': ledger_filing['submittedDate'].isoformat(), 'filingId': ledger_filing['filingId']}
+        return base64.urlsafe_b64encode(json.dumps(cursor).encode('utf-8')).decode('utf-8')
+
+    @staticmethod
+    def decode_ledger_cursor(cursor: Optional[str]) -> Optional[dict]:
+        """Return the filing date and id of the last filing of the previous page from the opaque cursor."""
+        if not cursor:
+            return None
+        try:
+            decoded = json.loads(base64.urlsafe_b64decode(cursor.encode('utf-8')))
+            return {'filingDate': datetime.fromisoformat(decoded['filingDate']), 'filingId': int(decoded['filingId'])}
+        except (binascii.Error, KeyError, ValueError, TypeError, AttributeError) as err:
+            raise ValueError('Invalid ledger cursor.') from err
+
+    @staticmethod
+    def common_ledger_items(business_identifier: str, filing_storage: FilingStorage,
+                            comments_count: int = None) -> dict:
         """Return attributes and links that also get included in T-business filings."""
         no_output_filing_types = ['Involuntary Dissolution', 'conversion']
         base_url = current_app.config.get('LEGAL_API_BASE_URL')
@@ -459,7 +510,7 @@ class Filing:  # pylint: disable=too-many-public-methods
         filing._storage = filing_storage  # pylint: disable=protected-access
         return {
             'displayLedger': not filing_storage.hide_in_ledger,
-            'commentsCount': filing_storage.comments_count,
+            'commentsCount': filing_storage.comments_count if comments_count is None else comments_count,
             'commentsLink': f'{base_url}/{business_identifier}/filings/{filing_storage.id}/comments',
             'documentsLink': f'{base_url}/{business_identifier}/filings/{filing_storage.id}/documents' if
             filing_storage.filing_type not in no_output_filing_types else None,
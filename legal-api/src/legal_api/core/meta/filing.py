@@ -811,8 +811,12 @@ class FilingMeta:  # pylint: disable=too-few-public-methods
     """Create all the information about a filing."""
 
     @staticmethod
-    def display_name(business: Business, filing: FilingStorage) -> Optional[str]:
-        """Return the name of the filing to display on outputs."""
+    def display_name(business: Business, filing: FilingStorage,
+                     business_revisions: Optional[dict] = None) -> Optional[str]:
+        """Return the name of the filing to display on outputs.
+
+        business_revisions can hold the business versions keyed by transaction id, already loaded for a list of filings.
+        """
         # if filing is imported from COLIN and has custom disaply name
         if filing.meta_data and\
                 (display_name := filing.meta_data.get('colinDisplayName')):
@@ -827,7 +831,9 @@ class FilingMeta:  # pylint: disable=too-few-public-methods
 
         business_revision = business
         # retrieve business revision at time of filing so legal type is correct when returned for display name
-        if filing.transaction_id and \
+        if filing.transaction_id and business_revisions is not None:
+            business_revision = business_revisions.get(filing.transaction_id) or business
+        elif filing.transaction_id and \
                 (bus_rev_temp := VersionService.get_business_revision_obj(filing, business.id)):
             business_revision = bus_rev_temp
 
@@ -20,7 +20,7 @@ from __future__ import annotations
 from enum import auto
 
 from sql_versioning import Versioned
-from sqlalchemy import or_
+from sqlalchemy import and_, or_
 
 from ..utils.base import BaseEnum
 from .db import db, VersioningProxy  # noqa: I001
@@ -115,6 +115,51 @@ class Amalgamation(db.Model, Versioned):  # pylint: disable=too-many-instance-at
             .order_by(amalgamation_version.transaction_id).one_or_none()
         return amalgamation
 
+    @classmethod
+    def get_revision_json_list(cls, revision_keys: list) -> dict:
+        """Get amalgamation json for each (transaction id, business id) pair in a single query.
+
+        Return a dict keyed by the (transaction id, business id) pair.
+        """
+        if not revision_keys:
+            return {}
+
+        # pylint: disable=singleton-comparison;
+        amalgamation_version = VersioningProxy.version_class(db.session(), Amalgamation)
+        revision_conditions = [
+            and_(amalgamation_version.business_id == business_id,
+                 amalgamation_version.transaction_id <= transaction_id,
+                 or_(amalgamation_version.end_transaction_id == None,  # noqa: E711;
+                     amalgamation_version.end_transaction_id > transaction_id)).self_group()
+            for transaction_id, business_id in revision_keys
+        ]
+        amalgamations = db.session.query(amalgamation_version) \
+            .filter(amalgamation_version.operation_type == 0) \
+            .filter(or_(*revision_conditions)) \
+            .all()
+
+        from .business import Business  # pylint: disable=import-outside-toplevel
+        business_ids = {amalgamation.business_id for amalgamation in amalgamations}
+        businesses = {business.id: business
+                      for business in db.session.query(Business).filter(Business.id.in_(business_ids)).all()}
+
+        revisions = {}
+        for transaction_id, business_id in revision_keys:
+            amalgamation = next((a for a in amalgamations
+                                 if a.business_id == business_id and a.transaction_id <= transaction_id and
+                                 (a.end_transaction_id is None or a.end_transaction_id > transaction_id)), None)
+            if not amalgamation:
+                continue
+            business = businesses[amalgamation.business_id]
+            revisions[(transaction_id, business_id)] = {
+                'amalgamationDate': amalgamation.amalgamation_date.isoformat(),
+                'amalgamationType': amalgamation.amalgamation_type.name,
+                'courtApproval': amalgamation.court_approval,
+                'identifier': business.identifier,
+                'legalName': business.legal_name
+            }
+        return revisions
+
     @classmethod
     def get_revision_json(cls, transaction_id, business_id, tombstone=False):
         """Get amalgamation json for the given transaction id.
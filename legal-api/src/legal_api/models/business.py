@@ -309,29 +309,42 @@ class Business(db.Model, Versioned):  # pylint: disable=too-many-instance-attrib
         Legal Name Easy Fix
         """
         if self.is_firm:
-            sort_name = func.trim(
-                func.coalesce(Party.organization_name, '') +
-                func.coalesce(Party.last_name + ' ', '') +
-                func.coalesce(Party.first_name + ' ', '') +
-                func.coalesce(Party.middle_initial, '')
-            )
+            return Business.get_firm_legal_names([self.id]).get(self.id, '')
+
+        return self.legal_name
 
-            parties_query = self.party_roles.join(Party).filter(
-                func.lower(PartyRole.role).in_([
-                    PartyRole.RoleTypes.PARTNER.value,
-                    PartyRole.RoleTypes.PROPRIETOR.value
-                ]),
-                PartyRole.cessation_date.is_(None)
-            ).order_by(sort_name)
+    @staticmethod
+    def get_firm_legal_names(business_ids: list) -> dict:
+        """Return the legal name of each firm built from its active partners/proprietors, keyed by business id."""
+        if not business_ids:
+            return {}
 
-            parties = [party_role.party for party_role in parties_query.all()]
+        sort_name = func.trim(
+            func.coalesce(Party.organization_name, '') +
+            func.coalesce(Party.last_name + ' ', '') +
+            func.coalesce(Party.first_name + ' ', '') +
+            func.coalesce(Party.middle_initial, '')
+        )
 
-            legal_names = ', '.join(party.name for party in parties[:2])
+        parties_query = db.session.query(PartyRole.business_id, Party).join(Party).filter(
+            PartyRole.business_id.in_(business_ids),
+            func.lower(PartyRole.role).in_([
+                PartyRole.RoleTypes.PARTNER.value,
+                PartyRole.RoleTypes.PROPRIETOR.value
+            ]),
+            PartyRole.cessation_date.is_(None)
+        ).order_by(PartyRole.business_id, sort_name)
+
+        parties_by_business = {}
+        for business_id, party in parties_query.all():
+            parties_by_business.setdefault(business_id, []).append(party)
+
+        legal_names = {}
+        for business_id, parties in parties_by_business.items():
+            legal_names[business_id] = ', '.join(party.name for party in parties[:2])
             if len(parties) > 2:
-                legal_names += ', et al'
-            return legal_names
-
-        return self.legal_name
+                legal_names[business_id] += ', et al'
+        return legal_names
 
     @property
     def next_anniversary(self):
@@ -485,13 +498,23 @@ class Business(db.Model, Versioned):  # pylint: disable=too-many-instance-attrib
     @property
     def good_standing(self):
         """Return true if in good standing, otherwise false."""
+        return self._get_good_standing()
+
+    def _get_good_standing(self, transition_needed: bool = None):
+        """Return true if in good standing, otherwise false.
+
+        transition_needed can be provided when it has already been resolved for a set of businesses.
+        """
         # A firm is always in good standing
         if self.is_firm:
             return True
 
         # check transition filing for corps
-        if self.legal_type in self.CORPS and self.transition_needed_but_not_filed():
-            return False
+        if self.legal_type in self.CORPS:
+            if transition_needed is None:
+                transition_needed = self.transition_needed_but_not_filed()
+            if transition_needed:
+                return False
 
         # Date of last AR or founding date if they haven't yet filed one
         last_ar_date = self.last_ar_date or self.founding_date
@@ -510,14 +533,19 @@ class Business(db.Model, Versioned):  # pylint: disable=too-many-instance-attrib
 
         Check whether the business needs to file Transition but has not done so.
         """
+        return self.id in Business.get_transition_needed_business_ids([self])
+
+    @staticmethod
+    def get_transition_needed_business_ids(businesses: list) -> set:
+        """Return the ids of the businesses that need to file Transition but have not done so."""
         from legal_api.core.filing import Filing as CoreFiling  # pylint: disable=import-outside-toplevel
-        
+
         new_act_date = LegislationDatetime.as_legislation_timezone_from_date_str('2004-03-29')
-        if (
-            self.legal_type == Business.LegalTypes.EXTRA_PRO_A.value or
-            self.founding_date >= new_act_date
-        ):
-            return False  # No transition needed
+        business_ids = [business.id for business in businesses
+                        if business.legal_type != Business.LegalTypes.EXTRA_PRO_A.value and
+                        business.founding_date < new_act_date]
+        if not business_ids:
+            return set()  # No transition needed
 
         restoration_filing = aliased(Filing)
         transition_filing = aliased(Filing)
@@ -525,7 +553,7 @@ class Business(db.Model, Versioned):  # pylint: disable=too-many-instance-attrib
         # Transition exists condition
         transition_exists_condition = exists().where(
             and_(
-                transition_filing.business_id == self.id,
+                transition_filing.business_id == restoration_filing.business_id,
                 transition_filing._filing_type == CoreFiling.FilingTypes.TRANSITION.value,
                 transition_filing._status == Filing.Status.COMPLETED.value,
                 transition_filing.effective_date >= restoration_filing.effective_date
@@ -533,17 +561,15 @@ class Business(db.Model, Versioned):  # pylint: disable=too-many-instance-attrib
         )
 
         # Main condition
-        condition = exists().where(
-            and_(
-                restoration_filing.business_id == self.id,
-                restoration_filing._filing_type == CoreFiling.FilingTypes.RESTORATION.value,
-                restoration_filing._filing_sub_type.in_(['fullRestoration', 'limitedRestorationToFull']),
-                restoration_filing._status == Filing.Status.COMPLETED.value,
-                not_(transition_exists_condition)
-            )
-        )
+        query = db.session.query(restoration_filing.business_id).filter(
+            restoration_filing.business_id.in_(business_ids),
+            restoration_filing._filing_type == CoreFiling.FilingTypes.RESTORATION.value,
+            restoration_filing._filing_sub_type.in_(['fullRestoration', 'limitedRestorationToFull']),
+            restoration_filing._status == Filing.Status.COMPLETED.value,
+            not_(transition_exists_condition)
+        ).distinct()
 
-        return db.session.query(condition).scalar()
+        return {business_id for business_id, in query.all()}
 
     @property
     def in_dissolution(self):
@@ -559,6 +585,22 @@ class Business(db.Model, Versioned):  # pylint: disable=too-many-instance-attrib
             one_or_none()
         return find_in_batch_processing is not None
 
+    @staticmethod
+    def get_in_dissolution_business_ids(business_ids: list) -> set:
+        """Return the ids of the businesses that are in dissolution."""
+        if not business_ids:
+            return set()
+
+        query = db.session.query(BatchProcessing.business_id).\
+            filter(BatchProcessing.business_id.in_(business_ids)).\
+            filter(BatchProcessing.status.notin_([BatchProcessing.BatchProcessingStatus.COMPLETED,
+                                                  BatchProcessing.BatchProcessingStatus.WITHDRAWN])). \
+            filter(Batch.id == BatchProcessing.batch_id).\
+            filter(Batch.status != Batch.BatchStatus.COMPLETED).\
+            filter(Batch.batch_type == Batch.BatchType.INVOLUNTARY_DISSOLUTION).\
+            distinct()
+        return {business_id for business_id, in query.all()}
+
     @property
     def is_tombstone(self):
         """Return True if it's a tombstone business, otherwise False."""
@@ -622,16 +664,56 @@ class Business(db.Model, Versioned):  # pylint: disable=too-many-instance-attrib
 
         return d
 
-    def _slim_json(self):
-        """Return a smaller/faster version of the business json."""
+    @classmethod
+    def slim_json_list(cls, businesses: list) -> list:
+        """Return the slim json for each business, resolving the derived fields for all of them at once.
+
+        The good standing, in dissolution, legal name and amalgamated into fields are resolved with a fixed
+        number of queries for the whole list instead of several queries per business.
+        """
+        slim_json_facts = cls._get_slim_json_facts(businesses)
+        return [business._slim_json(slim_json_facts[business.id]) for business in businesses]
+
+    @classmethod
+    def _get_slim_json_facts(cls, businesses: list) -> dict:
+        """Return the derived slim json fields for each business, keyed by business id."""
+        business_ids = [business.id for business in businesses]
+        transition_needed_ids = cls.get_transition_needed_business_ids(
+            [business for business in businesses if business.legal_type in cls.CORPS])
+        in_dissolution_ids = cls.get_in_dissolution_business_ids(business_ids)
+        firm_legal_names = cls.get_firm_legal_names([business.id for business in businesses if business.is_firm])
+        amalgamated_into = cls.get_amalgamated_into_list(businesses)
+
+        return {
+            business.id: {
+                'goodStanding': business._get_good_standing(business.id in transition_needed_ids),
+                'inDissolution': business.id in in_dissolution_ids,
+                'legalName': firm_legal_names.get(business.id, '') if business.is_firm else business.legal_name,
+                'amalgamatedInto': amalgamated_into.get(business.id)
+            }
+            for business in businesses
+        }
+
+    def _slim_json(self, slim_json_facts: dict = None):
+        """Return a smaller/faster version of the business json.
+
+        slim_json_facts holds the derived fields when they have already been resolved for a list of businesses.
+        """
+        if slim_json_facts is None:
+            slim_json_facts = {
+                'goodStanding': self.good_standing,
+                'inDissolution': self.in_dissolution,
+                'legalName': self.business_legal_name
+            }
+
         d = {
             'adminFreeze': self.admin_freeze or False,
             'foundingDate': self.founding_date.isoformat() if self.founding_date else '',
-            'goodStanding': self.good_standing,
+            'goodStanding': slim_json_facts['goodStanding'],
             'identifier': self.identifier,
-            'inDissolution': self.in_dissolution,
+            'inDissolution': slim_json_facts['inDissolution'],
             'inLiquidation': self.in_liquidation or False,
-            'legalName': self.business_legal_name,
+            'legalName': slim_json_facts['legalName'],
             'legalType': self.legal_type,
             'state': self.state.name if self.state else Business.State.ACTIVE.name,
             'lastModified': self.last_modified.isoformat()
@@ -641,7 +723,9 @@ class Business(db.Model, Versioned):  # pylint: disable=too-many-instance-attrib
             d['taxId'] = self.tax_id
         
         if self.state_filing_id:
-            if (amalgamated_into := self.get_amalgamated_into()):
+            amalgamated_into = slim_json_facts['amalgamatedInto'] if 'amalgamatedInto' in slim_json_facts \
+                else self.get_amalgamated_into()
+            if amalgamated_into:
                 d['amalgamatedInto'] = amalgamated_into
             else:
                 base_url = current_app.config.get('LEGAL_API_BASE_URL')
@@ -801,11 +885,19 @@ class Business(db.Model, Versioned):  # pylint: disable=too-many-instance-attrib
         - For SP or GP, also return an alternate name from existing business record
         - Return empty list if there are no alternate name entries
         """
-        alternate_names = []
+        return Business.get_alternate_names_list([self])[self.id]
+
+    @staticmethod
+    def get_alternate_names_list(businesses: list) -> dict:
+        """Get alternate names for each business with one query for all the SP DBA entries, keyed by business id."""
+        alternate_names = {business.id: [] for business in businesses}
 
         # Get SP DBA entries if not SP
-        if self.legal_type != Business.LegalTypes.SOLE_PROP:
+        identifiers = {business.identifier: business.id for business in businesses
+                       if business.legal_type != Business.LegalTypes.SOLE_PROP}
+        if identifiers:
             proprietors_query = db.session.query(
+                Party.identifier,
                 Business.legal_type,
                 Business.identifier,
                 Business.legal_name,
@@ -816,15 +908,15 @@ class Business(db.Model, Versioned):  # pylint: disable=too-many-instance-attrib
             ).join(
                 Party, and_(
                     Party.id == PartyRole.party_id,
-                    Party.identifier == self._identifier
+                    Party.identifier.in_(identifiers.keys())
                 )
             ).filter(
                 Party.party_type == Party.PartyTypes.ORGANIZATION.value,
                 PartyRole.role == PartyRole.RoleTypes.PROPRIETOR.value
             )
 
-            for legal_type, identifier, legal_name, founding_date, start_date in proprietors_query:
-                alternate_names.append({
+            for party_identifier, legal_type, identifier, legal_name, founding_date, start_date in proprietors_query:
+                alternate_names[identifiers[party_identifier]].append({
                     'entityType': legal_type,
                     'identifier': identifier,
                     'name': legal_name,
@@ -834,16 +926,17 @@ class Business(db.Model, Versioned):  # pylint: disable=too-many-instance-attrib
                 })
 
         # For firms also get existing business record
-        if self.is_firm:
-            alternate_names.append({
-                'entityType': self.legal_type,
-                'identifier': self.identifier,
-                'name': self.legal_name,
-                'registeredDate': self.founding_date.isoformat(),
-                'startDate':
-                    LegislationDatetime.format_as_legislation_date(self.start_date) if self.start_date else None,
-                'type': 'DBA'
-            })
+        for business in businesses:
+            if business.is_firm:
+                alternate_names[business.id].append({
+                    'entityType': business.legal_type,
+                    'identifier': business.identifier,
+                    'name': business.legal_name,
+                    'registeredDate': business.founding_date.isoformat(),
+                    'startDate': LegislationDatetime.format_as_legislation_date(business.start_date)
+                    if business.start_date else None,
+                    'type': 'DBA'
+                })
 
         return alternate_names
 
@@ -872,6 +965,48 @@ class Business(db.Model, Versioned):  # pylint: disable=too-many-instance-attrib
 
         return None
 
+    @staticmethod
+    def get_amalgamated_into_list(businesses: list) -> dict:
+        """Get amalgamated into for each business with a fixed number of queries, keyed by business id.
+
+        Only businesses that are part of an amalgamation are included, see get_amalgamated_into.
+        """
+        state_filing_ids = [business.state_filing_id for business in businesses
+                            if business.state == Business.State.HISTORICAL and business.state_filing_id]
+        if not state_filing_ids:
+            return {}
+
+        state_filings = {filing.id: filing
+                         for filing in db.session.query(Filing).filter(Filing.id.in_(state_filing_ids)).all()
+                         if filing.is_amalgamation_application}
+        if not state_filings:
+            return {}
+
+        amalgamating_businesses = [business for business in businesses
+                                   if business.state == Business.State.HISTORICAL and
+                                   business.state_filing_id in state_filings]
+        tombstone_ids = {business_id for business_id, in db.session.query(Filing.business_id).
+                         filter(Filing.business_id.in_([business.id for business in amalgamating_businesses])).
+                         filter(Filing._status == Filing.Status.TOMBSTONE.value).distinct().all()}
+
+        revision_keys = [(state_filings[business.state_filing_id].transaction_id,
+                          state_filings[business.state_filing_id].business_id)
+                         for business in amalgamating_businesses if business.id not in tombstone_ids]
+        revisions = Amalgamation.get_revision_json_list(revision_keys)
+
+        amalgamated_into = {}
+        for business in amalgamating_businesses:
+            if business.id in tombstone_ids:
+                amalgamated_into[business.id] = {
+                    'identifier': 'Not Available',
+                    'legalName': 'Not Available',
+                    'amalgamationDate': 'Not Available'
+                }
+            else:
+                state_filing = state_filings[business.state_filing_id]
+                amalgamated_into[business.id] = revisions.get((state_filing.transaction_id, state_filing.business_id))
+        return amalgamated_into
+
     @classmethod
     def is_pending_amalgamating_business(cls, business_identifier):
         """Check if a business has a pending amalgamation with the provided business identifier."""
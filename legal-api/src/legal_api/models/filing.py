@@ -18,7 +18,7 @@ from http import HTTPStatus
 from typing import Final, List
 
 from sqlalchemy import and_, desc, event, func, inspect, not_, or_, select
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, aggregate_order_by, array_agg
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import backref
 
@@ -1183,6 +1183,28 @@ class Filing(db.Model):  # pylint: disable=too-many-instance-attributes,too-many
         filings = query.all()
         return filings
 
+    @staticmethod
+    def get_filing_status_summary(business_id: int):
+        """Return one row per filing type, sub-type and status for the business.
+
+        Each row has the filing count, the id and effective date of the most recently created filing and the
+        latest effective date across the filings, so business level filing checks can be answered in memory.
+        """
+        # pylint: disable=W0212; prevent infinite loop
+        filings = db.session.query(
+            Filing._filing_type.label('filing_type'),
+            Filing._filing_sub_type.label('filing_sub_type'),
+            Filing._status.label('status'),
+            func.count(Filing.id).label('filing_count'),
+            func.max(Filing.id).label('last_filing_id'),
+            func.max(Filing.effective_date).label('max_effective_date'),
+            array_agg(aggregate_order_by(Filing.effective_date, Filing.id.desc()))[1].label('last_effective_date')
+        ). \
+            filter(Filing.business_id == business_id). \
+            group_by(Filing._filing_type, Filing._filing_sub_type, Filing._status). \
+            all()
+        return filings
+
     @staticmethod
     def get_most_recent_filing(business_id: str, filing_type: str = None, filing_sub_type: str = None):
         """Return the most recent filing.
@@ -9,12 +9,10 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 """Produces a PDF output based on templates and JSON messages."""
-import base64
 import json
 import os
 from datetime import datetime
 from http import HTTPStatus
-from pathlib import Path
 from typing import Final, Optional
 
 import pycountry
@@ -24,6 +22,7 @@ from flask import current_app, jsonify
 from legal_api.models import Alias, AmalgamatingBusiness, Amalgamation, Business, CorpType, Filing, Jurisdiction
 from legal_api.reports.document_service import DocumentService
 from legal_api.reports.registrar_meta import RegistrarInfo
+from legal_api.reports.template_cache import substitute_template_parts, template_cache
 from legal_api.resources.v2.business import get_addresses, get_directors
 from legal_api.resources.v2.business.business_parties import get_parties
 from legal_api.services import VersionedBusinessDetailsService, flags
@@ -38,6 +37,40 @@ OUTPUT_DATE_FORMAT: Final = '%B %-d, %Y'
 class BusinessDocument:
     """Service to create business document outputs."""
 
+    TEMPLATE_PARTS: Final = [
+        'business-summary/alterations',
+        'business-summary/amalgamations',
+        'business-summary/businessDetails',
+        'business-summary/foreignJurisdiction',
+        'business-summary/liquidation',
+        'business-summary/nameChanges',
+        'business-summary/stateTransition',
+        'business-summary/amalgamationOut',
+        'business-summary/recordKeeper',
+        'business-summary/parties',
+        'business-summary/receiverInformation',
+        'common/addresses',
+        'common/businessDetails',
+        'common/footerMOCS',
+        'common/nameTranslation',
+        'common/style',
+        'common/styleLetterOverride',
+        'common/certificateFooter',
+        'common/certificateLogo',
+        'common/certificateRegistrarSignature',
+        'common/certificateSeal',
+        'common/certificateStyle',
+        'common/certificateWatermark',
+        'common/courtOrder',
+        'common/watermark',
+        'footer',
+        'logo',
+        'macros',
+        'common/warning-bar',
+        'notice-of-articles/officers',
+        'notice-of-articles/directors'
+    ]
+
     def __init__(self, business, document_key, request_context: RequestContext = None):
         """Create the Report instance."""
         self._business = business
@@ -57,7 +90,7 @@ class BusinessDocument:
         }
         data = {
             'reportName': self._get_report_filename(),
-            'template': "'" + base64.b64encode(bytes(self._get_template(), 'utf-8')).decode() + "'",
+            'template': self._get_template(encoded=True),
             'templateVars': self._get_template_data()
         }
 
@@ -75,59 +108,22 @@ class BusinessDocument:
         return '{}_{}_{}.pdf'.format(self._business.identifier, report_date,
                                      ReportMeta.reports[self._document_key]['reportName']).replace(' ', '_')
 
-    def _get_template(self):
+    def _get_template(self, encoded=False):
         try:
-            template_path = current_app.config.get('REPORT_TEMPLATE_PATH')
             template_file_name = ReportMeta.reports[self._document_key]['templateName']
-            template_code = Path(f'{template_path}/{template_file_name}.html').read_text()
-            # substitute template parts
-            template_code = self._substitute_template_parts(template_code)
+            # template parts are substituted once and cached per template
+            if encoded:
+                return template_cache.get_encoded_template(f'{template_file_name}.html',
+                                                           BusinessDocument.TEMPLATE_PARTS)
+            return template_cache.get_template(f'{template_file_name}.html', BusinessDocument.TEMPLATE_PARTS)
         except Exception as err:
             current_app.logger.error(err)
             raise err
-        return template_code
 
     @staticmethod
     def _substitute_template_parts(template_code):
         template_path = current_app.config.get('REPORT_TEMPLATE_PATH')
-        template_parts = [
-            'business-summary/alterations',
-            'business-summary/amalgamations',
-            'business-summary/businessDetails',
-            'business-summary/foreignJurisdiction',
-            'business-summary/liquidation',
-            'business-summary/nameChanges',
-            'business-summary/stateTransition',
-            'business-summary/amalgamationOut',
-            'business-summary/recordKeeper',
-            'business-summary/parties',
-            'business-summary/receiverInformation',
-            'common/addresses',
-            'common/businessDetails',
-            'common/footerMOCS',
-            'common/nameTranslation',
-            'common/style',
-            'common/styleLetterOverride',
-            'common/certificateFooter',
-            'common/certificateLogo',
-            'common/certificateRegistrarSignature',
-            'common/certificateSeal',
-            'common/certificateStyle',
-            'common/certificateWatermark',
-            'common/courtOrder',
-            'common/watermark',
-            'footer',
-            'logo',
-            'macros',
-            'common/warning-bar',
-            'notice-of-articles/officers',
-            'notice-of-articles/directors'
-        ]
-        # substitute template parts - marked up by [[filename]]
-        for template_part in template_parts:
-            template_part_code = Path(f'{template_path}/template-parts/{template_part}.html').read_text()
-            template_code = template_code.replace('[[{}.html]]'.format(template_part), template_part_code)
-        return template_code
+        return substitute_template_parts(template_code, template_path, BusinessDocument.TEMPLATE_PARTS)
 
     def _get_template_data(self, get_json=False):
         """Return the json for the report template."""
@@ -9,13 +9,11 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 """Produces a PDF output based on templates and JSON messages."""
-import base64
 import copy
 import json
 import os
 from contextlib import suppress
 from http import HTTPStatus
-from pathlib import Path
 from typing import Final
 
 import pycountry
@@ -38,6 +36,7 @@ from legal_api.models import (
 from legal_api.models.business import ASSOCIATION_TYPE_DESC
 from legal_api.reports.document_service import DocumentService
 from legal_api.reports.registrar_meta import RegistrarInfo
+from legal_api.reports.template_cache import substitute_template_parts, template_cache
 from legal_api.services import MinioService, VersionedBusinessDetailsService, flags  # pylint: disable=line-too-long
 from legal_api.utils.auth import jwt
 from legal_api.utils.datetime import datetime
@@ -52,6 +51,94 @@ class Report:  # pylint: disable=too-few-public-methods, too-many-lines
     # TODO review pylint warning and alter as required
     """Service to create report outputs."""
 
+    TEMPLATE_PARTS: Final = [
+        'amalgamation/amalgamatingCorp',
+        'amalgamation/amalgamationName',
+        'amalgamation/amalgamationStmt',
+        'amalgamation/approvalType',
+        'amalgamation/effectiveDate',
+        'bc-annual-report/legalObligations',
+        'bc-address-change/addresses',
+        'bc-director-change/directors',
+        'common/certificateFooter',
+        'common/certificateLogo',
+        'common/certificateRegistrarSignature',
+        'common/certificateSeal',
+        'common/certificateStyle',
+        'common/certificateWatermark',
+        'common/addresses',
+        'common/shareStructure',
+        'common/correctedOnCertificate',
+        'common/style',
+        'common/styleLetterOverride',
+        'common/businessDetails',
+        'common/footerMOCS',
+        'common/directors',
+        'common/watermark',
+        'continuation/authorization',
+        'continuation/effectiveDate',
+        'continuation/exproRegistrationInBc',
+        'continuation/foreignJurisdiction',
+        'continuation/nameRequest',
+        'correction/businessDetails',
+        'correction/addresses',
+        'correction/associateType',
+        'correction/directors',
+        'correction/legalNameChange',
+        'correction/resolution',
+        'correction/rulesMemorandum',
+        'change-of-registration/legal-name',
+        'change-of-registration/nature-of-business',
+        'change-of-registration/addresses',
+        'change-of-registration/proprietor',
+        'change-of-registration/partner',
+        'notice-of-withdrawal/recordToBeWithdrawn',
+        'incorporation-application/benefitCompanyStmt',
+        'incorporation-application/completingParty',
+        'incorporation-application/effectiveDate',
+        'incorporation-application/incorporator',
+        'incorporation-application/nameRequest',
+        'incorporation-application/cooperativeAssociationType',
+        'restoration-application/nameRequest',
+        'restoration-application/legalName',
+        'restoration-application/legalNameDissolution',
+        'restoration-application/approvalType',
+        'restoration-application/applicant',
+        'restoration-application/expiry',
+        'registration/nameRequest',
+        'registration/addresses',
+        'registration/party',
+        'registration-statement/party',
+        'registration-statement/business-info',
+        'registration-statement/completingParty',
+        'receivers/receivers',
+        'common/statement',
+        'common/benefitCompanyStmt',
+        'dissolution/custodianOfRecords',
+        'dissolution/dissolutionStatement',
+        'dissolution/firmsDissolutionDate',
+        'notice-of-articles/directors',
+        'notice-of-articles/restrictions',
+        'common/resolutionDates',
+        'alteration-notice/businessTypeChange',
+        'alteration-notice/legalNameChange',
+        'alteration-notice/statement',
+        'common/effectiveDate',
+        'common/nameTranslation',
+        'alteration-notice/companyProvisions',
+        'special-resolution/resolution',
+        'special-resolution/resolutionApplication',
+        'addresses',
+        'certification',
+        'directors',
+        'dissolution',
+        'footer',
+        'legalNameChange',
+        'logo',
+        'macros',
+        'style'
+    ]
+
     def __init__(self, filing):
         """Create the Report instance."""
         self._filing = filing
@@ -105,7 +192,7 @@ class Report:  # pylint: disable=too-few-public-methods, too-many-lines
         }
         data = {
             'reportName': self._get_report_filename(),
-            'template': "'" + base64.b64encode(bytes(self._get_template(), 'utf-8')).decode() + "'",
+            'template': self._get_template(encoded=True),
             'templateVars': self._get_template_data()
         }
 
@@ -150,16 +237,15 @@ class Report:  # pylint: disable=too-few-public-methods, too-many-lines
         description = ReportMeta.reports[self._report_key]['filingDescription']
         return '{}_{}_{}.pdf'.format(legal_entity_number, filing_date, description).replace(' ', '_')
 
-    def _get_template(self):
+    def _get_template(self, encoded=False):
         try:
-            template_path = current_app.config.get('REPORT_TEMPLATE_PATH')
-            template_code = Path(f'{template_path}/{self._get_template_filename()}').read_text()
-            # substitute template parts
-            template_code = self._substitute_template_parts(template_code)
+            # template parts are substituted once and cached per template
+            if encoded:
+                return template_cache.get_encoded_template(self._get_template_filename(), Report.TEMPLATE_PARTS)
+            return template_cache.get_template(self._get_template_filename(), Report.TEMPLATE_PARTS)
         except Exception as err:
             current_app.logger.error(err)
             raise err
-        return template_code
 
     @staticmethod
     def _substitute_template_parts(template_code):
@@ -176,100 +262,7 @@ class Report:  # pylint: disable=too-few-public-methods, too-many-lines
         :return: template_code string, modified.
         """
         template_path = current_app.config.get('REPORT_TEMPLATE_PATH')
-        template_parts = [
-            'amalgamation/amalgamatingCorp',
-            'amalgamation/amalgamationName',
-            'amalgamation/amalgamationStmt',
-            'amalgamation/approvalType',
-            'amalgamation/effectiveDate',
-            'bc-annual-report/legalObligations',
-            'bc-address-change/addresses',
-            'bc-director-change/directors',
-            'common/certificateFooter',
-            'common/certificateLogo',
-            'common/certificateRegistrarSignature',
-            'common/certificateSeal',
-            'common/certificateStyle',
-            'common/certificateWatermark',
-            'common/addresses',
-            'common/shareStructure',
-            'common/correctedOnCertificate',
-            'common/style',
-            'common/styleLetterOverride',
-            'common/businessDetails',
-            'common/footerMOCS',
-            'common/directors',
-            'common/watermark',
-            'continuation/authorization',
-            'continuation/effectiveDate',
-            'continuation/exproRegistrationInBc',
-            'continuation/foreignJurisdiction',
-            'continuation/nameRequest',
-            'correction/businessDetails',
-            'correction/addresses',
-            'correction/associateType',
-            'correction/directors',
-            'correction/legalNameChange',
-            'correction/resolution',
-            'correction/rulesMemorandum',
-            'change-of-registration/legal-name',
-            'change-of-registration/nature-of-business',
-            'change-of-registration/addresses',
-            'change-of-registration/proprietor',
-            'change-of-registration/partner',
-            'notice-of-withdrawal/recordToBeWithdrawn',
-            'incorporation-application/benefitCompanyStmt',
-            'incorporation-application/completingParty',
-            'incorporation-application/effectiveDate',
-            'incorporation-application/incorporator',
-            'incorporation-application/nameRequest',
-            'incorporation-application/cooperativeAssociationType',
-            'restoration-application/nameRequest',
-            'restoration-application/legalName',
-            'restoration-application/legalNameDissolution',
-            'restoration-application/approvalType',
-            'restoration-application/applicant',
-            'restoration-application/expiry',
-            'registration/nameRequest',
-            'registration/addresses',
-            'registration/party',
-            'registration-statement/party',
-            'registration-statement/business-info',
-            'registration-statement/completingParty',
-            'receivers/receivers',
-            'common/statement',
-            'common/benefitCompanyStmt',
-            'dissolution/custodianOfRecords',
-            'dissolution/dissolutionStatement',
-            'dissolution/firmsDissolutionDate',
-            'notice-of-articles/directors',
-            'notice-of-articles/restrictions',
-            'common/resolutionDates',
-            'alteration-notice/businessTypeChange',
-            'alteration-notice/legalNameChange',
-            'alteration-notice/statement',
-            'common/effectiveDate',
-            'common/nameTranslation',
-            'alteration-notice/companyProvisions',
-            'special-resolution/resolution',
-            'special-resolution/resolutionApplication',
-            'addresses',
-            'certification',
-            'directors',
-            'dissolution',
-            'footer',
-            'legalNameChange',
-            'logo',
-            'macros',
-            'style'
-        ]
-
-        # substitute template parts - marked up by [[filename]]
-        for template_part in template_parts:
-            template_part_code = Path(f'{template_path}/template-parts/{template_part}.html').read_text()
-            template_code = template_code.replace('[[{}.html]]'.format(template_part), template_part_code)
-
-        return template_code
+        return substitute_template_parts(template_code, template_path, Report.TEMPLATE_PARTS)
 
     def _get_template_filename(self):
         if ReportMeta.reports[self._report_key].get('hasDifferentTemplates', False):
@@ -24,6 +24,7 @@ from jinja2 import Template
 
 from legal_api.models import Address, Business
 from legal_api.reports.registrar_meta import RegistrarInfo
+from legal_api.reports.template_cache import substitute_template_parts, template_cache
 from legal_api.utils.base import BaseEnum
 from legal_api.utils.legislation_datetime import LegislationDatetime
 
@@ -53,6 +54,12 @@ REPORT_FILES = {
 class ReportV2:
     """Service to create Gotenberg document outputs."""
 
+    TEMPLATE_PARTS: Final = [
+        'common/v2/style',
+        'common/v2/styleMail',
+        'common/certificateRegistrarSignature'
+    ]
+
     def __init__(self, business=None, furnishing=None, document_key=None, variant=None):
         """Create ReportV2 instance."""
         self._furnishing = furnishing
@@ -97,30 +104,17 @@ class ReportV2:
 
     def _get_template(self):
         try:
-            template_path = current_app.config.get('REPORT_TEMPLATE_PATH')
             template_file_name = ReportMeta.reports[self._document_key]['templateName']
-            template_code = Path(f'{template_path}/{template_file_name}.html').read_text(encoding='UTF-8')
-            # substitute template parts
-            template_code = self._substitute_template_parts(template_code)
+            # template parts are substituted once and cached per template
+            return template_cache.get_template(f'{template_file_name}.html', ReportV2.TEMPLATE_PARTS)
         except Exception as err:
             current_app.logger.error(err)
             raise err
-        return template_code
 
     @staticmethod
     def _substitute_template_parts(template_code):
         template_path = current_app.config.get('REPORT_TEMPLATE_PATH')
-        template_parts = [
-            'common/v2/style',
-            'common/v2/styleMail',
-            'common/certificateRegistrarSignature'
-        ]
-        # substitute template parts - marked up by [[filename]]
-        for template_part in template_parts:
-            template_part_code = Path(f'{template_path}/template-parts/{template_part}.html')\
-                .read_text(encoding='UTF-8')
-            template_code = template_code.replace('[[{}.html]]'.format(template_part), template_part_code)
-        return template_code
+        return substitute_template_parts(template_code, template_path, ReportV2.TEMPLATE_PARTS)
 
     def _get_template_data(self):
         # note that the cover template data should be set in service class
@@ -0,0 +1,106 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+"""Cache of report templates with their template parts substituted.
+
+Templates are read from disk and assembled once per process. When REPORT_TEMPLATE_CACHE_CHECK_MTIME is set
+(dev and test), a cached template is rebuilt if the template or any of the parts it includes has changed on disk.
+"""
+import base64
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Tuple
+
+from flask import current_app
+
+
+@dataclass
+class _CachedTemplate:
+    """An assembled template and the files it was built from."""
+
+    template_code: str
+    file_mtimes: Dict[str, float] = field(default_factory=dict)
+    encoded_template: str = None
+
+    def is_stale(self) -> bool:
+        """Return True if any of the files the template was built from has changed."""
+        try:
+            return any(os.stat(file_path).st_mtime != mtime for file_path, mtime in self.file_mtimes.items())
+        except OSError:
+            return True
+
+
+def substitute_template_parts(template_code: str, template_path: str, template_parts: list,
+                              file_mtimes: dict = None) -> str:
+    """Substitute the template parts referenced by the template, marked up by [[partname.html]].
+
+    Parts are substituted in the order given, so a part can only include the parts listed after it, and only
+    parts that are referenced are read from disk. The paths and mtimes of the parts read are added to file_mtimes.
+    """
+    for template_part in template_parts:
+        marker = '[[{}.html]]'.format(template_part)
+        if marker not in template_code:
+            continue
+        part_path = f'{template_path}/template-parts/{template_part}.html'
+        if file_mtimes is not None:
+            file_mtimes[part_path] = os.stat(part_path).st_mtime
+        template_part_code = Path(part_path).read_text(encoding='UTF-8')
+        template_code = template_code.replace(marker, template_part_code)
+    return template_code
+
+
+class TemplateCache:
+    """Process wide cache of assembled report templates, keyed by template file and template parts."""
+
+    def __init__(self):
+        """Create an empty cache."""
+        self._templates: Dict[Tuple[str, Tuple[str, ...]], _CachedTemplate] = {}
+        self._lock = threading.Lock()
+
+    def get_template(self, template_file_name: str, template_parts: list) -> str:
+        """Return the template with its template parts substituted."""
+        return self._get(template_file_name, template_parts).template_code
+
+    def get_encoded_template(self, template_file_name: str, template_parts: list) -> str:
+        """Return the base64 encoded template, quoted as expected by the report service."""
+        cached_template = self._get(template_file_name, template_parts)
+        if cached_template.encoded_template is None:
+            encoded = base64.b64encode(bytes(cached_template.template_code, 'utf-8')).decode()
+            cached_template.encoded_template = "'" + encoded + "'"
+        return cached_template.encoded_template
+
+    def clear(self):
+        """Remove all the cached templates."""
+        with self._lock:
+            self._templates.clear()
+
+    def _get(self, template_file_name: str, template_parts: list) -> _CachedTemplate:
+        template_path = current_app.config.get('REPORT_TEMPLATE_PATH')
+        key = (f'{template_path}/{template_file_name}', tuple(template_parts))
+
+        cached_template = self._templates.get(key)
+        if cached_template and \
+                not (current_app.config.get('REPORT_TEMPLATE_CACHE_CHECK_MTIME') and cached_template.is_stale()):
+            return cached_template
+
+        template_file = key[0]
+        file_mtimes = {template_file: os.stat(template_file).st_mtime}
+        template_code = Path(template_file).read_text(encoding='UTF-8')
+        template_code = substitute_template_parts(template_code, template_path, template_parts, file_mtimes)
+        cached_template = _CachedTemplate(template_code=template_code, file_mtimes=file_mtimes)
+
+        with self._lock:
+            self._templates[key] = cached_template
+        return cached_template
+
+
+template_cache = TemplateCache()  # pylint: disable=invalid-name; shared variables are lower case by Flask convention.
@@ -16,6 +16,11 @@ from flask_restx import Namespace, Resource
 from sqlalchemy import exc, text
 
 from legal_api.models import db
+from legal_api.services.authorization_cache import authorization_cache
+from legal_api.services.authz import SYSTEM_ROLE
+from legal_api.services.http_client import http_client
+from legal_api.services.revision_snapshot_cache import revision_snapshot_cache
+from legal_api.utils.auth import jwt
 
 
 API = Namespace('OPS', description='Service - OPS checks')
@@ -51,3 +56,21 @@ class Readyz(Resource):
         """Return a JSON object that identifies if the service is setupAnd ready to work."""
         # TODO: add a poll to the DB when called
         return {'message': 'api is ready'}, 200
+
+
+@API.route('metrics')
+class Metrics(Resource):
+    """In-process metrics of the caches and outbound service calls.
+
+    The outbound endpoints and their latencies describe the internal services, so only the system role can read them.
+    """
+
+    @staticmethod
+    @jwt.requires_roles([SYSTEM_ROLE])
+    def get():
+        """Return a JSON object with the cache hit rates and the latency per outbound endpoint."""
+        return {
+            'authorizationCache': authorization_cache.get_metrics(),
+            'httpClient': http_client.get_metrics(),
+            'revisionSnapshotCache': revision_snapshot_cache.get_metrics()
+        }, 200
@@ -180,7 +180,10 @@ def search_businesses():
                 temp_identifiers.append(identifier)
             else:
                 business_identifiers.append(identifier)
-        search_filters = AffiliationSearchDetails.from_request_args(json_input)
+        try:
+            search_filters = AffiliationSearchDetails.from_request_args(json_input)
+        except ValueError as err:
+            return {'message': str(err)}, HTTPStatus.BAD_REQUEST
 
         bus_results, bus_hasmore = BusinessSearchService.get_search_filtered_businesses_results(
             business_json=json_input,
@@ -191,11 +194,14 @@ def search_businesses():
             identifiers=temp_identifiers,
             search_filters=search_filters) or ([], False)
         has_more = bus_hasmore or draft_hasmore
-        return jsonify({
+        response = {
             'businessEntities': bus_results,
             'draftEntities': draft_results,
             'hasMore': has_more
-            }), HTTPStatus.OK
+        }
+        if search_filters.is_keyset and has_more:
+            response['nextCursor'] = AffiliationSearchDetails.encode_cursor(search_filters.cursor)
+        return jsonify(response), HTTPStatus.OK
     except Exception as err:
         current_app.logger.info(err)
         current_app.logger.error('Error searching over business information for: %s', identifiers)
@@ -413,6 +413,10 @@ class ListFilingResource():  # pylint: disable=too-many-public-methods
         ledger_start = request.args.get('start', default=None, type=int)
         ledger_size = request.args.get('size', default=None, type=int)
         datetime_str = request.args.get('effective_date', default=None)
+        try:
+            ledger_cursor = CoreFiling.decode_ledger_cursor(request.args.get('cursor', default=None))
+        except ValueError as err:
+            return jsonify({'message': str(err)}), HTTPStatus.BAD_REQUEST
 
         effective_date = None
         if datetime_str:
@@ -431,8 +435,14 @@ class ListFilingResource():  # pylint: disable=too-many-public-methods
                                     statuses=[Filing.Status.COMPLETED.value, Filing.Status.PAID.value,
                                               Filing.Status.WITHDRAWN.value],
                                     start=ledger_start,
-                                    size=ledger_size,
-                                    effective_date=effective_date)
+                                    # one extra filing tells if there is a next page
+                                    size=ledger_size + 1 if ledger_size else None,
+                                    effective_date=effective_date,
+                                    cursor=ledger_cursor)
+
+        if ledger_size and len(filings) > ledger_size:
+            filings = filings[:ledger_size]
+            return jsonify(filings=filings, next=CoreFiling.encode_ledger_cursor(filings[-1]))
 
         return jsonify(filings=filings)
 
@@ -0,0 +1,130 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Short lived cache of the auth api authorization decisions.
+
+The roles a token has on an entity are cached per (token hash, identifier) for AUTHZ_CACHE_TTL seconds,
+in a bounded in-process LRU and optionally in the shared flask_caching cache (AUTHZ_CACHE_USE_SHARED_CACHE).
+The entries of an identifier are invalidated when its affiliations change.
+"""
+import hashlib
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from flask import current_app
+
+from legal_api.services.cache import cache
+from legal_api.services.lru_cache import LRUCache
+
+
+class AuthorizationCache:
+    """Bounded LRU/TTL cache of the roles per (token hash, identifier)."""
+
+    def __init__(self):
+        """Create an empty cache."""
+        self._entries = LRUCache()  # (token hash, identifier) -> (expires at, roles)
+        self._lock = threading.Lock()  # guards the metrics
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _ttl() -> int:
+        return current_app.config.get('AUTHZ_CACHE_TTL', 0)
+
+    @staticmethod
+    def _token_hash(token: str) -> str:
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _shared_key(token_hash: str, identifier: str) -> str:
+        """Return the shared cache key, which includes the invalidation generation of the identifier."""
+        generation = cache.get(f'authz_generation_{identifier}') or 0
+        return f'authz_roles_{generation}_{token_hash}_{identifier}'
+
+    def get_roles(self, token: str, identifier: str) -> Optional[List[str]]:
+        """Return the cached roles of the token on the identifier, or None if not cached."""
+        if not token or not identifier or self._ttl() <= 0:
+            return None
+
+        key = (self._token_hash(token), identifier)
+        if entry := self._entries.get(key):
+            if entry[0] > time.monotonic():
+                with self._lock:
+                    self.hits += 1
+                return entry[1]
+            self._entries.pop(key)
+
+        roles = None
+        if current_app.config.get('AUTHZ_CACHE_USE_SHARED_CACHE'):
+            roles = cache.get(self._shared_key(*key))
+            if roles is not None:
+                self._set_local(key, roles)
+
+        with self._lock:
+            if roles is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return roles
+
+    def set_roles(self, token: str, identifier: str, roles: List[str]):
+        """Cache the roles of the token on the identifier."""
+        if not token or not identifier or self._ttl() <= 0:
+            return
+
+        key = (self._token_hash(token), identifier)
+        roles = list(roles or [])
+        self._set_local(key, roles)
+        if current_app.config.get('AUTHZ_CACHE_USE_SHARED_CACHE'):
+            cache.set(self._shared_key(*key), roles, timeout=self._ttl())
+
+    def invalidate(self, identifier: str):
+        """Remove the cached roles of every token on the identifier, e.g. after its affiliations changed."""
+        if not identifier:
+            return
+
+        for key in self._entries.keys():
+            if key[1] == identifier:
+                self._entries.pop(key)
+
+        if current_app.config.get('AUTHZ_CACHE_USE_SHARED_CACHE'):
+            generation_key = f'authz_generation_{identifier}'
+            cache.set(generation_key, (cache.get(generation_key) or 0) + 1, timeout=0)
+
+    def clear(self):
+        """Remove all the locally cached roles and reset the metrics."""
+        self._entries.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def get_metrics(self) -> dict:
+        """Return the size and hit rate of the cache."""
+        size = len(self._entries)
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hitRate': round(self.hits / lookups, 4) if lookups else 0
+            }
+
+    def _set_local(self, key: Tuple[str, str], roles: List[str]):
+        self._entries.set(key, (time.monotonic() + self._ttl(), roles),
+                          current_app.config.get('AUTHZ_CACHE_MAX_SIZE', 2048))
+
+
+# pylint: disable=invalid-name; shared variables are lower case by Flask convention.
+authorization_cache = AuthorizationCache()
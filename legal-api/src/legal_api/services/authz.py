@@ -14,23 +14,25 @@
 
 # pylint: disable=too-many-lines
 """This manages all of the authentication and authorization service."""
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
 from http import HTTPStatus
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 from flask import Response, current_app, request
 from flask_jwt_oidc import JwtManager
-from requests import Session, exceptions
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from requests import exceptions
 
 from legal_api.models import Business, Filing
+from legal_api.services.authorization_cache import authorization_cache
 from legal_api.services.cache import cache
+from legal_api.services.http_client import http_client
 from legal_api.services.digital_credentials_auth import (
     are_digital_credentials_allowed,
     get_digital_credentials_preconditions,
 )
+from legal_api.services.digital_credentials_rules import RulesEvaluationContext
 from legal_api.services.warnings.business.business_checks import WarningType
 
 
@@ -69,8 +71,11 @@ class BusinessRequirement(str, Enum):
     NO_RESTRICTION = 'NO_RESTRICTION'
 
 
-def _call_auth_api(path: str, token: str) -> Response:
-    """Return the auth api response for the given endpoint path."""
+def _call_auth_api(path: str, token: str, endpoint: str = None) -> Response:
+    """Return the auth api response for the given endpoint path.
+
+    The endpoint names the call in the http client latency metrics.
+    """
     if not token:
         return None
 
@@ -81,12 +86,7 @@ def _call_auth_api(path: str, token: str) -> Response:
 
     headers = {'Authorization': 'Bearer ' + token}
     try:
-        http = Session()
-        retries = Retry(total=5,
-                        backoff_factor=0.1,
-                        status_forcelist=[500, 502, 503, 504])
-        http.mount('http://', HTTPAdapter(max_retries=retries))
-        resp = http.get(url=auth_url, headers=headers)
+        resp = http_client.get(url=auth_url, headers=headers, endpoint=endpoint or 'auth')
         current_app.logger.debug(f'Auth get {path} response status: {str(resp.status_code)}')
         return resp
 
@@ -129,8 +129,14 @@ def authorized(  # pylint: disable=too-many-return-statements
         if any(elem in action for elem in staff_only_actions):
             return False
 
-        rv = _call_auth_api(f'entities/{identifier}/authorizations', jwt.get_token_auth_header())
-        if rv and rv.status_code == HTTPStatus.OK and (roles := rv.json().get('roles')):
+        token = jwt.get_token_auth_header()
+        roles = authorization_cache.get_roles(token, identifier)
+        if roles is None:
+            rv = _call_auth_api(f'entities/{identifier}/authorizations', token, 'auth.entities.authorizations')
+            if rv and rv.status_code == HTTPStatus.OK:
+                roles = rv.json().get('roles') or []
+                authorization_cache.set_roles(token, identifier, roles)
+        if roles:
             return all(elem.lower() in roles for elem in action)
 
     return False
@@ -582,6 +588,88 @@ def get_allowable_filings_dict():
     }
 
 
+@dataclass(frozen=True)
+class AllowableFilingRule:
+    """A compiled allowable filing rule for a single user role, business state and legal type."""
+
+    name: str
+    sub_type: Optional[str]
+    business_requirement: BusinessRequirement
+    blocker_checks: dict
+    display_name: Optional[str]
+    fee_code: Optional[str]
+
+    def as_filing_type(self, include_fee_code: bool = True) -> dict:
+        """Return the allowable filing type entry for this rule."""
+        filing_type = {'name': self.name}
+        if self.sub_type:
+            filing_type['type'] = self.sub_type
+        filing_type['displayName'] = self.display_name
+        if include_fee_code:
+            filing_type['feeCode'] = self.fee_code
+        return filing_type
+
+
+_allowable_filing_rules: Optional[Dict[Tuple[str, Business.State, str], Tuple[AllowableFilingRule, ...]]] = None
+
+
+def compile_allowable_filing_rules(allowable_filings_dict: dict = None) -> dict:
+    """Compile the allowable filings dict into rules indexed by (user role, state, legal type).
+
+    The rules for a key are kept in the same order as the allowable filings dict so the
+    allowable filing types returned by the lookups are unchanged.
+    """
+    # importing here to avoid circular dependencies
+    # pylint: disable=import-outside-toplevel
+    from legal_api.core.meta import FilingMeta
+
+    if allowable_filings_dict is None:
+        allowable_filings_dict = get_allowable_filings_dict()
+
+    compiled_rules = {}
+    for user_role, states in allowable_filings_dict.items():
+        for state, allowable_filings in states.items():
+            for filing_key, filing_value in allowable_filings.items():
+                business_requirement = filing_value.get('businessRequirement', BusinessRequirement.EXIST)
+
+                if filing_value.get('legalTypes'):
+                    sub_type_items = [(None, filing_value)]
+                else:
+                    sub_type_items = [(key, value) for key, value in filing_value.items()
+                                      if isinstance(value, dict)]
+
+                for sub_type, rule_value in sub_type_items:
+                    for legal_type in rule_value.get('legalTypes', []):
+                        rule = AllowableFilingRule(
+                            name=filing_key,
+                            sub_type=sub_type,
+                            business_requirement=business_requirement,
+                            blocker_checks=rule_value.get('blockerChecks', {}),
+                            display_name=FilingMeta.get_display_name(legal_type, filing_key, sub_type),
+                            fee_code=Filing.get_fee_code(legal_type, filing_key, sub_type))
+                        compiled_rules.setdefault((user_role, state, legal_type), []).append(rule)
+
+    return {key: tuple(rules) for key, rules in compiled_rules.items()}
+
+
+def get_allowable_filing_rules(user_role: str, state: Business.State, legal_type: str) -> Tuple[AllowableFilingRule]:
+    """Return the compiled allowable filing rules for the user role, business state and legal type.
+
+    The rules are compiled once per process on first use.
+    """
+    global _allowable_filing_rules  # pylint: disable=global-statement
+    if _allowable_filing_rules is None:
+        _allowable_filing_rules = compile_allowable_filing_rules()
+    return _allowable_filing_rules.get((user_role, state, legal_type), ())
+
+
+def get_user_role(jwt: JwtManager) -> str:
+    """Return the allowable filings user role for the jwt."""
+    if jwt.contains_role([STAFF_ROLE, SYSTEM_ROLE, COLIN_SVC_ROLE]):
+        return 'staff'
+    return 'general'
+
+
 # pylint: disable=(too-many-arguments,too-many-locals
 def is_allowed(business: Business,
                state: Business.State,
@@ -639,14 +727,17 @@ def get_allowable_actions(jwt: JwtManager, business: Business):
 
     base_url = current_app.config.get('LEGAL_API_BASE_URL')
     filing_submission_url = f'{base_url}/{business.identifier}/filings'
+    # the digital credential rules share the records they are evaluated against
+    digital_credentials_context = RulesEvaluationContext()
 
     result = {
         'filing': {
             'filingSubmissionLink': filing_submission_url,
             'filingTypes': allowed_filings
         },
-        'digitalBusinessCard': are_digital_credentials_allowed(business, jwt),
-        'digitalBusinessCardPreconditions': get_digital_credentials_preconditions(business),
+        'digitalBusinessCard': are_digital_credentials_allowed(business, jwt, digital_credentials_context),
+        'digitalBusinessCardPreconditions': get_digital_credentials_preconditions(business,
+                                                                                  digital_credentials_context),
         'viewAll': is_competent_authority(jwt)
     }
     return result
@@ -656,47 +747,10 @@ def get_could_file(legal_type: str,
                    state: str,
                    jwt: JwtManager):
     """Get allowed type of filing types for the current user."""
-    # importing here to avoid circular dependencies
-    # pylint: disable=import-outside-toplevel
-    from legal_api.core.meta import FilingMeta
-
-    user_role = 'general'
-    if jwt.contains_role([STAFF_ROLE, SYSTEM_ROLE, COLIN_SVC_ROLE]):
-        user_role = 'staff'
-
     bs_state = getattr(Business.State, state, '')
 
-    allowable_filings = get_allowable_filings_dict().get(user_role, {}).get(bs_state, {})
-    could_filing_types = []
-
-    for allowable_filing_key, allowable_filing_value in allowable_filings.items():
-        allowable_filing_legal_types = allowable_filing_value.get('legalTypes', [])
-
-        if allowable_filing_legal_types:
-            is_allowable = legal_type in allowable_filing_legal_types
-            allowable_filing_type = {'name': allowable_filing_key,
-                                     'displayName': FilingMeta.get_display_name(legal_type, allowable_filing_key)}
-            could_filing_types = add_allowable_filing_type(is_allowable,
-                                                           could_filing_types,
-                                                           allowable_filing_type)
-            continue
-
-        filing_sub_type_items = \
-            filter(lambda x: isinstance(x[1], dict) and legal_type in
-                   x[1].get('legalTypes', []), allowable_filing_value.items())
-
-        for filing_sub_type_item_key, _ in filing_sub_type_items:
-
-            allowable_filing_sub_type = {'name': allowable_filing_key,
-                                         'type': filing_sub_type_item_key,
-                                         'displayName': FilingMeta.get_display_name(legal_type,
-                                                                                    allowable_filing_key,
-                                                                                    filing_sub_type_item_key)}
-            could_filing_types = add_allowable_filing_type(True,
-                                                           could_filing_types,
-                                                           allowable_filing_sub_type)
-
-    return could_filing_types
+    return [rule.as_filing_type(include_fee_code=False)
+            for rule in get_allowable_filing_rules(get_user_role(jwt), bs_state, legal_type)]
 
 
 def get_allowed_filings(business: Business,
@@ -705,77 +759,41 @@ def get_allowed_filings(business: Business,
                         jwt: JwtManager,
                         is_ignore_draft_blockers: bool = False):
     """Get allowed type of filing types for the current user."""
-    # importing here to avoid circular dependencies
-    # pylint: disable=import-outside-toplevel
-    from legal_api.core.meta import FilingMeta
-
-    user_role = 'general'
-    if jwt.contains_role([STAFF_ROLE, SYSTEM_ROLE, COLIN_SVC_ROLE]):
-        user_role = 'staff'
-
     state_filing = None
     if business and business.state_filing_id:
         state_filing = Filing.find_by_id(business.state_filing_id)
 
-    # doing this check up front to cache result
-    business_blocker_dict: dict = business_blocker_check(business, is_ignore_draft_blockers)
-    allowable_filings = get_allowable_filings_dict().get(user_role, {}).get(state, {})
+    # doing these checks up front to cache result
+    snapshot = BusinessBlockerSnapshot.load(business)
+    business_blocker_dict: dict = business_blocker_check(business, is_ignore_draft_blockers, snapshot)
     allowable_filing_types = []
 
-    for allowable_filing_key, allowable_filing_value in allowable_filings.items():
+    for rule in get_allowable_filing_rules(get_user_role(jwt), state, legal_type):
         # skip if business does not exist and filing is not required
         # skip if this filing does not need to be returned for existing businesses
-
-        business_status = allowable_filing_value.get('businessRequirement', BusinessRequirement.EXIST)
-
-        if business_status != BusinessRequirement.NO_RESTRICTION and \
-                bool(business) ^ (business_status == BusinessRequirement.EXIST):
+        if rule.business_requirement != BusinessRequirement.NO_RESTRICTION and \
+                bool(business) ^ (rule.business_requirement == BusinessRequirement.EXIST):
             continue
 
-        allowable_filing_legal_types = allowable_filing_value.get('legalTypes', [])
-
-        if allowable_filing_legal_types:
-            is_blocker = has_blocker(business, state_filing, allowable_filing_value, business_blocker_dict)
-            is_include_legal_type = legal_type in allowable_filing_legal_types
-            is_allowable = not is_blocker and is_include_legal_type
-            allowable_filing_type = {'name': allowable_filing_key,
-                                     'displayName': FilingMeta.get_display_name(legal_type, allowable_filing_key),
-                                     'feeCode': Filing.get_fee_code(legal_type, allowable_filing_key)}
-            allowable_filing_types = add_allowable_filing_type(is_allowable,
-                                                               allowable_filing_types,
-                                                               allowable_filing_type)
-            continue
-
-        filing_sub_type_items = \
-            filter(lambda x: isinstance(x[1], dict) and legal_type in
-                   x[1].get('legalTypes', []), allowable_filing_value.items())
-
-        for filing_sub_type_item_key, filing_sub_type_item_value in filing_sub_type_items:
-            is_allowable = not has_blocker(business, state_filing, filing_sub_type_item_value, business_blocker_dict)
-
-            allowable_filing_sub_type = {'name': allowable_filing_key,
-                                         'type': filing_sub_type_item_key,
-                                         'displayName': FilingMeta.get_display_name(legal_type,
-                                                                                    allowable_filing_key,
-                                                                                    filing_sub_type_item_key),
-                                         'feeCode': Filing.get_fee_code(legal_type,
-                                                                        allowable_filing_key,
-                                                                        filing_sub_type_item_key)}
-            allowable_filing_types = add_allowable_filing_type(is_allowable,
-                                                               allowable_filing_types,
-                                                               allowable_filing_sub_type)
+        is_allowable = not has_blocker(business, state_filing, rule.blocker_checks, business_blocker_dict, snapshot)
+        allowable_filing_types = add_allowable_filing_type(is_allowable,
+                                                           allowable_filing_types,
+                                                           rule.as_filing_type())
 
     return allowable_filing_types
 
 
-def has_blocker(business: Business, state_filing: Filing, allowable_filing: dict, business_blocker_dict: dict):
-    """Return True if allowable filing has a blocker."""
+def has_blocker(business: Business,
+                state_filing: Filing,
+                blocker_checks: dict,
+                business_blocker_dict: dict,
+                snapshot: 'BusinessBlockerSnapshot' = None):
+    """Return True if the allowable filing blocker checks have a blocker."""
     if not business:
         return False
 
-    if not (blocker_checks := allowable_filing.get('blockerChecks', {})):
+    if not blocker_checks:
         return False
-
     if has_business_blocker(blocker_checks, business_blocker_dict):
         return True
 
@@ -785,10 +803,10 @@ def has_blocker(business: Business, state_filing: Filing, allowable_filing: dict
     if has_blocker_invalid_state_filing(state_filing, blocker_checks):
         return True
 
-    if has_blocker_completed_filing(business, blocker_checks):
+    if has_blocker_completed_filing(business, blocker_checks, snapshot):
         return True
 
-    if has_blocker_future_effective_filing(business, blocker_checks):
+    if has_blocker_future_effective_filing(business, blocker_checks, snapshot):
         return True
 
     if has_blocker_warning_filing(business.warnings, blocker_checks):
@@ -809,7 +827,72 @@ def has_business_blocker(blocker_checks: dict, business_blocker_dict: dict):
     return False
 
 
-def business_blocker_check(business: Business, is_ignore_draft_blockers: bool = False):
+class BusinessBlockerSnapshot:
+    """The filing facts needed by the business blocker checks, loaded for a business in a single query.
+
+    The snapshot holds one summary row per filing type, sub-type and status so the blocker checks can be
+    evaluated in memory instead of querying the filings table for every check.
+    """
+
+    def __init__(self, filing_summaries: list = None):
+        """Create the snapshot from the filing status summary rows."""
+        self.filing_summaries = filing_summaries or []
+
+    @classmethod
+    def load(cls, business: Business) -> 'BusinessBlockerSnapshot':
+        """Load the snapshot for the business."""
+        if not business or not business.id:
+            return cls()
+        return cls(Filing.get_filing_status_summary(business.id))
+
+    def _summaries(self, statuses: list = None, filing_type_pairs: list = None):
+        """Yield the summary rows matching the statuses and filing type/sub-type pairs, if provided."""
+        for summary in self.filing_summaries:
+            if statuses is not None and summary.status not in statuses:
+                continue
+            if filing_type_pairs is not None and \
+                    (summary.filing_type, summary.filing_sub_type) not in filing_type_pairs:
+                continue
+            yield summary
+
+    def has_filing_status(self, statuses: list) -> bool:
+        """Return True if the business has a filing in any of the statuses."""
+        return any(self._summaries(statuses=statuses))
+
+    def has_incomplete_filing_type(self, filing_types: list, excluded_statuses: list = None) -> bool:
+        """Return True if the business has an incomplete filing of any of the filing types."""
+        excluded_statuses = [Filing.Status.COMPLETED.value,
+                             Filing.Status.WITHDRAWN.value] + (excluded_statuses or [])
+        return any(summary.filing_type in filing_types and summary.status not in excluded_statuses
+                   for summary in self.filing_summaries)
+
+    def has_completed_filings(self, filing_type_pairs: list) -> bool:
+        """Return True if the business has a completed filing for every filing type/sub-type pair."""
+        completed_pairs = {(summary.filing_type, summary.filing_sub_type)
+                           for summary in self._summaries(statuses=[Filing.Status.COMPLETED.value],
+                                                          filing_type_pairs=filing_type_pairs)}
+        return len(completed_pairs) == len(filing_type_pairs)
+
+    def has_future_effective_filing(self, filing_type_pairs: list, statuses: list, now: datetime) -> bool:
+        """Return True if the latest filing of any filing type/sub-type pair in the statuses is future effective."""
+        latest_summaries = {}
+        for summary in self._summaries(statuses=statuses, filing_type_pairs=filing_type_pairs):
+            pair = (summary.filing_type, summary.filing_sub_type)
+            if pair not in latest_summaries or summary.last_filing_id > latest_summaries[pair].last_filing_id:
+                latest_summaries[pair] = summary
+
+        return any(summary.last_effective_date and summary.last_effective_date > now
+                   for summary in latest_summaries.values())
+
+    def has_future_effective_status(self, statuses: list, now: datetime) -> bool:
+        """Return True if any filing in the statuses is future effective."""
+        return any(summary.max_effective_date and summary.max_effective_date > now
+                   for summary in self._summaries(statuses=statuses))
+
+
+def business_blocker_check(business: Business,
+                           is_ignore_draft_blockers: bool = False,
+                           snapshot: BusinessBlockerSnapshot = None):
     """Return True if the business has a default blocker condition."""
     business_blocker_checks: dict = {
         BusinessBlocker.DEFAULT: False,
@@ -825,7 +908,9 @@ def business_blocker_check(business: Business, is_ignore_draft_blockers: bool =
     if not business:
         return business_blocker_checks
 
-    if has_blocker_filing(business, is_ignore_draft_blockers):
+    snapshot = snapshot or BusinessBlockerSnapshot.load(business)
+
+    if has_blocker_filing(business, is_ignore_draft_blockers, snapshot):
         business_blocker_checks[BusinessBlocker.DRAFT_PENDING] = True
         business_blocker_checks[BusinessBlocker.DEFAULT] = True
 
@@ -845,18 +930,22 @@ def business_blocker_check(business: Business, is_ignore_draft_blockers: bool =
     if business.in_liquidation:
         business_blocker_checks[BusinessBlocker.IN_LIQUIDATION] = True
 
-    if has_notice_of_withdrawal_filing_blocker(business, is_ignore_draft_blockers):
+    if has_notice_of_withdrawal_filing_blocker(business, is_ignore_draft_blockers, snapshot):
         business_blocker_checks[BusinessBlocker.FILING_WITHDRAWAL] = True
 
     return business_blocker_checks
 
 
-def has_blocker_filing(business: Business, is_ignore_draft_blockers: bool = False):
+def has_blocker_filing(business: Business,
+                       is_ignore_draft_blockers: bool = False,
+                       snapshot: BusinessBlockerSnapshot = None):
     """Check if there are any incomplete states filings. This is a blocker because it needs to be completed first."""
     # importing here to avoid circular dependencies
     # pylint: disable=import-outside-toplevel
     from legal_api.core.filing import Filing as CoreFiling
 
+    snapshot = snapshot or BusinessBlockerSnapshot.load(business)
+
     filing_statuses = [Filing.Status.PENDING.value,
                        Filing.Status.PENDING_CORRECTION.value,
                        Filing.Status.ERROR.value,
@@ -866,14 +955,12 @@ def has_blocker_filing(business: Business, is_ignore_draft_blockers: bool = Fals
                                 Filing.Status.AWAITING_REVIEW.value,
                                 Filing.Status.CHANGE_REQUESTED.value,
                                 Filing.Status.APPROVED.value])
-    blocker_filing_matches = Filing.get_filings_by_status(business.id, filing_statuses)
-    if any(blocker_filing_matches):
+    if snapshot.has_filing_status(filing_statuses):
         return True
 
     filing_types = [CoreFiling.FilingTypes.ALTERATION.value, CoreFiling.FilingTypes.CORRECTION.value]
     excluded_statuses = [Filing.Status.DRAFT.value] if is_ignore_draft_blockers else []
-    blocker_filing_matches = Filing.get_incomplete_filings_by_types(business.id, filing_types, excluded_statuses)
-    return any(blocker_filing_matches)
+    return snapshot.has_incomplete_filing_type(filing_types, excluded_statuses)
 
 
 def has_blocker_valid_state_filing(state_filing: Filing, blocker_checks: dict):
@@ -898,39 +985,31 @@ def has_blocker_invalid_state_filing(state_filing: Filing, blocker_checks: dict)
     return has_filing_match(state_filing, state_filing_types)
 
 
-def has_blocker_completed_filing(business: Business, blocker_checks: dict):
+def has_blocker_completed_filing(business: Business, blocker_checks: dict, snapshot: BusinessBlockerSnapshot = None):
     """Check if business has an completed filing."""
     if not (complete_filing_types := blocker_checks.get('completedFilings', [])):
         return False
 
+    snapshot = snapshot or BusinessBlockerSnapshot.load(business)
     filing_type_pairs = [(parse_filing_info(x)) for x in complete_filing_types]
-    completed_filings = Filing.get_filings_by_type_pairs(business.id,
-                                                         filing_type_pairs,
-                                                         [Filing.Status.COMPLETED.value],
-                                                         True)
 
-    if len(completed_filings) == len(complete_filing_types):
-        return False
-
-    return True
+    return not snapshot.has_completed_filings(filing_type_pairs)
 
 
-def has_blocker_future_effective_filing(business: Business, blocker_checks: dict):
+def has_blocker_future_effective_filing(business: Business,
+                                        blocker_checks: dict,
+                                        snapshot: BusinessBlockerSnapshot = None):
     """Check if business has a future effective filing."""
     if not (fed_filing_types := blocker_checks.get('futureEffectiveFilings', [])):
         return False
 
+    snapshot = snapshot or BusinessBlockerSnapshot.load(business)
     filing_type_pairs = [(parse_filing_info(x)) for x in fed_filing_types]
 
-    pending_filings = Filing.get_filings_by_type_pairs(business.id,
-                                                       filing_type_pairs,
-                                                       [Filing.Status.PENDING.value, Filing.Status.PAID.value],
-                                                       True)
-
     now = datetime.utcnow().replace(tzinfo=timezone.utc)
-    is_fed = any(f.effective_date > now for f in pending_filings)
-
-    return is_fed
+    return snapshot.has_future_effective_filing(filing_type_pairs,
+                                                [Filing.Status.PENDING.value, Filing.Status.PAID.value],
+                                                now)
 
 
 def has_filing_match(filing: Filing, filing_types: list):
@@ -971,44 +1050,39 @@ def has_blocker_warning_filing(warnings: List, blocker_checks: dict):
     return warning_matches
 
 
-def has_notice_of_withdrawal_filing_blocker(business: Business, is_ignore_draft_blockers: bool = False):
+def has_notice_of_withdrawal_filing_blocker(business: Business,
+                                            is_ignore_draft_blockers: bool = False,
+                                            snapshot: BusinessBlockerSnapshot = None):
     """Check if there are any blockers specific to Notice of Withdrawal."""
     if business.admin_freeze:
         return True
 
+    snapshot = snapshot or BusinessBlockerSnapshot.load(business)
+
     filing_statuses = [Filing.Status.PENDING.value,
                        Filing.Status.PENDING_CORRECTION.value,
                        Filing.Status.ERROR.value]
     if not is_ignore_draft_blockers:
         filing_statuses.append(Filing.Status.DRAFT.value)
-    blocker_filing_matches = Filing.get_filings_by_status(business.id, filing_statuses)
-    if any(blocker_filing_matches):
+    if snapshot.has_filing_status(filing_statuses):
         return True
 
     now = datetime.now(timezone.utc)
-    paid_filings = Filing.get_filings_by_status(business.id, [Filing.Status.PAID.value])
-    return not any(f.effective_date and f.effective_date > now for f in paid_filings)
+    return not snapshot.has_future_effective_status([Filing.Status.PAID.value], now)
 
 
 def get_allowed(state: Business.State, legal_type: str, jwt: JwtManager):
     """Get allowed type of filing types for the current user."""
-    user_role = 'general'
-    if jwt.contains_role([STAFF_ROLE, SYSTEM_ROLE, COLIN_SVC_ROLE]):
-        user_role = 'staff'
-
-    allowable_filings = get_allowable_filings_dict().get(user_role, {}).get(state, {})
     allowable_filing_types = []
-    for allowable_filing_key, allowable_filing_value in allowable_filings.items():
-        if legal_types := allowable_filing_value.get('legalTypes', None):
-            if legal_type in legal_types:
-                allowable_filing_types.append(allowable_filing_key)
+    sub_filing_types = {}
+    for rule in get_allowable_filing_rules(get_user_role(jwt), state, legal_type):
+        if not rule.sub_type:
+            allowable_filing_types.append(rule.name)
+        elif rule.name in sub_filing_types:
+            sub_filing_types[rule.name].append(rule.sub_type)
         else:
-            sub_filing_types = [x for x in allowable_filing_value.items()
-                                if isinstance(x[1], dict) and legal_type in x[1].get('legalTypes')]
-            if sub_filing_types:
-                allowable_filing_types.append({
-                    allowable_filing_key: [sub_filing_type[0] for sub_filing_type in sub_filing_types]
-                })
+            sub_filing_types[rule.name] = [rule.sub_type]
+            allowable_filing_types.append({rule.name: sub_filing_types[rule.name]})
 
     return allowable_filing_types
 
@@ -1032,7 +1106,7 @@ def get_account_id(_, account_id: str = None) -> str:
 def get_account_products(token: str, account_id: str = None) -> list:
     """Return the account products of the org identified by the account id."""
     account_id = account_id or request.headers.get('Account-Id', None)
-    resp = _call_auth_api(f'orgs/{account_id}/products?include_hidden=true', token)
+    resp = _call_auth_api(f'orgs/{account_id}/products?include_hidden=true', token, 'auth.orgs.products')
     if not resp or resp.status_code != HTTPStatus.OK or not isinstance(resp.json(), list):
         return None
     return resp.json()
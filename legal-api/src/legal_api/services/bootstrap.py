@@ -20,12 +20,13 @@ import string
 from http import HTTPStatus
 from typing import Dict, Union
 
-import requests
 from flask import current_app
 from flask_babel import _ as babel  # noqa: N813, I001, I003 casting _ to babel
 from sqlalchemy.orm.exc import FlushError  # noqa: I001
 
+from legal_api.services.authorization_cache import authorization_cache
 from legal_api.services.flags import Flags
+from legal_api.services.http_client import http_client
 from legal_api.services import flags  # noqa: D204, I003, I001;# due to babel cast above
 from legal_api.models import RegistrationBootstrap  # noqa: D204, I003, I001;# due to babel cast above
 
@@ -115,7 +116,7 @@ class RegistrationBootstrapService:
 class AccountService:
     """Wrapper to call Authentication Services.
 
-    @TODO Cache and refresh / retry token as needed to reduce calls.
+    Calls go through the shared http client, which pools the connections and caches the service account token.
     """
 
     BEARER: str = 'Bearer '
@@ -133,19 +134,8 @@ class AccountService:
         client_id = current_app.config.get('ACCOUNT_SVC_CLIENT_ID')
         client_secret = current_app.config.get('ACCOUNT_SVC_CLIENT_SECRET')
 
-        data = 'grant_type=client_credentials'
-
-        # get service account token
-        res = requests.post(url=token_url,
-                            data=data,
-                            headers={'content-type': 'application/x-www-form-urlencoded'},
-                            auth=(client_id, client_secret),
-                            timeout=cls.timeout)
-
-        try:
-            return res.json().get('access_token')
-        except Exception:
-            return None
+        # get service account token, cached until shortly before it expires
+        return http_client.get_service_account_token(token_url, client_id, client_secret, timeout=cls.timeout)
 
     @classmethod
     # pylint: disable=too-many-arguments, too-many-locals disable=invalid-name, disable=redefined-outer-name;
@@ -178,12 +168,13 @@ class AccountService:
         if corp_sub_type_code:
             entity_data['corpSubTypeCode'] = corp_sub_type_code
 
-        entity_record = requests.post(
+        entity_record = http_client.post(
             url=account_svc_entity_url,
             headers={**cls.CONTENT_TYPE_JSON,
                      'Authorization': cls.BEARER + token},
             data=json.dumps(entity_data),
-            timeout=cls.timeout
+            timeout=cls.timeout,
+            endpoint='auth.entities'
         )
 
         # Create an account:business affiliation
@@ -199,12 +190,14 @@ class AccountService:
         }
         if details:
             affiliate_data['entityDetails'] = details
-        affiliate = requests.post(
+        affiliate = http_client.post(
             url=account_svc_affiliate_url,
             headers=headers,
             data=json.dumps(affiliate_data),
-            timeout=cls.timeout
+            timeout=cls.timeout,
+            endpoint='auth.orgs.affiliations'
         )
+        authorization_cache.invalidate(business_registration)
 
         # @TODO delete affiliation and entity record next sprint when affiliation service is updated
         if affiliate.status_code != HTTPStatus.CREATED or entity_record.status_code != HTTPStatus.CREATED:
@@ -235,12 +228,13 @@ class AccountService:
         if state:
             entity_data['state'] = state
 
-        entity_record = requests.patch(
+        entity_record = http_client.patch(
             url=account_svc_entity_url + '/' + business_registration,
             headers={**cls.CONTENT_TYPE_JSON,
                      'Authorization': cls.BEARER + token},
             data=json.dumps(entity_data),
-            timeout=cls.timeout
+            timeout=cls.timeout,
+            endpoint='auth.entities'
         )
 
         if entity_record.status_code != HTTPStatus.OK:
@@ -261,19 +255,22 @@ class AccountService:
         token = cls.get_bearer_token()
 
         # Delete an account:business affiliation
-        affiliate = requests.delete(
+        affiliate = http_client.delete(
             url=account_svc_affiliate_url + '/' + business_registration,
             headers={**cls.CONTENT_TYPE_JSON,
                      'Authorization': cls.BEARER + token},
-            timeout=cls.timeout
+            timeout=cls.timeout,
+            endpoint='auth.orgs.affiliations'
         )
         # Delete an entity record
-        entity_record = requests.delete(
+        entity_record = http_client.delete(
             url=account_svc_entity_url + '/' + business_registration,
             headers={**cls.CONTENT_TYPE_JSON,
                      'Authorization': cls.BEARER + token},
-            timeout=cls.timeout
+            timeout=cls.timeout,
+            endpoint='auth.entities'
         )
+        authorization_cache.invalidate(business_registration)
 
         if affiliate.status_code != HTTPStatus.OK \
                 or entity_record.status_code not in (HTTPStatus.OK, HTTPStatus.NO_CONTENT):
@@ -292,7 +289,7 @@ class AccountService:
         if flags and isinstance(flags, Flags) and flags.is_on('enable-sandbox'):
             current_app.logger.info('Appending Environment-Override = sandbox header to get account affiliation info')
             headers['Environment-Override'] = 'sandbox'
-        res = requests.get(url=url, headers=headers)
+        res = http_client.get(url=url, headers=headers, endpoint='auth.orgs')
         try:
             return res.json()
         except Exception:  # noqa B902; pylint: disable=W0703;
@@ -311,11 +308,12 @@ class AccountService:
             current_app.logger.error('Not Authorized')
             return None
 
-        affiliates = requests.get(
+        affiliates = http_client.get(
             url=account_svc_affiliate_url,
             headers={**cls.CONTENT_TYPE_JSON,
                      'Authorization': cls.BEARER + token},
-            timeout=cls.timeout
+            timeout=cls.timeout,
+            endpoint='auth.orgs.affiliations'
         )
 
         if affiliates.status_code == HTTPStatus.OK:
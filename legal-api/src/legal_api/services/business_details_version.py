@@ -15,9 +15,10 @@
 """This provides the service for getting business details as of a filing."""
 # pylint: disable=singleton-comparison ; pylint does not recognize sqlalchemy ==
 from datetime import datetime
+from typing import Optional
 
 import pycountry
-from sqlalchemy import or_
+from sqlalchemy import func, or_
 
 from legal_api.models import (
     Address,
@@ -33,9 +34,96 @@ from legal_api.models import (
     db,
 )
 from legal_api.models.db import VersioningProxy
+from legal_api.services.revision_snapshot_cache import revision_snapshot_cache
 from legal_api.utils.legislation_datetime import LegislationDatetime
 
 
+class BusinessRevisionLoader:
+    """Loads the versioned rows of a business as of a transaction.
+
+    Each versioned table is queried once, for the whole business, with the rows that were current at the transaction
+    (transaction_id <= T and end_transaction_id is null or > T). The rows are kept so the revision json can be
+    assembled in memory.
+    """
+
+    def __init__(self, transaction_id: int, business_id: int):
+        """Create the loader for the business as of the transaction."""
+        self.transaction_id = transaction_id
+        self.business_id = business_id
+        self._rows = {}
+
+    def as_of(self, model, *criteria) -> list:
+        """Return the versions of the model current at the transaction, ordered by transaction."""
+        model_version = VersioningProxy.version_class(db.session(), model)
+        return db.session.query(model_version) \
+            .filter(model_version.transaction_id <= self.transaction_id) \
+            .filter(model_version.operation_type != 2) \
+            .filter(*[criterion(model_version) for criterion in criteria]) \
+            .filter(or_(model_version.end_transaction_id == None,  # pylint: disable=singleton-comparison # noqa: E711,E501;
+                        model_version.end_transaction_id > self.transaction_id)) \
+            .order_by(model_version.transaction_id).all()
+
+    def _load(self, key, model, *criteria) -> list:
+        if key not in self._rows:
+            self._rows[key] = self.as_of(model, *criteria)
+        return self._rows[key]
+
+    def offices(self) -> list:
+        """Return the offices of the business."""
+        return self._load('offices', Office, lambda v: v.business_id == self.business_id)
+
+    def office_addresses(self) -> dict:
+        """Return the addresses of the offices, keyed by office id."""
+        office_ids = [office.id for office in self.offices()]
+        addresses = {}
+        if office_ids:
+            for address in self._load('office_addresses', Address, lambda v: v.office_id.in_(office_ids)):
+                addresses.setdefault(address.office_id, []).append(address)
+        return addresses
+
+    def party_roles(self) -> list:
+        """Return the party roles of the business."""
+        return self._load('party_roles', PartyRole, lambda v: v.business_id == self.business_id)
+
+    def parties(self) -> dict:
+        """Return the parties of the party roles, keyed by party id."""
+        party_ids = {party_role.party_id for party_role in self.party_roles() if party_role.party_id}
+        if not party_ids:
+            return {}
+        return {party.id: party for party in self._load('parties', Party, lambda v: v.id.in_(party_ids))}
+
+    def party_addresses(self) -> dict:
+        """Return the delivery and mailing addresses of the parties, keyed by address id."""
+        address_ids = set()
+        for party in self.parties().values():
+            address_ids.update(filter(None, (party.delivery_address_id, party.mailing_address_id)))
+        if not address_ids:
+            return {}
+        return {address.id: address
+                for address in self._load('party_addresses', Address, lambda v: v.id.in_(address_ids))}
+
+    def share_classes(self) -> list:
+        """Return the share classes of the business."""
+        return self._load('share_classes', ShareClass, lambda v: v.business_id == self.business_id)
+
+    def share_series(self) -> dict:
+        """Return the share series of the share classes, keyed by share class id."""
+        share_class_ids = [share_class.id for share_class in self.share_classes()]
+        share_series = {}
+        if share_class_ids:
+            for series in self._load('share_series', ShareSeries, lambda v: v.share_class_id.in_(share_class_ids)):
+                share_series.setdefault(series.share_class_id, []).append(series)
+        return share_series
+
+    def aliases(self) -> list:
+        """Return the aliases of the business."""
+        return self._load('aliases', Alias, lambda v: v.business_id == self.business_id)
+
+    def resolutions(self) -> list:
+        """Return the resolutions of the business."""
+        return self._load('resolutions', Resolution, lambda v: v.business_id == self.business_id)
+
+
 class VersionedBusinessDetailsService:  # pylint: disable=too-many-public-methods
     """Provides service for getting business details as of a filing."""
 
@@ -48,14 +136,14 @@ class VersionedBusinessDetailsService:  # pylint: disable=too-many-public-method
         revision_json = {}
         revision_json['filing'] = {}
         if filing.filing_type == 'incorporationApplication':
-            revision_json['filing'] = \
-                VersionedBusinessDetailsService.get_ia_revision(filing, business)
+            revision_json['filing'] = VersionedBusinessDetailsService.get_revision_snapshot(
+                filing.filing_type, filing, business, VersionedBusinessDetailsService.get_ia_revision)
         elif filing.filing_type == 'changeOfDirectors':
-            revision_json['filing'] = \
-                VersionedBusinessDetailsService.get_cod_revision(filing, business)
+            revision_json['filing'] = VersionedBusinessDetailsService.get_revision_snapshot(
+                filing.filing_type, filing, business, VersionedBusinessDetailsService.get_cod_revision)
         elif filing.filing_type == 'changeOfAddress':
-            revision_json['filing'] = \
-                VersionedBusinessDetailsService.get_coa_revision(filing, business)
+            revision_json['filing'] = VersionedBusinessDetailsService.get_revision_snapshot(
+                filing.filing_type, filing, business, VersionedBusinessDetailsService.get_coa_revision)
         elif filing.filing_type == 'annualReport':
             revision_json['filing'] = \
                 VersionedBusinessDetailsService.get_ar_revision(filing, business)
@@ -82,25 +170,27 @@ class VersionedBusinessDetailsService:  # pylint: disable=too-many-public-method
     def get_ia_revision(filing, business) -> dict:
         """Consolidates incorporation application upto the given transaction id of a filing."""
         ia_json = {}
+        loader = BusinessRevisionLoader(filing.transaction_id, business.id)
 
         ia_json['business'] = \
             VersionedBusinessDetailsService.get_business_revision(filing, business)
         ia_json['incorporationApplication'] = {}
         ia_json['incorporationApplication']['offices'] = \
-            VersionedBusinessDetailsService.get_office_revision(filing.id, filing.transaction_id, business.id)
+            VersionedBusinessDetailsService.get_office_revision(filing.id, filing.transaction_id, business.id, loader)
         ia_json['incorporationApplication']['parties'] = \
             VersionedBusinessDetailsService.get_party_role_revision(filing,
                                                                     business.id,
-                                                                    is_ia_or_after=True)
+                                                                    is_ia_or_after=True,
+                                                                    loader=loader)
         ia_json['incorporationApplication']['nameRequest'] = \
             VersionedBusinessDetailsService.get_name_request_revision(filing)
         ia_json['incorporationApplication']['contactPoint'] = \
             VersionedBusinessDetailsService.get_contact_point_revision(filing)
         ia_json['incorporationApplication']['shareStructure'] = {}
         ia_json['incorporationApplication']['shareStructure']['shareClasses'] = \
-            VersionedBusinessDetailsService.get_share_class_revision(filing.transaction_id, business.id)
+            VersionedBusinessDetailsService.get_share_class_revision(filing.transaction_id, business.id, loader)
         ia_json['incorporationApplication']['nameTranslations'] = \
-            VersionedBusinessDetailsService.get_name_translations_revision(filing.transaction_id, business.id)
+            VersionedBusinessDetailsService.get_name_translations_revision(filing.transaction_id, business.id, loader)
         ia_json['incorporationApplication']['incorporationAgreement'] = \
             VersionedBusinessDetailsService.get_incorporation_agreement_json(filing)
 
@@ -148,6 +238,7 @@ class VersionedBusinessDetailsService:  # pylint: disable=too-many-public-method
     def get_ar_revision(filing, business) -> dict:
         """Consolidates annual report upto the given transaction id of a filing."""
         ar_json = {}
+        loader = BusinessRevisionLoader(filing.transaction_id, business.id)
 
         ar_json['business'] = \
             VersionedBusinessDetailsService.get_business_revision(filing, business)
@@ -166,9 +257,9 @@ class VersionedBusinessDetailsService:  # pylint: disable=too-many-public-method
 
         ar_json['annualReport']['directors'] = \
             VersionedBusinessDetailsService.get_party_role_revision(filing,
-                                                                    business.id, role='director')
+                                                                    business.id, role='director', loader=loader)
         ar_json['annualReport']['offices'] = \
-            VersionedBusinessDetailsService.get_office_revision(filing.id, filing.transaction_id, business.id)
+            VersionedBusinessDetailsService.get_office_revision(filing.id, filing.transaction_id, business.id, loader)
 
         # legal_type CP may need changeOfDirectors/changeOfAddress
         if 'changeOfDirectors' in filing.json['filing']:
@@ -191,23 +282,72 @@ class VersionedBusinessDetailsService:  # pylint: disable=too-many-public-method
     @staticmethod
     def get_company_details_revision(filing_id, business_id) -> dict:
         """Consolidates company details upto the given transaction id of a filing."""
-        company_profile_json = {}
         business = Business.find_by_internal_id(business_id)
         filing = Filing.find_by_id(filing_id)
+        return VersionedBusinessDetailsService.get_revision_snapshot(
+            'companyDetails', filing, business, VersionedBusinessDetailsService.get_company_details)
+
+    @staticmethod
+    def get_company_details(filing, business) -> dict:
+        """Consolidates company details upto the given transaction id of a filing, without the snapshot cache."""
+        company_profile_json = {}
+        business_id = business.id
+        filing_id = filing.id
+        loader = BusinessRevisionLoader(filing.transaction_id, business_id)
         company_profile_json['business'] = \
             VersionedBusinessDetailsService.get_business_revision(filing, business)
         company_profile_json['parties'] = \
-            VersionedBusinessDetailsService.get_party_role_revision(filing, business_id)
+            VersionedBusinessDetailsService.get_party_role_revision(filing, business_id, loader=loader)
         company_profile_json['offices'] = \
-            VersionedBusinessDetailsService.get_office_revision(filing_id, filing.transaction_id, business_id)
+            VersionedBusinessDetailsService.get_office_revision(filing_id, filing.transaction_id, business_id, loader)
         company_profile_json['shareClasses'] = \
-            VersionedBusinessDetailsService.get_share_class_revision(filing.transaction_id, business_id)
+            VersionedBusinessDetailsService.get_share_class_revision(filing.transaction_id, business_id, loader)
         company_profile_json['nameTranslations'] = \
-            VersionedBusinessDetailsService.get_name_translations_revision(filing.transaction_id, business_id)
+            VersionedBusinessDetailsService.get_name_translations_revision(filing.transaction_id, business_id, loader)
         company_profile_json['resolutions'] = \
-            VersionedBusinessDetailsService.get_resolution_dates_revision(filing.transaction_id, business_id)
+            VersionedBusinessDetailsService.get_resolution_dates_revision(filing.transaction_id, business_id, loader)
         return company_profile_json
 
+    @staticmethod
+    def get_revision_snapshot_key(name, filing, business_id) -> Optional[tuple]:
+        """Return the snapshot cache key of a revision, or None if the filing is not completed.
+
+        The key includes the last completed correction of the business, so a correction invalidates the snapshots.
+        """
+        if not filing.transaction_id or \
+                filing.status not in (Filing.Status.COMPLETED.value, Filing.Status.CORRECTED.value):
+            return None
+
+        # pylint: disable=protected-access; required by SA
+        last_correction_id = db.session.query(func.max(Filing.id)) \
+            .filter(Filing.business_id == business_id) \
+            .filter(Filing._filing_type == 'correction') \
+            .filter(Filing._status == Filing.Status.COMPLETED.value) \
+            .scalar()
+        return name, business_id, filing.transaction_id, last_correction_id or 0
+
+    @staticmethod
+    def get_revision_snapshot(name, filing, business, build) -> dict:
+        """Return the revision built by build(filing, business), cached as a snapshot for completed filings.
+
+        The business section is built from the current business as well as its version, so it is not cached.
+        """
+        if not (key := VersionedBusinessDetailsService.get_revision_snapshot_key(name, filing, business.id)):
+            return build(filing, business)
+
+        business_json = None
+
+        def build_snapshot():
+            nonlocal business_json
+            revision = build(filing, business)
+            business_json = revision.pop('business', None)
+            return revision
+
+        snapshot = revision_snapshot_cache.get_or_build(key, build_snapshot)
+        if business_json is None:
+            business_json = VersionedBusinessDetailsService.get_business_revision(filing, business)
+        return {'business': business_json, **snapshot}
+
     @staticmethod
     def get_business_revision(filing, business) -> dict:
         """Consolidates the business info as of a particular transaction."""
@@ -236,6 +376,35 @@ class VersionedBusinessDetailsService:  # pylint: disable=too-many-public-method
 
         return business_revision
 
+    @staticmethod
+    def get_business_revisions_for_transactions(business_id, transaction_ids) -> dict:
+        """Return the business version object as of each transaction id, keyed by the transaction id.
+
+        All the versions spanning the transactions are fetched in a single range query.
+        """
+        transaction_ids = sorted({tid for tid in transaction_ids if tid})
+        if not transaction_ids:
+            return {}
+
+        business_version = VersioningProxy.version_class(db.session(), Business)
+        business_revisions = db.session.query(business_version) \
+            .filter(business_version.transaction_id <= transaction_ids[-1]) \
+            .filter(business_version.operation_type != 2) \
+            .filter(business_version.id == business_id) \
+            .filter(or_(business_version.end_transaction_id == None,  # pylint: disable=singleton-comparison # noqa: E711,E501;
+                        business_version.end_transaction_id > transaction_ids[0])) \
+            .order_by(business_version.transaction_id).all()
+
+        revisions = {}
+        for transaction_id in transaction_ids:
+            for business_revision in business_revisions:
+                if business_revision.transaction_id > transaction_id:
+                    break
+                if business_revision.end_transaction_id is None or \
+                        business_revision.end_transaction_id > transaction_id:
+                    revisions[transaction_id] = business_revision
+        return revisions
+
     @staticmethod
     def find_last_value_from_business_revision(filing,
                                                is_dissolution_date=False,
@@ -254,100 +423,72 @@ class VersionedBusinessDetailsService:  # pylint: disable=too-many-public-method
         return business_revision
 
     @staticmethod
-    def get_office_revision(filing_id, transaction_id, business_id) -> dict:
+    def get_office_revision(filing_id, transaction_id, business_id, loader: BusinessRevisionLoader = None) -> dict:
         """Consolidates all office changes up to the given transaction id."""
         # TODO: remove all workaround logic to get tombstone specific data displaying after corp migration is complete
         offices_json = {}
-        address_version = VersioningProxy.version_class(db.session(), Address)
-        offices_version = VersioningProxy.version_class(db.session(), Office)
+        loader = loader or BusinessRevisionLoader(transaction_id, business_id)
 
-        # Get versioned office data
-        versioned_offices = db.session.query(offices_version) \
-            .filter(offices_version.transaction_id <= transaction_id) \
-            .filter(offices_version.operation_type != 2) \
-            .filter(offices_version.business_id == business_id) \
-            .filter(or_(offices_version.end_transaction_id == None,  # pylint: disable=singleton-comparison # noqa: E711,E501;
-                        offices_version.end_transaction_id > transaction_id)) \
-            .order_by(offices_version.transaction_id).all()
-
-        # Track office IDs found in versioning to avoid duplicates
-
-        # Process versioned offices
-        for office in versioned_offices:
+        office_addresses = loader.office_addresses()
+        for office in loader.offices():
             offices_json[office.office_type] = {}
-            addresses_list = db.session.query(address_version) \
-                .filter(address_version.transaction_id <= transaction_id) \
-                .filter(address_version.operation_type != 2) \
-                .filter(address_version.office_id == office.id) \
-                .filter(or_(address_version.end_transaction_id == None,  # pylint: disable=singleton-comparison # noqa: E711,E501;
-                            address_version.end_transaction_id > transaction_id)) \
-                .order_by(address_version.transaction_id).all()
-            for address in addresses_list:
+            for address in office_addresses.get(office.id, []):
                 offices_json[office.office_type][f'{address.address_type}Address'] = \
                     VersionedBusinessDetailsService.address_revision_json(address)
 
         return offices_json
 
     @staticmethod
-    def get_party_role_revision(filing, business_id, is_ia_or_after=False, role=None) -> dict:
+    def get_party_role_revision(filing, business_id, is_ia_or_after=False, role=None,
+                                loader: BusinessRevisionLoader = None) -> dict:
         """Consolidates all party changes up to the given transaction id.
 
         Args:
-            transaction_id (int): The transaction ID for versioning queries
+            filing (Filing): The filing whose transaction ID is used for the versioning queries
             business_id (int): The business ID to check
             is_ia_or_after (bool): Flag for incorporation application or after
             role (str): Optional role filter
+            loader (BusinessRevisionLoader): Optional loader shared with the other revisions of the filing
         """
         # TODO: remove all workaround logic to get tombstone specific data displaying after corp migration is complete
-        party_role_version = VersioningProxy.version_class(db.session(), PartyRole)
+        loader = loader or BusinessRevisionLoader(filing.transaction_id, business_id)
         parties = []
+        parties_by_id = {}
 
         # TODO: remove filter that excludes unsupported parties when we have plans to deal with it
-        # Get versioned party roles
-        versioned_party_roles = db.session.query(party_role_version)\
-            .filter(party_role_version.transaction_id <= filing.transaction_id) \
-            .filter(party_role_version.operation_type != 2) \
-            .filter(party_role_version.business_id == business_id) \
-            .filter(or_(role == None,  # pylint: disable=singleton-comparison # noqa: E711,E501;
-                        party_role_version.role == role)) \
-            .filter(or_(party_role_version.end_transaction_id == None,   # pylint: disable=singleton-comparison # noqa: E711,E501;
-                        party_role_version.end_transaction_id > filing.transaction_id)) \
-            .filter(party_role_version.role.notin_([
-                PartyRole.RoleTypes.OFFICER.value,
-                PartyRole.RoleTypes.LIQUIDATOR.value,
-                PartyRole.RoleTypes.RECEIVER.value,
-            ])) \
-            .order_by(party_role_version.transaction_id).all()
-
-        # Process versioned party roles
-        for party_role in versioned_party_roles:
+        unsupported_roles = [
+            PartyRole.RoleTypes.OFFICER.value,
+            PartyRole.RoleTypes.LIQUIDATOR.value,
+            PartyRole.RoleTypes.RECEIVER.value,
+        ]
+        for party_role in loader.party_roles():
+            if party_role.role in unsupported_roles or (role and party_role.role != role):
+                continue
             if party_role.cessation_date is None:
                 party_role_json = VersionedBusinessDetailsService.party_role_revision_json(filing,
-                                                                                           party_role, is_ia_or_after)
-                if 'roles' in party_role_json and (party := next((x for x in parties if x['officer']['id']
-                                                                  == party_role_json['officer']['id']), None)):
+                                                                                           party_role, is_ia_or_after,
+                                                                                           loader)
+                if 'roles' in party_role_json and (party := parties_by_id.get(party_role_json['officer']['id'])):
                     party['roles'].extend(party_role_json['roles'])
                 else:
                     parties.append(party_role_json)
+                    if 'roles' in party_role_json:
+                        parties_by_id.setdefault(party_role_json['officer']['id'], party_role_json)
 
         return parties
 
     @staticmethod
-    def get_share_class_revision(transaction_id, business_id) -> dict:
+    def get_share_class_revision(transaction_id, business_id, loader: BusinessRevisionLoader = None) -> dict:
         """Consolidates all share classes upto the given transaction id."""
-        share_class_version = VersioningProxy.version_class(db.session(), ShareClass)
-        share_classes_list = db.session.query(share_class_version) \
-            .filter(share_class_version.transaction_id <= transaction_id) \
-            .filter(share_class_version.operation_type != 2) \
-            .filter(share_class_version.business_id == business_id) \
-            .filter(or_(share_class_version.end_transaction_id == None,  # pylint: disable=singleton-comparison # noqa: E711,E501;
-                        share_class_version.end_transaction_id > transaction_id)) \
-            .order_by(share_class_version.transaction_id).all()
+        loader = loader or BusinessRevisionLoader(transaction_id, business_id)
+        share_series = loader.share_series()
         share_classes = []
-        for share_class in share_classes_list:
+        for share_class in loader.share_classes():
             share_class_json = VersionedBusinessDetailsService.share_class_revision_json(share_class)
-            share_class_json['series'] = VersionedBusinessDetailsService.get_share_series_revision(transaction_id,
-                                                                                                   share_class.id)
+            share_class_json['series'] = [
+                VersionedBusinessDetailsService.share_series_json(series)
+                for series in share_series.get(share_class.id, [])
+            ]
             share_class_json['type'] = 'Class'
             share_class_json['id'] = str(share_class_json['id'])
             share_classes.append(share_class_json)
@@ -364,31 +505,22 @@ class VersionedBusinessDetailsService:  # pylint: disable=too-many-public-method
             .filter(or_(share_series_version.end_transaction_id == None,  # pylint: disable=singleton-comparison # noqa: E711,E501;
                         share_series_version.end_transaction_id > transaction_id)) \
             .order_by(share_series_version.transaction_id).all()
-        share_series_arr = []
-        for share_series in share_series_list:
-            share_series_json = VersionedBusinessDetailsService.share_series_revision_json(share_series)
-            share_series_json['type'] = 'Series'
-            share_series_json['id'] = str(share_series_json['id'])
-            share_series_arr.append(share_series_json)
-        return share_series_arr
+        return [VersionedBusinessDetailsService.share_series_json(share_series) for share_series in share_series_list]
+
+    @staticmethod
+    def share_series_json(share_series) -> dict:
+        """Return the share series revision as a json object of the share class revision."""
+        share_series_json = VersionedBusinessDetailsService.share_series_revision_json(share_series)
+        share_series_json['type'] = 'Series'
+        share_series_json['id'] = str(share_series_json['id'])
+        return share_series_json
 
     @staticmethod
-    def get_name_translations_revision(transaction_id, business_id) -> dict:
+    def get_name_translations_revision(transaction_id, business_id, loader: BusinessRevisionLoader = None) -> dict:
         """Consolidates all name translations upto the given transaction id."""
-        name_translations_version = VersioningProxy.version_class(db.session(), Alias)
-        name_translations_list = db.session.query(name_translations_version) \
-            .filter(name_translations_version.transaction_id <= transaction_id) \
-            .filter(name_translations_version.operation_type != 2) \
-            .filter(name_translations_version.business_id == business_id) \
-            .filter(name_translations_version.type == 'TRANSLATION') \
-            .filter(or_(name_translations_version.end_transaction_id == None,  # pylint: disable=singleton-comparison # noqa: E711,E501;
-                        name_translations_version.end_transaction_id > transaction_id)) \
-            .order_by(name_translations_version.transaction_id).all()
-        name_translations_arr = []
-        for name_translation in name_translations_list:
-            name_translation_json = VersionedBusinessDetailsService.name_translations_json(name_translation)
-            name_translations_arr.append(name_translation_json)
-        return name_translations_arr
+        loader = loader or BusinessRevisionLoader(transaction_id, business_id)
+        return [VersionedBusinessDetailsService.name_translations_json(name_translation)
+                for name_translation in loader.aliases() if name_translation.type == 'TRANSLATION']
 
     @staticmethod
     def get_name_translations_before_revision(transaction_id, business_id) -> dict:
@@ -407,38 +539,33 @@ class VersionedBusinessDetailsService:  # pylint: disable=too-many-public-method
         return name_translations_arr
 
     @staticmethod
-    def get_resolution_dates_revision(transaction_id, business_id) -> dict:
+    def get_resolution_dates_revision(transaction_id, business_id, loader: BusinessRevisionLoader = None) -> dict:
         """Consolidates all resolutions upto the given transaction id."""
-        resolution_version = VersioningProxy.version_class(db.session(), Resolution)
-        resolution_list = db.session.query(resolution_version) \
-            .filter(resolution_version.transaction_id <= transaction_id) \
-            .filter(resolution_version.operation_type != 2) \
-            .filter(resolution_version.business_id == business_id) \
-            .filter(resolution_version.resolution_type == 'SPECIAL') \
-            .filter(or_(resolution_version.end_transaction_id == None,  # pylint: disable=singleton-comparison # noqa: E711,E501;
-                        resolution_version.end_transaction_id > transaction_id)) \
-            .order_by(resolution_version.transaction_id).all()
-        resolutions_arr = []
-        for resolution in resolution_list:
-            resolution_json = VersionedBusinessDetailsService.resolution_json(resolution)
-            resolutions_arr.append(resolution_json)
-        return resolutions_arr
-
-    @staticmethod
-    def party_role_revision_json(filing, party_role, is_ia_or_after) -> dict:
+        loader = loader or BusinessRevisionLoader(transaction_id, business_id)
+        return [VersionedBusinessDetailsService.resolution_json(resolution)
+                for resolution in loader.resolutions() if resolution.resolution_type == 'SPECIAL']
+
+    @staticmethod
+    def party_role_revision_json(filing, party_role, is_ia_or_after,
+                                 loader: BusinessRevisionLoader = None) -> dict:
         """Return the party member as a json object."""
         cessation_date = datetime.date(party_role.cessation_date).isoformat() if party_role.cessation_date else None
 
         # For both versioned and non-versioned cases, get party data through party_revision_json
-        if isinstance(party_role, VersioningProxy.version_class(db.session(), PartyRole)):
-            # Versioned party role
-            party_revision = VersionedBusinessDetailsService.get_party_revision(filing, party_role.party_id)
-        else:
+        addresses = None
+        if not isinstance(party_role, VersioningProxy.version_class(db.session(), PartyRole)):
             # Non-versioned party role - use current party
             party_revision = party_role.party
+        elif loader:
+            # Versioned party role, with the parties and their addresses already loaded
+            party_revision = loader.parties().get(party_role.party_id)
+            addresses = loader.party_addresses()
+        else:
+            # Versioned party role
+            party_revision = VersionedBusinessDetailsService.get_party_revision(filing, party_role.party_id)
 
         party = VersionedBusinessDetailsService.party_revision_json(filing.transaction_id,
-                                                                    party_revision, is_ia_or_after)
+                                                                    party_revision, is_ia_or_after, addresses)
 
         if is_ia_or_after:
             party['roles'] = [{
@@ -499,16 +626,24 @@ class VersionedBusinessDetailsService:  # pylint: disable=too-many-public-method
         return member
 
     @staticmethod
-    def party_revision_json(transaction_id, party, is_ia_or_after) -> dict:  # pylint: disable=too-many-branches
-        """Return the party member as a json object."""
+    def party_revision_json(transaction_id, party, is_ia_or_after,  # pylint: disable=too-many-branches
+                            addresses: dict = None) -> dict:
+        """Return the party member as a json object.
+
+        addresses can hold the address versions keyed by id, already loaded as of the transaction.
+        """
         member = VersionedBusinessDetailsService.party_revision_type_json(party, is_ia_or_after)
 
+        def get_address_revision(address_id):
+            if addresses is not None:
+                return addresses.get(address_id)
+            return VersionedBusinessDetailsService.get_address_revision(transaction_id, address_id)
+
         # Handle delivery address
         if isinstance(party, VersioningProxy.version_class(db.session(), Party)):
             # Versioned party
             if party.delivery_address_id:
-                address_revision = VersionedBusinessDetailsService.get_address_revision(
-                    transaction_id, party.delivery_address_id)
+                address_revision = get_address_revision(party.delivery_address_id)
                 if address_revision and address_revision.postal_code:
                     member_address = VersionedBusinessDetailsService.address_revision_json(address_revision)
                     if 'addressType' in member_address:
@@ -527,8 +662,7 @@ class VersionedBusinessDetailsService:  # pylint: disable=too-many-public-method
             if party.mailing_address_id:
                 member_mailing_address = \
                     VersionedBusinessDetailsService.address_revision_json(
-                        VersionedBusinessDetailsService.get_address_revision
-                        (transaction_id, party.mailing_address_id))
+                        get_address_revision(party.mailing_address_id))
                 if 'addressType' in member_mailing_address:
                     del member_mailing_address['addressType']
                 member['mailingAddress'] = member_mailing_address
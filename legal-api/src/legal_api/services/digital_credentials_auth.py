@@ -21,13 +21,14 @@ from flask_jwt_oidc import JwtManager
 
 from legal_api.models.business import Business
 from legal_api.models.user import User
-from legal_api.services.digital_credentials_rules import DigitalCredentialsRulesService
+from legal_api.services.digital_credentials_rules import DigitalCredentialsRulesService, RulesEvaluationContext
 
 
 STAFF_ROLE = 'staff'
 
 
-def are_digital_credentials_allowed(business: Business, jwt: JwtManager) -> bool:
+def are_digital_credentials_allowed(business: Business, jwt: JwtManager,
+                                    context: RulesEvaluationContext = None) -> bool:
     """Return True if the business is allowed to have/view digital credentials."""
     is_staff = jwt.contains_role([STAFF_ROLE])
     if is_staff:
@@ -38,10 +39,11 @@ def are_digital_credentials_allowed(business: Business, jwt: JwtManager) -> bool
         return False
 
     rules = DigitalCredentialsRulesService()
-    return rules.are_digital_credentials_allowed(user, business)
+    return rules.are_digital_credentials_allowed(user, business, context=context)
 
 
-def get_digital_credentials_preconditions(business: Business) -> Dict[str, List[str]]:
+def get_digital_credentials_preconditions(business: Business,
+                                          context: RulesEvaluationContext = None) -> Dict[str, List[str]]:
     """Return the preconditions for digital credentials."""
     if not (user := User.find_by_jwt_token(g.jwt_oidc_token_info)):
         return {}
@@ -50,5 +52,5 @@ def get_digital_credentials_preconditions(business: Business) -> Dict[str, List[
     return {
         "attestBusiness": business.legal_name if business else None,
         "attestName": user.display_name if user else None,
-        "attestRoles": rules.get_preconditions(user, business) if user and business else [],
+        "attestRoles": rules.get_preconditions(user, business, context=context) if user and business else [],
     }
@@ -16,14 +16,41 @@
 
 from datetime import datetime, timezone
 from enum import Enum
-from typing import List
+from typing import Callable, List, Optional, Tuple, Union
 
 from flask import current_app
+from sqlalchemy.orm import joinedload
 
 from legal_api.models import Business, Filing, Party, PartyRole, User
 from legal_api.services.digital_credentials_utils import FormattedUser, determine_allowed_business_types
 
 
+class RulesEvaluationContext:
+    """The records an evaluation of the rules for a user and business depends on, each loaded once.
+
+    The rules service is shared, so the context only lives for the evaluation it is created for.
+    """
+
+    def __init__(self):
+        """Create an empty context."""
+        self._values = {}
+        self._name_keys = {}
+
+    def get_or_load(self, key: str, load: Callable):
+        """Return the value loaded for the key, loading it the first time."""
+        if key not in self._values:
+            self._values[key] = load()
+        return self._values[key]
+
+    def name_key(self, user: Optional[Union[User, Party]]) -> Tuple[str, str]:
+        """Return the normalized (first name, last name) of the user or party, formatted once per record."""
+        if id(user) not in self._name_keys:
+            formatted = FormattedUser(user)
+            # the record is kept alongside its key, so its id is not reused during the evaluation
+            self._name_keys[id(user)] = (user, (formatted.first_name, formatted.last_name))
+        return self._name_keys[id(user)][1]
+
+
 class DigitalCredentialsRulesService:
     """Digital Credentials Rules service."""
 
@@ -48,22 +75,25 @@ class DigitalCredentialsRulesService:
         Business.LegalTypes.BCOMP_CONTINUE_IN.value
     ]
 
-    def are_digital_credentials_allowed(self, user: User, business: Business) -> bool:
+    def are_digital_credentials_allowed(self, user: User, business: Business,
+                                        context: RulesEvaluationContext = None) -> bool:
         """Return True if the user is allowed to access digital credentials."""
-        return self._has_general_access(user) and self._has_specific_access(user, business)
+        context = context or RulesEvaluationContext()
+        return self._has_general_access(user) and self._has_specific_access(user, business, context=context)
 
-    def get_preconditions(self, user: User, business: Business) -> List[str]:
+    def get_preconditions(self, user: User, business: Business, context: RulesEvaluationContext = None) -> List[str]:
         """
         Return the preconditions for digital credentials.
 
         These are simply just a list of roles a user must attest to.
         """
+        context = context or RulesEvaluationContext()
         preconditions = []
-        if not self.user_is_completing_party(user, business):
-            if self.user_has_business_party_role(user, business):
-                preconditions += self.user_business_party_roles(user, business)
-            if self.user_has_filing_party_role(user, business):
-                preconditions += self.user_filing_party_roles(user, business)
+        if not self.user_is_completing_party(user, business, context=context):
+            if self.user_has_business_party_role(user, business, context=context):
+                preconditions += self.user_business_party_roles(user, business, context=context)
+            if self.user_has_filing_party_role(user, business, context=context):
+                preconditions += self.user_filing_party_roles(user, business, context=context)
         return list(map(lambda party_role: party_role.role, preconditions))
 
     def _has_general_access(self, user: User) -> bool:
@@ -79,7 +109,7 @@ class DigitalCredentialsRulesService:
 
         return True
 
-    def _has_specific_access(self, user: User, business: Business) -> bool:
+    def _has_specific_access(self, user: User, business: Business, context: RulesEvaluationContext = None) -> bool:
         """Return True if business rules are met."""
         if not business:
             current_app.logger.debug('No business is provided.')
@@ -90,41 +120,45 @@ class DigitalCredentialsRulesService:
         current_app.logger.debug('Allowed business types: %s', allowed_business_types)
 
         if business.legal_type in allowed_business_types:
-            return (self.user_has_filing_party_role(user, business)
-                    or self.user_has_business_party_role(user, business))
+            return (self.user_has_filing_party_role(user, business, context=context)
+                    or self.user_has_business_party_role(user, business, context=context))
 
         current_app.logger.debug('No specific access rules are met.')
         return False
 
-    def user_is_completing_party(self, user: User, business: Business) -> bool:
+    def user_is_completing_party(self, user: User, business: Business, context: RulesEvaluationContext = None) -> bool:
         """Return True if the user is the completing party."""
-        if len(filings := self.valid_filings(business)) <= 0:
+        if len(filings := self.valid_filings(business, context=context)) <= 0:
             current_app.logger.debug(
                 'No registration or incorporation filing found for the business.')
             return False
 
         filing = filings.pop(0)
-        return self.user_submitted_filing(user, filing) and self.user_matches_completing_party(user, filing)
+        return self.user_submitted_filing(user, filing) and \
+            self.user_matches_completing_party(user, filing, context=context)
 
-    def user_has_filing_party_role(self, user: User, business: Business) -> bool:
+    def user_has_filing_party_role(self, user: User, business: Business,
+                                   context: RulesEvaluationContext = None) -> bool:
         """
         Return True if the user has a filing party role in the business. Excludes the completing party role.
 
         For example: if a user is an incorporator.
         """
-        return len(self.user_filing_party_roles(user, business)) > 0
+        return len(self.user_filing_party_roles(user, business, context=context)) > 0
 
-    def user_has_business_party_role(self, user: User, business: Business) -> bool:
+    def user_has_business_party_role(self, user: User, business: Business,
+                                     context: RulesEvaluationContext = None) -> bool:
         """
         Return True if the user has a business party role in the business.
 
         For example: if a user is a director.
         """
-        return len(self.user_business_party_roles(user, business)) > 0
+        return len(self.user_business_party_roles(user, business, context=context)) > 0
 
-    def user_filing_party_roles(self, user: User, business: Business) -> List[PartyRole]:
+    def user_filing_party_roles(self, user: User, business: Business,
+                                context: RulesEvaluationContext = None) -> List[PartyRole]:
         """Return the filing roles of the user for the business, if any."""
-        if len(filings := self.valid_filings(business)) <= 0:
+        if len(filings := self.valid_filings(business, context=context)) <= 0:
             current_app.logger.debug(
                 'No registration or incorporation filing found for the business.')
             return []
@@ -133,14 +167,16 @@ class DigitalCredentialsRulesService:
             return []
 
         filing = filings.pop(0)
-        roles = filing.filing_party_roles.filter(
-            PartyRole.role != PartyRole.RoleTypes.COMPLETING_PARTY.value).all()
-        return list(filter(lambda role: self.user_matches_party(user, role.party), roles))
+        roles = self._get_or_load(context, 'filing_party_roles', lambda: filing.filing_party_roles.filter(
+            PartyRole.role != PartyRole.RoleTypes.COMPLETING_PARTY.value).options(joinedload(PartyRole.party)).all())
+        return list(filter(lambda role: self.user_matches_party(user, role.party, context=context), roles))
 
-    def user_business_party_roles(self, user: User, business: Business) -> List[PartyRole]:
+    def user_business_party_roles(self, user: User, business: Business,
+                                  context: RulesEvaluationContext = None) -> List[PartyRole]:
         """Return the party roles of the user for the business, if any."""
-        roles = business.party_roles.all()
-        return list(filter(lambda role: self.user_matches_party(user, role.party), roles))
+        roles = self._get_or_load(context, 'business_party_roles',
+                                  lambda: business.party_roles.options(joinedload(PartyRole.party)).all())
+        return list(filter(lambda role: self.user_matches_party(user, role.party, context=context), roles))
 
     def user_submitted_filing(self, user: User, filing: Filing) -> bool:
         """Return True if the user submitted the filing."""
@@ -149,28 +185,38 @@ class DigitalCredentialsRulesService:
             current_app.logger.debug('User is not the filing submitter.')
         return did_user_submit_filing
 
-    def user_matches_completing_party(self, user: User, filing: Filing) -> bool:
+    def user_matches_completing_party(self, user: User, filing: Filing,
+                                      context: RulesEvaluationContext = None) -> bool:
         """Return the True if the user matches a completing party."""
-        if len(roles := self.completing_party_roles(filing)) <= 0:
+        if len(roles := self._get_or_load(context, 'completing_party_roles',
+                                          lambda: self.completing_party_roles(filing))) <= 0:
             current_app.logger.debug(
                 'No completing parties found for the registration or incorporation filing.')
             return False
 
         is_user_completing_party = len(
-            list(filter(lambda role: self.user_matches_party(user, role.party), roles))) > 0
+            list(filter(lambda role: self.user_matches_party(user, role.party, context=context), roles))) > 0
         if not is_user_completing_party:
             current_app.logger.debug('User is not the completing party.')
         return is_user_completing_party
 
-    def user_matches_party(self, user: User, party: Party) -> bool:
+    def user_matches_party(self, user: User, party: Party, context: RulesEvaluationContext = None) -> bool:
         """Return True if the user matches the party."""
+        if context:
+            return context.name_key(user) == context.name_key(party)
         u = FormattedUser(user)
         p = FormattedUser(party)
         return u.first_name == p.first_name and u.last_name == p.last_name
 
-    def valid_filings(self, business: Business) -> List[Filing]:
+    def valid_filings(self, business: Business, context: RulesEvaluationContext = None) -> List[Filing]:
         """Return the registration or incorporation filings for the business."""
-        return Filing.get_filings_by_types(business.id, self.valid_filing_types)
+        # a copy of the memoized list, as the callers pop from it
+        return list(self._get_or_load(context, 'valid_filings',
+                                      lambda: Filing.get_filings_by_types(business.id, self.valid_filing_types)))
+
+    @staticmethod
+    def _get_or_load(context: Optional[RulesEvaluationContext], key: str, load: Callable):
+        return context.get_or_load(key, load) if context else load()
 
     def completing_party_roles(self, filing: Filing) -> List[PartyRole]:
         """Return the completing parties of a filing."""
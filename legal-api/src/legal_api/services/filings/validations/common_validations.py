@@ -12,8 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Common validations share through the different filings."""
-import io
 import re
+import tempfile
 from datetime import datetime, timedelta
 from typing import Dict, Optional
 
@@ -25,6 +25,7 @@ from flask_babel import _
 from legal_api.errors import Error
 from legal_api.models import Address, Business, Party, PartyRole
 from legal_api.services import MinioService, flags, namex
+from legal_api.services.cache import cache
 from legal_api.services.utils import get_str
 from legal_api.utils.datetime import datetime as dt
 
@@ -229,34 +230,68 @@ def validate_court_order(court_order_path, court_order):
     return None
 
 
+PDF_MAX_FILE_SIZE = 30000000
+PDF_LETTER_WIDTH = 612
+PDF_LETTER_HEIGHT = 792
+
+
 def validate_pdf(file_key: str, file_key_path: str, verify_paper_size: bool = True) -> Optional[list]:
-    """Validate the PDF file."""
-    msg = []
+    """Validate the PDF file.
+
+    The file is stat'ed first and an oversize file is rejected without downloading it. Otherwise it is streamed into a
+    spooled temporary file and its pages are checked one at a time, stopping at the first one not letter size.
+    The result is cached per (file key, etag), so a file submitted again is not downloaded again.
+    """
     try:
-        file = MinioService.get_file(file_key)
-        open_pdf_file = io.BytesIO(file.data)
-        pdf_reader = PyPDF2.PdfFileReader(open_pdf_file)
+        file_info = MinioService.get_file_info(file_key)
+        cache_key = f'pdf_validation_{file_key}_{file_info.etag}_{verify_paper_size}'
+        timeout = current_app.config.get('PDF_VALIDATION_CACHE_TIMEOUT', 0)
+        if not timeout or (errors := cache.get(cache_key)) is None:
+            errors = _validate_pdf_file(file_key, file_info.size, verify_paper_size)
+            if timeout:
+                cache.set(cache_key, errors, timeout=timeout)
+    except Exception:
+        errors = ['invalid']
+
+    if errors:
+        return [{'error': _pdf_error_message(error), 'path': file_key_path} for error in errors]
+
+    return None
+
+
+def _validate_pdf_file(file_key: str, file_size: int, verify_paper_size: bool) -> list:
+    """Return the errors of the PDF file."""
+    if file_size > PDF_MAX_FILE_SIZE:
+        return ['size']
+
+    errors = []
+    with tempfile.SpooledTemporaryFile(max_size=current_app.config.get('PDF_VALIDATION_SPOOL_MAX_SIZE',
+                                                                       1024 * 1024)) as pdf_file:
+        MinioService.download_file(file_key, pdf_file)
+        pdf_file.seek(0)
+        pdf_reader = PyPDF2.PdfFileReader(pdf_file)
 
         if verify_paper_size:
             # Check that all pages in the pdf are letter size and able to be processed.
-            if any(x.mediaBox.getWidth() != 612 or x.mediaBox.getHeight() != 792 for x in pdf_reader.pages):
-                msg.append({'error': _('Document must be set to fit onto 8.5” x 11” letter-size paper.'),
-                            'path': file_key_path})
-
-        file_info = MinioService.get_file_info(file_key)
-        if file_info.size > 30000000:
-            msg.append({'error': _('File exceeds maximum size.'), 'path': file_key_path})
+            for page_number in range(pdf_reader.getNumPages()):
+                media_box = pdf_reader.getPage(page_number).mediaBox
+                if media_box.getWidth() != PDF_LETTER_WIDTH or media_box.getHeight() != PDF_LETTER_HEIGHT:
+                    errors.append('paperSize')
+                    break
 
         if pdf_reader.isEncrypted:
-            msg.append({'error': _('File must be unencrypted.'), 'path': file_key_path})
+            errors.append('encrypted')
 
-    except Exception:
-        msg.append({'error': _('Invalid file.'), 'path': file_key_path})
+    return errors
 
-    if msg:
-        return msg
 
-    return None
+def _pdf_error_message(error: str) -> str:
+    """Return the message of the PDF error."""
+    return {
+        'paperSize': _('Document must be set to fit onto 8.5” x 11” letter-size paper.'),
+        'size': _('File exceeds maximum size.'),
+        'encrypted': _('File must be unencrypted.'),
+    }.get(error, _('Invalid file.'))
 
 
 def validate_parties_names(filing_json: dict, filing_type: str, legal_type: str) -> list:
@@ -0,0 +1,73 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Thread safe, bounded in-process LRU used by the service caches."""
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional
+
+
+class LRUCache:
+    """Bounded LRU of the values per key.
+
+    The size limit is passed on each set, so the callers can read it from their app config. The least recently used
+    entries are removed once the cache holds more than the limit, and nothing is cached when it is 0.
+    """
+
+    def __init__(self):
+        """Create an empty cache."""
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the value of the key and mark it as recently used, or the default if not cached."""
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, key: Hashable, value: Any, max_size: int):
+        """Cache the value, removing the least recently used entries over the max size."""
+        if max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Remove the key, returning its value or the default if not cached."""
+        with self._lock:
+            return self._entries.pop(key, default)
+
+    def keys(self) -> List[Hashable]:
+        """Return a copy of the keys, from the least to the most recently used."""
+        with self._lock:
+            return list(self._entries.keys())
+
+    def values(self) -> List[Any]:
+        """Return a copy of the values, from the least to the most recently used."""
+        with self._lock:
+            return list(self._entries.values())
+
+    def clear(self):
+        """Remove all the entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        with self._lock:
+            return len(self._entries)
@@ -70,6 +70,20 @@ class MinioService:
         bucket = current_app.config['MINIO_BUCKET_BUSINESSES']
         return minio_client.get_object(bucket, key)
 
+    @staticmethod
+    def download_file(key: str, file, chunk_size: int = 1024 * 1024) -> int:
+        """Stream the file from Minio into the (writable, binary) file object, returning the number of bytes."""
+        response = MinioService.get_file(key)
+        size = 0
+        try:
+            for chunk in response.stream(chunk_size):
+                file.write(chunk)
+                size += len(chunk)
+        finally:
+            response.close()
+            response.release_conn()
+        return size
+
     @staticmethod
     def delete_file(key: str):
         """Delete file from Minio."""
@@ -0,0 +1,118 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Cache of the business revisions as of a completed filing.
+
+The versioned rows current at a transaction never change, so the json consolidated from them is cached per
+(name, business id, transaction id, last correction id). A completed correction of the business changes the key,
+so the snapshots taken before it are no longer used.
+
+The snapshots are held as compressed json in a bounded in-process LRU (REVISION_SNAPSHOT_CACHE_MAX_SIZE, 0 disables
+the cache) and optionally in the shared flask_caching cache (REVISION_SNAPSHOT_CACHE_USE_SHARED_CACHE).
+"""
+import json
+import threading
+import zlib
+from typing import Callable, Optional, Tuple
+
+from flask import current_app
+
+from legal_api.services.cache import cache
+from legal_api.services.lru_cache import LRUCache
+
+
+class RevisionSnapshotCache:
+    """Bounded LRU of the compressed revision json per (name, business id, transaction id, last correction id)."""
+
+    def __init__(self):
+        """Create an empty cache."""
+        self._entries = LRUCache()
+        self._lock = threading.Lock()  # guards the metrics
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _max_size() -> int:
+        return current_app.config.get('REVISION_SNAPSHOT_CACHE_MAX_SIZE', 0)
+
+    @staticmethod
+    def _use_shared_cache() -> bool:
+        return current_app.config.get('REVISION_SNAPSHOT_CACHE_USE_SHARED_CACHE', False)
+
+    @staticmethod
+    def _shared_key(key: Tuple) -> str:
+        return 'revision_snapshot_' + '_'.join(str(part) for part in key)
+
+    def get(self, key: Tuple) -> Optional[dict]:
+        """Return a copy of the cached revision, or None if not cached."""
+        if self._max_size() <= 0:
+            return None
+
+        snapshot = self._entries.get(key)
+        if snapshot is None and self._use_shared_cache():
+            if (snapshot := cache.get(self._shared_key(key))) is not None:
+                self._entries.set(key, snapshot, self._max_size())
+
+        with self._lock:
+            if snapshot is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(zlib.decompress(snapshot))
+
+    def set(self, key: Tuple, revision: dict):
+        """Cache the revision, it is not cached if it is not json serializable."""
+        if self._max_size() <= 0:
+            return
+
+        try:
+            snapshot = zlib.compress(json.dumps(revision).encode('utf-8'))
+        except (TypeError, ValueError) as err:
+            current_app.logger.warning('Revision %s is not cached: %s', key, err)
+            return
+
+        self._entries.set(key, snapshot, self._max_size())
+        if self._use_shared_cache():
+            cache.set(self._shared_key(key), snapshot)
+
+    def get_or_build(self, key: Tuple, build: Callable[[], dict]) -> dict:
+        """Return the cached revision, building and caching it when it is not cached."""
+        if (revision := self.get(key)) is not None:
+            return revision
+        revision = build()
+        self.set(key, revision)
+        return revision
+
+    def clear(self):
+        """Remove all the locally cached revisions and reset the metrics."""
+        self._entries.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def get_metrics(self) -> dict:
+        """Return the size and hit rate of the cache."""
+        snapshots = self._entries.values()
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(snapshots),
+                'bytes': sum(len(snapshot) for snapshot in snapshots),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hitRate': round(self.hits / lookups, 4) if lookups else 0
+            }
+
+
+# pylint: disable=invalid-name; shared variables are lower case by Flask convention.
+revision_snapshot_cache = RevisionSnapshotCache()
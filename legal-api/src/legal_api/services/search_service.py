@@ -14,6 +14,9 @@
 
 """This provides the service for getting business details as of a filing."""
 # pylint: disable=singleton-comparison ; pylint does not recognize sqlalchemy ==
+import base64
+import binascii
+import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from operator import and_
@@ -35,6 +38,30 @@ class AffiliationSearchDetails:  # pylint: disable=too-many-instance-attributes
     type: Optional[List[str]]
     page: int
     limit: int
+    # keyset pagination position, only set when the request uses a cursor instead of a page.
+    # The searches advance it to the last business and draft filing ids they return.
+    cursor: Optional[dict] = None
+
+    @property
+    def is_keyset(self) -> bool:
+        """Return True if the search uses keyset pagination."""
+        return self.cursor is not None
+
+    @staticmethod
+    def encode_cursor(cursor: dict) -> str:
+        """Return an opaque cursor for the last business and draft filing ids returned."""
+        return base64.urlsafe_b64encode(json.dumps(cursor).encode('utf-8')).decode('utf-8')
+
+    @staticmethod
+    def decode_cursor(cursor: Optional[str]) -> dict:
+        """Return the last business and draft filing ids from the opaque cursor, or the first page if empty."""
+        if not cursor:
+            return {'businessId': 0, 'filingId': 0}
+        try:
+            decoded = json.loads(base64.urlsafe_b64decode(cursor.encode('utf-8')))
+            return {'businessId': int(decoded.get('businessId', 0)), 'filingId': int(decoded.get('filingId', 0))}
+        except (binascii.Error, ValueError, TypeError, AttributeError) as err:
+            raise ValueError('Invalid search cursor.') from err
 
     @classmethod
     def from_request_args(cls, req: Request):
@@ -51,7 +78,8 @@ class AffiliationSearchDetails:  # pylint: disable=too-many-instance-attributes
             type=clean_list(req.get('type', [])),
             status=clean_list(req.get('status', [])),
             page=int(req.get('page', 1)),
-            limit=int(req.get('limit', 100000))
+            limit=int(req.get('limit', 100000)),
+            cursor=cls.decode_cursor(req.get('cursor')) if 'cursor' in req else None
         )
 
 
@@ -178,19 +206,24 @@ class BusinessSearchService:  # pylint: disable=too-many-public-methods
             return []
 
         limit = search_filters.limit
-        offset = (search_filters.page - 1) * limit
-        bus_query = db.session.query(Business).filter(*filters).limit(limit+1).offset(offset).all()
-        bus_results = []
-        for business in bus_query[:limit]:
-            business_json = business.json(slim=True)
-
-            if business.legal_type in (
-                Business.LegalTypes.SOLE_PROP,
-                Business.LegalTypes.PARTNERSHIP
-            ):
-                business_json['alternateNames'] = business.get_alternate_names()
-
-            bus_results.append(business_json)
+        query = db.session.query(Business).filter(*filters)
+        if search_filters.is_keyset:
+            query = query.filter(Business.id > search_filters.cursor['businessId']).order_by(Business.id)
+        else:
+            query = query.offset((search_filters.page - 1) * limit)
+        bus_query = query.limit(limit+1).all()
+        businesses = bus_query[:limit]
+        if search_filters.is_keyset and businesses:
+            search_filters.cursor['businessId'] = businesses[-1].id
+        bus_results = Business.slim_json_list(businesses)
+        firms = [business for business in businesses if business.legal_type in (
+            Business.LegalTypes.SOLE_PROP,
+            Business.LegalTypes.PARTNERSHIP
+        )]
+        alternate_names = Business.get_alternate_names_list(firms)
+        for business, business_json in zip(businesses, bus_results):
+            if business.id in alternate_names:
+                business_json['alternateNames'] = alternate_names[business.id]
         has_more = len(bus_query) > limit
         return bus_results, has_more
 
@@ -234,6 +267,7 @@ class BusinessSearchService:  # pylint: disable=too-many-public-methods
                 Filing.temp_reg.ilike(f'%{identifier}%') if identifier else None,
                 Filing._status.in_(filing_states) if filing_states else None,  # pylint: disable=protected-access
                 Filing._filing_type.in_(filing_name) if filing_name else None,  # pylint: disable=protected-access
+                # same expression as the ix_filings_draft_legal_name_trgm index
                 func.jsonb_extract_path_text(
                     Filing._filing_json,  # pylint: disable=protected-access
                     'filing',
@@ -249,8 +283,14 @@ class BusinessSearchService:  # pylint: disable=too-many-public-methods
                            .notin_(BusinessSearchService.EXCLUDED_FILINGS_STATUS))
 
         limit = search_filters.limit
-        offset = (search_filters.page - 1) * limit
-        draft_query = db.session.query(Filing).filter(*filters).limit(limit+1).offset(offset).all()
+        query = db.session.query(Filing).filter(*filters)
+        if search_filters.is_keyset:
+            query = query.filter(Filing.id > search_filters.cursor['filingId']).order_by(Filing.id)
+        else:
+            query = query.offset((search_filters.page - 1) * limit)
+        draft_query = query.limit(limit+1).all()
+        if search_filters.is_keyset and draft_query[:limit]:
+            search_filters.cursor['filingId'] = draft_query[:limit][-1].id
         draft_results = []
         # base filings query (for draft incorporation/registration filings -- treated as 'draft' business in auth-web)
         if identifiers:
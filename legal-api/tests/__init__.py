@@ -20,6 +20,7 @@ from typing import Dict, List
 from .pytest_marks import (
     api_v1,
     api_v2,
+    benchmark,
     integration_affiliation,
     integration_authorization,
     integration_colin,
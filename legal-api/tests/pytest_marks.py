@@ -55,6 +55,9 @@ not_github_ci = pytest.mark.skipif((os.getenv('NOT_GITHUB_CI', False) is False),
 todo_tech_debt = pytest.mark.skipif((os.getenv('TECH_DEBT', False) is False),
                                    reason='Does not run tech debt tests.')
 
+benchmark = pytest.mark.skipif((os.getenv('RUN_BENCHMARKS', False) is False),
+                               reason='Benchmarks are only run when requested.')
+
 api_v1 = pytest.mark.skipif((os.getenv('API_V1', False) is False),
                                    reason='Version 1 of API.')
 
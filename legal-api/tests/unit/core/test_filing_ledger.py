@@ -24,7 +24,7 @@ from legal_api.models import Business, Comment, Filing, UserRoles
 from legal_api.models.user import UserRoles
 from legal_api.utils.datetime import datetime
 from tests.unit.models import factory_business, factory_completed_filing, factory_user
-from tests.unit.services.utils import helper_create_jwt
+from tests.unit.services.utils import count_queries, helper_create_jwt
 
 
 def load_ledger(business, founding_date):
@@ -92,6 +92,24 @@ def test_simple_ledger_search(session):
     # assert alteration['filingLink']
 
 
+def test_ledger_query_count(session):
+    """Assert that the ledger query count does not grow with the number of filings."""
+    identifier = 'BC1234567'
+    founding_date = datetime.utcnow() - datedelta.datedelta(months=len(Filing.FILINGS.keys()))
+    business = factory_business(identifier=identifier, founding_date=founding_date, last_ar_date=None,
+                                entity_type=Business.LegalTypes.BCOMP.value)
+    num_of_files = load_ledger(business, founding_date)
+
+    with count_queries() as statements:
+        ledger = CoreFiling.ledger(business.id)
+
+    assert len(ledger) == num_of_files
+    assert len(statements) < 10
+    comments_counts = {f['filingId']: f['commentsCount'] for f in ledger}
+    for filing in Filing.get_filings_by_status(business.id, [Filing.Status.COMPLETED.value]):
+        assert comments_counts[filing.id] == filing.comments.count()
+
+
 def test_common_ledger_items(session):
     """Assert that common ledger items works as expected."""
     identifier = 'BC1234567'
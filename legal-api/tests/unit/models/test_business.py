@@ -45,6 +45,7 @@ from tests.unit import has_expected_date_str_format
 from tests.unit.models import factory_batch
 from tests.unit.models import factory_business as factory_business_from_tests
 from tests.unit.models import factory_completed_filing, factory_party_role
+from tests.unit.services.utils import count_queries
 
 
 def factory_business(designation: str = '001'):
@@ -900,3 +901,51 @@ def test_in_dissolution(session, test_name, is_testing_business_id, batch_status
         )
         batch_processing.save()
         assert business.in_dissolution is expected
+
+
+def test_slim_json_list(session):
+    """Assert that the bulk slim json matches the per business slim json with a fixed number of queries."""
+    officer = {
+        'firstName': 'Jane',
+        'lastName': 'Doe',
+        'middleInitial': 'A',
+        'partyType': 'person',
+        'organizationName': ''
+    }
+    businesses = []
+    for index, legal_type in enumerate(['BC', 'BEN', 'CP', 'GP', 'SP', 'BC']):
+        business = Business(
+            legal_name=f'TEST {index}',
+            legal_type=legal_type,
+            founding_date=datetime.utcfromtimestamp(0),
+            last_ledger_timestamp=datetime.utcfromtimestamp(0),
+            identifier=f'BC123456{index}',
+            state=Business.State.ACTIVE,
+        )
+        if legal_type == Business.LegalTypes.SOLE_PROP:
+            business.party_roles.append(
+                factory_party_role(None, None, officer, None, None, PartyRole.RoleTypes.PROPRIETOR))
+        elif legal_type == Business.LegalTypes.PARTNERSHIP:
+            for _ in range(3):
+                business.party_roles.append(
+                    factory_party_role(None, None, officer, None, None, PartyRole.RoleTypes.PARTNER))
+        business.save()
+        businesses.append(business)
+
+    factory_completed_filing(businesses[0], RESTORATION_FILING, filing_type='restoration',
+                             filing_sub_type='fullRestoration')
+    batch = factory_batch()
+    BatchProcessing(batch_id=batch.id,
+                    business_id=businesses[1].id,
+                    business_identifier=businesses[1].identifier,
+                    step=BatchProcessing.BatchProcessingStep.WARNING_LEVEL_2,
+                    status=BatchProcessing.BatchProcessingStatus.PROCESSING,
+                    notes='').save()
+
+    expected = [business.json(slim=True) for business in businesses]
+    assert not expected[0]['goodStanding']
+    assert expected[1]['inDissolution']
+
+    with count_queries() as queries:
+        assert Business.slim_json_list(businesses) == expected
+    assert len(queries) <= 3
@@ -0,0 +1,65 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the report template cache."""
+import os
+from pathlib import Path
+
+from flask import current_app
+
+from legal_api.reports.report import Report
+from legal_api.reports.template_cache import TemplateCache, substitute_template_parts
+
+
+def test_cached_template_matches_substitution(app):
+    """Assert that the cached template is the same as substituting the template parts directly."""
+    with app.app_context():
+        template_path = current_app.config.get('REPORT_TEMPLATE_PATH')
+        template_code = Path(f'{template_path}/incorporationApplication.html').read_text(encoding='UTF-8')
+        expected = substitute_template_parts(template_code, template_path, Report.TEMPLATE_PARTS)
+
+        cache = TemplateCache()
+        assert cache.get_template('incorporationApplication.html', Report.TEMPLATE_PARTS) == expected
+        assert cache.get_template('incorporationApplication.html', Report.TEMPLATE_PARTS) == expected
+        encoded = cache.get_encoded_template('incorporationApplication.html', Report.TEMPLATE_PARTS)
+        assert encoded.startswith("'") and encoded.endswith("'")
+
+
+def test_cached_template_rebuilt_when_changed(app, tmp_path):
+    """Assert that a cached template is rebuilt when a template part changes on disk."""
+    (tmp_path / 'template-parts').mkdir()
+    part_file = tmp_path / 'template-parts' / 'part.html'
+    part_file.write_text('first', encoding='UTF-8')
+    (tmp_path / 'test.html').write_text('<p>[[part.html]]</p>', encoding='UTF-8')
+
+    with app.app_context():
+        template_path = current_app.config.get('REPORT_TEMPLATE_PATH')
+        check_mtime = current_app.config.get('REPORT_TEMPLATE_CACHE_CHECK_MTIME')
+        try:
+            current_app.config['REPORT_TEMPLATE_PATH'] = str(tmp_path)
+            current_app.config['REPORT_TEMPLATE_CACHE_CHECK_MTIME'] = True
+            cache = TemplateCache()
+            assert cache.get_template('test.html', ['part']) == '<p>first</p>'
+
+            part_file.write_text('second', encoding='UTF-8')
+            mtime = os.stat(part_file).st_mtime + 10
+            os.utime(part_file, (mtime, mtime))
+            assert cache.get_template('test.html', ['part']) == '<p>second</p>'
+
+            current_app.config['REPORT_TEMPLATE_CACHE_CHECK_MTIME'] = False
+            part_file.write_text('third', encoding='UTF-8')
+            os.utime(part_file, (mtime + 10, mtime + 10))
+            assert cache.get_template('test.html', ['part']) == '<p>second</p>'
+        finally:
+            current_app.config['REPORT_TEMPLATE_PATH'] = template_path
+            current_app.config['REPORT_TEMPLATE_CACHE_CHECK_MTIME'] = check_mtime
@@ -16,6 +16,8 @@
 
 Test-Suite to ensure that the /ops endpoint is working as expected.
 """
+from legal_api.services.authz import STAFF_ROLE, SYSTEM_ROLE
+from tests.unit.services.utils import create_header
 
 
 def test_ops_healthz_success(client):
@@ -42,3 +44,18 @@ def test_ops_readyz(client):
 
     assert rv.status_code == 200
     assert rv.json == {'message': 'api is ready'}
+
+
+def test_ops_metrics(client, jwt):
+    """Asserts that the in-process metrics are returned to the system role only."""
+    rv = client.get('/ops/metrics')
+    assert rv.status_code == 401
+
+    rv = client.get('/ops/metrics', headers=create_header(jwt, [STAFF_ROLE]))
+    assert rv.status_code == 401
+
+    rv = client.get('/ops/metrics', headers=create_header(jwt, [SYSTEM_ROLE]))
+    assert rv.status_code == 200
+    assert set(rv.json['authorizationCache']) == {'size', 'hits', 'misses', 'hitRate'}
+    assert isinstance(rv.json['httpClient'], dict)
+    assert set(rv.json['revisionSnapshotCache']) == {'size', 'bytes', 'hits', 'misses', 'hitRate'}
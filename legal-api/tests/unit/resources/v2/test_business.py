@@ -589,6 +589,43 @@ def test_post_affiliated_businesses(session, client, jwt):
                     Business.BUSINESSES[expected_draft_business[2]]['numberedDescription'])
 
 
+def test_post_affiliated_businesses_keyset_pagination(session, client, jwt):
+    """Assert that the affiliated businesses endpoint pages through businesses with a cursor."""
+    identifiers = [f'BC123456{index}' for index in range(5)]
+    for identifier in identifiers:
+        factory_business_model(legal_name=identifier + 'name',
+                               identifier=identifier,
+                               founding_date=datetime.utcfromtimestamp(0),
+                               last_ledger_timestamp=datetime.utcfromtimestamp(0),
+                               last_modified=datetime.utcfromtimestamp(0),
+                               fiscal_year_end_date=None,
+                               tax_id=None,
+                               dissolution_date=None,
+                               legal_type=Business.LegalTypes.COMP.value)
+
+    returned_identifiers = []
+    cursor = None
+    for _ in range(3):
+        rv = client.post('/api/v2/businesses/search',
+                         json={'identifiers': identifiers, 'limit': 2, 'cursor': cursor},
+                         headers=create_header(jwt, [SYSTEM_ROLE]))
+        assert rv.status_code == HTTPStatus.OK
+        returned_identifiers.extend(business['identifier'] for business in rv.json['businessEntities'])
+        cursor = rv.json.get('nextCursor')
+        assert bool(cursor) == rv.json['hasMore']
+
+    assert returned_identifiers == identifiers
+    assert not cursor
+
+
+def test_post_affiliated_businesses_invalid_cursor(session, client, jwt):
+    """Assert that the affiliated businesses endpoint bad request when the cursor is invalid."""
+    rv = client.post('/api/v2/businesses/search',
+                     json={'identifiers': ['CP1234567'], 'cursor': 'not a cursor'},
+                     headers=create_header(jwt, [SYSTEM_ROLE]))
+    assert rv.status_code == HTTPStatus.BAD_REQUEST
+
+
 @pytest.mark.parametrize('is_future_effective', [
     False,
     True
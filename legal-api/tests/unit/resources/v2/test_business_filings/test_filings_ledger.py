@@ -142,6 +142,42 @@ def test_ledger_search(session, client, jwt):
     # assert alteration['filingLink']
 
 
+def test_ledger_search_pages(session, client, jwt):
+    """Assert that the ledger pages follow the next cursor in a stable order."""
+    identifier = 'BC1234567'
+    founding_date = datetime.utcnow() - datedelta.datedelta(months=len(FILINGS.keys()))
+    business = factory_business(identifier=identifier, founding_date=founding_date, last_ar_date=None,
+                                entity_type=Business.LegalTypes.BCOMP.value)
+    num_of_files = load_ledger(business, founding_date)
+    # filings submitted at the same time are ordered by id
+    ledger_element_setup_filing(business, 'brokenFiling', filing_date=founding_date)
+
+    rv = client.get(f'/api/v2/businesses/{identifier}/filings',
+                    headers=create_header(jwt, [UserRoles.system], identifier))
+    full_ledger = [f['filingId'] for f in rv.json['filings']]
+    assert len(full_ledger) == num_of_files + 1
+    assert 'next' not in rv.json
+
+    paged_ledger = []
+    cursor = None
+    while True:
+        url = f'/api/v2/businesses/{identifier}/filings?size=5'
+        if cursor:
+            url += f'&cursor={cursor}'
+        rv = client.get(url, headers=create_header(jwt, [UserRoles.system], identifier))
+        assert rv.status_code == HTTPStatus.OK
+        assert len(rv.json['filings']) <= 5
+        paged_ledger.extend(f['filingId'] for f in rv.json['filings'])
+        if not (cursor := rv.json.get('next')):
+            break
+
+    assert paged_ledger == full_ledger
+
+    rv = client.get(f'/api/v2/businesses/{identifier}/filings?size=5&cursor=invalid',
+                    headers=create_header(jwt, [UserRoles.system], identifier))
+    assert rv.status_code == HTTPStatus.BAD_REQUEST
+
+
 ###
 #  Check elements of the ledger search
 ###
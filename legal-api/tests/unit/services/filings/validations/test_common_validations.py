@@ -13,7 +13,8 @@
 # limitations under the License.
 """Test Suite for common validations sharing through the different filings."""
 import copy
-from unittest.mock import patch
+import io
+from unittest.mock import MagicMock, patch
 
 import pytest
 from registry_schemas.example_data import (
@@ -33,13 +34,18 @@ from registry_schemas.example_data import (
     REGISTRATION,
     RESTORATION,
 )
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen import canvas
 
+from legal_api.services import MinioService
+from legal_api.services.cache import cache
 from legal_api.services.filings.validations.common_validations import (
     find_updated_keys_for_firms,
     validate_certify_name,
     validate_certified_by,
     validate_offices_addresses,
     validate_parties_addresses,
+    validate_pdf,
     validate_staff_payment,
 )
 
@@ -324,3 +330,39 @@ def test_validate_certified_by(input_value, expected_error):
         assert errors[0]['path'] == '/filing/header/certifiedBy'
     else:
         assert errors == []
+
+
+def _create_pdf(page_sizes: list) -> bytes:
+    """Return a pdf with a page of each size."""
+    buffer = io.BytesIO()
+    can = canvas.Canvas(buffer, pagesize=page_sizes[0])
+    for page_size in page_sizes:
+        can.setPageSize(page_size)
+        can.drawString(100, 100, 'This is a test document.')
+        can.showPage()
+    can.save()
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize('test_name, size, page_sizes, expected_error', [
+    ('valid', 1000, [letter, letter], None),
+    ('invalid page size', 1000, [letter, (500, 500), letter],
+     'Document must be set to fit onto 8.5” x 11” letter-size paper.'),
+    ('oversize', 30000001, [letter], 'File exceeds maximum size.'),
+])
+def test_validate_pdf(session, app, test_name, size, page_sizes, expected_error):
+    """Assert that the pdf is validated, without downloading an oversize file and once per etag."""
+    pdf = _create_pdf(page_sizes)
+    file_info = MagicMock(size=size, etag=f'etag-{test_name}')
+    cache.clear()
+    with patch.dict(app.config, {'PDF_VALIDATION_CACHE_TIMEOUT': 60}), \
+            patch.object(MinioService, 'get_file_info', return_value=file_info), \
+            patch.object(MinioService, 'download_file', side_effect=lambda key, file: file.write(pdf)) as download:
+        errors = validate_pdf('file-key', '/filing/courtOrder/fileKey')
+        assert validate_pdf('file-key', '/filing/courtOrder/fileKey') == errors
+
+    if expected_error:
+        assert errors == [{'error': expected_error, 'path': '/filing/courtOrder/fileKey'}]
+    else:
+        assert errors is None
+    assert download.call_count == (0 if size > 30000000 else 1)
@@ -17,6 +17,7 @@
 Test-Suite to ensure that the Authorization Service is working as expected.
 """
 import random
+import timeit
 
 import copy
 from enum import Enum
@@ -46,14 +47,16 @@ from registry_schemas.example_data import (
 )
 
 from legal_api.models import Business, Filing
+from legal_api.services import authz
 from legal_api.services.authz import BASIC_USER, COLIN_SVC_ROLE, CONTACT_CENTRE_STAFF_ROLE , MAXIMUS_STAFF_ROLE, \
     PUBLIC_USER, STAFF_ROLE, SBC_STAFF_ROLE, \
-    authorized, is_allowed, get_allowed, get_allowed_filings, get_allowable_actions
+    authorized, is_allowed, get_allowed, get_allowed_filings, get_allowable_actions, get_allowable_filing_rules, \
+    get_allowable_filings_dict
 from legal_api.services.permissions import PermissionService
 from legal_api.services.warnings.business.business_checks import WarningType
-from tests import integration_authorization, not_github_ci
+from tests import benchmark, integration_authorization, not_github_ci
 from tests.unit.models import factory_business, factory_filing, factory_incomplete_statuses, factory_completed_filing
-from tests.unit.services.utils import create_business, helper_create_jwt
+from tests.unit.services.utils import count_queries, create_business, helper_create_jwt
 
 
 def test_jwt_manager_initialized(jwt):
@@ -3252,3 +3255,115 @@ def create_filing(business, filing_type, filing_sub_type=None):
                                       filing_type=filing_type,
                                       filing_sub_type=filing_sub_type)
     return filing
+
+
+ALL_LEGAL_TYPES = [legal_type.value for legal_type in Business.LegalTypes]
+
+
+def _walk_allowable_filings(user_role, state, legal_type):
+    """Return the allowable filing types by walking the allowable filings dict on every call."""
+    from legal_api.core.meta import FilingMeta
+
+    allowable_filings = get_allowable_filings_dict().get(user_role, {}).get(state, {})
+    filing_types = []
+    for filing_key, filing_value in allowable_filings.items():
+        if legal_types := filing_value.get('legalTypes', []):
+            if legal_type in legal_types:
+                filing_types.append({'name': filing_key,
+                                     'displayName': FilingMeta.get_display_name(legal_type, filing_key),
+                                     'feeCode': Filing.get_fee_code(legal_type, filing_key)})
+            continue
+
+        sub_type_items = filter(lambda x: isinstance(x[1], dict) and legal_type in x[1].get('legalTypes', []),
+                                filing_value.items())
+        for sub_type_key, _ in sub_type_items:
+            filing_types.append({'name': filing_key,
+                                 'type': sub_type_key,
+                                 'displayName': FilingMeta.get_display_name(legal_type, filing_key, sub_type_key),
+                                 'feeCode': Filing.get_fee_code(legal_type, filing_key, sub_type_key)})
+    return filing_types
+
+
+@pytest.mark.parametrize('user_role', ['staff', 'general'])
+@pytest.mark.parametrize('state', [Business.State.ACTIVE, Business.State.HISTORICAL])
+def test_allowable_filing_rules_match_allowable_filings_dict(app, user_role, state):
+    """Assert that the compiled allowable filing rules match the allowable filings dict for every legal type."""
+    for legal_type in ALL_LEGAL_TYPES:
+        compiled = [rule.as_filing_type() for rule in get_allowable_filing_rules(user_role, state, legal_type)]
+        assert compiled == _walk_allowable_filings(user_role, state, legal_type)
+
+
+def test_allowable_filing_rules_compiled_once(app, mocker):
+    """Assert that the allowable filing rules are compiled on first use and the repeated lookups return the same."""
+    keys = [(user_role, state, legal_type)
+            for user_role in ['staff', 'general']
+            for state in [Business.State.ACTIVE, Business.State.HISTORICAL]
+            for legal_type in ALL_LEGAL_TYPES]
+    mocker.patch('legal_api.services.authz._allowable_filing_rules', None)
+    compile_spy = mocker.spy(authz, 'compile_allowable_filing_rules')
+
+    first = [[rule.as_filing_type() for rule in get_allowable_filing_rules(*key)] for key in keys]
+    second = [[rule.as_filing_type() for rule in get_allowable_filing_rules(*key)] for key in keys]
+
+    assert first == second == [_walk_allowable_filings(*key) for key in keys]
+    assert compile_spy.call_count == 1
+
+
+@benchmark
+@pytest.mark.slow
+def test_allowable_filing_rules_benchmark(app):
+    """Report the compiled allowable filing rules lookup time against walking the allowable filings dict."""
+    keys = [(user_role, state, legal_type)
+            for user_role in ['staff', 'general']
+            for state in [Business.State.ACTIVE, Business.State.HISTORICAL]
+            for legal_type in ALL_LEGAL_TYPES]
+    get_allowable_filing_rules(*keys[0])  # compile outside of the timings
+
+    walk_time = timeit.timeit(lambda: [_walk_allowable_filings(*key) for key in keys], number=20)
+    compiled_time = timeit.timeit(
+        lambda: [[rule.as_filing_type() for rule in get_allowable_filing_rules(*key)] for key in keys], number=20)
+
+    # the timings depend on the runner, so they are reported rather than asserted
+    print(f'\nallowable filings for {len(keys)} keys x 20: dict walk {walk_time:.4f}s, compiled {compiled_time:.4f}s')
+
+
+@pytest.mark.parametrize(
+    'test_name,state,legal_types,username,roles',
+    [
+        ('staff_active_corps', Business.State.ACTIVE, ['BC', 'BEN', 'CC', 'ULC'], 'staff', [STAFF_ROLE]),
+        ('staff_active_cp', Business.State.ACTIVE, ['CP'], 'staff', [STAFF_ROLE]),
+        ('general_user_corps', Business.State.ACTIVE, ['BC', 'BEN', 'CC', 'ULC'], 'general', [BASIC_USER]),
+        ('general_user_firms', Business.State.ACTIVE, ['SP', 'GP'], 'general', [BASIC_USER]),
+    ]
+)
+def test_allowed_filings_blocker_checks_query_count(monkeypatch, app, session, jwt, test_name, state, legal_types,
+                                                    username, roles):
+    """Assert that the blocker checks for all allowable filings query the filings table once."""
+    token = helper_create_jwt(jwt, roles=roles, username=username)
+    headers = {'Authorization': 'Bearer ' + token}
+
+    def mock_auth(one, two):  # pylint: disable=unused-argument; mocks of library methods
+        return headers[one]
+
+    with app.test_request_context():
+        monkeypatch.setattr('flask.request.headers.get', mock_auth)
+
+        for legal_type in legal_types:
+            business = create_business(legal_type, state)
+            create_incomplete_filing(business=business,
+                                     filing_name='alteration',
+                                     filing_status=Filing.Status.DRAFT.value,
+                                     filing_type='alteration')
+            create_incomplete_filing(business=business,
+                                     filing_name='incorporationApplication',
+                                     filing_status=Filing.Status.PAID.value,
+                                     filing_type='incorporationApplication',
+                                     is_future_effective=True)
+
+            with count_queries('filings') as filing_queries:
+                get_allowed_filings(business, state, legal_type, jwt)
+            assert len(filing_queries) == 1
+
+            with count_queries('filings') as filing_queries:
+                get_allowed_filings(business, state, legal_type, jwt, is_ignore_draft_blockers=True)
+            assert len(filing_queries) == 1
@@ -0,0 +1,91 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the authorization decision cache.
+
+Test-Suite to ensure that the authorization cache is working as expected.
+"""
+import pytest
+
+from legal_api.services.authorization_cache import AuthorizationCache, authorization_cache
+from legal_api.services.authz import BASIC_USER, authorized
+from tests.unit.services.utils import helper_create_jwt
+
+
+@pytest.fixture
+def authz_cache_config(app):
+    """Enable the authorization cache for the duration of a test."""
+    ttl, max_size = app.config.get('AUTHZ_CACHE_TTL'), app.config.get('AUTHZ_CACHE_MAX_SIZE')
+    app.config['AUTHZ_CACHE_TTL'] = 30
+    app.config['AUTHZ_CACHE_MAX_SIZE'] = 2
+    yield app.config
+    app.config['AUTHZ_CACHE_TTL'] = ttl
+    app.config['AUTHZ_CACHE_MAX_SIZE'] = max_size
+
+
+def test_authorization_cache(app, authz_cache_config):
+    """Assert that roles are cached per token and identifier, bounded, invalidated and counted."""
+    with app.app_context():
+        authz_cache = AuthorizationCache()
+        assert authz_cache.get_roles('token', 'BC1234567') is None
+
+        authz_cache.set_roles('token', 'BC1234567', ['view', 'edit'])
+        assert authz_cache.get_roles('token', 'BC1234567') == ['view', 'edit']
+        assert authz_cache.get_roles('other token', 'BC1234567') is None
+
+        authz_cache.set_roles('token', 'BC7654321', [])
+        assert authz_cache.get_roles('token', 'BC7654321') == []
+
+        # least recently used entry is evicted past the max size
+        authz_cache.set_roles('other token', 'BC7654321', ['view'])
+        assert authz_cache.get_roles('token', 'BC1234567') is None
+        assert authz_cache.get_roles('other token', 'BC7654321') == ['view']
+
+        authz_cache.invalidate('BC7654321')
+        assert authz_cache.get_roles('other token', 'BC7654321') is None
+        assert authz_cache.get_roles('token', 'BC7654321') is None
+
+        metrics = authz_cache.get_metrics()
+        assert metrics == {'size': 0, 'hits': 3, 'misses': 5, 'hitRate': 0.375}
+
+
+def test_authorization_cache_disabled(app):
+    """Assert that nothing is cached when the ttl is 0, as in the test config."""
+    with app.app_context():
+        assert app.config['AUTHZ_CACHE_TTL'] == 0
+        authz_cache = AuthorizationCache()
+        authz_cache.set_roles('token', 'BC1234567', ['view'])
+        assert authz_cache.get_roles('token', 'BC1234567') is None
+        assert authz_cache.get_metrics()['size'] == 0
+
+
+def test_authorized_uses_cache(app, jwt, requests_mock, authz_cache_config):
+    """Assert that the auth api is only called once for repeated authorization checks."""
+    identifier = 'CP1234567'
+    auth_url = f"{app.config['AUTH_SVC_URL']}/entities/{identifier}/authorizations"
+    auth_api = requests_mock.get(auth_url, json={'roles': ['view']})
+    token = helper_create_jwt(jwt, roles=[BASIC_USER], username='user')
+    headers = {'Authorization': 'Bearer ' + token}
+
+    with app.test_request_context(headers=headers):
+        authorization_cache.clear()
+
+        assert authorized(identifier, jwt, ['view'])
+        assert authorized(identifier, jwt, ['view'])
+        assert not authorized(identifier, jwt, ['edit'])
+        assert auth_api.call_count == 1
+
+        authorization_cache.invalidate(identifier)
+        assert authorized(identifier, jwt, ['view'])
+        assert auth_api.call_count == 2
+        authorization_cache.clear()
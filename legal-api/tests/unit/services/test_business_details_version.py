@@ -0,0 +1,71 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the versioned business details service.
+
+Test-Suite to ensure that the business details are consolidated as of a filing.
+"""
+import copy
+import datetime
+
+from registry_schemas.example_data import FILING_TEMPLATE
+
+from legal_api.models import Address, Office, PartyRole
+from legal_api.services import VersionedBusinessDetailsService
+from tests.unit.models import factory_business, factory_completed_filing, factory_party_role
+from tests.unit.services.utils import count_queries
+
+
+def _address(address_type: str, street: str) -> Address:
+    return Address(street=street, city='Victoria', region='BC', country='CA', postal_code='V8V1V1',
+                   address_type=address_type)
+
+
+def test_company_details_revision_set_based(session):
+    """Assert that the company details are loaded with one query per versioned table, whatever the party count."""
+    business = factory_business('BC1234567')
+    office = Office(office_type='registeredOffice')
+    office.addresses.append(_address(Address.MAILING, 'office mailing'))
+    office.addresses.append(_address(Address.DELIVERY, 'office delivery'))
+    business.offices.append(office)
+
+    number_of_directors = 20
+    for i in range(number_of_directors):
+        officer = {
+            'firstName': f'first{i}',
+            'lastName': f'last{i}',
+            'middleInitial': '',
+            'partyType': 'person',
+            'organizationName': ''
+        }
+        business.party_roles.append(factory_party_role(_address(Address.DELIVERY, f'delivery {i}'),
+                                                       _address(Address.MAILING, f'mailing {i}'),
+                                                       officer,
+                                                       datetime.datetime(2020, 1, 1),
+                                                       None,
+                                                       PartyRole.RoleTypes.DIRECTOR))
+    business.save()
+    filing = factory_completed_filing(business, copy.deepcopy(FILING_TEMPLATE))
+
+    with count_queries() as statements:
+        revision = VersionedBusinessDetailsService.get_company_details_revision(filing.id, business.id)
+
+    assert len(statements) < 15
+    assert revision['offices']['registeredOffice']['mailingAddress']['streetAddress'] == 'office mailing'
+    assert revision['offices']['registeredOffice']['deliveryAddress']['streetAddress'] == 'office delivery'
+    assert len(revision['parties']) == number_of_directors
+    for party in revision['parties']:
+        i = party['officer']['firstName'][len('first'):]
+        assert party['role'] == PartyRole.RoleTypes.DIRECTOR.value
+        assert party['deliveryAddress']['streetAddress'] == f'delivery {i}'
+        assert party['mailingAddress']['streetAddress'] == f'mailing {i}'
@@ -23,10 +23,12 @@ import jwt as pyjwt
 import pytest
 
 from legal_api.models.business import Business
+from legal_api.models.filing import Filing
 from legal_api.models.party_role import PartyRole
 from legal_api.models.user import User
 from legal_api.services import DigitalCredentialsRulesService
 from legal_api.services.authz import PUBLIC_USER
+from legal_api.services.digital_credentials_rules import RulesEvaluationContext
 from tests.unit.models import factory_completed_filing, factory_user
 from tests.unit.services.utils import create_business, create_party_role, create_test_user, helper_create_jwt
 
@@ -449,3 +451,36 @@ def test_user_has_filing_party_role_and_user_has_business_party_role_true(app, s
 
     assert rules.user_has_filing_party_role(user, business) is True
     assert rules.user_has_business_party_role(user, business) is True
+
+
+def test_get_preconditions_loads_records_once(app, session, rules):
+    user = factory_user(username='test', firstname='Test', lastname='User')
+    business = create_business(
+        Business.LegalTypes.BCOMP.value, Business.State.ACTIVE)
+    incorporator_role = create_party_role(
+        PartyRole.RoleTypes.INCORPORATOR,
+        **create_test_user(first_name='Test', last_name='User', default_middle=False)
+    )
+    filing = factory_completed_filing(
+        business=business,
+        data_dict={'filing': {'header': {'name': 'incorporationApplication'}}},
+        filing_date=datetime.now(timezone.utc), filing_type='incorporationApplication'
+    )
+    filing.filing_party_roles.append(incorporator_role)
+    filing.save()
+    director_role = create_party_role(
+        PartyRole.RoleTypes.DIRECTOR,
+        **create_test_user(first_name='Test', last_name='User', default_middle=False)
+    )
+    director_role.business_id = business.id
+    director_role.save()
+
+    context = RulesEvaluationContext()
+    with patch('legal_api.models.Filing.get_filings_by_types',
+               wraps=Filing.get_filings_by_types) as mock_get_filings_by_types:
+        preconditions = rules.get_preconditions(user, business, context=context)
+        assert rules.user_has_filing_party_role(user, business, context=context) is True
+        assert rules.user_has_business_party_role(user, business, context=context) is True
+
+    assert sorted(preconditions) == [PartyRole.RoleTypes.DIRECTOR.value, PartyRole.RoleTypes.INCORPORATOR.value]
+    assert mock_get_filings_by_types.call_count == 1
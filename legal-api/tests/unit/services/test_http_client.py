@@ -0,0 +1,94 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the shared http client.
+
+Test-Suite to ensure that the http client caches tokens and records metrics as expected.
+"""
+import pytest
+
+from legal_api.services.http_client import TOKEN_EXPIRY_MARGIN, HttpClient
+
+
+TOKEN_URL = 'https://auth.example.com/token'
+
+
+@pytest.mark.parametrize('test_name, expires_in, expected_token_calls', [
+    ('cached', 300, 1),
+    ('expires_within_margin', TOKEN_EXPIRY_MARGIN, 2),
+    ('no_expiry', None, 2),
+])
+def test_service_account_token_cache(requests_mock, test_name, expires_in, expected_token_calls):
+    """Assert that the service account token is reused until shortly before it expires."""
+    requests_mock.post(TOKEN_URL, json={'access_token': 'token', 'expires_in': expires_in})
+    client = HttpClient()
+
+    assert client.get_service_account_token(TOKEN_URL, 'client', 'secret') == 'token'
+    assert client.get_service_account_token(TOKEN_URL, 'client', 'secret') == 'token'
+    assert requests_mock.call_count == expected_token_calls
+
+    client.invalidate_service_account_token(TOKEN_URL, 'client')
+    client.get_service_account_token(TOKEN_URL, 'client', 'secret')
+    assert requests_mock.call_count == expected_token_calls + 1
+
+
+def test_service_account_token_invalid_response(requests_mock):
+    """Assert that no token is returned or cached when the token response is not json."""
+    requests_mock.post(TOKEN_URL, text='not json')
+    client = HttpClient()
+
+    assert client.get_service_account_token(TOKEN_URL, 'client', 'secret') is None
+    assert client.get_service_account_token(TOKEN_URL, 'client', 'secret') is None
+    assert requests_mock.call_count == 2
+
+
+@pytest.mark.parametrize('test_name, authorization, expected_status, expected_token_calls', [
+    ('service_account_token', 'Bearer token-1', 200, 2),
+    ('other_token', 'Bearer user-token', 401, 1),
+])
+def test_unauthorized_retry(requests_mock, test_name, authorization, expected_status, expected_token_calls):
+    """Assert that a call rejected with a cached service account token is retried once with a new token."""
+    requests_mock.post(TOKEN_URL, [{'json': {'access_token': 'token-1', 'expires_in': 300}},
+                                   {'json': {'access_token': 'token-2', 'expires_in': 300}}])
+    entities = requests_mock.get('https://auth.example.com/entities', [{'status_code': 401}, {'status_code': 200}])
+    client = HttpClient()
+    client.get_service_account_token(TOKEN_URL, 'client', 'secret')
+
+    res = client.get('https://auth.example.com/entities', headers={'Authorization': authorization})
+
+    assert res.status_code == expected_status
+    assert requests_mock.call_count - entities.call_count == expected_token_calls
+    if expected_status == 200:
+        assert entities.last_request.headers['Authorization'] == 'Bearer token-2'
+        assert client.get_service_account_token(TOKEN_URL, 'client', 'secret') == 'token-2'
+
+
+def test_endpoint_metrics(requests_mock):
+    """Assert that the call count and latency are recorded per endpoint."""
+    requests_mock.get('https://auth.example.com/entities/BC1234567/authorizations', json={})
+    requests_mock.get('https://auth.example.com/orgs/1/products', status_code=503)
+    client = HttpClient()
+
+    client.get('https://auth.example.com/entities/BC1234567/authorizations', endpoint='auth.entities')
+    client.get('https://auth.example.com/entities/BC1234567/authorizations', endpoint='auth.entities')
+    client.get('https://auth.example.com/orgs/1/products')
+
+    metrics = client.get_metrics()
+    assert metrics['auth.entities']['count'] == 2
+    assert metrics['auth.entities']['errors'] == 0
+    assert metrics['auth.entities']['maxMs'] >= metrics['auth.entities']['avgMs']
+    assert metrics['GET auth.example.com']['count'] == 1
+    assert metrics['GET auth.example.com']['errors'] == 1
+
+    client.reset_metrics()
+    assert not client.get_metrics()
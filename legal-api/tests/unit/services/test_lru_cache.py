@@ -0,0 +1,54 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to ensure the bounded LRU is working as expected."""
+from legal_api.services.lru_cache import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    """Assert that the least recently used entry is removed over the max size."""
+    lru = LRUCache()
+    lru.set('a', 1, max_size=2)
+    lru.set('b', 2, max_size=2)
+    assert lru.get('a') == 1
+
+    lru.set('c', 3, max_size=2)
+
+    assert lru.keys() == ['a', 'c']
+    assert lru.get('b') is None
+    assert lru.values() == [1, 3]
+    assert len(lru) == 2
+
+
+def test_lru_cache_disabled():
+    """Assert that nothing is cached when the max size is 0."""
+    lru = LRUCache()
+    lru.set('a', 1, max_size=0)
+
+    assert lru.get('a', 'missing') == 'missing'
+    assert not len(lru)
+
+
+def test_lru_cache_pop_and_clear():
+    """Assert that entries can be removed one at a time or all at once."""
+    lru = LRUCache()
+    lru.set('a', 1, max_size=10)
+    lru.set('b', 2, max_size=10)
+
+    assert lru.pop('a') == 1
+    assert lru.pop('a') is None
+    assert lru.keys() == ['b']
+
+    lru.clear()
+    assert not lru.keys()
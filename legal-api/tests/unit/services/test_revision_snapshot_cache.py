@@ -0,0 +1,86 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the revision snapshot cache.
+
+Test-Suite to ensure that the business revisions of completed filings are cached as expected.
+"""
+import copy
+
+import pytest
+from registry_schemas.example_data import CORRECTION_INCORPORATION, FILING_TEMPLATE
+
+from legal_api.services import VersionedBusinessDetailsService
+from legal_api.services.revision_snapshot_cache import RevisionSnapshotCache, revision_snapshot_cache
+from tests.unit.models import factory_business, factory_completed_filing
+
+
+@pytest.fixture
+def snapshot_cache_config(app):
+    """Enable the revision snapshot cache for the duration of a test."""
+    max_size = app.config.get('REVISION_SNAPSHOT_CACHE_MAX_SIZE')
+    app.config['REVISION_SNAPSHOT_CACHE_MAX_SIZE'] = 2
+    revision_snapshot_cache.clear()
+    yield app.config
+    app.config['REVISION_SNAPSHOT_CACHE_MAX_SIZE'] = max_size
+    revision_snapshot_cache.clear()
+
+
+def test_revision_snapshot_cache(app, snapshot_cache_config):
+    """Assert that revisions are cached as copies, bounded and counted."""
+    with app.app_context():
+        snapshot_cache = RevisionSnapshotCache()
+        assert snapshot_cache.get(('companyDetails', 1, 10, 0)) is None
+
+        revision = {'parties': [{'id': '1'}], 'offices': {}}
+        snapshot_cache.set(('companyDetails', 1, 10, 0), revision)
+        revision['parties'].append({'id': '2'})
+        cached = snapshot_cache.get(('companyDetails', 1, 10, 0))
+        assert cached == {'parties': [{'id': '1'}], 'offices': {}}
+        cached['offices']['registeredOffice'] = {}
+        assert snapshot_cache.get(('companyDetails', 1, 10, 0)) == {'parties': [{'id': '1'}], 'offices': {}}
+
+        # least recently used entry is evicted past the max size
+        snapshot_cache.set(('companyDetails', 1, 11, 0), {})
+        snapshot_cache.set(('companyDetails', 2, 12, 0), {})
+        assert snapshot_cache.get(('companyDetails', 1, 10, 0)) is None
+
+        metrics = snapshot_cache.get_metrics()
+        assert metrics['size'] == 2
+        assert metrics['bytes'] > 0
+        assert (metrics['hits'], metrics['misses'], metrics['hitRate']) == (2, 2, 0.5)
+
+
+def test_revision_snapshot_cache_disabled(app):
+    """Assert that nothing is cached when the max size is 0, as in the test config."""
+    with app.app_context():
+        assert app.config['REVISION_SNAPSHOT_CACHE_MAX_SIZE'] == 0
+        snapshot_cache = RevisionSnapshotCache()
+        snapshot_cache.set(('companyDetails', 1, 10, 0), {})
+        assert snapshot_cache.get(('companyDetails', 1, 10, 0)) is None
+        assert snapshot_cache.get_metrics()['size'] == 0
+
+
+def test_company_details_revision_snapshot(session, snapshot_cache_config):
+    """Assert that the company details of a completed filing are cached until the business is corrected."""
+    business = factory_business('BC1234567')
+    filing = factory_completed_filing(business, copy.deepcopy(FILING_TEMPLATE))
+
+    revision = VersionedBusinessDetailsService.get_company_details_revision(filing.id, business.id)
+    assert VersionedBusinessDetailsService.get_company_details_revision(filing.id, business.id) == revision
+    assert revision_snapshot_cache.get_metrics()['hits'] == 1
+
+    factory_completed_filing(business, copy.deepcopy(CORRECTION_INCORPORATION), filing_type='correction')
+    assert VersionedBusinessDetailsService.get_company_details_revision(filing.id, business.id) == revision
+    metrics = revision_snapshot_cache.get_metrics()
+    assert (metrics['hits'], metrics['misses'], metrics['size']) == (1, 2, 2)
@@ -15,8 +15,13 @@
 
 from flask_jwt_oidc import JwtManager
 import random
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from typing import List, Union
+
+from sqlalchemy import event
+
+from legal_api.models import db
 from legal_api.models.address import Address
 from legal_api.models.business import Business
 from legal_api.models.party_role import PartyRole
@@ -109,3 +114,20 @@ def create_party_role(role=PartyRole.RoleTypes.COMPLETING_PARTY,
         role
     )
     return party_role
+
+
+@contextmanager
+def count_queries(table_name: str = None):
+    """Record the SQL statements executed in the block, optionally only those selecting from table_name."""
+    statements = []
+
+    # pylint: disable=unused-argument
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not table_name or f'FROM {table_name}' in statement:
+            statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
@@ -1,13 +1,15 @@
 from flask import current_app
 from http import HTTPStatus
 import json
-import requests
 from typing import Dict
 
+from business_account.http_client import http_client
+
+
 class AccountService:
     """Wrapper to call Authentication Services.
 
-    @TODO Cache and refresh / retry token as needed to reduce calls.
+    Calls go through the shared http client, which pools the connections and caches the service account token.
     """
 
     BEARER: str = 'Bearer '
@@ -25,19 +27,8 @@ class AccountService:
         client_id = current_app.config.get('ACCOUNT_SVC_CLIENT_ID')
         client_secret = current_app.config.get('ACCOUNT_SVC_CLIENT_SECRET')
 
-        data = 'grant_type=client_credentials'
-
-        # get service account token
-        res = requests.post(url=token_url,
-                            data=data,
-                            headers={'content-type': 'application/x-www-form-urlencoded'},
-                            auth=(client_id, client_secret),
-                            timeout=cls.timeout)
-
-        try:
-            return res.json().get('access_token')
-        except Exception:
-            return None
+        # get service account token, cached until shortly before it expires
+        return http_client.get_service_account_token(token_url, client_id, client_secret, timeout=cls.timeout)
 
     @classmethod
     # pylint: disable=too-many-arguments, too-many-locals disable=invalid-name, disable=redefined-outer-name;
@@ -70,7 +61,7 @@ class AccountService:
         if corp_sub_type_code:
             entity_data['corpSubTypeCode'] = corp_sub_type_code
 
-        entity_record = requests.post(
+        entity_record = http_client.post(
             url=account_svc_entity_url,
             headers={**cls.CONTENT_TYPE_JSON,
                      'Authorization': cls.BEARER + token},
@@ -91,7 +82,7 @@ class AccountService:
         }
         if details:
             affiliate_data['entityDetails'] = details
-        affiliate = requests.post(
+        affiliate = http_client.post(
             url=account_svc_affiliate_url,
             headers=headers,
             data=json.dumps(affiliate_data),
@@ -127,7 +118,7 @@ class AccountService:
         if state:
             entity_data['state'] = state
 
-        entity_record = requests.patch(
+        entity_record = http_client.patch(
             url=account_svc_entity_url + '/' + business_registration,
             headers={**cls.CONTENT_TYPE_JSON,
                      'Authorization': cls.BEARER + token},
@@ -152,14 +143,14 @@ class AccountService:
         token = cls.get_bearer_token()
 
         # Delete an account:business affiliation
-        affiliate = requests.delete(
+        affiliate = http_client.delete(
             url=account_svc_affiliate_url + '/' + business_registration,
             headers={**cls.CONTENT_TYPE_JSON,
                      'Authorization': cls.BEARER + token},
             timeout=cls.timeout
         )
         # Delete an entity record
-        entity_record = requests.delete(
+        entity_record = http_client.delete(
             url=account_svc_entity_url + '/' + business_registration,
             headers={**cls.CONTENT_TYPE_JSON,
                      'Authorization': cls.BEARER + token},
@@ -183,7 +174,7 @@ class AccountService:
         if flags and isinstance(flags, Flags) and flags.is_on('enable-sandbox'):
             current_app.logger.info('Appending Environment-Override = sandbox header to get account affiliation info')
             headers['Environment-Override'] = 'sandbox'
-        res = requests.get(url=url, headers=headers)
+        res = http_client.get(url=url, headers=headers)
         try:
             return res.json()
         except Exception:  # noqa B902; pylint: disable=W0703;
@@ -202,7 +193,7 @@ class AccountService:
             current_app.logger.error('Not Authorized')
             return None
 
-        affiliates = requests.get(
+        affiliates = http_client.get(
             url=account_svc_affiliate_url,
             headers={**cls.CONTENT_TYPE_JSON,
                      'Authorization': cls.BEARER + token},
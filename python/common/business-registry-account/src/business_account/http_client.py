@@ -0,0 +1,213 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Shared HTTP client for the outbound service calls.
+
+Connections are kept alive and pooled per host, service account tokens are cached until shortly
+before they expire, and the latency of every call is recorded per endpoint. A call rejected (401)
+with a cached service account token is retried once with a new token.
+"""
+import threading
+import time
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# seconds before the expiry of a service account token that it is refreshed
+TOKEN_EXPIRY_MARGIN = 60
+
+
+@dataclass
+class EndpointMetrics:
+    """Call count and latency of an endpoint."""
+
+    count: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def as_dict(self) -> dict:
+        """Return the metrics in milliseconds."""
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'avgMs': round(self.total_seconds * 1000 / self.count, 3) if self.count else 0,
+            'maxMs': round(self.max_seconds * 1000, 3)
+        }
+
+
+@dataclass(frozen=True)
+class _CachedToken:
+    """A service account token, the monotonic time it should be refreshed at and how to get a new one."""
+
+    access_token: str
+    refresh_at: float
+    client_secret: str
+    timeout: Optional[float]
+
+
+class HttpClient:
+    """HTTP client that reuses keep-alive connections and caches service account tokens.
+
+    A requests Session is not guaranteed to be thread safe, so each thread gets its own session.
+    Each session keeps a connection pool per host for the life of the thread.
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10, retries: Optional[Retry] = None):
+        """Create the client."""
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.retries = retries or Retry(total=5,
+                                        backoff_factor=0.1,
+                                        status_forcelist=[500, 502, 503, 504],
+                                        raise_on_status=False)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._tokens: Dict[Tuple[str, str], _CachedToken] = {}
+        self._metrics: Dict[str, EndpointMetrics] = {}
+
+    @property
+    def session(self) -> Session:
+        """Return the session of the current thread."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = Session()
+            adapter = HTTPAdapter(pool_connections=self.pool_connections,
+                                  pool_maxsize=self.pool_maxsize,
+                                  max_retries=self.retries)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._local.session = session
+        return session
+
+    def request(self, method: str, url: str, endpoint: str = None, **kwargs) -> Response:
+        """Send the request on the pooled session and record its latency against the endpoint.
+
+        The endpoint is the name the latency is recorded under, it defaults to the method and host.
+        """
+        endpoint = endpoint or f'{method.upper()} {urlsplit(url).netloc}'
+        response = self._send(method, url, endpoint, **kwargs)
+        if response.status_code == HTTPStatus.UNAUTHORIZED and \
+                (headers := self._refresh_service_account_token(kwargs.get('headers'))):
+            response = self._send(method, url, endpoint, **{**kwargs, 'headers': headers})
+        return response
+
+    def get(self, url: str, **kwargs) -> Response:
+        """Send a GET request."""
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> Response:
+        """Send a POST request."""
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> Response:
+        """Send a PUT request."""
+        return self.request('PUT', url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> Response:
+        """Send a PATCH request."""
+        return self.request('PATCH', url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> Response:
+        """Send a DELETE request."""
+        return self.request('DELETE', url, **kwargs)
+
+    def get_service_account_token(self, token_url: str, client_id: str, client_secret: str,
+                                  timeout: Optional[float] = None) -> Optional[str]:
+        """Return a client credentials token, cached until TOKEN_EXPIRY_MARGIN seconds before it expires."""
+        key = (token_url, client_id)
+        cached_token = self._tokens.get(key)
+        if cached_token and cached_token.refresh_at > time.monotonic():
+            return cached_token.access_token
+
+        res = self.post(url=token_url,
+                        data='grant_type=client_credentials',
+                        headers={'content-type': 'application/x-www-form-urlencoded'},
+                        auth=(client_id, client_secret),
+                        timeout=timeout,
+                        endpoint='service-account-token')
+        try:
+            token_json = res.json()
+            access_token = token_json.get('access_token')
+        except Exception:  # pylint: disable=broad-except
+            return None
+
+        try:
+            expires_in = int(token_json.get('expires_in') or 0)
+        except (TypeError, ValueError):
+            expires_in = 0
+        if access_token and expires_in > TOKEN_EXPIRY_MARGIN:
+            with self._lock:
+                self._tokens[key] = _CachedToken(access_token, time.monotonic() + expires_in - TOKEN_EXPIRY_MARGIN,
+                                                 client_secret, timeout)
+        return access_token
+
+    def invalidate_service_account_token(self, token_url: str, client_id: str):
+        """Remove a cached token, e.g. after it was rejected."""
+        with self._lock:
+            self._tokens.pop((token_url, client_id), None)
+
+    def get_metrics(self) -> Dict[str, dict]:
+        """Return the call count and latency per endpoint."""
+        with self._lock:
+            return {endpoint: metrics.as_dict() for endpoint, metrics in self._metrics.items()}
+
+    def reset_metrics(self):
+        """Clear the recorded metrics."""
+        with self._lock:
+            self._metrics.clear()
+
+    def _send(self, method: str, url: str, endpoint: str, **kwargs) -> Response:
+        failed = True
+        start = time.perf_counter()
+        try:
+            response = self.session.request(method, url, **kwargs)
+            failed = response.status_code >= 500
+            return response
+        finally:
+            self._record(endpoint, time.perf_counter() - start, failed)
+
+    def _refresh_service_account_token(self, headers: Optional[dict]) -> Optional[dict]:
+        """Return the headers with a new token, if their bearer token is a cached service account token."""
+        authorization = (headers or {}).get('Authorization') or ''
+        if not authorization.startswith('Bearer '):
+            return None
+        access_token = authorization[len('Bearer '):]
+        with self._lock:
+            key, cached_token = next(((key, cached_token) for key, cached_token in self._tokens.items()
+                                      if cached_token.access_token == access_token), (None, None))
+        if not cached_token:
+            return None
+
+        self.invalidate_service_account_token(*key)
+        new_token = self.get_service_account_token(*key, cached_token.client_secret, timeout=cached_token.timeout)
+        if not new_token or new_token == access_token:
+            return None
+        return {**headers, 'Authorization': f'Bearer {new_token}'}
+
+    def _record(self, endpoint: str, seconds: float, failed: bool):
+        with self._lock:
+            metrics = self._metrics.setdefault(endpoint, EndpointMetrics())
+            metrics.count += 1
+            metrics.errors += 1 if failed else 0
+            metrics.total_seconds += seconds
+            metrics.max_seconds = max(metrics.max_seconds, seconds)
+
+
+http_client = HttpClient()  # pylint: disable=invalid-name; shared variables are lower case by Flask convention.
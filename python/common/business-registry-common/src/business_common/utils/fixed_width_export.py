@@ -0,0 +1,99 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""This module streams the fixed width report files generated by the report job notebooks.
+
+The report query selects one column holding the whole fixed width line. The lines are fetched from a server side
+cursor and written straight to the (optionally gzipped) file, counting them on the way, so the report is never held
+in memory and the data is read once.
+
+SQLAlchemy is required, it is installed with the fixed-width-export extra.
+"""
+import gzip
+import logging
+import os
+import shutil
+from typing import Iterator, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+FETCH_SIZE = 10000
+SFTP_CHUNK_SIZE = 1024 * 1024
+
+
+def _statement(query: str) -> str:
+    return query.strip().rstrip(';')
+
+
+def max_line_length(engine: Engine, query: str) -> int:
+    """Return the length of the longest line of the query, which names its column line."""
+    with engine.connect() as connection:
+        # the query is set by the job notebook, not by a user
+        length = connection.execute(text(f'select max(length(line)) from ({_statement(query)}) lines')).scalar()
+    return length or 0
+
+
+def stream_lines(engine: Engine, query: str, fetch_size: int = FETCH_SIZE,
+                 width: Optional[int] = None) -> Iterator[str]:
+    """Yield the first column of the query rows, fetched from a server side cursor.
+
+    The lines are left aligned to the width when given. The NULL lines are skipped and their count is logged.
+    """
+    skipped = 0
+    with engine.connect() as connection:
+        result = connection.execution_options(stream_results=True, yield_per=fetch_size) \
+            .execute(text(_statement(query)))
+        for line in result.scalars():
+            if line is None:
+                skipped += 1
+                continue
+            yield line.ljust(width) if width else line
+    if skipped:
+        logging.warning('Skipped %s NULL lines of the report query', skipped)
+
+
+def write_lines(lines: Iterator[str], filename: str, compress: bool = False) -> int:
+    """Write the lines to the file (gzipped if compress) and return the line count.
+
+    The lines are separated by a new line, without a trailing one, as the DataFrame.to_string output was.
+    """
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    opener = gzip.open if compress else open
+    count = 0
+    with opener(filename, 'wt', encoding='utf-8', newline='') as file:
+        for line in lines:
+            if count:
+                file.write('\n')
+            file.write(line)
+            count += 1
+    logging.info('Wrote %s lines to %s', count, filename)
+    return count
+
+
+def export(engine: Engine, query: str, filename: str, compress: bool = False, width: Optional[int] = None) -> int:
+    """Stream the query lines (left aligned to the width when given) into the file and return the line count."""
+    return write_lines(stream_lines(engine, query, width=width), filename, compress)
+
+
+def upload(sftp_client, filename: str, remote_path: str = None, chunk_size: int = SFTP_CHUNK_SIZE) -> int:
+    """Upload the file in chunks to the SFTP server and return the uploaded size."""
+    remote_path = remote_path or os.path.basename(filename)
+    with open(filename, 'rb') as local_file, sftp_client.open(remote_path, 'wb') as remote_file:
+        # do not wait for the server to acknowledge each chunk
+        remote_file.set_pipelined(True)
+        shutil.copyfileobj(local_file, remote_file, chunk_size)
+    size = os.path.getsize(filename)
+    if sftp_client.stat(remote_path).st_size != size:
+        raise IOError(f'Size mismatch uploading {filename} to {remote_path}')
+    return size
@@ -0,0 +1,106 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to ensure the fixed width report export is working as expected."""
+import gzip
+import io
+import logging
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from business_common.utils.fixed_width_export import export, max_line_length, upload
+
+
+QUERY = 'select line from report_lines order by id;'
+
+
+@pytest.fixture
+def engine():
+    """Return an in memory engine with the report lines, one of them NULL."""
+    engine = create_engine('sqlite://')
+    with engine.begin() as connection:
+        connection.execute(text('create table report_lines (id integer primary key, line varchar)'))
+        connection.execute(text('insert into report_lines (id, line) values (1, :a), (2, NULL), (3, :b)'),
+                           {'a': '1SP 0000001 A NAME', 'b': '2GP 0000002 NAME'})
+    return engine
+
+
+def test_export(engine, tmp_path, caplog):
+    """Assert that the lines are written without a trailing new line and the NULL lines are counted."""
+    filename = os.path.join(tmp_path, 'data', 'report.txt')
+
+    with caplog.at_level(logging.WARNING):
+        assert export(engine, QUERY, filename) == 2
+
+    with open(filename, encoding='utf-8', newline='') as file:
+        assert file.read() == '1SP 0000001 A NAME\n2GP 0000002 NAME'
+    assert 'Skipped 1 NULL lines' in caplog.text
+
+
+def test_export_width(engine, tmp_path):
+    """Assert that the lines are left aligned to the longest line."""
+    filename = os.path.join(tmp_path, 'report.txt')
+
+    width = max_line_length(engine, QUERY)
+    assert width == 18
+    export(engine, QUERY, filename, width=width)
+
+    with open(filename, encoding='utf-8', newline='') as file:
+        assert file.read().split('\n') == ['1SP 0000001 A NAME', '2GP 0000002 NAME  ']
+
+
+def test_export_compress(engine, tmp_path):
+    """Assert that the lines are gzipped when compress is set."""
+    filename = os.path.join(tmp_path, 'report.gz')
+
+    assert export(engine, QUERY, filename, compress=True) == 2
+
+    with gzip.open(filename, 'rt', encoding='utf-8', newline='') as file:
+        assert file.read() == '1SP 0000001 A NAME\n2GP 0000002 NAME'
+
+
+def test_export_empty(tmp_path):
+    """Assert that an empty file is written when the query has no lines."""
+    engine = create_engine('sqlite://')
+    filename = os.path.join(tmp_path, 'report.txt')
+
+    assert max_line_length(engine, 'select 1 as line where 1 = 0') == 0
+    assert export(engine, 'select 1 as line where 1 = 0', filename) == 0
+    assert os.path.getsize(filename) == 0
+
+
+def test_upload(tmp_path):
+    """Assert that the file is uploaded pipelined and its size is checked."""
+    filename = os.path.join(tmp_path, 'report.txt')
+    with open(filename, 'wb') as file:
+        file.write(b'x' * 100)
+    remote_file = io.BytesIO()
+    remote_file.set_pipelined = MagicMock()
+    sftp_client = MagicMock()
+    sftp_client.open.return_value.__enter__.return_value = remote_file
+    sftp_client.stat.return_value = SimpleNamespace(st_size=100)
+
+    assert upload(sftp_client, filename, chunk_size=30) == 100
+
+    sftp_client.open.assert_called_once_with('report.txt', 'wb')
+    remote_file.set_pipelined.assert_called_once_with(True)
+    assert remote_file.getvalue() == b'x' * 100
+
+    sftp_client.stat.return_value = SimpleNamespace(st_size=99)
+    with pytest.raises(IOError):
+        upload(sftp_client, filename, 'remote/report.txt')
@@ -44,6 +44,7 @@ from .jurisdiction import Jurisdiction
 from .naics_element import NaicsElement
 from .naics_structure import NaicsStructure
 from .office import Office, OfficeType
+from .outbox_event import OutboxEvent
 from .party_role import Party, PartyRole
 from .party_class import PartyClass
 from .permission import Permission
@@ -91,6 +92,7 @@ __all__ = (
     'NaicsStructure',
     'Office',
     'OfficeType',
+    'OutboxEvent',
     'Party',
     'PartyClass',
     'PartyRole',
@@ -25,6 +25,8 @@ from .db import db
 class BatchProcessing(db.Model):  # pylint: disable=too-many-instance-attributes
     """This class manages the batch processing."""
 
+    BULK_UPDATE_CHUNK_SIZE = 1000
+
     class BatchProcessingStep(BaseEnum):
         """Render an Enum of the batch processing step."""
 
@@ -67,6 +69,20 @@ class BatchProcessing(db.Model):  # pylint: disable=too-many-instance-attributes
         db.session.add(self)
         db.session.commit()
 
+    @classmethod
+    def bulk_save(cls, batch_processings: list, chunk_size: int = BULK_UPDATE_CHUNK_SIZE):
+        """Save the new batch processing entries, committing once per chunk."""
+        for start in range(0, len(batch_processings), chunk_size):
+            db.session.add_all(batch_processings[start:start + chunk_size])
+            db.session.commit()
+
+    @classmethod
+    def bulk_update(cls, mappings: list[dict], chunk_size: int = BULK_UPDATE_CHUNK_SIZE):
+        """Update the batch processing entries by id from the column mappings, committing once per chunk."""
+        for start in range(0, len(mappings), chunk_size):
+            db.session.bulk_update_mappings(cls, mappings[start:start + chunk_size])
+            db.session.commit()
+
     @classmethod
     def find_by_id(cls, batch_processing_id: int):
         """Return the batch matching the id."""
@@ -14,10 +14,11 @@
 """This module holds data for furnishings."""
 from __future__ import annotations
 
+from datetime import datetime
 from enum import auto
 
-from sqlalchemy import func
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import any_, func, literal, update
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 
 from business_model.utils.base import BaseEnum
 
@@ -28,6 +29,8 @@ from .furnishing_group import FurnishingGroup
 class Furnishing(db.Model):
     """This class manages the furnishings."""
 
+    BULK_UPDATE_CHUNK_SIZE = 1000
+
     class FurnishingType(BaseEnum):
         """Render an Enum for the furnishing type."""
 
@@ -88,6 +91,24 @@ class Furnishing(db.Model):
         db.session.add(self)
         db.session.commit()
 
+    @classmethod
+    def bulk_update_status(cls,
+                           furnishing_ids: list[int],
+                           status: FurnishingStatus,
+                           notes: str = None,
+                           processed_date: datetime = None,
+                           chunk_size: int = BULK_UPDATE_CHUNK_SIZE):
+        """Set the status, notes and processed date of the furnishings, committing once per chunk of ids."""
+        for start in range(0, len(furnishing_ids), chunk_size):
+            chunk = furnishing_ids[start:start + chunk_size]
+            db.session.execute(
+                update(cls)
+                .where(cls.id == any_(literal(chunk, ARRAY(db.Integer))))
+                .values(status=status, notes=notes, processed_date=processed_date)
+                .execution_options(synchronize_session=False)
+            )
+            db.session.commit()
+
     @classmethod
     def find_by_id(cls, furnishing_id: int):
         """Return a Furnishing entry by the id."""
@@ -0,0 +1,130 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""This module holds the outbox of the side effects of a filing.
+
+The events are written in the same transaction as the filing, so they are committed if and only if the filing is,
+and dispatched after the commit. The events of a filing are dispatched one at a time, in the order they were added.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from enum import auto
+
+from sqlalchemy import and_, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import aliased
+
+from business_model.utils.base import BaseEnum
+
+from .db import db
+
+
+class OutboxEvent(db.Model):  # pylint: disable=too-many-instance-attributes
+    """This class manages the outbox events."""
+
+    class Status(BaseEnum):
+        """Render an Enum of the outbox event status."""
+
+        PENDING = auto()
+        COMPLETED = auto()
+        FAILED = auto()
+
+    __tablename__ = 'outbox_events'
+    __table_args__ = (
+        db.Index('ix_outbox_events_status_next_attempt_date', 'status', 'next_attempt_date'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    idempotency_key = db.Column('idempotency_key', db.String(100), unique=True, nullable=False)
+    event_type = db.Column('event_type', db.String(50), nullable=False)
+    status = db.Column('status', db.Enum(Status, name='outbox_event_status'), default=Status.PENDING, nullable=False)
+    payload = db.Column('payload', JSONB, nullable=True)
+    attempts = db.Column('attempts', db.Integer, default=0, nullable=False)
+    last_error = db.Column('last_error', db.String(1000), nullable=True)
+    created_date = db.Column('created_date', db.DateTime(timezone=True), default=func.now())
+    next_attempt_date = db.Column('next_attempt_date', db.DateTime(timezone=True), default=func.now())
+    processed_date = db.Column('processed_date', db.DateTime(timezone=True), nullable=True)
+
+    # parent keys
+    filing_id = db.Column('filing_id', db.Integer, db.ForeignKey('filings.id'), index=True, nullable=False)
+    business_id = db.Column('business_id', db.Integer, db.ForeignKey('businesses.id'), nullable=True)
+
+    def save(self):
+        """Save the object to the database immediately."""
+        db.session.add(self)
+        db.session.commit()
+
+    @classmethod
+    def find_by_id(cls, outbox_event_id: int) -> OutboxEvent:
+        """Return the outbox event matching the id."""
+        outbox_event = None
+        if outbox_event_id:
+            outbox_event = cls.query.filter_by(id=outbox_event_id).one_or_none()
+        return outbox_event
+
+    @classmethod
+    def find_by_filing_id(cls, filing_id: int) -> list[OutboxEvent]:
+        """Return the outbox events of the filing, in the order they were added."""
+        return cls.query.filter_by(filing_id=filing_id).order_by(cls.id).all()
+
+    @classmethod
+    def claim_due(cls, limit: int, lease_seconds: int, filing_id: int = None) -> list[OutboxEvent]:
+        """Claim the next due event of each filing, or of the given filing only, up to the limit.
+
+        An event is due when it is pending, its next attempt date is past and no earlier event of its filing is
+        pending. The claimed events are leased by moving their next attempt date past the lease, so they are not
+        claimed again while they are dispatched, and are retried once the lease expires if the dispatcher stops.
+        """
+        now = datetime.now(timezone.utc)
+        earlier = aliased(cls)
+        earlier_pending = db.session.query(earlier.id).filter(
+            and_(earlier.filing_id == cls.filing_id,
+                 earlier.id < cls.id,
+                 earlier.status == cls.Status.PENDING)
+        ).exists()
+        query = cls.query \
+            .filter(cls.status == cls.Status.PENDING) \
+            .filter(cls.next_attempt_date <= now) \
+            .filter(~earlier_pending)
+        if filing_id:
+            query = query.filter(cls.filing_id == filing_id)
+        outbox_events = query \
+            .order_by(cls.id) \
+            .limit(limit) \
+            .with_for_update(skip_locked=True) \
+            .all()
+        for outbox_event in outbox_events:
+            outbox_event.next_attempt_date = now + timedelta(seconds=lease_seconds)
+        db.session.commit()
+        return outbox_events
+
+    def mark_completed(self):
+        """Mark the event as dispatched."""
+        self.status = OutboxEvent.Status.COMPLETED
+        self.attempts += 1
+        self.processed_date = datetime.now(timezone.utc)
+        self.last_error = None
+        self.save()
+
+    def mark_failed(self, error: str, max_attempts: int, retry_delay: int):
+        """Record the failed attempt, retrying with an exponential backoff until the max attempts."""
+        self.attempts += 1
+        self.last_error = (error or '')[:1000]
+        if self.attempts >= max_attempts:
+            self.status = OutboxEvent.Status.FAILED
+            self.processed_date = datetime.now(timezone.utc)
+        else:
+            self.next_attempt_date = datetime.now(timezone.utc) + \
+                timedelta(seconds=retry_delay * 2 ** (self.attempts - 1))
+        self.save()
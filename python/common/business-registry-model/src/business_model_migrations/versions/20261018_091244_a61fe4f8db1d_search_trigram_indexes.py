@@ -0,0 +1,43 @@
+"""search_trigram_indexes
+
+Revision ID: a61fe4f8db1d
+Revises: 7efd0c42babd
+Create Date: 2026-10-18 09:12:44.318512
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'a61fe4f8db1d'
+down_revision = '7efd0c42babd'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # built concurrently so the businesses and filings tables stay writable, which needs to run outside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index('ix_businesses_identifier_trgm', 'businesses', ['identifier'], unique=False,
+                        postgresql_using='gin', postgresql_ops={'identifier': 'gin_trgm_ops'},
+                        postgresql_concurrently=True)
+        op.create_index('ix_businesses_legal_name_trgm', 'businesses', ['legal_name'], unique=False,
+                        postgresql_using='gin', postgresql_ops={'legal_name': 'gin_trgm_ops'},
+                        postgresql_concurrently=True)
+        op.create_index('ix_filings_temp_reg_trgm', 'filings', ['temp_reg'], unique=False,
+                        postgresql_using='gin', postgresql_ops={'temp_reg': 'gin_trgm_ops'},
+                        postgresql_concurrently=True)
+        # draft legal name from the name request in the filing json, used by the affiliation search of draft entities.
+        # The expression must match the one in BusinessSearchService.get_search_filtered_filings_results.
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_filings_draft_legal_name_trgm ON filings "
+                   "USING gin ((jsonb_extract_path_text(filing_json, 'filing', filing_type, "
+                   "'nameRequest', 'legalName')) gin_trgm_ops)")
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_filings_draft_legal_name_trgm', table_name='filings', postgresql_concurrently=True)
+        op.drop_index('ix_filings_temp_reg_trgm', table_name='filings', postgresql_concurrently=True)
+        op.drop_index('ix_businesses_legal_name_trgm', table_name='businesses', postgresql_concurrently=True)
+        op.drop_index('ix_businesses_identifier_trgm', table_name='businesses', postgresql_concurrently=True)
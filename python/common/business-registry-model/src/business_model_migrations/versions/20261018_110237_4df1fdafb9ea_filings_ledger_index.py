@@ -0,0 +1,29 @@
+"""filings_ledger_index
+
+Revision ID: 4df1fdafb9ea
+Revises: a61fe4f8db1d
+Create Date: 2026-10-18 11:02:37.514208
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '4df1fdafb9ea'
+down_revision = 'a61fe4f8db1d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # keyset pagination of the business ledger, ordered by (filing_date desc, id).
+    # Built concurrently so the filings table stays writable, which needs to run outside a transaction.
+    with op.get_context().autocommit_block():
+        op.create_index('ix_filings_business_id_filing_date_id', 'filings',
+                        ['business_id', sa.text('filing_date DESC'), 'id'], unique=False,
+                        postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_filings_business_id_filing_date_id', table_name='filings', postgresql_concurrently=True)
@@ -85,3 +85,44 @@ def test_batch_processing_with_meta_data(session):
 
     assert batch_processing.id
     assert json.loads(batch_processing.meta_data) == meta_data
+
+
+def test_batch_processing_bulk_save_and_update(session):
+    """Assert that batch processing entries are saved and updated in chunks."""
+    batch = factory_batch()
+    batch_processings = []
+    for identifier in ['BC1234567', 'BC7654321', 'BC1111111']:
+        business = factory_business(identifier)
+        batch_processings.append(BatchProcessing(
+            batch_id=batch.id,
+            business_id=business.id,
+            business_identifier=identifier,
+            step=BatchProcessing.BatchProcessingStep.WARNING_LEVEL_1,
+            status=BatchProcessing.BatchProcessingStatus.PROCESSING
+        ))
+
+    BatchProcessing.bulk_save(batch_processings, chunk_size=2)
+    assert all(batch_processing.id for batch_processing in batch_processings)
+
+    BatchProcessing.bulk_update([
+        {
+            'id': batch_processings[0].id,
+            'step': BatchProcessing.BatchProcessingStep.WARNING_LEVEL_2,
+            'meta_data': {'stage_2_date': '2025-02-01'}
+        },
+        {
+            'id': batch_processings[1].id,
+            'status': BatchProcessing.BatchProcessingStatus.WITHDRAWN,
+            'notes': 'Moved back into good standing'
+        }
+    ], chunk_size=1)
+
+    res = BatchProcessing.find_by_id(batch_processings[0].id)
+    assert res.step == BatchProcessing.BatchProcessingStep.WARNING_LEVEL_2
+    assert res.status == BatchProcessing.BatchProcessingStatus.PROCESSING
+    assert res.meta_data == {'stage_2_date': '2025-02-01'}
+    res = BatchProcessing.find_by_id(batch_processings[1].id)
+    assert res.status == BatchProcessing.BatchProcessingStatus.WITHDRAWN
+    assert res.notes == 'Moved back into good standing'
+    res = BatchProcessing.find_by_id(batch_processings[2].id)
+    assert res.step == BatchProcessing.BatchProcessingStep.WARNING_LEVEL_1
@@ -17,6 +17,7 @@
 Test-Suite to ensure that the Furnishing Model is working as expected.
 """
 import random
+from datetime import datetime, timezone
 
 import pytest
 
@@ -132,3 +133,35 @@ def test_find_furnishing_by(session, params):
 
     assert len(res) == 1
     assert res[0].id == furnishing.id
+
+
+def test_furnishing_bulk_update_status(session):
+    """Assert that the status, notes and processed date of the furnishings are updated in chunks."""
+    business = factory_business('BC1234567')
+    batch = factory_batch()
+    furnishings = []
+    for _ in range(3):
+        furnishing = Furnishing(
+            furnishing_type=Furnishing.FurnishingType.MAIL,
+            furnishing_name=Furnishing.FurnishingName.DISSOLUTION_COMMENCEMENT_NO_AR,
+            batch_id=batch.id,
+            business_id=business.id,
+            business_identifier=business.identifier,
+            status=Furnishing.FurnishingStatus.QUEUED
+        )
+        furnishing.save()
+        furnishings.append(furnishing)
+
+    processed_date = datetime.now(timezone.utc)
+    Furnishing.bulk_update_status([f.id for f in furnishings[:2]],
+                                  Furnishing.FurnishingStatus.PROCESSED,
+                                  'SFTP of batch letter was a success.',
+                                  processed_date,
+                                  chunk_size=1)
+
+    for furnishing in furnishings[:2]:
+        res = Furnishing.find_by_id(furnishing.id)
+        assert res.status == Furnishing.FurnishingStatus.PROCESSED
+        assert res.notes == 'SFTP of batch letter was a success.'
+        assert res.processed_date == processed_date
+    assert Furnishing.find_by_id(furnishings[2].id).status == Furnishing.FurnishingStatus.QUEUED
@@ -0,0 +1,81 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the OutboxEvent Model.
+
+Test-Suite to ensure that the OutboxEvent Model is working as expected.
+"""
+from business_model.models import OutboxEvent
+from tests.models import factory_business, factory_filing
+
+
+def factory_outbox_event(filing, event_type, business=None):
+    """Create an outbox event."""
+    outbox_event = OutboxEvent(
+        idempotency_key=f'{filing.id}-{event_type}',
+        event_type=event_type,
+        filing_id=filing.id,
+        business_id=business.id if business else None
+    )
+    outbox_event.save()
+    return outbox_event
+
+
+def test_valid_outbox_event_save(session):
+    """Assert that a valid outbox event can be saved."""
+    business = factory_business('FM1234567')
+    filing = factory_filing(business, {'filing': {'header': {'name': 'registration'}}}, filing_type='registration')
+    outbox_event = factory_outbox_event(filing, 'publishEvent', business)
+
+    assert outbox_event.id
+    assert outbox_event.status == OutboxEvent.Status.PENDING
+    assert outbox_event.attempts == 0
+    assert OutboxEvent.find_by_id(outbox_event.id) == outbox_event
+    assert OutboxEvent.find_by_filing_id(filing.id) == [outbox_event]
+
+
+def test_claim_due(session):
+    """Assert that only the first pending event of each filing is claimed, and not claimed again while leased."""
+    business = factory_business('FM1234567')
+    filing_1 = factory_filing(business, {'filing': {'header': {'name': 'registration'}}}, filing_type='registration')
+    filing_2 = factory_filing(business, {'filing': {'header': {'name': 'registration'}}}, filing_type='registration')
+    event_1 = factory_outbox_event(filing_1, 'consumeNr', business)
+    event_2 = factory_outbox_event(filing_1, 'publishEvent', business)
+    event_3 = factory_outbox_event(filing_2, 'publishEvent', business)
+
+    assert OutboxEvent.claim_due(limit=10, lease_seconds=300, filing_id=filing_2.id) == [event_3]
+    assert OutboxEvent.claim_due(limit=10, lease_seconds=300) == [event_1]
+    assert OutboxEvent.claim_due(limit=10, lease_seconds=300) == []
+
+    # the next event of the filing is due once the earlier one is dispatched
+    event_1.mark_completed()
+    assert event_1.status == OutboxEvent.Status.COMPLETED
+    assert event_1.processed_date
+    assert OutboxEvent.claim_due(limit=10, lease_seconds=300) == [event_2]
+
+
+def test_mark_failed(session):
+    """Assert that a failed event is retried later until the max attempts."""
+    business = factory_business('FM1234567')
+    filing = factory_filing(business, {'filing': {'header': {'name': 'registration'}}}, filing_type='registration')
+    outbox_event = factory_outbox_event(filing, 'publishEvent', business)
+
+    outbox_event.mark_failed('timeout', max_attempts=2, retry_delay=60)
+    assert outbox_event.status == OutboxEvent.Status.PENDING
+    assert outbox_event.attempts == 1
+    assert outbox_event.last_error == 'timeout'
+    assert OutboxEvent.claim_due(limit=10, lease_seconds=300) == []
+
+    outbox_event.mark_failed('timeout', max_attempts=2, retry_delay=60)
+    assert outbox_event.status == OutboxEvent.Status.FAILED
+    assert outbox_event.attempts == 2
@@ -17,6 +17,7 @@ import datetime
 from sqlalchemy import (BigInteger, Column, DateTime, Integer, SmallInteger,
                         String, and_, event, func, insert, inspect, select,
                         update)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 # from sqlalchemy.ext.declarative import declarative_base, declared_attr
 from sqlalchemy.orm import declarative_base, declared_attr
 from sqlalchemy.orm import Session, Mapper, relationships
@@ -26,8 +27,71 @@ from .relationship_builder import RelationshipBuilder
 
 Base = declarative_base()
 
+# Maximum number of version rows written by a single bulk statement
+VERSION_BATCH_SIZE = 500
+
+OPERATION_TYPES = {'I': 0, 'U': 1, 'D': 2}
+
+# Columns that are managed by the versioning and not copied from the versioned object
+VERSION_COLUMNS = ('transaction_id', 'end_transaction_id', 'operation_type')
+
+# Cache of versioned class -> ((column name, property name), ...)
+_version_column_maps = {}
+
 
 # ---------- Utilities ----------
+class VersionedMapperInfo:
+    """Mapper details used by the change detection of a versioned class.
+
+    Computed once per class when the mappers are configured, so that a flush doesn't
+    inspect the mapper of every changed object.
+    """
+
+    __slots__ = ('modified_keys', 'orphan_parent_keys', 'orphan_cascade_keys')
+
+    def __init__(self, cls):
+        """Initialize the mapper details of the given versioned class.
+
+        :param cls: The versioned class.
+        """
+        mapper = inspect(cls)
+
+        # keys of the columns and relationships whose changes create a new version
+        self.modified_keys = tuple(mapper.columns.keys()) + tuple(mapper.relationships.keys())
+
+        # backrefs of the many-to-one relationships whose reverse one-to-many relationship has cascade=delete-orphan
+        orphan_parent_keys = []
+        for r in mapper.relationships:
+            if r.direction.name == 'MANYTOONE' and r._reverse_property:
+                reverse_rel, *_ = r._reverse_property
+                if reverse_rel.backref is not None and 'delete-orphan' in reverse_rel._cascade:
+                    orphan_parent_keys.append(reverse_rel.backref)
+        self.orphan_parent_keys = tuple(orphan_parent_keys)
+
+        # one-to-many relationships with cascade="delete, delete-orphan"
+        self.orphan_cascade_keys = tuple(
+            r.key
+            for r in mapper.relationships
+            if r.direction.name == 'ONETOMANY' and 'delete' in r._cascade and 'delete-orphan' in r._cascade
+        )
+
+
+# Cache of versioned class -> VersionedMapperInfo
+_versioned_mapper_infos = {}
+
+
+def _get_versioned_mapper_info(cls):
+    """Return the mapper details of the given versioned class.
+
+    :param cls: The versioned class.
+    :return: The VersionedMapperInfo of the class.
+    """
+    mapper_info = _versioned_mapper_infos.get(cls)
+    if mapper_info is None:
+        mapper_info = _versioned_mapper_infos[cls] = VersionedMapperInfo(cls)
+    return mapper_info
+
+
 def _is_obj_modified(obj):
     """
     Check if the properties and relationships of the given object have been modified.
@@ -35,16 +99,10 @@ def _is_obj_modified(obj):
     :param obj: The object to inspect for changes.
     :return: True if any property or relationship has been modified, otherwise False.
     """
-    column_names = inspect(obj.__class__).columns.keys()
-    relationship_keys = inspect(obj.__class__).relationships.keys()
-
-    for key, attr in inspect(obj).attrs.items():
-        if key in column_names:
-            if attr.history.has_changes():
-                return True
-        if key in relationship_keys:
-            if attr.history.has_changes():
-                return True
+    attrs = inspect(obj).attrs
+    for key in _get_versioned_mapper_info(obj.__class__).modified_keys:
+        if attrs[key].history.has_changes():
+            return True
     return False
 
 
@@ -62,14 +120,16 @@ def _should_relationship_delete_orphan(session, obj):
     :param obj: The object to inspect for changes.
     :return: True if the above checks pass, otherwise False.
     """
-    should_delete = False
-    for r in inspect(obj.__class__).relationships:
-        if r.direction.name == 'MANYTOONE' and r._reverse_property:
-            reverse_rel, *_ = r._reverse_property
-            parent_obj = inspect(obj).committed_state.get(reverse_rel.backref, None)
-            if parent_obj in session.dirty:
-                should_delete = should_delete or "delete-orphan" in inspect(reverse_rel)._cascade
-    return should_delete
+    orphan_parent_keys = _get_versioned_mapper_info(obj.__class__).orphan_parent_keys
+    if not orphan_parent_keys:
+        return False
+
+    committed_state = inspect(obj).committed_state
+    for key in orphan_parent_keys:
+        parent_obj = committed_state.get(key, None)
+        if parent_obj in session.dirty:
+            return True
+    return False
 
 
 def _cascade_delete_relationship_orphans(session):
@@ -79,32 +139,32 @@ def _cascade_delete_relationship_orphans(session):
     structure is something like parent->child->grandchild->(...) and parent.remove(child) is used.
     
     Iterates through changed versioned objects and checks if:
-        1. The operation type is D (delete)
-        2. This object (considered the child) is an orphan that should be deleted.
-        3. The relationship from child to grandchild is one-to-many
-        4. The relationship from child to grandchild has cascade="delete, delete-orphan"
+        1. The relationship from child to grandchild is one-to-many
+        2. The relationship from child to grandchild has cascade="delete, delete-orphan"
+        3. This object (considered the child) is an orphan that should be deleted.
+        4. The operation type is D (delete)
 
     If all conditions are met, mark the grandchild object for deletion.
 
     :param session: The database session instance.
     """
     for obj in versioned_objects(session):
+        orphan_cascade_keys = _get_versioned_mapper_info(obj.__class__).orphan_cascade_keys
+        if not orphan_cascade_keys:
+            continue
         should_delete_orphan = _should_relationship_delete_orphan(session, obj)
+        if not should_delete_orphan:
+            continue
         operation_type = _get_operation_type(session, obj, should_delete_orphan)
-        for r in inspect(obj.__class__).relationships:
-            if (
-                operation_type == 'D' and
-                should_delete_orphan and
-                r.direction.name == 'ONETOMANY' and
-                'delete' in r._cascade and
-                'delete-orphan' in r._cascade
-            ):
-                with session.no_autoflush:
-                    relationship_objects = getattr(obj, r.key)
-                    if isinstance(relationship_objects, AppenderQuery):
-                        relationship_objects = relationship_objects.all()
-                    for r_obj in relationship_objects:
-                        session.delete(r_obj)
+        if operation_type != 'D':
+            continue
+        for key in orphan_cascade_keys:
+            with session.no_autoflush:
+                relationship_objects = getattr(obj, key)
+                if isinstance(relationship_objects, AppenderQuery):
+                    relationship_objects = relationship_objects.all()
+                for r_obj in relationship_objects:
+                    session.delete(r_obj)
 
 
 def _is_session_modified(session):
@@ -169,20 +229,7 @@ def _create_version(session, target, operation_type):
     ).scalar_one_or_none()
 
     # Prepare new version data
-    new_version_data = {
-        'id': target.id,
-        'transaction_id': transaction_id,
-        'end_transaction_id': None,
-        'operation_type': {'I': 0, 'U': 1, 'D': 2}.get(operation_type, 1)
-    }
-
-    mapper = inspect(target.__class__)
-
-    for column in mapper.columns:
-        if column.name not in ['transaction_id', 'end_transaction_id', 'operation_type']:
-            property_name = mapper.get_property_by_column(column).key
-            if hasattr(target, property_name):
-                new_version_data[column.name] = getattr(target, property_name)
+    new_version_data = _get_version_data(target, operation_type, transaction_id)
 
     if existing_version:
         # Update the existing version
@@ -210,6 +257,95 @@ def _create_version(session, target, operation_type):
     )
 
 
+def _create_versions(session, changed_objects):
+    """Create and update the versioned records of the changed objects in bulk.
+
+    Objects are grouped by class. Each group is written with one multi-row
+    INSERT ... ON CONFLICT (id, transaction_id) DO UPDATE, and the previous versions
+    are closed with one set-based UPDATE, per batch of VERSION_BATCH_SIZE objects.
+
+    :param session: The database session instance.
+    :param changed_objects: List of (object, operation type) tuples.
+    :return: None
+    """
+    if not session or not changed_objects:
+        return
+
+    transaction_manager = TransactionManager(session)
+    transaction_id = transaction_manager.get_current_transaction_id()
+
+    if transaction_id is None:
+        print('\033[31mError - Unable to create transaction for versioned objects\033[0m')
+        return
+
+    version_rows = {}
+    for target, operation_type in changed_objects:
+        version_rows.setdefault(target.__class__, []).append(
+            _get_version_data(target, operation_type, transaction_id)
+        )
+
+    for cls, rows in version_rows.items():
+        version_table = cls.__versioned_cls__.__table__
+        for i in range(0, len(rows), VERSION_BATCH_SIZE):
+            batch = rows[i:i + VERSION_BATCH_SIZE]
+
+            # Insert the new versions, or update the versions already written in this transaction
+            stmt = pg_insert(version_table).values(batch)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[version_table.c.id, version_table.c.transaction_id],
+                set_={name: stmt.excluded[name] for name in batch[0] if name not in ('id', 'transaction_id')}
+            )
+            session.execute(stmt)
+
+            # Close any open versions
+            session.execute(
+                update(version_table).
+                where(and_(
+                    version_table.c.id.in_([row['id'] for row in batch]),
+                    version_table.c.end_transaction_id.is_(None),
+                    version_table.c.transaction_id != transaction_id
+                )).
+                values(end_transaction_id=transaction_id)
+            )
+
+
+def _get_version_data(target, operation_type, transaction_id):
+    """Return the version record values for the given object.
+
+    :param target: The object to create version.
+    :param operation_type: The type of operation ('I', 'U', 'D') being performed on the object.
+    :param transaction_id: The current transaction id.
+    :return: Dict of version table column name to value.
+    """
+    version_data = {
+        'id': target.id,
+        'transaction_id': transaction_id,
+        'end_transaction_id': None,
+        'operation_type': OPERATION_TYPES.get(operation_type, 1)
+    }
+    for column_name, property_name in _get_version_column_map(target.__class__):
+        version_data[column_name] = getattr(target, property_name, None)
+    return version_data
+
+
+def _get_version_column_map(cls):
+    """Return the (column name, property name) pairs copied to the version record, cached per class.
+
+    :param cls: The versioned class.
+    :return: Tuple of (column name, property name) tuples.
+    """
+    column_map = _version_column_maps.get(cls)
+    if column_map is None:
+        mapper = inspect(cls)
+        column_map = tuple(
+            (column.name, mapper.get_property_by_column(column).key)
+            for column in mapper.columns
+            if column.name not in VERSION_COLUMNS
+        )
+        _version_column_maps[cls] = column_map
+    return column_map
+
+
 # ---------- Transaction Related Classes ----------
 class TransactionFactory:
     """Factory to create or return singleton Transaction model."""
@@ -316,10 +452,20 @@ def _before_flush(session, flush_context, instances):
 def _after_flush(session, flush_context):
     """Trigger after a flush operation to create version records for changed objects."""
     try:
+        changed_objects = []
         for obj in versioned_objects(session):
             should_delete_orphan = _should_relationship_delete_orphan(session, obj)
             operation_type = _get_operation_type(session, obj, should_delete_orphan)
             if operation_type:
+                changed_objects.append((obj, operation_type))
+
+        if not changed_objects:
+            return
+
+        if session.get_bind().dialect.name == 'postgresql':
+            _create_versions(session, changed_objects)
+        else:
+            for obj, operation_type in changed_objects:
                 _create_version(session, obj, operation_type)
     except Exception as e:
         raise e
@@ -414,6 +560,9 @@ class Versioned:
                     builder = RelationshipBuilder(cls, prop)
                     builder()
 
+            # Precompute the mapper details used by the change detection on flush
+            _versioned_mapper_infos[cls] = VersionedMapperInfo(cls)
+
             delattr(cls, '_pending_version_classes')
 
 
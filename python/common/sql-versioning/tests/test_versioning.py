@@ -15,9 +15,15 @@
 
 Test-Suite to ensure that the versioning extension is working as expected.
 """
+
+import os
+import time
+
 import pytest
+from sqlalchemy import event
 
 from sql_versioning import (version_class)
+from sql_versioning.versioning import _is_obj_modified
 from tests import (Model, User, Address, Location, Email, Setting, Item, Transaction)
 
 @pytest.mark.parametrize('test_name', ['CLASS','INSTANCE'])
@@ -346,3 +352,78 @@ def test_versioning_rollback(db, session):
     assert results_txn1[0] == results_txn2[0]
     assert results_user1[0] == results_user2[0]
     assert results_version1[0] == results_version2[0]
+
+
+def test_versioning_bulk(db, session):
+    """Test that the versions of many changed objects are written in bulk."""
+    users = [User(name=f'user{i}', emails=[Email(name=f'email{i}')]) for i in range(20)]
+    session.add_all(users)
+    session.commit()
+
+    statements = []
+
+    def count_version_statements(conn, cursor, statement, parameters, context, executemany):
+        if '_version' in statement:
+            statements.append(statement)
+
+    event.listen(session.bind, 'before_cursor_execute', count_version_statements)
+    try:
+        for user in users:
+            user.name = f'{user.name}-updated'
+        session.commit()
+    finally:
+        event.remove(session.bind, 'before_cursor_execute', count_version_statements)
+
+    # one upsert and one update closing the previous versions
+    assert len(statements) == 2
+
+    user_version = version_class(User)
+    results = session.query(user_version)\
+        .order_by(user_version.id, user_version.transaction_id)\
+        .all()
+    assert len(results) == 40
+    for initial, updated in zip(results[::2], results[1::2]):
+        assert initial.operation_type == 0
+        assert initial.end_transaction_id == updated.transaction_id
+        assert updated.operation_type == 1
+        assert updated.name == f'{initial.name}-updated'
+        assert updated.end_transaction_id is None
+
+    email_version = version_class(Email)
+    assert session.query(email_version).count() == 20
+
+
+def test_versioning_flush_many(db, session):
+    """Assert that the flush of 1k dirty versioned objects versions each of them once."""
+    users = [User(name=f'user{i}') for i in range(1000)]
+    session.add_all(users)
+    session.commit()
+
+    for user in users:
+        user.name = f'{user.name}-updated'
+    assert all(_is_obj_modified(user) for user in users)
+
+    session.flush()
+    session.commit()
+
+    user_version = version_class(User)
+    assert session.query(user_version).filter(user_version.operation_type == 1).count() == 1000
+    assert session.query(user_version).filter(user_version.end_transaction_id.is_(None)).count() == 1000
+
+
+@pytest.mark.skipif(not os.getenv('RUN_BENCHMARKS'), reason='Benchmarks are only run when requested.')
+def test_versioning_flush_many_benchmark(db, session):
+    """Report the time to flush 1k dirty versioned objects."""
+    users = [User(name=f'user{i}') for i in range(1000)]
+    session.add_all(users)
+    session.commit()
+
+    for user in users:
+        user.name = f'{user.name}-updated'
+    start = time.perf_counter()
+    session.flush()
+    flush_time = time.perf_counter() - start
+    session.commit()
+
+    # the timing depends on the runner and the database, so it is reported rather than asserted
+    print(f'\nflush of {len(users)} dirty versioned objects: {flush_time:.4f}s')
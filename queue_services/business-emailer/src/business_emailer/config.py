@@ -100,6 +100,11 @@ class Config:  # pylint: disable=too-few-public-methods
     PAY_API_URL = os.getenv("PAY_API_URL", "") + os.getenv("PAY_API_VERSION", "") + "/payment-requests"
     AUTH_URL = os.getenv("AUTH_API_URL", "") + os.getenv("AUTH_API_VERSION", "")
 
+    # Email attachments
+    ATTACHMENT_FETCH_MAX_WORKERS = int(os.getenv("ATTACHMENT_FETCH_MAX_WORKERS", "4"))
+    ATTACHMENT_REQUEST_TIMEOUT = int(os.getenv("ATTACHMENT_REQUEST_TIMEOUT", "120"))
+    ATTACHMENT_CACHE_MAX_SIZE = int(os.getenv("ATTACHMENT_CACHE_MAX_SIZE", "64"))
+
     # POSTGRESQL
     DB_USER = os.getenv("DATABASE_USERNAME", "")
     DB_PASSWORD = os.getenv("DATABASE_PASSWORD", "")
@@ -136,6 +141,7 @@ class TestConfig(Config):  # pylint: disable=too-few-public-methods
     DEPLOYMENT_ENV = "testing"
     LEGAL_API_URL = "https://legal-api-url/"
     PAY_API_URL = "https://pay-api-url/"
+    ATTACHMENT_CACHE_MAX_SIZE = 0
     SQLALCHEMY_DATABASE_URI = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{int(DB_PORT)}/{DB_NAME}"
     TEMPLATE_PATH = os.getenv("TEMPLATE_PATH", "src/business_emailer/email_templates")
     DASHBOARD_URL = os.getenv("DASHBOARD_URL", "https://dev.bcregistry.ca/businesses/")
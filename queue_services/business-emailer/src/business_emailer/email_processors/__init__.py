@@ -18,6 +18,10 @@ Processors hold the business logic for how an email is interpreted and sent.
 from __future__ import annotations
 
 import base64
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from http import HTTPStatus
 from pathlib import Path
@@ -225,24 +229,138 @@ def get_jurisdictions(identifier: str, token: str) -> dict:
         return None
 
 
-def get_filing_document(business_identifier, filing_id, document_type, token):
-    """Get the filing documents."""
-    headers = {
-        "Accept": "application/pdf",
-        "Authorization": f"Bearer {token}"
-    }
+@dataclass
+class _Attachment:
+    """A pdf to attach to the email, and the request to get it."""
 
-    document = requests.get(
-        f'{current_app.config.get("LEGAL_API_URL")}/businesses/{business_identifier}/filings/{filing_id}'
-        f'/documents/{document_type}', headers=headers
-    )
+    file_name: str
+    document_type: str
+    method: str
+    url: str
+    expected_status: HTTPStatus
+    json: dict | None = None
+    file_bytes: str | None = None
 
-    if document.status_code != HTTPStatus.OK:
-        current_app.logger.error("Failed to get %s pdf for filing: %s", document_type, filing_id)
-        return None
-    try:
-        filing_pdf_encoded = base64.b64encode(document.content)
-        return filing_pdf_encoded
-    except Exception:
-        current_app.logger.error("Failed to get document response")
-        return None
+
+class _DocumentCache:
+    """Bounded LRU of the fetched documents (base64 encoded) per filing id, status, resubmission and document type."""
+
+    def __init__(self):
+        self._documents: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> str | None:
+        with self._lock:
+            if (document := self._documents.get(key)) is not None:
+                self._documents.move_to_end(key)
+            return document
+
+    def set(self, key: tuple, document: str):
+        if (max_size := current_app.config.get("ATTACHMENT_CACHE_MAX_SIZE", 0)) <= 0:
+            return
+        with self._lock:
+            self._documents[key] = document
+            self._documents.move_to_end(key)
+            while len(self._documents) > max_size:
+                self._documents.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._documents.clear()
+
+
+document_cache = _DocumentCache()
+_session = requests.Session()
+
+
+class AttachmentFetcher:
+    """Fetch the pdfs attached to a filing email concurrently.
+
+    The pdfs are requested on a shared keep-alive session, each with a timeout (ATTACHMENT_REQUEST_TIMEOUT), by up to
+    ATTACHMENT_FETCH_MAX_WORKERS threads. They are numbered (attachOrder) in the order they were added, skipping the
+    ones that could not be fetched, and cached so a redelivered email does not render them again.
+    """
+
+    def __init__(self, token: str, filing: Filing, business_identifier: str | None = None):
+        """Create the fetcher of the filing (business_identifier is the identifier used for the documents)."""
+        self._token = token
+        self._filing = filing
+        self._business_identifier = business_identifier
+        self._attachments: list[_Attachment] = []
+
+    def add_filing_document(self, file_name: str, document_type: str):
+        """Add the filing document rendered by the legal api."""
+        self._attachments.append(_Attachment(
+            file_name=file_name,
+            document_type=document_type,
+            method="GET",
+            url=f'{current_app.config.get("LEGAL_API_URL")}/businesses/{self._business_identifier}'
+                f"/filings/{self._filing.id}/documents/{document_type}",
+            expected_status=HTTPStatus.OK
+        ))
+
+    def add_receipt(self, file_name: str, receipt_json: dict):
+        """Add the receipt of the filing payment rendered by the pay api."""
+        self._attachments.append(_Attachment(
+            file_name=file_name,
+            document_type="receipt",
+            method="POST",
+            url=f'{current_app.config.get("PAY_API_URL")}/{self._filing.payment_token}/receipts',
+            expected_status=HTTPStatus.CREATED,
+            json=receipt_json
+        ))
+
+    def fetch(self) -> list:
+        """Return the pdfs in the order they were added, fetching the ones not cached."""
+        headers = {
+            "Accept": "application/pdf",
+            "Authorization": f"Bearer {self._token}"
+        }
+        timeout = current_app.config.get("ATTACHMENT_REQUEST_TIMEOUT")
+        uncached = []
+        for attachment in self._attachments:
+            if (file_bytes := document_cache.get(self._cache_key(attachment))) is not None:
+                attachment.file_bytes = file_bytes
+            else:
+                uncached.append(attachment)
+
+        if uncached:
+            max_workers = max(min(current_app.config.get("ATTACHMENT_FETCH_MAX_WORKERS", 1), len(uncached)), 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(_session.request, attachment.method, attachment.url, json=attachment.json,
+                                           headers=headers, timeout=timeout)
+                           for attachment in uncached]
+                for attachment, future in zip(uncached, futures, strict=True):
+                    self._set_file_bytes(attachment, future)
+
+        pdfs = []
+        for attachment in self._attachments:
+            if attachment.file_bytes is None:
+                continue
+            pdfs.append(
+                {
+                    "fileName": attachment.file_name,
+                    "fileBytes": attachment.file_bytes,
+                    "fileUrl": "",
+                    "attachOrder": str(len(pdfs) + 1)
+                }
+            )
+        return pdfs
+
+    def _cache_key(self, attachment: _Attachment) -> tuple:
+        return self._filing.id, self._filing.status, self._filing.resubmission_date, attachment.document_type
+
+    def _set_file_bytes(self, attachment: _Attachment, future):
+        try:
+            response = future.result()
+            if response.status_code != attachment.expected_status:
+                current_app.logger.error("Failed to get %s pdf for filing: %s", attachment.document_type,
+                                         self._filing.id)
+                return
+            attachment.file_bytes = base64.b64encode(response.content).decode("utf-8")
+        except Exception as err:
+            # the email is sent without the attachment, as when the document could not be rendered
+            current_app.logger.error("Failed to get %s pdf for filing: %s, %s", attachment.document_type,
+                                     self._filing.id, err)
+            return
+        document_cache.set(self._cache_key(attachment), attachment.file_bytes)
@@ -12,17 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Email processing rules and actions for Cease Receiver notifications."""
-import base64
 import re
-from http import HTTPStatus
 from pathlib import Path
 
-import requests
 from flask import current_app
 from jinja2 import Template
 
 from business_emailer.email_processors import (
-    get_filing_document,
+    AttachmentFetcher,
     get_filing_info,
     get_recipient_from_auth,
     substitute_template_parts,
@@ -94,26 +91,10 @@ def _get_pdfs(
     filing_date_time: str,
     effective_date: str) -> list:
     """Get the PDFs for the Cease Receiver output."""
-    pdfs = []
-    attach_order = 1
-    headers = {
-        "Accept": "application/pdf",
-        "Authorization": f"Bearer {token}"
-    }
+    attachments = AttachmentFetcher(token, filing, business["identifier"])
 
     # add filing PDF
-    filing_pdf_type = "ceaseReceiver"
-    filing_pdf_encoded = get_filing_document(business["identifier"], filing.id, filing_pdf_type, token)
-    if filing_pdf_encoded:
-        pdfs.append(
-            {
-                "fileName": "Cease Receiver.pdf",
-                "fileBytes": filing_pdf_encoded.decode("utf-8"),
-                "fileUrl": "",
-                "attachOrder": str(attach_order)
-            }
-        )
-        attach_order += 1
+    attachments.add_filing_document("Cease Receiver.pdf", "ceaseReceiver")
 
     # add receipt PDF
     corp_name = business.get("legalName")
@@ -121,26 +102,14 @@ def _get_pdfs(
         business_data = None
     else:
         business_data = Business.find_by_internal_id(filing.business_id)
-    receipt = requests.post(
-        f'{current_app.config.get("PAY_API_URL")}/{filing.payment_token}/receipts',
-        json={
+    attachments.add_receipt(
+        "Receipt.pdf",
+        {
             "corpName": corp_name,
             "filingDateTime": filing_date_time,
             "effectiveDateTime": effective_date if effective_date else "",
             "filingIdentifier": str(filing.id),
             "businessNumber": business_data.tax_id if business_data and business_data.tax_id else ""
-        }, headers=headers)
-
-    if receipt.status_code != HTTPStatus.CREATED:
-        current_app.logger.error("Failed to get receipt pdf for filing: %s", filing.id)
-    else:
-        receipt_encoded = base64.b64encode(receipt.content)
-        pdfs.append(
-            {
-                "fileName": "Receipt.pdf",
-                "fileBytes": receipt_encoded.decode("utf-8"),
-                "fileUrl": "",
-                "attachOrder": str(attach_order)
-            })
-        attach_order += 1
-    return pdfs
+        }
+    )
+    return attachments.fetch()
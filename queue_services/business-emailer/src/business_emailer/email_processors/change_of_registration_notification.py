@@ -14,17 +14,14 @@
 """Email processing rules and actions for Change of Registration notifications."""
 from __future__ import annotations
 
-import base64
 import re
-from http import HTTPStatus
 from pathlib import Path
 
-import requests
 from flask import current_app
 from jinja2 import Template
 
 from business_emailer.email_processors import (
-    get_filing_document,
+    AttachmentFetcher,
     get_filing_info,
     get_user_email_from_auth,
     substitute_template_parts,
@@ -40,71 +37,30 @@ def _get_pdfs( # noqa: PLR0913
     filing_date_time: str,
     effective_date: str
 ) -> list:
-    # pylint: disable=too-many-locals, too-many-branches, too-many-statements, too-many-arguments
+    # pylint: disable=too-many-arguments
     """Get the outputs for the change of registration notification."""
-    pdfs = []
-    attach_order = 1
-    headers = {
-        "Accept": "application/pdf",
-        "Authorization": f"Bearer {token}"
-    }
+    attachments = AttachmentFetcher(token, filing, business["identifier"])
 
     if status == Filing.Status.PAID.value:
         # add filing pdf
-        filing_pdf_type = "changeOfRegistration"
-        filing_pdf_encoded = get_filing_document(business["identifier"], filing.id, filing_pdf_type, token)
-        if filing_pdf_encoded:
-            pdfs.append(
-                {
-                    "fileName": "Change of Registration.pdf",
-                    "fileBytes": filing_pdf_encoded.decode("utf-8"),
-                    "fileUrl": "",
-                    "attachOrder": str(attach_order)
-                }
-            )
-            attach_order += 1
+        attachments.add_filing_document("Change of Registration.pdf", "changeOfRegistration")
 
         corp_name = business.get("legalName")
         business_data = Business.find_by_internal_id(filing.business_id)
-        receipt = requests.post(
-            f'{current_app.config.get("PAY_API_URL")}/{filing.payment_token}/receipts',
-            json={
+        attachments.add_receipt(
+            "Receipt.pdf",
+            {
                 "corpName": corp_name,
                 "filingDateTime": filing_date_time,
                 "effectiveDateTime": effective_date if effective_date != filing_date_time else "",
                 "filingIdentifier": str(filing.id),
                 "businessNumber": business_data.tax_id if business_data and business_data.tax_id else ""
-            },
-            headers=headers
+            }
         )
-        if receipt.status_code != HTTPStatus.CREATED:
-            current_app.logger.error("Failed to get receipt pdf for filing: %s", filing.id)
-        else:
-            receipt_encoded = base64.b64encode(receipt.content)
-            pdfs.append(
-                {
-                    "fileName": "Receipt.pdf",
-                    "fileBytes": receipt_encoded.decode("utf-8"),
-                    "fileUrl": "",
-                    "attachOrder": str(attach_order)
-                }
-            )
-            attach_order += 1
     elif status == Filing.Status.COMPLETED.value:
         # add amended registration statement
-        certificate_pdf_type = "amendedRegistrationStatement"
-        certificate_encoded = get_filing_document(business["identifier"], filing.id, certificate_pdf_type, token)
-        if certificate_encoded:
-            pdfs.append(
-                {
-                    "fileName": "AmendedRegistrationStatement.pdf",
-                    "fileBytes": certificate_encoded.decode("utf-8"),
-                    "fileUrl": "",
-                    "attachOrder": str(attach_order)
-                }
-            )
-            attach_order += 1
-    return pdfs
+        attachments.add_filing_document("AmendedRegistrationStatement.pdf", "amendedRegistrationStatement")
+    return attachments.fetch()
 
 
 def process(email_info: dict, token: str) -> dict:  # pylint: disable=too-many-locals, , too-many-branches
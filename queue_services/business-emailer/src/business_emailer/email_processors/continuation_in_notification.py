@@ -14,19 +14,16 @@
 """Email processing rules and actions for Continuation In notifications."""
 from __future__ import annotations
 
-import base64
 import re
-from http import HTTPStatus
 from pathlib import Path
 
 import pycountry
-import requests
 from flask import current_app
 from jinja2 import Template
 
 from business_emailer.email_processors import (
+    AttachmentFetcher,
     get_entity_dashboard_url,
-    get_filing_document,
     get_filing_info,
     get_recipients,
     substitute_template_parts,
@@ -42,105 +39,41 @@ def _get_pdfs( # noqa: PLR0913
     filing_date_time: str,
     effective_date: str
 ) -> list:
-    # pylint: disable=too-many-locals, too-many-branches, too-many-statements, too-many-arguments
+    # pylint: disable=too-many-arguments
     """Get the outputs for the Continuation In notification."""
-    pdfs = []
-    attach_order = 1
-    headers = {
-        "Accept": "application/pdf",
-        "Authorization": f"Bearer {token}"
-    }
+    attachments = AttachmentFetcher(token, filing, business["identifier"])
 
     if status == Filing.Status.PAID.value:
         # add filing pdf
-        filing_pdf_type = "continuationIn"
-        filing_pdf_encoded = get_filing_document(business["identifier"], filing.id, filing_pdf_type, token)
-        if filing_pdf_encoded:
-            pdfs.append(
-                {
-                    "fileName": "Continuation Application - Pending.pdf",
-                    "fileBytes": filing_pdf_encoded.decode("utf-8"),
-                    "fileUrl": "",
-                    "attachOrder": str(attach_order)
-                }
-            )
-            attach_order += 1
+        attachments.add_filing_document("Continuation Application - Pending.pdf", "continuationIn")
 
         # add receipt
         if not (corp_name := business.get("legalName")):  # pylint: disable=superfluous-parens
             legal_type = business.get("legalType")
             corp_name = Business.BUSINESSES.get(legal_type, {}).get("numberedDescription")
 
-        receipt = requests.post(
-            f'{current_app.config.get("PAY_API_URL")}/{filing.payment_token}/receipts',
-            json={
+        attachments.add_receipt(
+            "Receipt.pdf",
+            {
                 "corpName": corp_name,
                 "filingDateTime": filing_date_time,
                 "effectiveDateTime": effective_date if effective_date != filing_date_time else "",
                 "filingIdentifier": str(filing.id),
                 "businessNumber": business.get("taxId", "")
-            },
-            headers=headers
+            }
         )
-        if receipt.status_code != HTTPStatus.CREATED:
-            current_app.logger.error("Failed to get receipt pdf for filing: %s", filing.id)
-        else:
-            receipt_encoded = base64.b64encode(receipt.content)
-            pdfs.append(
-                {
-                    "fileName": "Receipt.pdf",
-                    "fileBytes": receipt_encoded.decode("utf-8"),
-                    "fileUrl": "",
-                    "attachOrder": str(attach_order)
-                }
-            )
-            attach_order += 1
 
     elif status == "RESUBMITTED":
         # add filing pdf
-        filing_pdf_type = "continuationIn"
-        filing_pdf_encoded = get_filing_document(business["identifier"], filing.id, filing_pdf_type, token)
-        if filing_pdf_encoded:
-            pdfs.append(
-                {
-                    "fileName": "Continuation Application - Resubmitted.pdf",
-                    "fileBytes": filing_pdf_encoded.decode("utf-8"),
-                    "fileUrl": "",
-                    "attachOrder": str(attach_order)
-                }
-            )
-            attach_order += 1
+        attachments.add_filing_document("Continuation Application - Resubmitted.pdf", "continuationIn")
 
     elif status == Filing.Status.COMPLETED.value:
         # add certificate of continuation
-        certificate_pdf_type = "certificateOfContinuation"
-        certificate_encoded = get_filing_document(business["identifier"], filing.id, certificate_pdf_type, token)
-        if certificate_encoded:
-            pdfs.append(
-                {
-                    "fileName": "Certificate of Continuation.pdf",
-                    "fileBytes": certificate_encoded.decode("utf-8"),
-                    "fileUrl": "",
-                    "attachOrder": str(attach_order)
-                }
-            )
-            attach_order += 1
-
+        attachments.add_filing_document("Certificate of Continuation.pdf", "certificateOfContinuation")
         # add notice of articles
-        noa_pdf_type = "noticeOfArticles"
-        noa_encoded = get_filing_document(business["identifier"], filing.id, noa_pdf_type, token)
-        if noa_encoded:
-            pdfs.append(
-                {
-                    "fileName": "Notice of Articles.pdf",
-                    "fileBytes": noa_encoded.decode("utf-8"),
-                    "fileUrl": "",
-                    "attachOrder": str(attach_order)
-                }
-            )
-            attach_order += 1
-
-    return pdfs
+        attachments.add_filing_document("Notice of Articles.pdf", "noticeOfArticles")
+
+    return attachments.fetch()
 
 
 def process(email_info: dict, token: str) -> dict:  # pylint: disable=too-many-locals, , too-many-branches
@@ -14,16 +14,13 @@
 """Email processing rules and actions for Correction notifications."""
 from __future__ import annotations
 
-import base64
 import re
-from http import HTTPStatus
 from pathlib import Path
 
-import requests
 from flask import current_app
 from jinja2 import Template
 
-from business_emailer.email_processors import get_filing_document, get_filing_info, substitute_template_parts
+from business_emailer.email_processors import AttachmentFetcher, get_filing_info, substitute_template_parts
 from business_emailer.email_processors.special_resolution_helper import get_completed_pdfs
 from business_emailer.filing_helper import is_special_resolution_correction_by_filing_json
 from business_model.models import Business, Filing
@@ -53,14 +50,9 @@ def _get_pdfs( # noqa: PLR0913
     filing_date_time: str,
     effective_date: str,
     name_changed: bool) -> list:
-    # pylint: disable=too-many-locals, too-many-branches, too-many-statements, too-many-arguments
+    # pylint: disable=too-many-arguments
     """Get the outputs for the correction notification."""
-    pdfs = []
-    attach_order = 1
-    headers = {
-        "Accept": "application/pdf",
-        "Authorization": f"Bearer {token}"
-    }
+    attachments = AttachmentFetcher(token, filing, business["identifier"])
     legal_type = business.get("legalType")
     is_cp_special_resolution = legal_type == "CP" and is_special_resolution_correction_by_filing_json(
         filing.filing_json["filing"]
@@ -68,79 +60,33 @@ def _get_pdfs( # noqa: PLR0913
 
     if status == Filing.Status.PAID.value:
         # add filing pdf
-        filing_pdf_type = "correction"
-        filing_pdf_encoded = get_filing_document(business["identifier"], filing.id, filing_pdf_type, token)
-        if filing_pdf_encoded:
-            pdfs.append(
-                {
-                    "fileName": "Register Correction Application.pdf",
-                    "fileBytes": filing_pdf_encoded.decode("utf-8"),
-                    "fileUrl": "",
-                    "attachOrder": str(attach_order)
-                }
-            )
-            attach_order += 1
+        attachments.add_filing_document("Register Correction Application.pdf", "correction")
 
         corp_name = business.get("legalName")
-        receipt = requests.post(
-            f'{current_app.config.get("PAY_API_URL")}/{filing.payment_token}/receipts',
-            json={
+        attachments.add_receipt(
+            "Receipt.pdf",
+            {
                 "corpName": corp_name,
                 "filingDateTime": filing_date_time,
                 "effectiveDateTime": effective_date if effective_date != filing_date_time else "",
                 "filingIdentifier": str(filing.id),
                 "businessNumber": business.get("taxId", "")
-            },
-            headers=headers
+            }
         )
-        if receipt.status_code != HTTPStatus.CREATED:
-            current_app.logger.error("Failed to get receipt pdf for filing: %s", filing.id)
-        else:
-            receipt_encoded = base64.b64encode(receipt.content)
-            pdfs.append(
-                {
-                    "fileName": "Receipt.pdf",
-                    "fileBytes": receipt_encoded.decode("utf-8"),
-                    "fileUrl": "",
-                    "attachOrder": str(attach_order)
-                }
-            )
-            attach_order += 1
     elif status == Filing.Status.COMPLETED.value:
         if legal_type in ("SP", "GP"):
             # add corrected registration statement
-            certificate_pdf_type = "correctedRegistrationStatement"
-            certificate_encoded = get_filing_document(business["identifier"], filing.id, certificate_pdf_type, token)
-            if certificate_encoded:
-                pdfs.append(
-                    {
-                        "fileName": "Corrected - Registration Statement.pdf",
-                        "fileBytes": certificate_encoded.decode("utf-8"),
-                        "fileUrl": "",
-                        "attachOrder": str(attach_order)
-                    }
-                )
-                attach_order += 1
+            attachments.add_filing_document("Corrected - Registration Statement.pdf",
+                                            "correctedRegistrationStatement")
         elif legal_type in Business.CORPS:
             # add notice of articles
-            noa_pdf_type = "noticeOfArticles"
-            noa_encoded = get_filing_document(business["identifier"], filing.id, noa_pdf_type, token)
-            if noa_encoded:
-                pdfs.append(
-                    {
-                        "fileName": "Notice of Articles.pdf",
-                        "fileBytes": noa_encoded.decode("utf-8"),
-                        "fileUrl": "",
-                        "attachOrder": str(attach_order)
-                    }
-                )
-                attach_order += 1
+            attachments.add_filing_document("Notice of Articles.pdf", "noticeOfArticles")
         elif is_cp_special_resolution:
             rules_changed = bool(filing.filing_json["filing"]["correction"].get("rulesFileKey"))
             memorandum_changed = bool(filing.filing_json["filing"]["correction"].get("memorandumFileKey"))
-            pdfs = get_completed_pdfs(token, business, filing, name_changed,
+            return get_completed_pdfs(token, business, filing, name_changed,
                                       rules_changed=rules_changed, memorandum_changed=memorandum_changed)
-    return pdfs
+    return attachments.fetch()
 
 
 def _get_template(prefix: str, status: str, filing_type: str, filing: Filing,  # pylint: disable=too-many-arguments  # noqa: PLR0913
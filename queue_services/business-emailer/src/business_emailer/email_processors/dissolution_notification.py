@@ -14,17 +14,14 @@
 """Email processing rules and actions for Dissolution Application notifications."""
 from __future__ import annotations
 
-import base64
 import re
-from http import HTTPStatus
 from pathlib import Path
 
-import requests
 from flask import current_app
 from jinja2 import Template
 
 from business_emailer.email_processors import (
-    get_filing_document,
+    AttachmentFetcher,
     get_filing_info,
     get_recipient_from_auth,
     get_user_email_from_auth,
@@ -33,7 +30,7 @@ from business_emailer.email_processors import (
 from business_model.models import Business, Filing, UserRoles
 
 
-def _get_pdfs( # noqa: PLR0913,PLR0912
+def _get_pdfs( # noqa: PLR0913
     status: str,
     token: str,
     business: dict,
@@ -41,121 +38,43 @@ def _get_pdfs( # noqa: PLR0913,PLR0912
     filing_date_time: str,
     effective_date: str
 ) -> list:
-    # pylint: disable=too-many-locals, too-many-branches, too-many-statements, too-many-arguments
+    # pylint: disable=too-many-arguments
     """Get the pdfs for the dissolution output."""
-    pdfs = []
-    attach_order = 1
-    headers = {
-        "Accept": "application/pdf",
-        "Authorization": f"Bearer {token}"
-    }
+    attachments = AttachmentFetcher(token, filing, business["identifier"])
     legal_type = business.get("legalType")
 
     if status == Filing.Status.PAID.value:
         # add filing pdf
         if legal_type not in ["SP", "GP"]:
-            filing_pdf_type = "dissolution"
-            filing_pdf_encoded = get_filing_document(business["identifier"], filing.id, filing_pdf_type, token)
-            if filing_pdf_encoded:
-                pdfs.append(
-                    {
-                        "fileName": "Voluntary Dissolution Application.pdf",
-                        "fileBytes": filing_pdf_encoded.decode("utf-8"),
-                        "fileUrl": "",
-                        "attachOrder": str(attach_order)
-                    }
-                )
-                attach_order += 1
+            attachments.add_filing_document("Voluntary Dissolution Application.pdf", "dissolution")
 
         corp_name = business.get("legalName")
         business_data = Business.find_by_internal_id(filing.business_id)
-        receipt = requests.post(
-            f'{current_app.config.get("PAY_API_URL")}/{filing.payment_token}/receipts',
-            json={
+        attachments.add_receipt(
+            "Receipt.pdf",
+            {
                 "corpName": corp_name,
                 "filingDateTime": filing_date_time,
                 "effectiveDateTime": effective_date if effective_date != filing_date_time else "",
                 "filingIdentifier": str(filing.id),
                 "businessNumber": business_data.tax_id if business_data and business_data.tax_id else ""
-            },
-            headers=headers
+            }
         )
-        if receipt.status_code != HTTPStatus.CREATED:
-            current_app.logger.error("Failed to get receipt pdf for filing: %s", filing.id)
-        else:
-            receipt_encoded = base64.b64encode(receipt.content)
-            pdfs.append(
-                {
-                    "fileName": "Receipt.pdf",
-                    "fileBytes": receipt_encoded.decode("utf-8"),
-                    "fileUrl": "",
-                    "attachOrder": str(attach_order)
-                }
-            )
-            attach_order += 1
     elif status == Filing.Status.COMPLETED.value:
         if legal_type in ["SP", "GP"]:
-            filing_pdf_type = "dissolution"
-            filing_pdf_encoded = get_filing_document(business["identifier"], filing.id, filing_pdf_type, token)
-            if filing_pdf_encoded:
-                pdfs.append(
-                    {
-                        "fileName": "Statement of Dissolution.pdf",
-                        "fileBytes": filing_pdf_encoded.decode("utf-8"),
-                        "fileUrl": "",
-                        "attachOrder": str(attach_order)
-                    }
-                )
-                attach_order += 1
+            attachments.add_filing_document("Statement of Dissolution.pdf", "dissolution")
         else:
             if filing.filing_sub_type != "administrative":
                 # add certificateOfDissolution, suppress certificate of dissolution for admin dissolution
-                certificate_pdf_type = "certificateOfDissolution"
-                certificate_encoded = get_filing_document(business["identifier"], filing.id,
-                                                          certificate_pdf_type, token)
-                if certificate_encoded:
-                    pdfs.append(
-                        {
-                            "fileName": "Certificate of Dissolution.pdf",
-                            "fileBytes": certificate_encoded.decode("utf-8"),
-                            "fileUrl": "",
-                            "attachOrder": str(attach_order)
-                        }
-                    )
-                    attach_order += 1
+                attachments.add_filing_document("Certificate of Dissolution.pdf", "certificateOfDissolution")
 
             if legal_type == Business.LegalTypes.COOP.value:
                 # certifiedAffidavit
-                certified_affidavit_pdf_type = "affidavit"
-                certified_affidavit_encoded = get_filing_document(business["identifier"], filing.id,
-                                                                  certified_affidavit_pdf_type, token)
-                if certified_affidavit_encoded:
-                    pdfs.append(
-                        {
-                            "fileName": "Certified Affidavit.pdf",
-                            "fileBytes": certified_affidavit_encoded.decode("utf-8"),
-                            "fileUrl": "",
-                            "attachOrder": str(attach_order)
-                        }
-                    )
-                    attach_order += 1
-
+                attachments.add_filing_document("Certified Affidavit.pdf", "affidavit")
                 # specialResolution
-                special_resolution_pdf_type = "specialResolution"
-                special_resolution_encoded = get_filing_document(business["identifier"], filing.id,
-                                                                 special_resolution_pdf_type, token)
-                if special_resolution_encoded:
-                    pdfs.append(
-                        {
-                            "fileName": "Certified Special Resolution.pdf",
-                            "fileBytes": special_resolution_encoded.decode("utf-8"),
-                            "fileUrl": "",
-                            "attachOrder": str(attach_order)
-                        }
-                    )
-                    attach_order += 1
-
-    return pdfs
+                attachments.add_filing_document("Certified Special Resolution.pdf", "specialResolution")
+
+    return attachments.fetch()
 
 
 def process(email_info: dict, token: str) -> dict:  # pylint: disable=too-many-locals, , too-many-branches, # noqa: PLR0912
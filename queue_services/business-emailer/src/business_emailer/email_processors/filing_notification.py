@@ -14,18 +14,15 @@
 """Email processing rules and actions for Incorporation Application notifications."""
 from __future__ import annotations
 
-import base64
 import re
-from http import HTTPStatus
 from pathlib import Path
 
-import requests
 from flask import current_app
 from jinja2 import Template
 
 from business_emailer.email_processors import (
+    AttachmentFetcher,
     get_entity_dashboard_url,
-    get_filing_document,
     get_filing_info,
     get_recipients,
     get_user_email_from_auth,
@@ -42,7 +39,7 @@ FILING_TYPE_CONVERTER = {
 }
 
 
-def _get_pdfs( # noqa: PLR0913,PLR0912,PLR0915
+def _get_pdfs( # noqa: PLR0913
     status: str,
     token: str,
     business: dict,
@@ -50,143 +47,54 @@ def _get_pdfs( # noqa: PLR0913,PLR0912,PLR0915
     filing_date_time: str,
     effective_date: str
 ) -> list:
-    # pylint: disable=too-many-locals, too-many-branches, too-many-statements, too-many-arguments
+    # pylint: disable=too-many-arguments
     """Get the pdfs for the incorporation output."""
-    pdfs = []
-    attach_order = 1
-    headers = {
-        "Accept": "application/pdf",
-        "Authorization": f"Bearer {token}"
-    }
+    attachments = AttachmentFetcher(token, filing, business["identifier"])
     legal_type = business.get("legalType")
 
     if status == Filing.Status.PAID.value:
         # add filing pdf
-        filing_pdf_encoded = get_filing_document(business["identifier"], filing.id, filing.filing_type, token)
-        if filing_pdf_encoded:
-            file_name = filing.filing_type[0].upper() + \
-                        " ".join(re.findall("[a-zA-Z][^A-Z]*", filing.filing_type[1:]))
-            if ar_date := filing.filing_json["filing"].get("annualReport", {}).get("annualReportDate"):
-                file_name = f"{ar_date[:4]} {file_name}"
-
-            pdfs.append(
-                {
-                    "fileName": f"{file_name}.pdf",
-                    "fileBytes": filing_pdf_encoded.decode("utf-8"),
-                    "fileUrl": "",
-                    "attachOrder": str(attach_order)
-                }
-            )
-            attach_order += 1
+        file_name = filing.filing_type[0].upper() + \
+                    " ".join(re.findall("[a-zA-Z][^A-Z]*", filing.filing_type[1:]))
+        if ar_date := filing.filing_json["filing"].get("annualReport", {}).get("annualReportDate"):
+            file_name = f"{ar_date[:4]} {file_name}"
+        attachments.add_filing_document(f"{file_name}.pdf", filing.filing_type)
 
         # add receipt pdf
         if not (corp_name := business.get("legalName")):  # pylint: disable=superfluous-parens
             legal_type = business.get("legalType")
             corp_name = Business.BUSINESSES.get(legal_type, {}).get("numberedDescription")
 
-        receipt = requests.post(
-            f'{current_app.config.get("PAY_API_URL")}/{filing.payment_token}/receipts',
-            json={
+        attachments.add_receipt(
+            "Receipt.pdf",
+            {
                 "corpName": corp_name,
                 "filingDateTime": filing_date_time,
                 "effectiveDateTime": effective_date if effective_date != filing_date_time else "",
                 "filingIdentifier": str(filing.id),
                 "businessNumber": business.get("taxId", "")
-            },
-            headers=headers
+            }
         )
-        if receipt.status_code != HTTPStatus.CREATED:
-            current_app.logger.error("Failed to get receipt pdf for filing: %s", filing.id)
-        else:
-            receipt_encoded = base64.b64encode(receipt.content)
-            pdfs.append(
-                {
-                    "fileName": "Receipt.pdf",
-                    "fileBytes": receipt_encoded.decode("utf-8"),
-                    "fileUrl": "",
-                    "attachOrder": str(attach_order)
-                }
-            )
-            attach_order += 1
     elif status == Filing.Status.COMPLETED.value:
         if legal_type != Business.LegalTypes.COOP.value:
             # add notice of articles
-            noa_pdf_type = "noticeOfArticles"
-            noa_encoded = get_filing_document(business["identifier"], filing.id, noa_pdf_type, token)
-            if noa_encoded:
-                pdfs.append(
-                    {
-                        "fileName": "Notice of Articles.pdf",
-                        "fileBytes": noa_encoded.decode("utf-8"),
-                        "fileUrl": "",
-                        "attachOrder": str(attach_order)
-                    }
-                )
-                attach_order += 1
+            attachments.add_filing_document("Notice of Articles.pdf", "noticeOfArticles")
 
         if filing.filing_type == "incorporationApplication":
             # add certificate
-            certificate_pdf_type = "certificateOfIncorporation"
-            certificate_encoded = get_filing_document(business["identifier"], filing.id, certificate_pdf_type, token)
-            if certificate_encoded:
-                file_name = "Certificate Of Incorporation.pdf"
-                pdfs.append(
-                    {
-                        "fileName": file_name,
-                        "fileBytes": certificate_encoded.decode("utf-8"),
-                        "fileUrl": "",
-                        "attachOrder": str(attach_order)
-                    }
-                )
-                attach_order += 1
+            attachments.add_filing_document("Certificate Of Incorporation.pdf", "certificateOfIncorporation")
 
             if legal_type == Business.LegalTypes.COOP.value:
                 # Add rules
-                rules_pdf_type = "certifiedRules"
-                certified_rules_encoded = get_filing_document(business["identifier"], filing.id, rules_pdf_type, token)
-                if certified_rules_encoded:
-                    pdfs.append(
-                        {
-                            "fileName": "Certified Rules.pdf",
-                            "fileBytes": certified_rules_encoded.decode("utf-8"),
-                            "fileUrl": "",
-                            "attachOrder": str(attach_order)
-                        }
-                    )
-                    attach_order += 1
-
+                attachments.add_filing_document("Certified Rules.pdf", "certifiedRules")
                 # Add memorandum
-                memorandum_pdf_type = "memorandum"
-                certified_memorandum_encoded = get_filing_document(business["identifier"], filing.id,
-                                                                   memorandum_pdf_type, token)
-                if certified_memorandum_encoded:
-                    pdfs.append(
-                        {
-                            "fileName": "Certified Memorandum.pdf",
-                            "fileBytes": certified_memorandum_encoded.decode("utf-8"),
-                            "fileUrl": "",
-                            "attachOrder": str(attach_order)
-                        }
-                    )
-                    attach_order += 1
+                attachments.add_filing_document("Certified Memorandum.pdf", "memorandum")
 
         if filing.filing_type == "alteration" and get_additional_info(filing).get("nameChange", False):
             # add certificate of name change
-            certificate_pdf_type = "certificateOfNameChange"
-            certificate_encoded = get_filing_document(business["identifier"], filing.id, certificate_pdf_type, token)
-            if certificate_encoded:
-                file_name = "Certificate of Name Change.pdf"
-                pdfs.append(
-                    {
-                        "fileName": file_name,
-                        "fileBytes": certificate_encoded.decode("utf-8"),
-                        "fileUrl": "",
-                        "attachOrder": str(attach_order)
-                    }
-                )
-                attach_order += 1
+            attachments.add_filing_document("Certificate of Name Change.pdf", "certificateOfNameChange")
 
-    return pdfs
+    return attachments.fetch()
 
 
 def process(  # pylint: disable=too-many-locals, too-many-statements, too-many-branches # noqa: PLR0912
@@ -14,15 +14,12 @@
 """Email processing rules and actions for Restoration Application notifications."""
 from __future__ import annotations
 
-import base64
 import re
-from http import HTTPStatus
 
-import requests
 from flask import current_app
 from jinja2 import Environment, FileSystemLoader
 
-from business_emailer.email_processors import get_filing_document, get_filing_info
+from business_emailer.email_processors import AttachmentFetcher, get_filing_info
 from business_model.models import Business, CorpType, Filing
 
 
@@ -30,39 +27,13 @@ def _get_completed_pdfs(
     token: str,
     business: dict,
     filing: Filing) -> list:
-    # pylint: disable=too-many-locals, too-many-branches, too-many-statements, too-many-arguments
     """Get the pdfs for the restoration output."""
-    pdfs = []
-    attach_order = 1
-
+    attachments = AttachmentFetcher(token, filing, business["identifier"])
     # add notice of articles
-    noa_pdf_type = "noticeOfArticles"
-    noa_encoded = get_filing_document(business["identifier"], filing.id, noa_pdf_type, token)
-    if noa_encoded:
-        pdfs.append(
-            {
-                "fileName": "Notice of Articles.pdf",
-                "fileBytes": noa_encoded.decode("utf-8"),
-                "fileUrl": "",
-                "attachOrder": str(attach_order)
-            }
-        )
-        attach_order += 1
+    attachments.add_filing_document("Notice of Articles.pdf", "noticeOfArticles")
     # add certificate of restoration
-    certificate_pdf_type = "certificateOfRestoration"
-    certificate_encoded = get_filing_document(business["identifier"], filing.id, certificate_pdf_type, token)
-    if certificate_encoded:
-        pdfs.append(
-            {
-                "fileName": "Certificate of Restoration.pdf",
-                "fileBytes": certificate_encoded.decode("utf-8"),
-                "fileUrl": "",
-                "attachOrder": str(attach_order)
-            }
-        )
-        attach_order += 1
-
-    return pdfs
+    attachments.add_filing_document("Certificate of Restoration.pdf", "certificateOfRestoration")
+    return attachments.fetch()
 
 
 def _get_paid_pdfs(
@@ -71,56 +42,25 @@ def _get_paid_pdfs(
     filing: Filing,
     filing_date_time: str,
     effective_date: str) -> list:
-    # pylint: disable=too-many-locals, too-many-branches, too-many-statements, too-many-arguments
+    # pylint: disable=too-many-arguments
     """Get the pdfs for the restoration output."""
-    pdfs = []
-    attach_order = 1
-    headers = {
-        "Accept": "application/pdf",
-        "Authorization": f"Bearer {token}"
-    }
+    attachments = AttachmentFetcher(token, filing, business["identifier"])
+    attachments.add_filing_document("Restoration Application.pdf", "restoration")
 
-    filing_pdf_type = "restoration"
-    filing_pdf_encoded = get_filing_document(business["identifier"], filing.id, filing_pdf_type, token)
-    if filing_pdf_encoded:
-        pdfs.append(
-            {
-                "fileName": "Restoration Application.pdf",
-                "fileBytes": filing_pdf_encoded.decode("utf-8"),
-                "fileUrl": "",
-                "attachOrder": str(attach_order)
-            }
-        )
-        attach_order += 1
     name_request = filing.json["filing"]["restoration"]["nameRequest"]
     corp_name = name_request.get("legalName")
     business_data = Business.find_by_internal_id(filing.business_id)
-    receipt = requests.post(
-        f'{current_app.config.get("PAY_API_URL")}/{filing.payment_token}/receipts',
-        json={
+    attachments.add_receipt(
+        "Receipt.pdf",
+        {
             "corpName": corp_name,
             "filingDateTime": filing_date_time,
             "effectiveDateTime": effective_date if effective_date != filing_date_time else "",
             "filingIdentifier": str(filing.id),
             "businessNumber": business_data.tax_id if business_data and business_data.tax_id else ""
-        },
-        headers=headers
+        }
     )
-    if receipt.status_code != HTTPStatus.CREATED:
-        current_app.logger.error("Failed to get receipt pdf for filing: %s", filing.id)
-    else:
-        receipt_encoded = base64.b64encode(receipt.content)
-        pdfs.append(
-            {
-                "fileName": "Receipt.pdf",
-                "fileBytes": receipt_encoded.decode("utf-8"),
-                "fileUrl": "",
-                "attachOrder": str(attach_order)
-            }
-        )
-        attach_order += 1
-
-    return pdfs
+    return attachments.fetch()
 
 
 def process(email_info: dict, token: str) -> dict:  # pylint: disable=too-many-locals, , too-many-branches
@@ -12,13 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Common functions relate to Special Resolution."""
-import base64
-from http import HTTPStatus
-
-import requests
-from flask import current_app
-
-from business_emailer.email_processors import get_filing_document
+from business_emailer.email_processors import AttachmentFetcher
 from business_model.models import Business, Filing
 
 
@@ -30,75 +24,26 @@ def get_completed_pdfs( # noqa: PLR0913
     rules_changed=False,
     memorandum_changed=False
 ) -> list:
-    # pylint: disable=too-many-locals, too-many-branches, too-many-statements, too-many-arguments
+    # pylint: disable=too-many-arguments
     """Get the completed pdfs for the special resolution output."""
-    pdfs = []
-    attach_order = 1
+    attachments = AttachmentFetcher(token, filing, business["identifier"])
 
     # specialResolution
-    special_resolution_pdf_type = "specialResolution"
-    special_resolution_encoded = get_filing_document(business["identifier"], filing.id,
-                                                     special_resolution_pdf_type, token)
-    if special_resolution_encoded:
-        pdfs.append(
-            {
-                "fileName": "Special Resolution.pdf",
-                "fileBytes": special_resolution_encoded.decode("utf-8"),
-                "fileUrl": "",
-                "attachOrder": str(attach_order)
-            }
-        )
-        attach_order += 1
+    attachments.add_filing_document("Special Resolution.pdf", "specialResolution")
 
     # Change of Name
     if name_changed:
-        certified_name_change_pdf_type = "certificateOfNameChange"
-        certified_name_change_encoded = get_filing_document(business["identifier"], filing.id,
-                                                            certified_name_change_pdf_type, token)
-
-        if certified_name_change_encoded:
-            pdfs.append(
-                {
-                    "fileName": "Certificate of Name Change.pdf",
-                    "fileBytes": certified_name_change_encoded.decode("utf-8"),
-                    "fileUrl": "",
-                    "attachOrder": str(attach_order)
-                }
-            )
-            attach_order += 1
+        attachments.add_filing_document("Certificate of Name Change.pdf", "certificateOfNameChange")
 
     # Certified Rules
     if rules_changed:
-        rules_pdf_type = "certifiedRules"
-        certified_rules_encoded = get_filing_document(business["identifier"], filing.id, rules_pdf_type, token)
-        if certified_rules_encoded:
-            pdfs.append(
-                {
-                    "fileName": "Certified Rules.pdf",
-                    "fileBytes": certified_rules_encoded.decode("utf-8"),
-                    "fileUrl": "",
-                    "attachOrder": str(attach_order)
-                }
-            )
-            attach_order += 1
+        attachments.add_filing_document("Certified Rules.pdf", "certifiedRules")
 
     # Certified Memorandum
     if memorandum_changed:
-        certified_memorandum_pdf_type = "certifiedMemorandum"
-        certified_memorandum_encoded = get_filing_document(business["identifier"], filing.id,
-                                                           certified_memorandum_pdf_type, token)
-        if certified_memorandum_encoded:
-            pdfs.append(
-                {
-                    "fileName": "Certified Memorandum.pdf",
-                    "fileBytes": certified_memorandum_encoded.decode("utf-8"),
-                    "fileUrl": "",
-                    "attachOrder": str(attach_order)
-                }
-            )
-            attach_order += 1
+        attachments.add_filing_document("Certified Memorandum.pdf", "certifiedMemorandum")
 
-    return pdfs
+    return attachments.fetch()
 
 
 def get_paid_pdfs(
@@ -107,56 +52,23 @@ def get_paid_pdfs(
     filing: Filing,
     filing_date_time: str,
     effective_date: str) -> list:
-    # pylint: disable=too-many-locals, too-many-branches, too-many-statements, too-many-arguments
+    # pylint: disable=too-many-arguments
     """Get the paid pdfs for the special resolution output."""
-    pdfs = []
-    attach_order = 1
-    headers = {
-        "Accept": "application/pdf",
-        "Authorization": f"Bearer {token}"
-    }
+    attachments = AttachmentFetcher(token, filing, business["identifier"])
 
     # add filing pdf
-    sr_filing_pdf_type = "specialResolutionApplication"
-    sr_filing_pdf_encoded = get_filing_document(business["identifier"], filing.id, sr_filing_pdf_type, token)
-    if sr_filing_pdf_encoded:
-        pdfs.append(
-            {
-                "fileName": "Special Resolution Application.pdf",
-                "fileBytes": sr_filing_pdf_encoded.decode("utf-8"),
-                "fileUrl": "",
-                "attachOrder": str(attach_order)
-            }
-        )
-        attach_order += 1
+    attachments.add_filing_document("Special Resolution Application.pdf", "specialResolutionApplication")
 
     legal_name = business.get("legalName")
     origin_business = Business.find_by_internal_id(filing.business_id)
-
-    sr_receipt = requests.post(
-        f'{current_app.config.get("PAY_API_URL")}/{filing.payment_token}/receipts',
-        json={
+    attachments.add_receipt(
+        "Receipt.pdf",
+        {
             "corpName": legal_name,
             "filingDateTime": filing_date_time,
             "effectiveDateTime": effective_date if effective_date != filing_date_time else "",
             "filingIdentifier": str(filing.id),
             "businessNumber": origin_business.tax_id if origin_business and origin_business.tax_id else ""
-        },
-        headers=headers
+        }
     )
-
-    if sr_receipt.status_code != HTTPStatus.CREATED:
-        current_app.logger.error("Failed to get receipt pdf for filing: %s", filing.id)
-    else:
-        receipt_encoded = base64.b64encode(sr_receipt.content)
-        pdfs.append(
-            {
-                "fileName": "Receipt.pdf",
-                "fileBytes": receipt_encoded.decode("utf-8"),
-                "fileUrl": "",
-                "attachOrder": str(attach_order)
-            }
-        )
-        attach_order += 1
-
-    return pdfs
+    return attachments.fetch()
@@ -19,7 +19,7 @@ from unittest.mock import patch
 import pytest
 import requests_mock
 
-from business_emailer.email_processors import restoration_notification
+from business_emailer.email_processors import document_cache, restoration_notification
 from tests.unit import prep_restoration_filing
 
 
@@ -78,6 +78,48 @@ def test_paid_restoration_notification_includes_receipt_and_restoration_applicat
         assert base64.b64decode(output['content']['attachments'][1]['fileBytes']).decode('utf-8') == 'pdf_content_1'
 
 
+def test_completed_restoration_notification_skips_failed_attachments(session, config):
+    """Assert that an attachment that fails to render is skipped and the others are numbered in order."""
+    filing = prep_restoration_filing(BUS_ID, '1', 'BC', LEGAL_NAME)
+    with requests_mock.Mocker() as m:
+        m.get(f'{config.get("LEGAL_API_URL")}/businesses/{BUS_ID}/filings/{filing.id}/documents/noticeOfArticles',
+              status_code=500)
+        m.get(f'{config.get("LEGAL_API_URL")}/businesses/{BUS_ID}/filings/{filing.id}'
+              '/documents/certificateOfRestoration',
+              content=b'pdf_content_2')
+        output = restoration_notification.process({
+            'filingId': filing.id,
+            'type': 'restoration',
+            'option': 'COMPLETED'
+        }, TOKEN)
+        attachments = output['content']['attachments']
+        assert len(attachments) == 1
+        assert attachments[0]['fileName'] == 'Certificate of Restoration.pdf'
+        assert attachments[0]['attachOrder'] == '1'
+
+
+def test_completed_restoration_notification_attachments_cached(session, config):
+    """Assert that the attachments are rendered once when the email is processed again."""
+    filing = prep_restoration_filing(BUS_ID, '1', 'BC', LEGAL_NAME)
+    document_cache.clear()
+    with patch.dict(config, {'ATTACHMENT_CACHE_MAX_SIZE': 2}), requests_mock.Mocker() as m:
+        noa_mock = m.get(f'{config.get("LEGAL_API_URL")}/businesses/{BUS_ID}/filings/{filing.id}'
+                         '/documents/noticeOfArticles',
+                         content=b'pdf_content_1')
+        m.get(f'{config.get("LEGAL_API_URL")}/businesses/{BUS_ID}/filings/{filing.id}'
+              '/documents/certificateOfRestoration',
+              content=b'pdf_content_2')
+        for _ in range(2):
+            output = restoration_notification.process({
+                'filingId': filing.id,
+                'type': 'restoration',
+                'option': 'COMPLETED'
+            }, TOKEN)
+            assert [attachment['attachOrder'] for attachment in output['content']['attachments']] == ['1', '2']
+        assert noa_mock.call_count == 1
+    document_cache.clear()
+
+
 def test_completed_full_restoration_notification(session, config):
     """Test completed full restoration notification."""
     # setup filing + business for email
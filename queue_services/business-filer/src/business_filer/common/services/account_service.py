@@ -2,7 +2,7 @@ import json
 from http import HTTPStatus
 from typing import ClassVar
 
-import requests
+from business_account.http_client import http_client
 from flask import current_app
 
 from business_filer.common.services.flag_manager import Flags
@@ -11,7 +11,7 @@ from business_filer.common.services.flag_manager import Flags
 class AccountService:
     """Wrapper to call Authentication Services.
 
-    @TODO Cache and refresh / retry token as needed to reduce calls.
+    Calls go through the shared http client, which pools the connections and caches the service account token.
     """
 
     BEARER: str = "Bearer "
@@ -29,19 +29,8 @@ class AccountService:
         client_id = current_app.config.get("ACCOUNT_SVC_CLIENT_ID")
         client_secret = current_app.config.get("ACCOUNT_SVC_CLIENT_SECRET")
 
-        data = "grant_type=client_credentials"
-
-        # get service account token
-        res = requests.post(url=token_url,
-                            data=data,
-                            headers={"content-type": "application/x-www-form-urlencoded"},
-                            auth=(client_id, client_secret),
-                            timeout=cls.timeout)
-
-        try:
-            return res.json().get("access_token")
-        except Exception:
-            return None
+        # get service account token, cached until shortly before it expires
+        return http_client.get_service_account_token(token_url, client_id, client_secret, timeout=cls.timeout)
 
     @classmethod
     def create_affiliation(cls, account: int, # noqa: PLR0913
@@ -72,7 +61,7 @@ class AccountService:
         if corp_sub_type_code:
             entity_data["corpSubTypeCode"] = corp_sub_type_code
 
-        entity_record = requests.post(
+        entity_record = http_client.post(
             url=account_svc_entity_url,
             headers={**cls.CONTENT_TYPE_JSON,
                      "Authorization": cls.BEARER + token},
@@ -93,7 +82,7 @@ class AccountService:
         }
         if details:
             affiliate_data["entityDetails"] = details
-        affiliate = requests.post(
+        affiliate = http_client.post(
             url=account_svc_affiliate_url,
             headers=headers,
             data=json.dumps(affiliate_data),
@@ -129,7 +118,7 @@ class AccountService:
         if state:
             entity_data["state"] = state
 
-        entity_record = requests.patch(
+        entity_record = http_client.patch(
             url=account_svc_entity_url + "/" + business_registration,
             headers={**cls.CONTENT_TYPE_JSON,
                      "Authorization": cls.BEARER + token},
@@ -154,14 +143,14 @@ class AccountService:
         token = cls.get_bearer_token()
 
         # Delete an account:business affiliation
-        affiliate = requests.delete(
+        affiliate = http_client.delete(
             url=account_svc_affiliate_url + "/" + business_registration,
             headers={**cls.CONTENT_TYPE_JSON,
                      "Authorization": cls.BEARER + token},
             timeout=cls.timeout
         )
         # Delete an entity record
-        entity_record = requests.delete(
+        entity_record = http_client.delete(
             url=account_svc_entity_url + "/" + business_registration,
             headers={**cls.CONTENT_TYPE_JSON,
                      "Authorization": cls.BEARER + token},
@@ -185,7 +174,7 @@ class AccountService:
         if Flags.is_on("enable-sandbox"):
             current_app.logger.info("Appending Environment-Override = sandbox header to get account affiliation info")
             headers["Environment-Override"] = "sandbox"
-        res = requests.get(url=url, headers=headers)
+        res = http_client.get(url=url, headers=headers)
         try:
             return res.json()
         except Exception:
@@ -204,7 +193,7 @@ class AccountService:
             current_app.logger.error("Not Authorized")
             return None
 
-        affiliates = requests.get(
+        affiliates = http_client.get(
             url=account_svc_affiliate_url,
             headers={**cls.CONTENT_TYPE_JSON,
                      "Authorization": cls.BEARER + token},
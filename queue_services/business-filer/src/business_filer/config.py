@@ -84,6 +84,21 @@ class _Config:  # pylint: disable=too-few-public-methods
     SUB_AUDIENCE = os.getenv("SUB_AUDIENCE", "")
     SUB_SERVICE_ACCOUNT = os.getenv("SUB_SERVICE_ACCOUNT", "")
 
+    # Pull consumer (pull_worker.py)
+    BUSINESS_FILER_SUBSCRIPTION = os.getenv("BUSINESS_FILER_SUBSCRIPTION", "")
+    PULL_MAX_MESSAGES = int(os.getenv("PULL_MAX_MESSAGES", "50"))
+    PULL_MAX_WORKERS = int(os.getenv("PULL_MAX_WORKERS", "4"))
+    PULL_ACK_DEADLINE = int(os.getenv("PULL_ACK_DEADLINE", "60"))
+
+    # Outbox dispatcher (outbox_worker.py)
+    OUTBOX_INLINE_DISPATCH = os.getenv("OUTBOX_INLINE_DISPATCH", "True").lower() == "true"
+    OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "50"))
+    OUTBOX_MAX_WORKERS = int(os.getenv("OUTBOX_MAX_WORKERS", "4"))
+    OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "5"))
+    OUTBOX_RETRY_DELAY = int(os.getenv("OUTBOX_RETRY_DELAY", "60"))
+    OUTBOX_LEASE_SECONDS = int(os.getenv("OUTBOX_LEASE_SECONDS", "300"))
+    OUTBOX_POLL_INTERVAL = int(os.getenv("OUTBOX_POLL_INTERVAL", "5"))
+
     AUDIENCE = os.getenv("AUDIENCE", "https://pubsub.googleapis.com/google.pubsub.v1.Subscriber")
     PUBLISHER_AUDIENCE = os.getenv("PUBLISHER_AUDIENCE", "https://pubsub.googleapis.com/google.pubsub.v1.Publisher")
 
@@ -45,6 +45,7 @@ from business_filer.filing_processors.filing_components import (
     create_party,
     create_role,
     filings,
+    set_changed_values,
     update_address,
 )
 
@@ -121,14 +122,16 @@ def update_parties(business: Business, parties: dict, change_filing_rec: Filing)
 def _update_party(party_info):
     party = Party.find_by_id(party_id=party_info.get("officer").get("id"))
     if party:
-        party.first_name = party_info["officer"].get("firstName", "").upper()
-        party.last_name = party_info["officer"].get("lastName", "").upper()
-        party.middle_initial = party_info["officer"].get("middleName", "").upper()
-        party.title = party_info.get("title", "").upper()
-        party.organization_name = party_info["officer"].get("organizationName", "").upper()
-        party.party_type = party_info["officer"].get("partyType")
-        party.email = party_info["officer"].get("email", "").lower()
-        party.identifier = party_info["officer"].get("identifier", "").upper()
+        set_changed_values(party, {
+            "first_name": party_info["officer"].get("firstName", "").upper(),
+            "last_name": party_info["officer"].get("lastName", "").upper(),
+            "middle_initial": party_info["officer"].get("middleName", "").upper(),
+            "title": party_info.get("title", "").upper(),
+            "organization_name": party_info["officer"].get("organizationName", "").upper(),
+            "party_type": party_info["officer"].get("partyType"),
+            "email": party_info["officer"].get("email", "").lower(),
+            "identifier": party_info["officer"].get("identifier", "").upper()
+        })
 
         # add addresses to party
         if party_info.get("deliveryAddress", None):
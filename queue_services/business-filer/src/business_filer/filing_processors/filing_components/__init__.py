@@ -79,18 +79,30 @@ def create_address(address_info: dict, address_type: str) -> Address:
     return address
 
 
+def set_changed_values(obj, new_values: dict):
+    """Set the new values that differ from the current ones.
+
+    An empty value is the same as no value, so a row is not versioned for a None replaced by an empty string.
+    """
+    for key, value in new_values.items():
+        if (getattr(obj, key) or "") != (value or ""):
+            setattr(obj, key, value)
+
+
 def update_address(address: Address, new_info: dict) -> Address:
     """Update address with new info."""
     if not new_info:
         return address
 
-    address.street = new_info.get("streetAddress") or ""
-    address.street_additional = new_info.get("streetAddressAdditional") or ""
-    address.city = new_info.get("addressCity") or ""
-    address.region = new_info.get("addressRegion") or ""
-    address.country = pycountry.countries.search_fuzzy(new_info.get("addressCountry"))[0].alpha_2
-    address.postal_code = new_info.get("postalCode") or ""
-    address.delivery_instructions = new_info.get("deliveryInstructions") or ""
+    set_changed_values(address, {
+        "street": new_info.get("streetAddress") or "",
+        "street_additional": new_info.get("streetAddressAdditional") or "",
+        "city": new_info.get("addressCity") or "",
+        "region": new_info.get("addressRegion") or "",
+        "country": pycountry.countries.search_fuzzy(new_info.get("addressCountry"))[0].alpha_2,
+        "postal_code": new_info.get("postalCode") or "",
+        "delivery_instructions": new_info.get("deliveryInstructions") or ""
+    })
 
     return address
 
@@ -145,6 +157,41 @@ def create_party(business_id: int, party_info: dict, create: bool = True) -> Par
     return party
 
 
+def update_party(party: Party, party_info: dict) -> Party:
+    """Update the party with the new info, only setting the changed fields."""
+    if not (middle_initial := party_info["officer"].get("middleInitial")):
+        middle_initial = party_info["officer"].get("middleName", "")
+
+    new_values = {
+        "first_name": party_info["officer"].get("firstName", "").upper(),
+        "last_name": party_info["officer"].get("lastName", "").upper(),
+        "middle_initial": middle_initial.upper(),
+        "title": party_info.get("title", "").upper(),
+        "organization_name": party_info["officer"].get("organizationName", "").upper(),
+        "email": party_info["officer"].get("email") or "",
+        "identifier": party_info["officer"].get("identifier") or "",
+        "party_type": party_info["officer"].get("partyType")
+    }
+    set_changed_values(party, new_values)
+
+    # an address the json omits is cleared, as a party created from the json would not have it
+    if delivery_address := party_info.get("deliveryAddress"):
+        if party.delivery_address:
+            update_address(party.delivery_address, delivery_address)
+        else:
+            party.delivery_address = create_address(delivery_address, Address.DELIVERY)
+    elif party.delivery_address:
+        party.delivery_address = None
+    if mailing_address := party_info.get("mailingAddress"):
+        if party.mailing_address:
+            update_address(party.mailing_address, mailing_address)
+        else:
+            party.mailing_address = create_address(mailing_address, Address.MAILING)
+    elif party.mailing_address:
+        party.mailing_address = None
+    return party
+
+
 def create_role(party: Party, role_info: dict) -> PartyRole:
     """Create a new party role and link to party."""
     party_role = PartyRole(
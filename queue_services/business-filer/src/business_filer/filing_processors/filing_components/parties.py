@@ -34,16 +34,40 @@
 """Manages the parties and party roles for a business."""
 from __future__ import annotations
 
-from business_model.models import Business, Filing, PartyRole
+from datetime import datetime
 
-from business_filer.filing_processors.filing_components import create_party, create_role
+from business_model.models import Business, Filing, Party, PartyRole
+from dateutil.parser import parse
 
+from business_filer.filing_processors.filing_components import (
+    JSON_ROLE_CONVERTER,
+    create_party,
+    create_role,
+    update_party,
+)
 
-def update_parties(business: Business, parties_structure: dict, filing: Filing, delete_existing=True) -> list | None:
+FILING_ROLE_TYPES = [
+    PartyRole.RoleTypes.COMPLETING_PARTY.value,
+    PartyRole.RoleTypes.INCORPORATOR.value,
+    PartyRole.RoleTypes.APPLICANT.value,
+]
+
+RETAINED_ROLE_TYPES = [
+    PartyRole.RoleTypes.OFFICER.value,
+    PartyRole.RoleTypes.RECEIVER.value,
+    PartyRole.RoleTypes.LIQUIDATOR.value,
+]
+
+
+def update_parties(business: Business, parties_structure: dict, filing: Filing, delete_existing=True,
+                   reconcile=False) -> list | None:
     """Manage the party and party roles for a business.
 
     Assumption: The structure has already been validated, upon submission.
 
+    If reconcile, the party roles are reconciled with the existing ones, instead of deleting and recreating all of
+    them.
+
     Other errors are recorded and will be managed out of band.
     """
     if not business:
@@ -52,7 +76,15 @@ def update_parties(business: Business, parties_structure: dict, filing: Filing,
 
     err = []
 
-    if parties_structure:
+    if parties_structure and reconcile:
+        try:
+            reconcile_parties(business, parties_structure, filing)
+        except KeyError:
+            err.append(
+                {"error_code": "FILER_UNABLE_TO_SAVE_PARTIES",
+                 "error_message": f"Filer: unable to save new parties for :'{business.identifier}'"}
+            )
+    elif parties_structure:
         if delete_existing:
             try:
                 delete_parties(business)
@@ -74,9 +106,7 @@ def update_parties(business: Business, parties_structure: dict, filing: Filing,
                         "cessationDate": role_type.get("cessationDate", None)
                     }
                     party_role = create_role(party=party, role_info=role)
-                    if party_role.role in [PartyRole.RoleTypes.COMPLETING_PARTY.value,
-                                           PartyRole.RoleTypes.INCORPORATOR.value,
-                                           PartyRole.RoleTypes.APPLICANT.value]:
+                    if party_role.role in FILING_ROLE_TYPES:
                         filing.filing_party_roles.append(party_role)
                     else:
                         business.party_roles.append(party_role)
@@ -92,9 +122,92 @@ def delete_parties(business: Business):
     """Delete the party_roles for a business."""
     if existing_party_roles := business.party_roles.all():
         for role in existing_party_roles:
-            if role.role not in [
-                PartyRole.RoleTypes.OFFICER.value,
-                PartyRole.RoleTypes.RECEIVER.value,
-                PartyRole.RoleTypes.LIQUIDATOR.value,
-            ]:
+            if role.role not in RETAINED_ROLE_TYPES:
                 business.party_roles.remove(role)
+
+
+def reconcile_parties(business: Business, parties_structure: list, filing: Filing):
+    """Reconcile the party roles of a business with the parties in the json.
+
+    The end state is the same as delete_parties followed by creating the parties and roles, but the parties are
+    matched to the existing ones by id, or else by name, and the roles by party and role type. The matched ones are
+    updated in place (only the changed rows get a new version), the new ones are created and the ones not in the json
+    are removed from the business. A party is matched once. The filing roles (completing party, incorporator,
+    applicant) always get a new party, which records them as of the filing.
+    """
+    unmatched_roles = [role for role in business.party_roles.all() if role.role not in RETAINED_ROLE_TYPES]
+    parties_by_id = {role.party.id: role.party for role in unmatched_roles if role.party}
+    parties_by_name = {_party_name_key(party): party for party in parties_by_id.values()}
+
+    for party_info in parties_structure:
+        role_infos = [{
+            "roleType": role_type.get("roleType", "").lower(),
+            "appointmentDate": role_type.get("appointmentDate", None),
+            "cessationDate": role_type.get("cessationDate", None)
+        } for role_type in party_info.get("roles")]
+        filing_role_infos = [role_info for role_info in role_infos
+                             if JSON_ROLE_CONVERTER.get(role_info["roleType"], "") in FILING_ROLE_TYPES]
+        business_role_infos = [role_info for role_info in role_infos if role_info not in filing_role_infos]
+
+        # the filing roles are recorded as of the filing, with their own party
+        if filing_role_infos:
+            filing_party = create_party(business_id=business.id, party_info=party_info, create=False)
+            for role_info in filing_role_infos:
+                filing.filing_party_roles.append(create_role(party=filing_party, role_info=role_info))
+
+        if not business_role_infos:
+            continue
+
+        # a party is matched once, another party in the json with the same name is a new party
+        if party := parties_by_id.get(party_info["officer"].get("id")) or \
+                parties_by_name.get(_party_info_name_key(party_info)):
+            parties_by_id.pop(party.id, None)
+            parties_by_name.pop(_party_name_key(party), None)
+            update_party(party, party_info)
+        else:
+            party = create_party(business_id=business.id, party_info=party_info, create=False)
+
+        for role_info in business_role_infos:
+            role = JSON_ROLE_CONVERTER.get(role_info["roleType"], "")
+            if party_role := _pop_matching_role(unmatched_roles, party, role, role_info):
+                if not _is_same_date(party_role.appointment_date, role_info["appointmentDate"]):
+                    party_role.appointment_date = role_info["appointmentDate"]
+                if not _is_same_date(party_role.cessation_date, role_info["cessationDate"]):
+                    party_role.cessation_date = role_info["cessationDate"]
+            else:
+                business.party_roles.append(create_role(party=party, role_info=role_info))
+
+    for party_role in unmatched_roles:
+        business.party_roles.remove(party_role)
+
+
+def _party_name_key(party: Party) -> tuple:
+    return ((party.first_name or "").upper(),
+            (party.middle_initial or "").upper(),
+            (party.last_name or "").upper(),
+            (party.organization_name or "").upper())
+
+
+def _party_info_name_key(party_info: dict) -> tuple:
+    officer = party_info["officer"]
+    return ((officer.get("firstName") or "").upper(),
+            (officer.get("middleInitial") or officer.get("middleName") or "").upper(),
+            (officer.get("lastName") or "").upper(),
+            (officer.get("organizationName") or "").upper())
+
+
+def _pop_matching_role(party_roles: list, party: Party, role: str, role_info: dict) -> PartyRole | None:
+    """Remove and return the role of the party, preferring the one with the same appointment date."""
+    candidates = [party_role for party_role in party_roles if party_role.party is party and party_role.role == role]
+    party_role = next((candidate for candidate in candidates
+                       if _is_same_date(candidate.appointment_date, role_info["appointmentDate"])),
+                      candidates[0] if candidates else None)
+    if party_role:
+        party_roles.remove(party_role)
+    return party_role
+
+
+def _is_same_date(current: datetime | None, new_date: str | None) -> bool:
+    if not current or not new_date:
+        return not current and not new_date
+    return current.date() == parse(new_date).date()
@@ -38,11 +38,14 @@ from business_model.models import Business, Resolution, ShareClass, ShareSeries
 from dateutil.parser import parse
 
 
-def update_share_structure(business: Business, share_structure: dict) -> list | None:
+def update_share_structure(business: Business, share_structure: dict, reconcile: bool = False) -> list | None:
     """Manage the share structure for a business.
 
     Assumption: The structure has already been validated, upon submission.
 
+    If reconcile, the share classes and series are reconciled with the existing ones, instead of deleting and
+    recreating all of them.
+
     Other errors are recorded and will be managed out of band.
     """
     if not business or not share_structure:
@@ -65,7 +68,15 @@ def update_share_structure(business: Business, share_structure: dict) -> list |
                      "error_message": f"Filer: invalid resolution date:'{resolution_dt}'"}
                 )
 
-    if share_classes := share_structure.get("shareClasses"):
+    if (share_classes := share_structure.get("shareClasses")) and reconcile:
+        try:
+            reconcile_share_classes(business, share_classes)
+        except KeyError:
+            err.append(
+                {"error_code": "FILER_UNABLE_TO_SAVE_SHARES",
+                 "error_message": f"Filer: unable to save new shares for :'{business.identifier}'"}
+            )
+    elif share_classes:
         try:
             delete_existing_shares(business)
         except:
@@ -165,6 +176,35 @@ def update_share_structure_correction(business: Business, share_structure: dict)
     return err
 
 
+def reconcile_share_classes(business: Business, share_classes: list):
+    """Reconcile the share classes and series of a business with the ones in the json.
+
+    The share classes and series are matched to the existing ones by id, or else by name. The matched ones are
+    updated in place (only the changed rows get a new version), the new ones are created and the ones not in the json
+    are deleted.
+    """
+    unmatched_share_classes = business.share_classes.all()
+    for share_class_info in share_classes:
+        if share_class := _pop_matching_entry(unmatched_share_classes, share_class_info, match_by_name=True):
+            update_share_class(share_class, share_class_info, match_by_name=True)
+        else:
+            business.share_classes.append(create_share_class(share_class_info))
+
+    for share_class in unmatched_share_classes:
+        business.share_classes.remove(share_class)
+
+
+def _pop_matching_entry(entries: list, entry_info: dict, match_by_name: bool = False):
+    """Remove and return the share class or series of the entries matching the json, by id or else by name."""
+    entry = next((item for item in entries if entry_info.get("id") and item.id == entry_info.get("id")), None)
+    if not entry and match_by_name:
+        name = (entry_info.get("name") or "").strip().upper()
+        entry = next((item for item in entries if (item.name or "").strip().upper() == name), None)
+    if entry:
+        entries.remove(entry)
+    return entry
+
+
 def delete_existing_shares(business: Business):
     """Delete the existing share classes and series for a business."""
     if existing_shares := business.share_classes.all():
@@ -217,8 +257,11 @@ def update_business_share_class(share_classes: list, business: Business, exclusi
     business.share_classes = inclusion_entries
 
 
-def update_share_class(share_class: ShareClass, share_class_info: dict):
-    """Update share class instance in db."""
+def update_share_class(share_class: ShareClass, share_class_info: dict, match_by_name: bool = False):
+    """Update share class instance in db.
+
+    The existing series are matched by id, or else by name if match_by_name.
+    """
     share_class.name = share_class_info["name"]
     share_class.priority = share_class_info["priority"]
     share_class.max_share_flag = share_class_info["hasMaximumShares"]
@@ -228,24 +271,14 @@ def update_share_class(share_class: ShareClass, share_class_info: dict):
     share_class.currency = share_class_info.get("currency")
     share_class.special_rights_flag = share_class_info["hasRightsOrRestrictions"]
 
-    # array of ids for share series instance from db
-    share_class_series_ids = []
-    if len(share_class.series) > 0:
-        share_class_series_ids = [series.id for series in share_class.series]
-
+    unmatched_series = list(share_class.series)
     inclusion_series = []
     # update existing series in db and create new series if not exist
     for series_info in share_class_info.get("series"):
-        series_id = series_info.get("id")
-        if series_id in share_class_series_ids:
-            series_index = share_class_series_ids.index(series_id)
-            series = share_class.series[series_index]
-            update_share_series(series_info, series)
-            inclusion_series.append(series)
-        else:
-            new_share_series = ShareSeries()
-            update_share_series(series_info, new_share_series)
-            inclusion_series.append(new_share_series)
+        if not (series := _pop_matching_entry(unmatched_series, series_info, match_by_name)):
+            series = ShareSeries()
+        update_share_series(series_info, series)
+        inclusion_series.append(series)
     share_class.series = inclusion_series
 
 
@@ -58,10 +58,10 @@ def process(business: Business, filing_rec: Filing, filing: dict, filing_meta: F
         update_offices(business, offices)
 
     if parties := transition_filing.get("parties"):
-        update_parties(business, parties, filing_rec)
+        update_parties(business, parties, filing_rec, reconcile=True)
 
     if share_structure := transition_filing["shareStructure"]:
-        shares.update_share_structure(business, share_structure)
+        shares.update_share_structure(business, share_structure, reconcile=True)
 
     if name_translations := transition_filing.get("nameTranslations"):
         aliases.update_aliases(business, name_translations)
@@ -79,9 +79,7 @@ from business_filer.filing_processors import (
     transition,
     transparency_register,
 )
-from business_filer.filing_processors.filing_components import business_profile, name_request
-from business_filer.services import Flags
-from business_filer.services.publish_event import PublishEvent
+from business_filer.services import Flags, outbox
 
 
 def get_filing_types(legal_filings: dict):
@@ -274,58 +272,20 @@ def process_filing(filing_message: FilingMessage): # noqa: PLR0915, PLR0912
         )
 
         db.session.add(filing_submission)
+        # the side effects are dispatched from the outbox once committed with the filing
+        db.session.flush()
+        outbox.add_filing_side_effects(business, filing_submission, filing_meta)
         db.session.commit()
 
-        if filing_submission.filing_type in [
-            FilingTypes.AMALGAMATIONAPPLICATION,
-            FilingTypes.CONTINUATIONIN,
-            # code says corps conversion creates a new business (not sure: why?, in use (not implemented in UI)?)
-            FilingTypes.CONVERSION,
-            FilingTypes.INCORPORATIONAPPLICATION,
-            FilingTypes.REGISTRATION
-        ]:
+        if filing_submission.filing_type in outbox.NEW_BUSINESS_FILING_TYPES:
             # update business id for new business
             filing_submission.business_id = business.id
             db.session.add(filing_submission)
             db.session.commit()
 
-            # update affiliation for new business
-            if filing_submission.filing_type != FilingTypes.CONVERSION:
-                business_profile.update_affiliation(business, filing_submission)
-
-            name_request.consume_nr(business, filing_submission)
-            business_profile.update_business_profile(business, filing_submission)
-            PublishEvent.publish_mras_email(current_app, business, filing_submission)
-        elif not Flags.is_on("enable-sandbox"):
-            for filing_type in filing_meta.legal_filings:
-                if filing_type in [
-                    FilingTypes.AMALGAMATIONOUT,
-                    FilingTypes.ALTERATION,
-                    FilingTypes.CHANGEOFREGISTRATION,
-                    FilingTypes.CONTINUATIONOUT,
-                    FilingTypes.CORRECTION,
-                    FilingTypes.DISSOLUTION,
-                    FilingTypes.PUTBACKON,
-                    FilingTypes.RESTORATION
-                ]:
-                    business_profile.update_entity(business, filing_type)
-
-                if filing_type in [
-                    FilingTypes.ALTERATION,
-                    FilingTypes.CHANGEOFREGISTRATION,
-                    FilingTypes.CHANGEOFNAME,
-                    FilingTypes.CORRECTION,
-                    FilingTypes.RESTORATION,
-                ]:
-                    name_request.consume_nr(business,
-                                            filing_submission,
-                                            filing_type=filing_type)
-                    if filing_type != FilingTypes.CHANGEOFNAME:
-                        business_profile.update_business_profile(business,
-                                                                    filing_submission,
-                                                                    filing_type)
-
-        if not Flags.is_on("enable-sandbox"):
-            PublishEvent.publish_email_message(current_app, business, filing_submission, filing_submission.status)
-
-        PublishEvent.publish_event(current_app, business, filing_submission)
+        if current_app.config.get("OUTBOX_INLINE_DISPATCH"):
+            try:
+                outbox.OutboxDispatcher(current_app._get_current_object()).dispatch_filing(filing_submission.id)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                # the events stay in the outbox, to be dispatched by outbox_worker.py
+                current_app.logger.error(f"Error dispatching the outbox events of filing {filing_submission.id}: {err}")
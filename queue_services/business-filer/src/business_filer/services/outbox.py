@@ -0,0 +1,262 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Transactional outbox of the side effects of a filing.
+
+The filer adds the side effects (auth, namex and the published events) to the outbox in the same transaction as the
+filing, instead of running them once the filing is committed. They are committed if and only if the filing is, and
+are not lost when the filer stops after the commit.
+
+The filer dispatches the events of the filing inline once it is committed (OutboxDispatcher.dispatch_filing), and
+the dispatcher of outbox_worker.py retries the events that failed or were not dispatched.
+
+Flow
+--------
+1. Claim up to OUTBOX_BATCH_SIZE due events, the next one of each filing
+2. Dispatch the events under OUTBOX_MAX_WORKERS threads
+3. Mark each event completed, or failed and retried with an exponential backoff (OUTBOX_RETRY_DELAY) until
+   OUTBOX_MAX_ATTEMPTS
+
+The events of a filing are dispatched one at a time, in the order they were added, as the filer ran them. Each event
+has an idempotency key, which is used as the id of the cloud events published for it, so the consumers can discard
+the duplicates of an event dispatched again.
+"""
+import threading
+import traceback
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+
+from business_model.models import Business, Filing, OutboxEvent, db
+from flask import Flask, current_app
+
+from business_filer.common.filing import FilingTypes
+from business_filer.filing_meta import FilingMeta
+from business_filer.filing_processors.filing_components import business_profile, name_request
+from business_filer.services import Flags
+from business_filer.services.publish_event import PublishEvent
+
+
+class OutboxEventTypes(str, Enum):
+    """Outbox event types."""
+
+    CONSUME_NR = "consumeNr"
+    PUBLISH_EMAIL = "publishEmail"
+    PUBLISH_EVENT = "publishEvent"
+    PUBLISH_MRAS_EMAIL = "publishMrasEmail"
+    UPDATE_AFFILIATION = "updateAffiliation"
+    UPDATE_BUSINESS_PROFILE = "updateBusinessProfile"
+    UPDATE_ENTITY = "updateEntity"
+
+
+NEW_BUSINESS_FILING_TYPES = [
+    FilingTypes.AMALGAMATIONAPPLICATION,
+    FilingTypes.CONTINUATIONIN,
+    # code says corps conversion creates a new business (not sure: why?, in use (not implemented in UI)?)
+    FilingTypes.CONVERSION,
+    FilingTypes.INCORPORATIONAPPLICATION,
+    FilingTypes.REGISTRATION
+]
+
+
+def add_outbox_event(business: Business | None, filing: Filing, event_type: OutboxEventTypes,
+                     filing_type: str | None = None, payload: dict | None = None) -> OutboxEvent:
+    """Add the event to the session, it is committed with the filing."""
+    key_parts = [str(filing.id), event_type.value] + ([filing_type] if filing_type else [])
+    outbox_event = OutboxEvent(
+        idempotency_key="-".join(key_parts),
+        event_type=event_type.value,
+        filing_id=filing.id,
+        business_id=business.id if business else None,
+        payload={**(payload or {}), **({"filingType": filing_type} if filing_type else {})} or None
+    )
+    db.session.add(outbox_event)
+    return outbox_event
+
+
+def add_filing_side_effects(business: Business | None, filing: Filing, filing_meta: FilingMeta):
+    """Add the side effects of the processed filing to the outbox, in the order they are dispatched in.
+
+    The business and filing must have been flushed, so they have their ids.
+    """
+    if filing.filing_type in NEW_BUSINESS_FILING_TYPES:
+        # update affiliation for new business
+        if filing.filing_type != FilingTypes.CONVERSION:
+            add_outbox_event(business, filing, OutboxEventTypes.UPDATE_AFFILIATION)
+
+        add_outbox_event(business, filing, OutboxEventTypes.CONSUME_NR)
+        add_outbox_event(business, filing, OutboxEventTypes.UPDATE_BUSINESS_PROFILE)
+        add_outbox_event(business, filing, OutboxEventTypes.PUBLISH_MRAS_EMAIL)
+    elif not Flags.is_on("enable-sandbox"):
+        for filing_type in filing_meta.legal_filings:
+            if filing_type in [
+                FilingTypes.AMALGAMATIONOUT,
+                FilingTypes.ALTERATION,
+                FilingTypes.CHANGEOFREGISTRATION,
+                FilingTypes.CONTINUATIONOUT,
+                FilingTypes.CORRECTION,
+                FilingTypes.DISSOLUTION,
+                FilingTypes.PUTBACKON,
+                FilingTypes.RESTORATION
+            ]:
+                add_outbox_event(business, filing, OutboxEventTypes.UPDATE_ENTITY, filing_type)
+
+            if filing_type in [
+                FilingTypes.ALTERATION,
+                FilingTypes.CHANGEOFREGISTRATION,
+                FilingTypes.CHANGEOFNAME,
+                FilingTypes.CORRECTION,
+                FilingTypes.RESTORATION,
+            ]:
+                add_outbox_event(business, filing, OutboxEventTypes.CONSUME_NR, filing_type)
+                if filing_type != FilingTypes.CHANGEOFNAME:
+                    add_outbox_event(business, filing, OutboxEventTypes.UPDATE_BUSINESS_PROFILE, filing_type)
+
+    if not Flags.is_on("enable-sandbox"):
+        add_outbox_event(business, filing, OutboxEventTypes.PUBLISH_EMAIL, payload={"option": filing.status})
+
+    add_outbox_event(business, filing, OutboxEventTypes.PUBLISH_EVENT)
+
+
+def _update_affiliation(business: Business, filing: Filing, _: OutboxEvent):
+    business_profile.update_affiliation(business, filing)
+
+
+def _consume_nr(business: Business, filing: Filing, outbox_event: OutboxEvent):
+    name_request.consume_nr(business, filing, filing_type=(outbox_event.payload or {}).get("filingType"))
+
+
+def _update_business_profile(business: Business, filing: Filing, outbox_event: OutboxEvent):
+    business_profile.update_business_profile(business, filing, (outbox_event.payload or {}).get("filingType"))
+
+
+def _update_entity(business: Business, _: Filing, outbox_event: OutboxEvent):
+    business_profile.update_entity(business, outbox_event.payload["filingType"])
+
+
+def _publish_mras_email(business: Business, filing: Filing, outbox_event: OutboxEvent):
+    PublishEvent.publish_mras_email(current_app, business, filing, outbox_event.idempotency_key)
+
+
+def _publish_email(business: Business, filing: Filing, outbox_event: OutboxEvent):
+    PublishEvent.publish_email_message(current_app, business, filing, outbox_event.payload["option"],
+                                       outbox_event.idempotency_key)
+
+
+def _publish_event(business: Business, filing: Filing, outbox_event: OutboxEvent):
+    PublishEvent.publish_event(current_app, business, filing, outbox_event.idempotency_key)
+
+
+HANDLERS: dict[str, Callable[[Business, Filing, OutboxEvent], None]] = {
+    OutboxEventTypes.CONSUME_NR.value: _consume_nr,
+    OutboxEventTypes.PUBLISH_EMAIL.value: _publish_email,
+    OutboxEventTypes.PUBLISH_EVENT.value: _publish_event,
+    OutboxEventTypes.PUBLISH_MRAS_EMAIL.value: _publish_mras_email,
+    OutboxEventTypes.UPDATE_AFFILIATION.value: _update_affiliation,
+    OutboxEventTypes.UPDATE_BUSINESS_PROFILE.value: _update_business_profile,
+    OutboxEventTypes.UPDATE_ENTITY.value: _update_entity,
+}
+
+
+class OutboxDispatcher:
+    """Dispatch the outbox events with bounded concurrency and per filing ordering."""
+
+    def __init__(self, app: Flask, max_workers: int | None = None, batch_size: int | None = None):
+        """Create the dispatcher, the settings default to the app config."""
+        self.app = app
+        self.max_workers = max_workers or app.config.get("OUTBOX_MAX_WORKERS", 4)
+        self.batch_size = batch_size or app.config.get("OUTBOX_BATCH_SIZE", 50)
+        self.max_attempts = app.config.get("OUTBOX_MAX_ATTEMPTS", 5)
+        self.retry_delay = app.config.get("OUTBOX_RETRY_DELAY", 60)
+        self.lease_seconds = app.config.get("OUTBOX_LEASE_SECONDS", 300)
+        self.poll_interval = app.config.get("OUTBOX_POLL_INTERVAL", 5)
+        self._stopped = threading.Event()
+
+    def run(self):
+        """Dispatch the due events until stopped, waiting for new ones when there are none."""
+        self.app.logger.info("Dispatching the outbox events")
+        while not self._stopped.is_set():
+            try:
+                if not self.dispatch_once():
+                    self._stopped.wait(self.poll_interval)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                self.app.logger.error(f"Error dispatching the outbox events: {err}")
+                self.app.logger.debug(traceback.format_exc())
+                self._stopped.wait(self.poll_interval)
+
+    def stop(self):
+        """Stop dispatching once the current batch is dispatched."""
+        self._stopped.set()
+
+    def dispatch_once(self) -> int:
+        """Claim and dispatch one batch of events, returning the number of events claimed."""
+        with self.app.app_context():
+            event_ids = [outbox_event.id
+                         for outbox_event in OutboxEvent.claim_due(self.batch_size, self.lease_seconds)]
+        if event_ids:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                list(executor.map(self._dispatch, event_ids))
+        return len(event_ids)
+
+    def dispatch_filing(self, filing_id: int) -> int:
+        """Dispatch the events of the committed filing in order, returning the number of events dispatched.
+
+        This is the best effort dispatch the filer runs once the filing is committed. It stops at the first event
+        that fails, which is retried with its later events by the dispatcher of outbox_worker.py.
+        """
+        dispatched = 0
+        while True:
+            with self.app.app_context():
+                event_ids = [outbox_event.id
+                             for outbox_event in OutboxEvent.claim_due(1, self.lease_seconds, filing_id)]
+            if not event_ids or not self._dispatch(event_ids[0]):
+                return dispatched
+            dispatched += 1
+
+    def _dispatch(self, event_id: int) -> bool:
+        with self.app.app_context():
+            outbox_event = OutboxEvent.find_by_id(event_id)
+            try:
+                filing = Filing.find_by_id(outbox_event.filing_id)
+                business = Business.find_by_internal_id(outbox_event.business_id) if outbox_event.business_id \
+                    else None
+                HANDLERS[outbox_event.event_type](business, filing, outbox_event)
+                outbox_event.mark_completed()
+                return True
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                db.session.rollback()
+                current_app.logger.error(f"Error dispatching outbox event {outbox_event.idempotency_key} "
+                                         f"(attempt {outbox_event.attempts + 1}): {err}")
+                current_app.logger.debug(traceback.format_exc())
+                outbox_event.mark_failed(repr(err), self.max_attempts, self.retry_delay)
+                return False
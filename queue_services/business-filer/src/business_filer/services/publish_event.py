@@ -15,20 +15,21 @@ class PublishEvent:
     """Service to publish specific events onto the GCP Queue."""
 
     @staticmethod
-    def publish_email_message(app: Flask, business: Business, filing: Filing, option: str = "PAID"):
-        """Publish the email message."""
+    def publish_email_message(app: Flask, business: Business, filing: Filing, option: str = "PAID",
+                              event_id: str | None = None):
+        """Publish the email message, event_id is the cloud event id (a new uuid if not set)."""
         try:
             subject = app.config.get("BUSINESS_MAILER_TOPIC")
             data = {"email": {"filingId": filing.id, "type": filing.filing_type, "option": option}}
 
-            ce = PublishEvent._create_cloud_event(app, business, filing, subject, data)
+            ce = PublishEvent._create_cloud_event(app, business, filing, subject, data, event_id)
 
             gcp_queue.publish(subject, to_queue_message(ce))
         except Exception as err:  # pylint: disable=broad-except;
             raise PublishException(err) from err
 
     @staticmethod
-    def publish_event(app: Flask, business: Business, filing: Filing):
+    def publish_event(app: Flask, business: Business, filing: Filing, event_id: str | None = None):
         """Publish the filing message onto the GCP-QUEUE filing subject."""
         try:
             subject = app.config.get("BUSINESS_EVENTS_TOPIC")
@@ -51,14 +52,14 @@ class PublishEvent:
             if filing.temp_reg:
                 data["tempidentifier"] = filing.temp_reg
 
-            ce = PublishEvent._create_cloud_event(app, business, filing, subject, data)
+            ce = PublishEvent._create_cloud_event(app, business, filing, subject, data, event_id)
             gcp_queue.publish(subject, to_queue_message(ce))
 
         except Exception as err:  # pylint: disable=broad-except;
             raise PublishException(err) from err
 
     @staticmethod
-    def publish_mras_email(app: Flask, business: Business, filing: Filing):
+    def publish_mras_email(app: Flask, business: Business, filing: Filing, event_id: str | None = None):
         """Publish MRAS email message onto the NATS emailer subject."""
         if Flags.is_on("enable-sandbox"):
             app.logger.info("Skip publishing MRAS email")
@@ -73,13 +74,14 @@ class PublishEvent:
             try:
                 subject = app.config.get("BUSINESS_MAILER_TOPIC")
                 data = {"email": {"filingId": filing.id, "type": filing.filing_type, "option": "mras"}}
-                ce = PublishEvent._create_cloud_event(app, business, filing, subject, data)
+                ce = PublishEvent._create_cloud_event(app, business, filing, subject, data, event_id)
                 gcp_queue.publish(subject, to_queue_message(ce))
             except Exception as err:  # pylint: disable=broad-except;
                 raise PublishException(err) from err
 
     @staticmethod
-    def _create_cloud_event(app: Flask, business: Business, filing: Filing, subject: str, data: dict):
+    def _create_cloud_event(app: Flask, business: Business, filing: Filing, subject: str, data: dict,  # noqa: PLR0913
+                            event_id: str | None = None):
         """Create the cloud event."""
         identifier = business.identifier if business else (
             filing.temp_reg or 
@@ -87,7 +89,7 @@ class PublishEvent:
         )
 
         ce = SimpleCloudEvent(
-                id=str(uuid.uuid4()),
+                id=event_id or str(uuid.uuid4()),
                 source="".join([
                     app.config.get("LEGAL_API_URL"),
                     "/business/",
@@ -0,0 +1,224 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Pull subscription consumer that processes filing messages in micro-batches.
+
+An alternative to the push worker (resources/worker.py) for bursts of filings, such as the ones
+enqueued by the future effective filings and involuntary dissolution jobs.
+
+Flow
+--------
+1. Lease up to PULL_MAX_MESSAGES messages from the subscription
+2. Ack the messages without filing information, as the push worker does
+3. Group the filings by business, keeping the order they were received in
+4. Process the groups under PULL_MAX_WORKERS threads, so no two filings of a business are processed at once
+5. Ack each filing once processed, or nack it and the rest of its business group if it fails
+
+The leases of the outstanding messages are extended while the batch is processed.
+"""
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from business_model.models import Filing, db
+from flask import Flask, current_app
+from google.cloud import pubsub_v1
+from simple_cloudevent import from_queue_message
+
+from business_filer.common.filing_message import FilingMessage, get_filing_message
+from business_filer.services.filer import process_filing
+
+
+@dataclass
+class LeasedFiling:
+    """A leased message and the filing it refers to."""
+
+    ack_id: str
+    filing_message: FilingMessage
+    business_key: str | None = None
+
+
+def get_business_keys(filing_ids: list) -> dict:
+    """Return the key of the business of each filing, the temp reg for filings without a business yet."""
+    ids = [int(filing_id) for filing_id in filing_ids if str(filing_id).isdigit()]
+    if not ids:
+        return {}
+    rows = db.session.query(Filing.id, Filing.business_id, Filing.temp_reg) \
+        .filter(Filing.id.in_(ids)) \
+        .all()
+    return {
+        str(filing_id): f"business-{business_id}" if business_id else f"temp-reg-{temp_reg}"
+        for filing_id, business_id, temp_reg in rows
+        if business_id or temp_reg
+    }
+
+
+class PullConsumer:
+    """Lease filing messages in batches and process them with bounded concurrency and per business ordering."""
+
+    def __init__(self, app: Flask, subscriber=None, subscription: str | None = None,
+                 max_messages: int | None = None, max_workers: int | None = None):
+        """Create the consumer, the settings default to the app config."""
+        self.app = app
+        self.subscriber = subscriber or pubsub_v1.SubscriberClient()
+        self.subscription = subscription or app.config.get("BUSINESS_FILER_SUBSCRIPTION")
+        self.max_messages = max_messages or app.config.get("PULL_MAX_MESSAGES", 50)
+        self.max_workers = max_workers or app.config.get("PULL_MAX_WORKERS", 4)
+        self.ack_deadline = app.config.get("PULL_ACK_DEADLINE", 60)
+        self._outstanding: set[str] = set()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def run(self):
+        """Pull and process batches until stopped."""
+        self.app.logger.info(f"Pulling filing messages from {self.subscription}")
+        while not self._stopped.is_set():
+            try:
+                self.pull_once()
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                self.app.logger.error(f"Error pulling filing messages: {err}")
+                self.app.logger.debug(traceback.format_exc())
+                self._stopped.wait(5)
+
+    def stop(self):
+        """Stop pulling once the current batch is processed."""
+        self._stopped.set()
+
+    def pull_once(self) -> int:
+        """Lease and process one batch of messages, returning the number of messages leased."""
+        response = self.subscriber.pull(
+            request={"subscription": self.subscription, "max_messages": self.max_messages},
+            timeout=self.ack_deadline
+        )
+        received_messages = list(response.received_messages)
+        if not received_messages:
+            return 0
+
+        filings = []
+        with self._lock:
+            self._outstanding.update(received.ack_id for received in received_messages)
+        for received in received_messages:
+            if filing_message := self._get_filing_message(received.message.data):
+                filings.append(LeasedFiling(ack_id=received.ack_id, filing_message=filing_message))
+            else:
+                # no filing_message info, take off Q
+                self._ack(received.ack_id)
+
+        if filings:
+            done = threading.Event()
+            extender = threading.Thread(target=self._extend_leases, args=(done,), daemon=True)
+            extender.start()
+            try:
+                groups = self._group_by_business(filings)
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    list(executor.map(self._process_group, groups))
+            finally:
+                done.set()
+                extender.join()
+                with self._lock:
+                    pending = list(self._outstanding)
+                if pending:
+                    self._nack(pending)
+
+        return len(received_messages)
+
+    def _get_filing_message(self, data: bytes) -> FilingMessage | None:
+        try:
+            if ce := from_queue_message(data):
+                return get_filing_message(ce)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            self.app.logger.debug(f"ignoring message, raw payload: {data!s}, error: {err}")
+        return None
+
+    def _group_by_business(self, filings: list[LeasedFiling]) -> list[list[LeasedFiling]]:
+        """Return the filings grouped by business, in the order they were received."""
+        with self.app.app_context():
+            business_keys = get_business_keys([filing.filing_message.filing_identifier for filing in filings])
+
+        groups: dict[str, list[LeasedFiling]] = {}
+        for filing in filings:
+            filing_identifier = str(filing.filing_message.filing_identifier)
+            filing.business_key = business_keys.get(filing_identifier, f"filing-{filing_identifier}")
+            groups.setdefault(filing.business_key, []).append(filing)
+        return list(groups.values())
+
+    def _process_group(self, filings: list[LeasedFiling]):
+        """Process the filings of a business one at a time."""
+        for index, filing in enumerate(filings):
+            if not self._process(filing.filing_message):
+                # keep the filings of the business in order, the rest are redelivered after the failed one
+                self._nack([f.ack_id for f in filings[index:]])
+                return
+            self._ack(filing.ack_id)
+
+    def _process(self, filing_message: FilingMessage) -> bool:
+        with self.app.app_context():
+            try:
+                current_app.logger.info(f"Incoming filing_message: {filing_message}")
+                process_filing(filing_message)
+                current_app.logger.info(f"completed filing_message: {filing_message}")
+                return True
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                current_app.logger.error(f"Error processing filing {filing_message}: {err}")
+                current_app.logger.debug(traceback.format_exc())
+                return False
+
+    def _ack(self, ack_id: str):
+        with self._lock:
+            self._outstanding.discard(ack_id)
+        self.subscriber.acknowledge(request={"subscription": self.subscription, "ack_ids": [ack_id]})
+
+    def _nack(self, ack_ids: list[str]):
+        with self._lock:
+            self._outstanding.difference_update(ack_ids)
+        self.subscriber.modify_ack_deadline(
+            request={"subscription": self.subscription, "ack_ids": ack_ids, "ack_deadline_seconds": 0}
+        )
+
+    def _extend_leases(self, done: threading.Event):
+        """Extend the leases of the outstanding messages until the batch is done."""
+        interval = max(self.ack_deadline // 2, 1)
+        while not done.is_set():
+            with self._lock:
+                ack_ids = list(self._outstanding)
+            if ack_ids:
+                try:
+                    self.subscriber.modify_ack_deadline(
+                        request={"subscription": self.subscription,
+                                 "ack_ids": ack_ids,
+                                 "ack_deadline_seconds": self.ack_deadline}
+                    )
+                except Exception as err:  # pylint: disable=broad-exception-caught
+                    self.app.logger.warning(f"Unable to extend the message leases: {err}")
+            done.wait(interval)
@@ -32,11 +32,15 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 """The Unit Tests for the business filing component processors."""
+import copy
 import json
 import datetime
 import pytest
-from business_model.models import Business, Filing
+from business_model.models import Address, Business, Filing, Party
+from sql_versioning import version_class
 
+from business_filer.filing_processors import change_of_registration
+from business_filer.filing_processors.filing_components import correction
 from business_filer.filing_processors.filing_components.parties import update_parties
 
 
@@ -187,3 +191,108 @@ def update_and_validate_party_and_roles(business, parties_structure, roles_count
     assert len(party_id_list) == parties_count
     assert len(filing.filing_party_roles.all()) == filing_parties_count
     assert not err
+
+
+def test_manage_parties_structure__reconcile(app, session):
+    """Assert that the unchanged parties and roles are kept, and only the changes are applied."""
+    business = Business()
+    business.save()
+
+    filing1 = Filing()
+    filing1.business_id = business.id
+    filing1.filing_date = datetime.datetime.now(datetime.timezone.utc)
+    filing1.filing_data = json.dumps({'filing': 'not a real filing, fail validation'})
+    filing1.save()
+    update_parties(business, PARTIES_STRUCTURE['parties'] + SECOND_PARTY['parties'], filing1)
+    business.save()
+    roles = {role.party.last_name: role for role in business.party_roles.all()}
+    director_role_id, director_party_id = roles['TEST'].id, roles['TEST'].party_id
+
+    filing2 = Filing()
+    filing2.business_id = business.id
+    filing2.filing_date = datetime.datetime.now(datetime.timezone.utc)
+    filing2.filing_data = json.dumps({'filing': 'not a real filing, fail validation'})
+    filing2.save()
+    parties = copy.deepcopy(PARTIES_STRUCTURE['parties'])
+    parties[0]['officer']['email'] = 'new@test.com'
+    err = update_parties(business, parties, filing2, reconcile=True)
+    business.save()
+
+    check_party_roles = Business.find_by_internal_id(business.id).party_roles.all()
+    assert not err
+    assert [(role.id, role.party_id) for role in check_party_roles] == [(director_role_id, director_party_id)]
+    assert check_party_roles[0].party.email == 'new@test.com'
+    # the completing party and incorporator roles get a party of their own, as of the filing
+    filing_party_roles = filing2.filing_party_roles.all()
+    assert len(filing_party_roles) == 2
+    assert all(role.party_id != director_party_id for role in filing_party_roles)
+
+
+def test_manage_parties_structure__reconcile_omitted_address(app, session):
+    """Assert that an address omitted from the json is cleared from the matched party."""
+    business = Business()
+    business.save()
+
+    filing1 = Filing()
+    filing1.business_id = business.id
+    filing1.filing_date = datetime.datetime.now(datetime.timezone.utc)
+    filing1.filing_data = json.dumps({'filing': 'not a real filing, fail validation'})
+    filing1.save()
+    update_parties(business, SECOND_PARTY['parties'], filing1)
+    business.save()
+    party_id = business.party_roles.all()[0].party_id
+
+    filing2 = Filing()
+    filing2.business_id = business.id
+    filing2.filing_date = datetime.datetime.now(datetime.timezone.utc)
+    filing2.filing_data = json.dumps({'filing': 'not a real filing, fail validation'})
+    filing2.save()
+    parties = copy.deepcopy(SECOND_PARTY['parties'])
+    del parties[0]['mailingAddress']
+    err = update_parties(business, parties, filing2, reconcile=True)
+    business.save()
+
+    check_party_roles = Business.find_by_internal_id(business.id).party_roles.all()
+    assert not err
+    assert [role.party_id for role in check_party_roles] == [party_id]
+    assert check_party_roles[0].party.delivery_address
+    assert not check_party_roles[0].party.mailing_address
+
+
+@pytest.mark.parametrize('test_name,update_by_id', [
+    ('correction', correction.update_parties),
+    ('change of registration', change_of_registration.update_parties)
+])
+def test_update_parties_by_id__no_op(app, session, test_name, update_by_id):
+    """Assert that updating a party with its own values writes no new party or address versions."""
+    business = Business()
+    business.save()
+
+    filing1 = Filing()
+    filing1.business_id = business.id
+    filing1.filing_date = datetime.datetime.now(datetime.timezone.utc)
+    filing1.filing_data = json.dumps({'filing': 'not a real filing, fail validation'})
+    filing1.save()
+    update_parties(business, SECOND_PARTY['parties'], filing1)
+    business.save()
+    party = business.party_roles.all()[0].party
+    # the empty values are stored as NULL by the older filings
+    party.identifier = None
+    party.mailing_address.delivery_instructions = None
+    business.save()
+    party_versions = session.query(version_class(Party)).count()
+    address_versions = session.query(version_class(Address)).count()
+
+    filing2 = Filing()
+    filing2.business_id = business.id
+    filing2.filing_date = datetime.datetime.now(datetime.timezone.utc)
+    filing2.filing_data = json.dumps({'filing': 'not a real filing, fail validation'})
+    filing2.save()
+    parties = copy.deepcopy(SECOND_PARTY['parties'])
+    parties[0]['officer']['id'] = party.id
+    update_by_id(business, parties, filing2)
+    business.save()
+
+    assert session.query(version_class(Party)).count() == party_versions
+    assert session.query(version_class(Address)).count() == address_versions
+    assert not business.party_roles.all()[0].cessation_date
@@ -32,6 +32,7 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 """The Unit Tests for the business filing component processors."""
+import copy
 import random
 
 import pytest
@@ -155,3 +156,36 @@ def test_manage_share_structure__delete_shares(app, session):
     for scv in share_class_versions:
         assert scv.operation_type in (0, 2)
         # assert scv.operation_type == 2
+
+
+def test_manage_share_structure__reconcile(app, session):
+    """Assert that the share classes and series are matched to the existing ones, and only the changes are applied."""
+    business = Business()
+    business.save()
+    shares.update_share_structure(business, SINGLE_SHARE_CLASS['shareStructure'])
+    business.save()
+    share_class = business.share_classes.one()
+    share_class_id, series_id = share_class.id, share_class.series[0].id
+
+    share_structure = copy.deepcopy(SINGLE_SHARE_CLASS['shareStructure'])
+    share_structure['shareClasses'][0]['maxNumberOfShares'] = 1000
+    share_structure['shareClasses'][0]['series'][0]['name'] = 'series2'
+    share_structure['shareClasses'].append({**copy.deepcopy(SINGLE_SHARE_CLASS['shareStructure']['shareClasses'][0]),
+                                            'name': 'class2', 'priority': 2, 'series': []})
+    err = shares.update_share_structure(business, share_structure, reconcile=True)
+    business.save()
+
+    check_share_classes = sorted(Business.find_by_internal_id(business.id).share_classes.all(),
+                                 key=lambda s: s.priority)
+    assert not err
+    assert [s.name for s in check_share_classes] == ['class1', 'class2']
+    assert check_share_classes[0].id == share_class_id
+    assert check_share_classes[0].max_shares == 1000
+    # the series is matched by name, so the renamed one is replaced
+    assert [(s.name, s.id != series_id) for s in check_share_classes[0].series] == [('series2', True)]
+
+    # the classes not in the json are deleted
+    err = shares.update_share_structure(business, SINGLE_SHARE_CLASS['shareStructure'], reconcile=True)
+    business.save()
+    check_share_classes = Business.find_by_internal_id(business.id).share_classes.all()
+    assert [(s.id, s.max_shares) for s in check_share_classes] == [(share_class_id, 600)]
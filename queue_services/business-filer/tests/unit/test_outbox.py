@@ -0,0 +1,131 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Tests for the outbox of the filing side effects."""
+from business_model.models import OutboxEvent
+
+from business_filer.filing_meta import FilingMeta
+from business_filer.services import outbox
+from business_filer.services.outbox import OutboxDispatcher, OutboxEventTypes
+from tests.unit import create_business, create_filing
+
+
+def create_alteration_with_side_effects(identifier: str):
+    """Return an alteration filing with its side effects added to the outbox."""
+    business = create_business(identifier, legal_type="BC", legal_name="test business")
+    filing = create_filing("123", {"filing": {"header": {"name": "alteration"}, "alteration": {}}}, business.id)
+    outbox.add_filing_side_effects(business, filing, FilingMeta(legal_filings=["alteration"]))
+    return business, filing
+
+
+def test_add_filing_side_effects(app, session):
+    """Assert that the side effects are added in the order the filer ran them, with an idempotency key."""
+    _, filing = create_alteration_with_side_effects("BC1234567")
+    session.commit()
+
+    outbox_events = OutboxEvent.find_by_filing_id(filing.id)
+    assert [outbox_event.event_type for outbox_event in outbox_events] == [
+        OutboxEventTypes.UPDATE_ENTITY.value,
+        OutboxEventTypes.CONSUME_NR.value,
+        OutboxEventTypes.UPDATE_BUSINESS_PROFILE.value,
+        OutboxEventTypes.PUBLISH_EMAIL.value,
+        OutboxEventTypes.PUBLISH_EVENT.value,
+    ]
+    assert outbox_events[0].idempotency_key == f"{filing.id}-updateEntity-alteration"
+    assert outbox_events[0].payload == {"filingType": "alteration"}
+    assert outbox_events[3].payload == {"option": "PAID"}
+    assert outbox_events[4].idempotency_key == f"{filing.id}-publishEvent"
+
+
+def test_dispatch_once(app, session, mocker):
+    """Assert that the events of a filing are dispatched in order, and a failed one holds back the later ones."""
+    _, filing = create_alteration_with_side_effects("BC1234567")
+    session.commit()
+
+    dispatched = []
+
+    def dispatch(business, filing, outbox_event):
+        dispatched.append(outbox_event.event_type)
+        if outbox_event.event_type == OutboxEventTypes.CONSUME_NR.value:
+            raise ConnectionError("namex is down")
+
+    mocker.patch.dict(outbox.HANDLERS, {event_type.value: dispatch for event_type in OutboxEventTypes})
+
+    dispatcher = OutboxDispatcher(app, max_workers=1)
+    assert dispatcher.dispatch_once() == 1
+    assert dispatcher.dispatch_once() == 1
+    # the failed event is retried later, the events after it wait for it
+    assert dispatcher.dispatch_once() == 0
+    assert dispatched == [OutboxEventTypes.UPDATE_ENTITY.value, OutboxEventTypes.CONSUME_NR.value]
+
+    outbox_events = OutboxEvent.find_by_filing_id(filing.id)
+    assert outbox_events[0].status == OutboxEvent.Status.COMPLETED
+    assert outbox_events[1].status == OutboxEvent.Status.PENDING
+    assert outbox_events[1].attempts == 1
+    assert "namex is down" in outbox_events[1].last_error
+
+
+def test_dispatch_filing(app, session, mocker):
+    """Assert that the inline dispatch of a filing stops at the first failed event, leaving the rest to the worker."""
+    _, filing = create_alteration_with_side_effects("BC1234567")
+    _, other_filing = create_alteration_with_side_effects("BC7654321")
+    session.commit()
+
+    dispatched = []
+
+    def dispatch(business, filing, outbox_event):
+        dispatched.append(outbox_event.event_type)
+        if outbox_event.event_type == OutboxEventTypes.UPDATE_BUSINESS_PROFILE.value:
+            raise ConnectionError("auth is down")
+
+    mocker.patch.dict(outbox.HANDLERS, {event_type.value: dispatch for event_type in OutboxEventTypes})
+
+    assert OutboxDispatcher(app).dispatch_filing(filing.id) == 2
+    assert dispatched == [
+        OutboxEventTypes.UPDATE_ENTITY.value,
+        OutboxEventTypes.CONSUME_NR.value,
+        OutboxEventTypes.UPDATE_BUSINESS_PROFILE.value,
+    ]
+
+    outbox_events = OutboxEvent.find_by_filing_id(filing.id)
+    assert [outbox_event.status for outbox_event in outbox_events] == [
+        OutboxEvent.Status.COMPLETED,
+        OutboxEvent.Status.COMPLETED,
+        OutboxEvent.Status.PENDING,
+        OutboxEvent.Status.PENDING,
+        OutboxEvent.Status.PENDING,
+    ]
+    assert outbox_events[2].attempts == 1
+    # the events of the other filings are left to the worker
+    assert all(outbox_event.status == OutboxEvent.Status.PENDING
+               for outbox_event in OutboxEvent.find_by_filing_id(other_filing.id))
@@ -0,0 +1,139 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Tests for the pull subscription consumer."""
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from simple_cloudevent import SimpleCloudEvent, to_queue_message
+
+from business_filer.services import pull_consumer
+from business_filer.services.pull_consumer import PullConsumer
+
+
+class FakeSubscriber:
+    """Subscriber that returns one batch of messages and records the acks and nacks."""
+
+    def __init__(self, messages):
+        self.messages = messages
+        self.acked = []
+        self.nacked = []
+        self.lock = threading.Lock()
+
+    def pull(self, request, timeout=None):
+        messages, self.messages = self.messages, []
+        return SimpleNamespace(received_messages=messages)
+
+    def acknowledge(self, request):
+        with self.lock:
+            self.acked.extend(request["ack_ids"])
+
+    def modify_ack_deadline(self, request):
+        if request["ack_deadline_seconds"] == 0:
+            with self.lock:
+                self.nacked.extend(request["ack_ids"])
+
+
+def create_received_message(ack_id: str, filing_id: int | None = None):
+    """Create a pulled message holding a filing cloud event, or garbage when there is no filing id."""
+    if filing_id is None:
+        data = b"not a cloud event"
+    else:
+        ce = SimpleCloudEvent(
+            id=str(uuid.uuid4()),
+            source="business_pay",
+            subject="filing",
+            time=datetime.now(timezone.utc),
+            type="filingMessage",
+            data={"filingMessage": {"filingIdentifier": filing_id}}
+        )
+        data = to_queue_message(ce)
+    return SimpleNamespace(ack_id=ack_id, message=SimpleNamespace(data=data))
+
+
+def test_pull_once_orders_filings_per_business(app, mocker):
+    """Assert that filings of a business are processed in order and never at the same time."""
+    business_keys = {"1": "business-1", "2": "business-2", "3": "business-1", "4": "business-2", "5": "business-1"}
+    mocker.patch.object(pull_consumer, "get_business_keys", return_value=business_keys)
+
+    processed = []
+    active = set()
+    overlap = []
+    lock = threading.Lock()
+
+    def process_filing(filing_message):
+        business_key = business_keys[str(filing_message.filing_identifier)]
+        with lock:
+            if business_key in active:
+                overlap.append(business_key)
+            active.add(business_key)
+        time.sleep(0.01)
+        with lock:
+            active.discard(business_key)
+            processed.append(filing_message.filing_identifier)
+
+    mocker.patch.object(pull_consumer, "process_filing", side_effect=process_filing)
+
+    messages = [create_received_message(f"ack-{i}", i) for i in range(1, 6)]
+    messages.append(create_received_message("ack-garbage"))
+    subscriber = FakeSubscriber(messages)
+    consumer = PullConsumer(app, subscriber=subscriber, subscription="filer-sub", max_workers=2)
+
+    assert consumer.pull_once() == 6
+    assert not overlap
+    assert [i for i in processed if business_keys[str(i)] == "business-1"] == [1, 3, 5]
+    assert [i for i in processed if business_keys[str(i)] == "business-2"] == [2, 4]
+    assert sorted(subscriber.acked) == sorted([f"ack-{i}" for i in range(1, 6)] + ["ack-garbage"])
+    assert not subscriber.nacked
+
+
+def test_pull_once_nacks_rest_of_business_on_failure(app, mocker):
+    """Assert that a failed filing is nacked with the later filings of its business only."""
+    business_keys = {"1": "business-1", "2": "business-1", "3": "business-1", "4": "business-2"}
+    mocker.patch.object(pull_consumer, "get_business_keys", return_value=business_keys)
+
+    def process_filing(filing_message):
+        if filing_message.filing_identifier == 2:
+            raise Exception("failed")
+
+    mocker.patch.object(pull_consumer, "process_filing", side_effect=process_filing)
+
+    subscriber = FakeSubscriber([create_received_message(f"ack-{i}", i) for i in range(1, 5)])
+    consumer = PullConsumer(app, subscriber=subscriber, subscription="filer-sub", max_workers=2)
+
+    assert consumer.pull_once() == 4
+    assert sorted(subscriber.acked) == ["ack-1", "ack-4"]
+    assert sorted(subscriber.nacked) == ["ack-2", "ack-3"]